@@ -0,0 +1,46 @@
+"""
+FitTrack's pages, one module each, imported on first use.
+
+Streamlit reruns the main script on every interaction, but modules it
+imports stay loaded for the life of the server process. The main script is
+kept small and asks load_page() for the page picked in the sidebar, so a
+session only ever imports the pages it opens and no rerun re-executes page
+code it does not show. IMPORT_TIMES records how long each module took to
+import the first time; `python -m app_pages` measures every page from a
+cold start.
+"""
+import importlib
+import time
+
+# Sidebar label -> (module in this package, page function)
+STUDENT_PAGES = {
+    "📊 Weekly Progress": ('progress', 'reminders_and_progress'),
+    "🏆 Community": ('community', 'community_features'),
+    "🤖 AI Insights": ('insights', 'ai_insights'),
+    "🏥 Advanced Metrics": ('metrics', 'advanced_metrics'),
+    "🌐 Integrations": ('integrations', 'api_integrations'),
+    "💪 Log Workout": ('exercise', 'exercise_logger'),
+    "BMI Calculator": ('bmi', 'bmi_calculator'),
+    "NAPFA Test": ('napfa_test', 'napfa_calculator'),
+    "Sleep Tracker": ('sleep', 'sleep_tracker'),
+    "Training Schedule": ('schedule', 'schedule_manager'),
+}
+LOGIN_PAGE = ('login', 'login_page')
+TEACHER_PAGE = ('teacher', 'teacher_dashboard')
+DIAGNOSTICS_PAGE = ('diagnostics', 'diagnostics_page')
+
+# Module -> seconds its first import took in this process
+IMPORT_TIMES = {}
+
+
+def load_page(page):
+    """The page function for a (module, function) pair, importing its module on first use"""
+    module_name, function = page
+    name = f'{__name__}.{module_name}'
+    if module_name not in IMPORT_TIMES:
+        start = time.perf_counter()
+        module = importlib.import_module(name)
+        IMPORT_TIMES[module_name] = time.perf_counter() - start
+    else:
+        module = importlib.import_module(name)
+    return getattr(module, function)
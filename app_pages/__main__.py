@@ -0,0 +1,51 @@
+"""
+Cold import time of every page module.
+
+Each module is imported in a fresh interpreter (from a scratch directory, so
+the shared user store is created empty there) after the shared modules the
+main script always loads, and the time of that import alone is reported.
+
+    python -m app_pages [rounds]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from app_pages import DIAGNOSTICS_PAGE, LOGIN_PAGE, STUDENT_PAGES, TEACHER_PAGE
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+import app_pages.common
+shared = time.perf_counter()
+import app_pages.{module}
+print(shared - start, time.perf_counter() - shared)
+"""
+
+
+def measure(module, rounds):
+    shared, own = [], []
+    for _ in range(rounds):
+        with tempfile.TemporaryDirectory() as scratch:
+            output = subprocess.run([sys.executable, '-c', PROBE.format(root=ROOT, module=module)],
+                                    cwd=scratch, capture_output=True, text=True, check=True).stdout
+        first, second = output.split()[-2:]
+        shared.append(float(first) * 1000)
+        own.append(float(second) * 1000)
+    return statistics.median(shared), statistics.median(own)
+
+
+if __name__ == '__main__':
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    pages = [(label, module) for label, (module, _) in STUDENT_PAGES.items()]
+    pages += [('Sign in', LOGIN_PAGE[0]), ('Teacher dashboard', TEACHER_PAGE[0]), ('Diagnostics', DIAGNOSTICS_PAGE[0])]
+    print(f"Cold import time per page (median of {rounds})")
+    print(f"  {'page':<22} {'module':<14} {'page ms':>8} {'shared ms':>10}")
+    for label, module in pages:
+        shared, own = measure(module, rounds)
+        print(f"  {label:<22} {module:<14} {own:8.1f} {shared:10.1f}")
@@ -0,0 +1,50 @@
+"""BMI calculator page."""
+import streamlit as st
+
+from app_pages.common import SST_COLORS, get_user_data, update_user_data
+from fittrack.services import record_bmi
+
+CATEGORY_COLORS = {
+    "Underweight": "#2196f3",
+    "Normal": "#4caf50",
+    "Overweight": "#ff9800",
+    "Obesity": "#f44336"
+}
+
+
+# BMI Calculator
+def bmi_calculator():
+    st.header("📊 BMI Calculator")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        weight = st.number_input("Weight (kg)", min_value=20.0, max_value=200.0, value=60.0, step=0.1)
+    with col2:
+        height = st.number_input("Height (m)", min_value=1.0, max_value=2.5, value=1.65, step=0.01)
+    
+    if st.button("Calculate BMI"):
+        # Save to history
+        user_data = get_user_data()
+        entry = record_bmi(user_data, weight, height)
+        update_user_data(user_data)
+        
+        bmi = weight / (height * height)
+        category = entry['category']
+        color = CATEGORY_COLORS[category]
+        
+        # Display results
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown(f'<div class="stat-card"><h2 style="color: {color};">BMI: {bmi:.2f}</h2></div>', unsafe_allow_html=True)
+        with col2:
+            st.markdown(f'<div class="stat-card"><h2 style="color: {SST_COLORS["gray"]};">Category: {category}</h2></div>', unsafe_allow_html=True)
+        
+        st.info(f"📈 You have {len(user_data['bmi_history'])} BMI record(s) saved.")
+        
+        # Show history chart if there's data
+        if len(user_data['bmi_history']) > 1:
+            import pandas as pd  # only needed for the chart
+            df = pd.DataFrame(user_data['bmi_history'])
+            df_chart = df.set_index('date')['bmi']
+            st.subheader("BMI History")
+            st.line_chart(df_chart)
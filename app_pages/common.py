@@ -0,0 +1,396 @@
+"""
+State and styling shared by every page.
+
+Page modules are imported once per server process, so everything here is
+built once rather than on each rerun. The user store and the background job
+queue are shared by every session; the logged-in user's private copy lives
+in st.session_state.
+"""
+import os
+from datetime import datetime
+
+import streamlit as st
+
+from fittrack.instrument import count
+from fittrack.jobs import ACTIVE, open_jobs
+from fittrack.photos import prepare_photo
+from fittrack.storage import StaleWriteError, UserStore, open_store
+
+# ============================================
+# API CONFIGURATION
+# ============================================
+# Set these environment variables to enable real APIs
+# In Streamlit Cloud: Go to App Settings > Secrets
+# Add these keys there
+
+OPENWEATHER_API_KEY = os.environ.get('OPENWEATHER_API_KEY', '')
+USDA_API_KEY = os.environ.get('USDA_API_KEY', '')
+YOUTUBE_API_KEY = os.environ.get('YOUTUBE_API_KEY', '')
+OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY', '')  # For AI workout verification
+
+# API Mode: 'mock' or 'real'
+# Automatically switches to 'real' when API keys are present
+API_MODE = 'real' if (OPENWEATHER_API_KEY or USDA_API_KEY or YOUTUBE_API_KEY) else 'mock'
+
+# Storage backend: 'sqlite' (one row per user) or 'json' (snapshot + log files)
+STORAGE_BACKEND = os.environ.get('FITTRACK_STORAGE', 'sqlite')
+
+# Seconds between checks on a background job a page is waiting for
+JOB_POLL_SECONDS = 1
+
+# Shown with a verdict reused from the verification cache (see fittrack.verification)
+CACHED_NOTE = "♻️ This photo was checked before, so its earlier answer was reused (no new AI call)."
+
+# Usernames allowed to open the Diagnostics page (comma-separated)
+ADMIN_USERS = {name.strip() for name in os.environ.get('FITTRACK_ADMINS', '').split(',') if name.strip()}
+
+# ============================================
+
+# SST Color Palette
+SST_COLORS = {
+    'red': '#d32f2f',
+    'blue': '#1976d2',
+    'gray': '#5a5a5a',
+    'light_gray': '#e0e0e0',
+    'white': '#ffffff',
+    'dark': '#2c2c2c'
+}
+
+MEDAL_COLORS = {
+    '🥇 Gold': '#FFD700',
+    '🥈 Silver': '#C0C0C0',
+    '🥉 Bronze': '#CD7F32'
+}
+
+# Page styling, sent with every rerun by the main script
+APP_CSS = f"""
+    <style>
+    /* Dark mode support - Streamlit uses data-theme attribute */
+    [data-theme="dark"] {{
+        color-scheme: dark;
+    }}
+    
+    [data-theme="dark"] .stat-card {{
+        background: #2d2d2d !important;
+        border-left: 5px solid {SST_COLORS['blue']} !important;
+        box-shadow: 0 4px 15px rgba(0,0,0,0.5) !important;
+        color: #ffffff !important;
+    }}
+    
+    [data-theme="dark"] .stat-card h1,
+    [data-theme="dark"] .stat-card h2,
+    [data-theme="dark"] .stat-card h3,
+    [data-theme="dark"] .stat-card h4 {{
+        color: #ffffff !important;
+    }}
+    
+    [data-theme="dark"] .stat-card p,
+    [data-theme="dark"] .stat-card span,
+    [data-theme="dark"] .stat-card div {{
+        color: #ffffff !important;
+    }}
+    
+    [data-theme="dark"] h1,
+    [data-theme="dark"] h2,
+    [data-theme="dark"] h3,
+    [data-theme="dark"] h4,
+    [data-theme="dark"] h5,
+    [data-theme="dark"] h6 {{
+        color: #ffffff !important;
+    }}
+    
+    [data-theme="dark"] p,
+    [data-theme="dark"] span,
+    [data-theme="dark"] div,
+    [data-theme="dark"] label,
+    [data-theme="dark"] li,
+    [data-theme="dark"] td,
+    [data-theme="dark"] th,
+    [data-theme="dark"] .stMarkdown,
+    [data-theme="dark"] .element-container {{
+        color: #ffffff !important;
+    }}
+    
+    [data-theme="dark"] .stTextInput label,
+    [data-theme="dark"] .stNumberInput label,
+    [data-theme="dark"] .stSelectbox label,
+    [data-theme="dark"] .stRadio label,
+    [data-theme="dark"] .stCheckbox label {{
+        color: #ffffff !important;
+    }}
+    
+    [data-theme="dark"] .stAlert {{
+        color: #ffffff !important;
+    }}
+    
+    [data-theme="dark"] .stInfo,
+    [data-theme="dark"] .stWarning,
+    [data-theme="dark"] .stSuccess,
+    [data-theme="dark"] .stError {{
+        color: #1a1a1a !important;
+    }}
+    
+    [data-theme="dark"] .stDataFrame {{
+        color: #ffffff !important;
+    }}
+    
+    [data-theme="dark"] table {{
+        color: #ffffff !important;
+    }}
+    
+    /* Also support prefers-color-scheme for browsers */
+    @media (prefers-color-scheme: dark) {{
+        body {{
+            color: #ffffff !important;
+        }}
+        
+        .stApp {{
+            background: linear-gradient(135deg, #1a1a1a 0%, #2d2d2d 100%);
+            color: #ffffff !important;
+        }}
+        
+        .stat-card {{
+            background: #2d2d2d !important;
+            border-left: 5px solid {SST_COLORS['blue']};
+            box-shadow: 0 4px 15px rgba(0,0,0,0.5);
+            color: #ffffff !important;
+        }}
+        
+        .stat-card h1,
+        .stat-card h2,
+        .stat-card h3,
+        .stat-card h4 {{
+            color: #ffffff !important;
+        }}
+        
+        .stat-card p,
+        .stat-card span,
+        .stat-card div {{
+            color: #ffffff !important;
+        }}
+        
+        h1, h2, h3, h4, h5, h6 {{
+            color: #ffffff !important;
+        }}
+        
+        p, span, div, label, li, td, th {{
+            color: #ffffff !important;
+        }}
+        
+        .stMarkdown,
+        .element-container {{
+            color: #ffffff !important;
+        }}
+        
+        .stTextInput label,
+        .stNumberInput label,
+        .stSelectbox label,
+        .stRadio label,
+        .stCheckbox label {{
+            color: #ffffff !important;
+        }}
+        
+        .stDataFrame,
+        table {{
+            color: #ffffff !important;
+        }}
+    }}
+    
+    /* Light mode (default) */
+    .stApp {{
+        background: linear-gradient(135deg, #f5f5f5 0%, #e8e8e8 100%);
+    }}
+    
+    .main-header {{
+        background: linear-gradient(135deg, {SST_COLORS['red']} 0%, #b71c1c 100%);
+        padding: 30px;
+        border-radius: 12px;
+        color: white !important;
+        text-align: center;
+        margin-bottom: 30px;
+        box-shadow: 0 8px 20px rgba(211, 47, 47, 0.3);
+    }}
+    
+    .main-header h1,
+    .main-header p {{
+        color: white !important;
+    }}
+    
+    .stat-card {{
+        background: white;
+        padding: 20px;
+        border-radius: 10px;
+        border-left: 5px solid {SST_COLORS['blue']};
+        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
+        margin: 10px 0;
+        transition: transform 0.2s, box-shadow 0.2s;
+    }}
+    
+    .stat-card:hover {{
+        transform: translateY(-2px);
+        box-shadow: 0 6px 20px rgba(0,0,0,0.15);
+    }}
+    
+    .grade-badge {{
+        display: inline-block;
+        padding: 5px 15px;
+        border-radius: 6px;
+        font-weight: bold;
+        color: white !important;
+        margin: 5px;
+    }}
+    
+    .grade-5 {{ background: #4caf50; }}
+    .grade-4 {{ background: #8bc34a; }}
+    .grade-3 {{ background: #ffc107; color: #000 !important; }}
+    .grade-2 {{ background: #ff9800; }}
+    .grade-1 {{ background: #f44336; }}
+    
+    h1, h2, h3 {{ 
+        color: {SST_COLORS['dark']};
+        font-weight: 700;
+    }}
+    
+    .stButton>button {{
+        background: linear-gradient(135deg, {SST_COLORS['blue']} 0%, #1565c0 100%);
+        color: white !important;
+        border: none;
+        border-radius: 8px;
+        padding: 10px 30px;
+        font-weight: 600;
+        transition: all 0.3s;
+    }}
+    
+    .stButton>button:hover {{
+        background: linear-gradient(135deg, #1565c0 0%, #0d47a1 100%);
+        transform: translateY(-2px);
+        box-shadow: 0 4px 12px rgba(25, 118, 210, 0.4);
+    }}
+    
+    /* Mobile responsive */
+    @media (max-width: 768px) {{
+        .main-header {{
+            padding: 20px;
+        }}
+        .stat-card {{
+            padding: 15px;
+            margin: 8px 0;
+        }}
+        .stButton>button {{
+            padding: 8px 20px;
+            font-size: 14px;
+        }}
+    }}
+    
+    /* Smooth animations */
+    * {{
+        transition: background-color 0.3s ease;
+    }}
+    </style>
+"""
+
+# Data storage file
+DATA_FILE = 'fittrack_users.json'
+
+# One user store per server process, shared by every browser session
+@st.cache_resource
+def get_user_store():
+    return UserStore(open_store(DATA_FILE, STORAGE_BACKEND))
+
+user_store = get_user_store()
+
+# Background jobs (see fittrack.jobs), run on this process's threads for every session
+@st.cache_resource
+def get_job_queue():
+    return open_jobs(DATA_FILE, user_store)
+
+job_queue = get_job_queue()
+
+
+# All users, shared across sessions (read-only; write through user_store)
+def load_users():
+    return user_store.all_users()
+
+# Get current user data
+def get_user_data():
+    if st.session_state.user_copy is None:
+        data, version = user_store.get(st.session_state.username)
+        if data is None:
+            return None
+        st.session_state.user_copy = {'data': data, 'version': version}
+    return st.session_state.user_copy['data']
+
+# Update user data (merged with any newer save from another session)
+def update_user_data(data):
+    user_copy = st.session_state.user_copy
+    base_version = user_copy['version'] if user_copy and user_copy['data'] is data else None
+    try:
+        version = user_store.put(st.session_state.username, data, base_version)
+    except StaleWriteError:
+        # Changed in another window or tab in the meantime; start over from the latest copy
+        count('store.stale_writes')
+        st.session_state.user_copy = None
+        st.error("⚠️ Your data was changed somewhere else just now, so this change was not saved. Please try again.")
+        st.stop()
+    st.session_state.user_copy = {'data': data, 'version': version}
+
+# An uploaded photo made ready for AI verification (see fittrack.photos), once per upload rather than per rerun
+@st.cache_data(max_entries=8, show_spinner=False)
+def prepared_photo(data):
+    return prepare_photo(data)
+
+# Progress of a background job, checked again every JOB_POLL_SECONDS without rerunning the page
+@st.fragment(run_every=JOB_POLL_SECONDS)
+def _job_progress(job_id, label):
+    job = job_queue.get(job_id)
+    if job is None or job['status'] not in ACTIVE:
+        st.rerun()
+    st.progress(job['progress'], text=job['message'] or label)
+
+# The finished job whose id a page put in st.session_state[key], once; None while it runs
+def finished_job(key, label):
+    job_id = st.session_state.get(key)
+    if job_id is None:
+        return None
+    job = job_queue.get(job_id)
+    if job is not None and job['status'] in ACTIVE:
+        _job_progress(job_id, label)
+        return None
+    if st.session_state.get('synced_job') != job_id:
+        # The job may have saved to this user; start the page over from the latest copy
+        st.session_state.synced_job = job_id
+        st.session_state.user_copy = None
+        st.rerun()
+    del st.session_state[key]
+    return job
+
+# Whether the signed-in user may see the Diagnostics page
+def is_admin():
+    return st.session_state.get('username') in ADMIN_USERS
+
+
+def update_login_streak(user_data):
+    """Update login streak for daily login tracking"""
+    last_login = user_data.get('last_login')
+    if last_login:
+        last_login_date = datetime.fromisoformat(last_login).date()
+        today = datetime.now().date()
+        days_diff = (today - last_login_date).days
+        
+        if days_diff == 1:
+            # Consecutive day
+            user_data['login_streak'] = user_data.get('login_streak', 0) + 1
+            from fittrack.services import award_badges, update_level  # badges load numpy; only on a new day
+            award_badges(user_data, ('login',))
+            update_level(user_data)
+        elif days_diff == 0:
+            # Same day, no change
+            pass
+        else:
+            # Streak broken
+            user_data['login_streak'] = 1
+    else:
+        user_data['login_streak'] = 1
+    
+    user_data['last_login'] = datetime.now().isoformat()
+    return user_data
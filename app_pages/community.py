@@ -0,0 +1,1074 @@
+"""Community page: leaderboards, houses, badges, friends, groups and challenges."""
+from datetime import datetime
+
+import streamlit as st
+
+from app_pages.common import get_user_data, update_user_data, user_store
+from fittrack.catalogs import BADGE_CATALOG, WEEKLY_CHALLENGES, calculate_level
+from fittrack.groups import GROUP_TYPES
+from fittrack.houses import standings
+from fittrack.leaderboards import on_leaderboards
+from fittrack.services import (ActionError, accept_friend, award_badges, challenge_progress, complete_challenge,
+                               create_group, decline_friend, decline_group, invite_to_group, join_group, leave_group,
+                               remove_friend, send_friend_request)
+from fittrack.timeseries import log_columns
+
+
+# Community and Social Features
+def community_features():
+    st.header("🏆 Community & Achievements")
+    
+    user_data = get_user_data()
+    
+    # Create tabs
+    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
+        "🏠 Houses",
+        "🏆 Leaderboards",
+        "🎖️ My Achievements", 
+        "👥 Friends",
+        "⚡ Challenges",
+        "⚙️ Privacy Settings"
+    ])
+    
+    with tab1:
+        st.subheader("🏠 House System")
+        st.write("Compete for house glory! Every hour you exercise earns 1 point for your house.")
+        
+        # House standings (running totals kept up to date by the user store)
+        house_stats = standings(user_store.house_totals())
+        
+        # Sort houses by points
+        sorted_houses = sorted(house_stats.items(), key=lambda x: x[1]['points'], reverse=True)
+        
+        # Display house leaderboard
+        st.write("### 🏆 House Standings")
+        
+        for rank, (house_name, stats) in enumerate(sorted_houses, 1):
+            medal = "🥇" if rank == 1 else "🥈" if rank == 2 else "🥉" if rank == 3 else f"{rank}."
+            
+            with st.container():
+                st.markdown(f"""
+                <div class="stat-card" style="background: linear-gradient(135deg, {stats['color']} 0%, {stats['color']}dd 100%); color: white; margin: 10px 0;">
+                    <h2>{medal} {stats['display']}</h2>
+                    <h1>{stats['points']:.1f} Points</h1>
+                    <p style="font-size: 1.1em;">
+                        👥 {stats['members']} members | 
+                        💪 {stats['workouts']} total workouts | 
+                        📊 {(stats['points']/stats['members'] if stats['members'] > 0 else 0):.1f} pts/member
+                    </p>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        # User's house info
+        if user_data.get('role') == 'student' and user_data.get('house'):
+            st.write("")
+            st.write("---")
+            st.write("### 🏠 Your House")
+            
+            user_house = user_data['house']
+            user_house_stats = house_stats.get(user_house, {})
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Your House", user_house_stats.get('display', user_house.title()))
+            with col2:
+                st.metric("Your Contribution", f"{user_data.get('house_points_contributed', 0):.1f} pts")
+            with col3:
+                st.metric("Total Workout Hours", f"{user_data.get('total_workout_hours', 0):.1f}h")
+            
+            # House rank
+            house_rank = next((i+1 for i, (h, s) in enumerate(sorted_houses) if h == user_house), 0)
+            if house_rank == 1:
+                st.success(f"🥇 Your house is in 1ST PLACE! Keep it up!")
+            elif house_rank == 2:
+                st.info(f"🥈 Your house is in 2nd place. Keep training to reach 1st!")
+            elif house_rank == 3:
+                st.info(f"🥉 Your house is in 3rd place. Every workout counts!")
+            else:
+                st.warning(f"Your house is in {house_rank}th place. Time to train harder!")
+            
+            # Top contributors in user's house
+            st.write("")
+            st.write(f"### ⭐ Top Contributors - {user_house_stats.get('display', 'Your House')}")
+            
+            # Best five from the store's house index, then just their records for the names
+            top_members = user_store.house_members(user_house, 5)
+            members = user_store.users([username for username, _ in top_members])
+            
+            for idx, (username, points) in enumerate(top_members, 1):
+                medal = "🥇" if idx == 1 else "🥈" if idx == 2 else "🥉" if idx == 3 else f"{idx}."
+                name = members.get(username, {}).get('name', 'Unknown')
+                
+                highlight = " 🌟 (You)" if username == st.session_state.username else ""
+                st.write(f"{medal} **{name}**{highlight} - {points:.1f} points")
+        else:
+            st.info("💡 Students: Your house information will appear here after you log workouts!")
+    
+    with tab2:
+        st.subheader("🏆 Leaderboards & High Scores")
+        
+        if not user_data.get('show_on_leaderboards', False):
+            st.warning("⚠️ You're not visible on leaderboards. Update your privacy settings to join!")
+            st.info("Go to 'Privacy Settings' tab to enable leaderboard participation.")
+        
+        # Create sub-tabs for different leaderboard types
+        lb_tab1, lb_tab2, lb_tab3, lb_tab4, lb_tab5, lb_tab6 = st.tabs([
+            "🌍 Global",
+            "🏠 House Rankings", 
+            "🏅 High Scores",
+            "👥 Friends",
+            "👫 Groups",
+            "📚 Class"
+        ])
+        
+        with lb_tab1:
+            st.write("### 🌍 Global Leaderboards")
+            st.write("Compete with everyone who opted in!")
+            
+            # Everyone on any global board has house points or a workout
+            if not (user_store.leaderboard('house_points', 1) or user_store.leaderboard('total_workouts', 1)):
+                st.info("No users on leaderboards yet. Be the first to opt in!")
+            else:
+                global_board_type = st.selectbox("Select Ranking", [
+                    "Total House Points",
+                    "Weekly Warriors", 
+                    "Workout Streak",
+                    "Total Workouts"
+                ], key="global_board")
+                
+                # Rankings come pre-sorted from the leaderboard index
+                if global_board_type == "Total House Points":
+                    st.write("### 🏆 Top House Point Earners")
+                    
+                    top = user_store.leaderboard('house_points', 20)
+                    ranked = user_store.users([username for username, _ in top])
+                    rankings = [{
+                        'username': username,
+                        'name': ranked[username]['name'],
+                        'points': points,
+                        'house': ranked[username].get('house', 'N/A')
+                    } for username, points in top
+                    if username in ranked]
+                    
+                    for idx, user in enumerate(rankings, 1):
+                        medal = "🥇" if idx == 1 else "🥈" if idx == 2 else "🥉" if idx == 3 else f"{idx}."
+                        highlight = "🌟 " if user['username'] == st.session_state.username else ""
+                        
+                        house_emoji = {'yellow': '🟡', 'red': '🔴', 'blue': '🔵', 'green': '🟢', 'black': '⚫'}.get(user['house'], '')
+                        
+                        st.write(f"{medal} {highlight}**{user['name']}** {house_emoji} - {user['points']:.1f} points")
+                
+                elif global_board_type == "Weekly Warriors":
+                    st.write("### 💪 Most Workouts This Week")
+                    
+                    top = user_store.weekly_leaderboard(20)
+                    ranked = user_store.users([username for username, _, _ in top])
+                    weekly_counts = [{
+                        'username': username,
+                        'name': ranked[username]['name'],
+                        'count': count,
+                        'total_time': total_time,
+                        'house': ranked[username].get('house', 'N/A')
+                    } for username, count, total_time in top
+                    if username in ranked]
+                    
+                    for idx, user in enumerate(weekly_counts, 1):
+                        medal = "🥇" if idx == 1 else "🥈" if idx == 2 else "🥉" if idx == 3 else f"{idx}."
+                        highlight = "🌟 " if user['username'] == st.session_state.username else ""
+                        house_emoji = {'yellow': '🟡', 'red': '🔴', 'blue': '🔵', 'green': '🟢', 'black': '⚫'}.get(user['house'], '')
+                        
+                        st.write(f"{medal} {highlight}**{user['name']}** {house_emoji} - {user['count']} workouts ({user['total_time']} min)")
+                
+                elif global_board_type == "Workout Streak":
+                    st.write("### 🔥 Longest Workout Streaks")
+                    
+                    top = user_store.leaderboard('streak', 20)
+                    ranked = user_store.users([username for username, _ in top])
+                    streaks = [{
+                        'username': username,
+                        'name': ranked[username]['name'],
+                        'streak': streak,
+                        'house': ranked[username].get('house', 'N/A')
+                    } for username, streak in top
+                    if username in ranked]
+                    
+                    for idx, user in enumerate(streaks, 1):
+                        medal = "🥇" if idx == 1 else "🥈" if idx == 2 else "🥉" if idx == 3 else f"{idx}."
+                        highlight = "🌟 " if user['username'] == st.session_state.username else ""
+                        house_emoji = {'yellow': '🟡', 'red': '🔴', 'blue': '🔵', 'green': '🟢', 'black': '⚫'}.get(user['house'], '')
+                        
+                        st.write(f"{medal} {highlight}**{user['name']}** {house_emoji} - {user['streak']} days 🔥")
+                
+                else:  # Total Workouts
+                    st.write("### 💪 Most Total Workouts")
+                    
+                    top = user_store.leaderboard('total_workouts', 20)
+                    ranked = user_store.users([username for username, _ in top])
+                    rankings = [{
+                        'username': username,
+                        'name': ranked[username]['name'],
+                        'workouts': workouts,
+                        'house': ranked[username].get('house', 'N/A')
+                    } for username, workouts in top
+                    if username in ranked]
+                    
+                    for idx, user in enumerate(rankings, 1):
+                        medal = "🥇" if idx == 1 else "🥈" if idx == 2 else "🥉" if idx == 3 else f"{idx}."
+                        highlight = "🌟 " if user['username'] == st.session_state.username else ""
+                        house_emoji = {'yellow': '🟡', 'red': '🔴', 'blue': '🔵', 'green': '🟢', 'black': '⚫'}.get(user['house'], '')
+                        
+                        st.write(f"{medal} {highlight}**{user['name']}** {house_emoji} - {user['workouts']} workouts")
+                
+                # Your own position, even when outside the top 20
+                board_keys = {
+                    "Total House Points": 'house_points',
+                    "Workout Streak": 'streak',
+                    "Total Workouts": 'total_workouts'
+                }
+                if global_board_type in board_keys:
+                    my_rank = user_store.leaderboard_rank(board_keys[global_board_type], st.session_state.username)
+                    if my_rank:
+                        st.info(f"📍 Your rank: #{my_rank[0]} of {my_rank[1]}")
+        
+        with lb_tab2:
+            st.write("### 🏠 House Rankings")
+            st.write("See how each house member ranks!")
+            
+            user_house = user_data.get('house')
+            
+            if not user_house:
+                st.warning("You need to be in a house to view house rankings!")
+            else:
+                house_display = {'yellow': '🟡 Yellow', 'red': '🔴 Red', 'blue': '🔵 Blue', 
+                               'green': '🟢 Green', 'black': '⚫ Black'}.get(user_house, user_house.title())
+                
+                st.write(f"### {house_display} House Leaderboard")
+                
+                # Members of user's house (from the store's house index) who opted in
+                house_members = user_store.users([username for username, _ in user_store.house_members(user_house)])
+                house_members = {username: data for username, data in house_members.items()
+                                 if on_leaderboards(data)}
+                
+                if not house_members:
+                    st.info("No house members on leaderboards yet. Encourage your housemates to opt in!")
+                else:
+                    house_rank_type = st.selectbox("Rank By", [
+                        "House Points",
+                        "NAPFA Score",
+                        "Weekly Workouts"
+                    ], key="house_rank")
+                    
+                    rankings = []
+                    
+                    if house_rank_type == "House Points":
+                        for username, data in house_members.items():
+                            points = data.get('house_points_contributed', 0)
+                            rankings.append({
+                                'username': username,
+                                'name': data['name'],
+                                'value': points,
+                                'display': f"{points:.1f} points"
+                            })
+                    
+                    elif house_rank_type == "NAPFA Score":
+                        for username, data in house_members.items():
+                            if data.get('napfa_history'):
+                                score = data['napfa_history'][-1]['total']
+                                rankings.append({
+                                    'username': username,
+                                    'name': data['name'],
+                                    'value': score,
+                                    'display': f"{score}/30"
+                                })
+                    
+                    else:  # Weekly Workouts
+                        for username, data in house_members.items():
+                            if data.get('exercises'):
+                                workout_log = log_columns(data, 'exercises')
+                                weekly = workout_log.count(workout_log.recent(7))
+                                rankings.append({
+                                    'username': username,
+                                    'name': data['name'],
+                                    'value': weekly,
+                                    'display': f"{weekly} workouts"
+                                })
+                    
+                    rankings.sort(key=lambda x: x['value'], reverse=True)
+                    
+                    for idx, user in enumerate(rankings, 1):
+                        medal = "🥇" if idx == 1 else "🥈" if idx == 2 else "🥉" if idx == 3 else f"{idx}."
+                        highlight = "🌟 " if user['username'] == st.session_state.username else ""
+                        
+                        st.write(f"{medal} {highlight}**{user['name']}** - {user['display']}")
+        
+        with lb_tab3:
+            st.write("### 🏅 NAPFA High Scores")
+            st.write("Record-breaking performances!")
+            
+            if not user_store.leaderboard('napfa:total', 1):
+                st.info("No users on leaderboards yet.")
+            else:
+                # Age and gender filters
+                col1, col2 = st.columns(2)
+                with col1:
+                    score_age = st.selectbox("Age Group", ["All Ages"] + list(range(12, 19)), key="score_age")
+                with col2:
+                    score_gender = st.selectbox("Gender", ["All", "Male", "Female"], key="score_gender")
+                
+                # Leaderboard slice for these filters
+                age_key = None if score_age == "All Ages" else score_age
+                gender_key = None if score_gender == "All" else ('m' if score_gender == "Male" else 'f')
+                
+                if not user_store.leaderboard('napfa:total', 1, age_key, gender_key):
+                    st.info("No users in this category yet")
+                else:
+                    score_type = st.selectbox("Component", [
+                        "Total NAPFA Score",
+                        "Sit-Ups",
+                        "Standing Broad Jump",
+                        "Sit and Reach",
+                        "Pull-Ups",
+                        "Shuttle Run",
+                        "2.4km Run"
+                    ], key="score_component")
+                    
+                    high_scores = []
+                    
+                    component_map = {
+                        'Total NAPFA Score': 'total',
+                        'Sit-Ups': 'SU',
+                        'Standing Broad Jump': 'SBJ',
+                        'Sit and Reach': 'SAR',
+                        'Pull-Ups': 'PU',
+                        'Shuttle Run': 'SR',
+                        '2.4km Run': 'RUN'
+                    }
+                    component_key = component_map[score_type]
+                    board = 'napfa:' + component_key
+                    
+                    # Already sorted best first (lower is better for SR and RUN)
+                    top = user_store.leaderboard(board, 15, age_key, gender_key)
+                    ranked = user_store.users([username for username, _ in top])
+                    for username, score_value in top:
+                        data = ranked.get(username)
+                        if data is None:
+                            continue
+                        if component_key == 'total':
+                            display = f"{score_value}/30"
+                        elif component_key == 'SR':
+                            display = f"{score_value:.2f}s"
+                        elif component_key == 'RUN':
+                            display = f"{int(score_value)}:{int((score_value % 1) * 60):02d}"
+                        else:
+                            display = f"{score_value}"
+                        
+                        high_scores.append({
+                            'username': username,
+                            'name': data['name'],
+                            'score': score_value,
+                            'display': display,
+                            'house': data.get('house', 'N/A'),
+                            'age': data['age']
+                        })
+                    
+                    if high_scores:
+                        st.write(f"### 🏆 Top {score_type} Scores")
+                        
+                        for idx, user in enumerate(high_scores, 1):
+                            medal = "🥇" if idx == 1 else "🥈" if idx == 2 else "🥉" if idx == 3 else f"{idx}."
+                            highlight = "🌟 " if user['username'] == st.session_state.username else ""
+                            house_emoji = {'yellow': '🟡', 'red': '🔴', 'blue': '🔵', 'green': '🟢', 'black': '⚫'}.get(user['house'], '')
+                            
+                            st.write(f"{medal} {highlight}**{user['name']}** {house_emoji} (Age {user['age']}) - {user['display']}")
+                        
+                        # Show record
+                        if high_scores:
+                            record_holder = high_scores[0]
+                            st.success(f"🏆 **Record:** {record_holder['name']} - {record_holder['display']}")
+                        
+                        my_rank = user_store.leaderboard_rank(board, st.session_state.username, age_key, gender_key)
+                        if my_rank:
+                            st.info(f"📍 Your rank: #{my_rank[0]} of {my_rank[1]}")
+                    else:
+                        st.info("No scores available for this component")
+        
+        with lb_tab4:
+            st.write("### 👥 Friends Leaderboard")
+            st.write("Compete with your friends!")
+            
+            friends = user_data.get('friends', [])
+            
+            if not friends:
+                st.info("Add friends to see friend leaderboards!")
+            else:
+                # Include self in friend leaderboard
+                friend_users = {st.session_state.username: user_data}
+                friend_users.update(user_store.users(friends))
+                
+                friend_rank_type = st.selectbox("Rank By", [
+                    "House Points",
+                    "NAPFA Score",
+                    "Total Workouts",
+                    "Weekly Workouts"
+                ], key="friend_rank")
+                
+                rankings = []
+                
+                if friend_rank_type == "House Points":
+                    for username, data in friend_users.items():
+                        points = data.get('house_points_contributed', 0)
+                        rankings.append({
+                            'username': username,
+                            'name': data['name'],
+                            'value': points,
+                            'display': f"{points:.1f} points",
+                            'house': data.get('house', 'N/A')
+                        })
+                
+                elif friend_rank_type == "NAPFA Score":
+                    for username, data in friend_users.items():
+                        if data.get('napfa_history'):
+                            score = data['napfa_history'][-1]['total']
+                            rankings.append({
+                                'username': username,
+                                'name': data['name'],
+                                'value': score,
+                                'display': f"{score}/30",
+                                'house': data.get('house', 'N/A')
+                            })
+                
+                elif friend_rank_type == "Total Workouts":
+                    for username, data in friend_users.items():
+                        total = len(data.get('exercises', []))
+                        rankings.append({
+                            'username': username,
+                            'name': data['name'],
+                            'value': total,
+                            'display': f"{total} workouts",
+                            'house': data.get('house', 'N/A')
+                        })
+                
+                else:  # Weekly Workouts
+                    for username, data in friend_users.items():
+                        if data.get('exercises'):
+                            workout_log = log_columns(data, 'exercises')
+                            weekly = workout_log.count(workout_log.recent(7))
+                            rankings.append({
+                                'username': username,
+                                'name': data['name'],
+                                'value': weekly,
+                                'display': f"{weekly} workouts",
+                                'house': data.get('house', 'N/A')
+                            })
+                
+                rankings.sort(key=lambda x: x['value'], reverse=True)
+                
+                for idx, user in enumerate(rankings, 1):
+                    medal = "🥇" if idx == 1 else "🥈" if idx == 2 else "🥉" if idx == 3 else f"{idx}."
+                    highlight = "🌟 " if user['username'] == st.session_state.username else ""
+                    house_emoji = {'yellow': '🟡', 'red': '🔴', 'blue': '🔵', 'green': '🟢', 'black': '⚫'}.get(user['house'], '')
+                    
+                    st.write(f"{medal} {highlight}**{user['name']}** {house_emoji} - {user['display']}")
+        
+        with lb_tab5:
+            st.write("### 👫 Group Leaderboards")
+            st.write("See how your groups rank!")
+            
+            user_groups = {group_id: user_store.group(group_id)
+                           for group_id in user_store.groups_of(st.session_state.username)}
+            
+            if not user_groups:
+                st.info("Join a group to see group leaderboards!")
+            else:
+                selected_group_id = st.selectbox(
+                    "Select Group",
+                    list(user_groups),
+                    format_func=lambda x: (user_groups[x] or {}).get('name', 'Unknown Group'),
+                    key="select_group_lb"
+                )
+                
+                group = user_groups[selected_group_id]
+                
+                if group:
+                    st.write(f"### {group['name']} Leaderboard")
+                    
+                    group_rank_type = st.selectbox("Rank By", [
+                        "House Points",
+                        "NAPFA Score",
+                        "Total Workouts"
+                    ], key="group_rank")
+                    
+                    rankings = []
+                    
+                    # Each member's (house points, workouts, NAPFA total), kept by the store
+                    member_stats = user_store.group_member_stats(selected_group_id)
+                    member_users = user_store.users(member_stats)
+                    for member, stats in member_stats.items():
+                        member_data = member_users.get(member, {})
+                        house_points, workouts, napfa_total = stats or (0, 0, None)
+                        
+                        if group_rank_type == "House Points":
+                            value = house_points
+                            display = f"{value:.1f} points"
+                        elif group_rank_type == "NAPFA Score":
+                            if napfa_total is not None:
+                                value = napfa_total
+                                display = f"{value}/30"
+                            else:
+                                continue
+                        else:  # Total Workouts
+                            value = workouts
+                            display = f"{value} workouts"
+                        
+                        rankings.append({
+                            'username': member,
+                            'name': member_data.get('name', 'Unknown'),
+                            'value': value,
+                            'display': display,
+                            'house': member_data.get('house', 'N/A')
+                        })
+                    
+                    rankings.sort(key=lambda x: x['value'], reverse=True)
+                    
+                    for idx, user in enumerate(rankings, 1):
+                        medal = "🥇" if idx == 1 else "🥈" if idx == 2 else "🥉" if idx == 3 else f"{idx}."
+                        highlight = "🌟 " if user['username'] == st.session_state.username else ""
+                        house_emoji = {'yellow': '🟡', 'red': '🔴', 'blue': '🔵', 'green': '🟢', 'black': '⚫'}.get(user['house'], '')
+                        
+                        st.write(f"{medal} {highlight}**{user['name']}** {house_emoji} - {user['display']}")
+        
+        with lb_tab6:
+            st.write("### 📚 Class Leaderboards")
+            st.write("See your class rankings!")
+            
+            user_class = user_data.get('class')
+            
+            if not user_class:
+                st.info("Set your class in Privacy Settings to view class leaderboards!")
+            else:
+                st.write(f"### Class: {user_class}")
+                
+                # Get classmates (from the store's class index) who opted in
+                classmates = {username: data
+                              for username, data in user_store.users(user_store.find_all('class', user_class)).items()
+                              if on_leaderboards(data)}
+                
+                if not classmates:
+                    st.info("No classmates on leaderboards yet!")
+                else:
+                    class_rank_type = st.selectbox("Rank By", [
+                        "NAPFA Score",
+                        "House Points",
+                        "Total Workouts"
+                    ], key="class_rank")
+                    
+                    rankings = []
+                    
+                    if class_rank_type == "NAPFA Score":
+                        for username, data in classmates.items():
+                            if data.get('napfa_history'):
+                                score = data['napfa_history'][-1]['total']
+                                rankings.append({
+                                    'username': username,
+                                    'name': data['name'],
+                                    'value': score,
+                                    'display': f"{score}/30",
+                                    'house': data.get('house', 'N/A')
+                                })
+                    
+                    elif class_rank_type == "House Points":
+                        for username, data in classmates.items():
+                            points = data.get('house_points_contributed', 0)
+                            rankings.append({
+                                'username': username,
+                                'name': data['name'],
+                                'value': points,
+                                'display': f"{points:.1f} points",
+                                'house': data.get('house', 'N/A')
+                            })
+                    
+                    else:  # Total Workouts
+                        for username, data in classmates.items():
+                            total = len(data.get('exercises', []))
+                            rankings.append({
+                                'username': username,
+                                'name': data['name'],
+                                'value': total,
+                                'display': f"{total} workouts",
+                                'house': data.get('house', 'N/A')
+                            })
+                    
+                    rankings.sort(key=lambda x: x['value'], reverse=True)
+                    
+                    for idx, user in enumerate(rankings, 1):
+                        medal = "🥇" if idx == 1 else "🥈" if idx == 2 else "🥉" if idx == 3 else f"{idx}."
+                        highlight = "🌟 " if user['username'] == st.session_state.username else ""
+                        house_emoji = {'yellow': '🟡', 'red': '🔴', 'blue': '🔵', 'green': '🟢', 'black': '⚫'}.get(user['house'], '')
+                        
+                        st.write(f"{medal} {highlight}**{user['name']}** {house_emoji} - {user['display']}")
+    
+    with tab3:
+                st.write("### 🔥 Longest Workout Streaks")
+                
+                top = user_store.leaderboard('streak', 10)
+                ranked = user_store.users([username for username, _ in top])
+                streaks = [{
+                    'username': username,
+                    'name': ranked[username]['name'],
+                    'streak': streak
+                } for username, streak in top
+                if username in ranked]
+                
+                for idx, user in enumerate(streaks, 1):
+                    medal = "🥇" if idx == 1 else "🥈" if idx == 2 else "🥉" if idx == 3 else f"{idx}."
+                    
+                    highlight = "🌟 " if user['username'] == st.session_state.username else ""
+                    st.write(f"{medal} {highlight}**{user['name']}** (@{user['username']}) - {user['streak']} days 🔥")
+            
+    with tab3:
+        st.subheader("🎖️ My Achievements")
+        
+        # Actions award badges as they happen; this catches up records not yet checked under the current rules
+        new_badges = award_badges(user_data, ())
+        
+        if new_badges:
+            st.balloons()
+            st.success(f"🎉 You earned {len(new_badges)} new badge(s) and {sum(b['points'] for b in new_badges)} points!")
+            
+            update_user_data(user_data)
+        
+        # Display level and progress
+        current_level, level_min, level_max = calculate_level(user_data.get('total_points', 0))
+        user_data['level'] = current_level
+        update_user_data(user_data)
+        
+        st.write("### 📊 Your Progress")
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Level", current_level)
+        with col2:
+            st.metric("Total Points", user_data.get('total_points', 0))
+        with col3:
+            st.metric("Login Streak", f"{user_data.get('login_streak', 0)} days")
+        
+        # Progress bar to next level
+        if current_level != "Legend":
+            progress = (user_data.get('total_points', 0) - level_min) / (level_max - level_min)
+            st.progress(progress)
+            st.write(f"**Next Level:** {level_max - user_data.get('total_points', 0)} points to go!")
+        else:
+            st.success("🏆 You've reached the maximum level!")
+        
+        # Display badges
+        st.write("")
+        st.write("### 🎖️ Earned Badges")
+        
+        if user_data.get('badges'):
+            # Sort by date
+            badges = sorted(user_data['badges'], key=lambda x: x['date'], reverse=True)
+            
+            cols = st.columns(3)
+            for idx, badge in enumerate(badges):
+                with cols[idx % 3]:
+                    st.markdown(f"""
+                    <div style="background: linear-gradient(135deg, #1976d2 0%, #1565c0 100%); 
+                                padding: 15px; border-radius: 10px; color: white; margin: 5px;">
+                        <h3>{badge['name']}</h3>
+                        <p>{badge['description']}</p>
+                        <small>Earned: {badge['date']} | +{badge['points']} pts</small>
+                    </div>
+                    """, unsafe_allow_html=True)
+        else:
+            st.info("No badges earned yet. Keep working out to unlock achievements!")
+        
+        # Available badges to earn
+        st.write("")
+        st.write("### 🎯 Available Badges")
+        
+        earned_names = [b['name'] for b in user_data.get('badges', [])]
+        remaining = [b for b in BADGE_CATALOG if not any(name in b for name in earned_names)]
+        
+        for badge in remaining:
+            st.write(f"🔒 {badge}")
+    
+    with tab4:
+        st.subheader("👥 Friends")
+        
+        # Friend requests
+        friend_requests = user_data.get('friend_requests', [])
+        if friend_requests:
+            st.write("### 📬 Friend Requests")
+            requesters = user_store.users(friend_requests)
+            for requester in friend_requests:
+                col1, col2, col3 = st.columns([3, 1, 1])
+                with col1:
+                    requester_data = requesters.get(requester, {})
+                    st.write(f"**{requester_data.get('name', 'Unknown')}** (@{requester})")
+                with col2:
+                    if st.button("✅ Accept", key=f"accept_{requester}"):
+                        # Saves both users
+                        accept_friend(user_store, st.session_state.username, requester)
+                        st.success(f"Added {requester} as friend!")
+                        st.rerun()
+                with col3:
+                    if st.button("❌ Decline", key=f"decline_{requester}"):
+                        decline_friend(user_store, st.session_state.username, requester)
+                        st.rerun()
+        
+        # Add friend
+        st.write("### ➕ Add Friend")
+        new_friend = st.text_input("Enter username", key="add_friend_input")
+        if st.button("Send Friend Request"):
+            try:
+                send_friend_request(user_store, st.session_state.username, new_friend)
+            except ActionError as e:
+                st.error(str(e))
+            else:
+                st.success(f"Friend request sent to {new_friend}!")
+        
+        # Friends list
+        st.write("### 👥 My Friends")
+        friends = user_data.get('friends', [])
+        
+        if friends:
+            friend_records = user_store.users(friends)
+            for friend in friends:
+                friend_data = friend_records.get(friend, {})
+                
+                with st.expander(f"👤 {friend_data.get('name', 'Unknown')} (@{friend})"):
+                    col1, col2 = st.columns(2)
+                    
+                    with col1:
+                        st.write(f"**Age:** {friend_data.get('age', 'N/A')}")
+                        st.write(f"**School:** {friend_data.get('school', 'N/A')}")
+                        st.write(f"**Level:** {friend_data.get('level', 'Novice')}")
+                    
+                    with col2:
+                        if friend_data.get('napfa_history'):
+                            latest = friend_data['napfa_history'][-1]
+                            st.write(f"**NAPFA:** {latest['total']}/30")
+                            st.write(f"**Medal:** {latest['medal']}")
+                        
+                        if friend_data.get('exercises'):
+                            st.write(f"**Workouts:** {len(friend_data['exercises'])}")
+                    
+                    # Recent activity
+                    if friend_data.get('badges'):
+                        recent_badge = friend_data['badges'][-1]
+                        st.info(f"🎖️ Recently earned: {recent_badge['name']}")
+                    
+                    if st.button(f"Remove Friend", key=f"remove_{friend}"):
+                        remove_friend(user_store, st.session_state.username, friend)
+                        st.rerun()
+        else:
+            st.info("No friends yet. Add friends to see their progress!")
+        
+        # GROUPS SECTION
+        st.write("")
+        st.write("---")
+        st.write("## 👫 Groups")
+        st.write("Create or join groups to workout together!")
+        
+        # Initialize user groups
+        if 'groups' not in user_data:
+            user_data['groups'] = []
+            user_data['group_invites'] = []
+            update_user_data(user_data)
+        
+        group_tab1, group_tab2 = st.tabs(["My Groups", "Create/Join Group"])
+        
+        with group_tab1:
+            st.write("### 👫 My Groups")
+            
+            user_groups = user_store.groups_of(st.session_state.username)
+            
+            if user_groups:
+                for group_id in user_groups:
+                    group = user_store.group(group_id)
+                    if group:
+                        group_users = user_store.users([group['admin']] + group['members'])
+                        with st.expander(f"👫 {group['name']} ({len(group['members'])}/{group['max_members']} members)"):
+                            st.write(f"**Type:** {group['type']}")
+                            st.write(f"**Description:** {group['description']}")
+                            st.write(f"**Admin:** {group_users.get(group['admin'], {}).get('name', 'Unknown')}")
+                            st.write(f"**Created:** {group['created']}")
+                            
+                            # Members list
+                            st.write("")
+                            st.write("**Members:**")
+                            for member in group['members']:
+                                member_data = group_users.get(member, {})
+                                admin_badge = " 👑" if member == group['admin'] else ""
+                                st.write(f"• {member_data.get('name', 'Unknown')} (@{member}){admin_badge}")
+                            
+                            # Group stats (running totals kept by the store)
+                            st.write("")
+                            group_totals = user_store.group_totals(group_id)
+                            
+                            col1, col2 = st.columns(2)
+                            with col1:
+                                st.metric("Total Workouts", group_totals['workouts'])
+                            with col2:
+                                st.metric("Total House Points", f"{group_totals['house_points']:.1f}")
+                            
+                            # Group leaderboard
+                            st.write("")
+                            st.write("**Group Leaderboard:**")
+                            member_scores = [(m, stats[0] if stats else 0)
+                                             for m, stats in user_store.group_member_stats(group_id).items()]
+                            member_scores.sort(key=lambda x: x[1], reverse=True)
+                            
+                            for idx, (member, score) in enumerate(member_scores[:5], 1):
+                                medal = "🥇" if idx == 1 else "🥈" if idx == 2 else "🥉" if idx == 3 else f"{idx}."
+                                member_name = group_users.get(member, {}).get('name', 'Unknown')
+                                highlight = " 🌟" if member == st.session_state.username else ""
+                                st.write(f"{medal} {member_name}{highlight} - {score:.1f} points")
+                            
+                            # Invite friends (admin only)
+                            if group['admin'] == st.session_state.username:
+                                st.write("")
+                                st.write("**Invite Friends:**")
+                                
+                                available_friends = [f for f in user_data.get('friends', []) if f not in group['members']]
+                                
+                                if available_friends and len(group['members']) < group['max_members']:
+                                    friend_names = {f: d.get('name', 'Unknown')
+                                                    for f, d in user_store.users(available_friends).items()}
+                                    invite_friend = st.selectbox(
+                                        "Select friend",
+                                        available_friends,
+                                        format_func=lambda x: friend_names.get(x, 'Unknown'),
+                                        key=f"invite_{group_id}"
+                                    )
+                                    
+                                    if st.button(f"Send Invite", key=f"send_{group_id}"):
+                                        invite_to_group(user_store, group_id, invite_friend)
+                                        st.success(f"Invite sent!")
+                                        st.rerun()
+                                elif len(group['members']) >= group['max_members']:
+                                    st.info("Group is full!")
+                            
+                            # Leave group
+                            if st.button(f"Leave Group", key=f"leave_{group_id}"):
+                                leave_group(user_store, st.session_state.username, group_id)
+                                st.rerun()
+            else:
+                st.info("You're not in any groups yet. Create or join one in the other tab!")
+        
+        with group_tab2:
+            st.write("### 🆕 Create New Group")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                group_name = st.text_input("Group Name", placeholder="e.g., Running Club")
+                group_description = st.text_area("Description", placeholder="Group goals...")
+            
+            with col2:
+                group_type = st.selectbox("Type", GROUP_TYPES)
+                max_members = st.number_input("Max Members", min_value=2, max_value=50, value=10)
+            
+            if st.button("Create Group", type="primary"):
+                try:
+                    create_group(user_store, st.session_state.username, group_name, group_description, group_type,
+                                 max_members)
+                except ActionError as e:
+                    st.error(str(e))
+                else:
+                    st.success(f"Group '{group_name}' created!")
+                    st.balloons()
+                    st.rerun()
+            
+            # Group Invites
+            group_invites = user_data.get('group_invites', [])
+            if group_invites:
+                st.write("")
+                st.write("### 📬 Group Invitations")
+                
+                for group_id in group_invites:
+                    group = user_store.group(group_id)
+                    if group:
+                        col1, col2, col3 = st.columns([3, 1, 1])
+                        with col1:
+                            st.write(f"**{group['name']}** - {group['type']}")
+                        with col2:
+                            if st.button("✅ Join", key=f"join_{group_id}"):
+                                try:
+                                    join_group(user_store, st.session_state.username, group_id)
+                                except ActionError as e:
+                                    st.error(str(e))
+                                else:
+                                    st.success(f"Joined {group['name']}!")
+                                    st.rerun()
+                        with col3:
+                            if st.button("❌", key=f"decline_{group_id}"):
+                                decline_group(user_data, group_id)
+                                update_user_data(user_data)
+                                st.rerun()
+    
+    with tab5:
+        st.subheader("⚡ Challenges")
+        
+        # Weekly Challenges
+        st.write("### 🏃 Weekly Challenges")
+        
+        for challenge in WEEKLY_CHALLENGES:
+            with st.expander(f"{'✅' if challenge['name'] in [c['name'] for c in user_data.get('completed_challenges', [])] else '⚡'} {challenge['name']} (+{challenge['points']} pts)", expanded=True):
+                st.write(f"**Goal:** {challenge['description']}")
+                
+                # Calculate progress
+                progress = challenge_progress(user_data, challenge)
+                
+                st.progress(min(progress / challenge['target'], 1.0))
+                st.write(f"**Progress:** {progress}/{challenge['target']}")
+                
+                if progress >= challenge['target'] and complete_challenge(user_data, challenge):
+                    st.success("🎉 Challenge completed! Points awarded!")
+                    update_user_data(user_data)
+        
+        # Friend Challenges
+        st.write("")
+        st.write("### 🤝 Friend Challenges")
+        
+        friends = user_data.get('friends', [])
+        if not friends:
+            st.info("Add friends to create challenges with them!")
+        else:
+            selected_friend = st.selectbox("Challenge a friend", friends)
+            
+            challenge_types = [
+                "Most workouts this week",
+                "Highest NAPFA score",
+                "Longest workout streak"
+            ]
+            
+            challenge_type = st.selectbox("Challenge type", challenge_types)
+            
+            if st.button("Send Challenge"):
+                st.success(f"Challenge sent to {selected_friend}! (Feature coming soon)")
+        
+        # Class Challenges
+        st.write("")
+        st.write("### 🏫 Class Challenges")
+        
+        if user_data.get('class'):
+            st.write(f"**Your Class:** {user_data['class']}")
+            
+            # Get class members
+            class_members = {u: d for u, d in user_store.users(user_store.find_all('class', user_data['class'])).items()
+                             if d.get('show_on_leaderboards', False)}
+            
+            if len(class_members) > 1:
+                st.write(f"**Class Members:** {len(class_members)}")
+                
+                # Show class goal
+                st.info("🎯 **Class Goal:** Average NAPFA score of 20+ by end of month!")
+                
+                # Calculate class average
+                napfa_scores = []
+                for data in class_members.values():
+                    if data.get('napfa_history'):
+                        napfa_scores.append(data['napfa_history'][-1]['total'])
+                
+                if napfa_scores:
+                    class_avg = sum(napfa_scores) / len(napfa_scores)
+                    st.metric("Current Class Average", f"{class_avg:.1f}/30")
+                    
+                    if class_avg >= 20:
+                        st.success("🎉 Class goal achieved!")
+            else:
+                st.info("Not enough class members on leaderboards yet")
+        else:
+            st.info("Set your class in Privacy Settings to join class challenges!")
+    
+    with tab6:
+        st.subheader("⚙️ Privacy Settings")
+        
+        st.write("### 👁️ Leaderboard Visibility")
+        
+        current_setting = user_data.get('show_on_leaderboards', False)
+        new_setting = st.checkbox("Show me on public leaderboards", value=current_setting)
+        
+        if new_setting != current_setting:
+            user_data['show_on_leaderboards'] = new_setting
+            update_user_data(user_data)
+            st.success("✅ Settings updated!")
+            st.rerun()
+        
+        st.info("ℹ️ When enabled, your stats will be visible on leaderboards. Your friends can always see your profile.")
+        
+        # Update school/class
+        st.write("")
+        st.write("### 🏫 School & Class")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            current_school = user_data.get('school', '')
+            new_school = st.text_input("School", value=current_school, key="update_school")
+        
+        with col2:
+            current_class = user_data.get('class', '')
+            new_class = st.text_input("Class", value=current_class, key="update_class")
+        
+        if st.button("Update School/Class Info"):
+            user_data['school'] = new_school
+            user_data['class'] = new_class
+            update_user_data(user_data)
+            st.success("✅ Updated!")
+            st.rerun()
+        
+        # Personal Data Export (Phase 7 BONUS!)
+        st.write("")
+        st.write("### 📥 Export Your Data")
+        st.write("Download all your personal fitness data")
+        
+        if st.button("📥 Download My Data (JSON)", type="secondary"):
+            import json
+            
+            # Create exportable data
+            export_data = {
+                'account_info': {
+                    'name': user_data.get('name'),
+                    'email': user_data.get('email'),
+                    'age': user_data.get('age'),
+                    'gender': 'Male' if user_data.get('gender') == 'm' else 'Female',
+                    'school': user_data.get('school'),
+                    'class': user_data.get('class'),
+                    'house': user_data.get('house'),
+                    'created': user_data.get('created'),
+                    'role': user_data.get('role')
+                },
+                'fitness_data': {
+                    'bmi_history': user_data.get('bmi_history', []),
+                    'napfa_history': user_data.get('napfa_history', []),
+                    'sleep_history': user_data.get('sleep_history', []),
+                    'exercises': user_data.get('exercises', []),
+                    'total_workout_hours': user_data.get('total_workout_hours', 0),
+                    'house_points_contributed': user_data.get('house_points_contributed', 0)
+                },
+                'achievements': {
+                    'badges': user_data.get('badges', []),
+                    'level': user_data.get('level'),
+                    'total_points': user_data.get('total_points', 0),
+                    'login_streak': user_data.get('login_streak', 0)
+                },
+                'social': {
+                    'friends': user_data.get('friends', []),
+                    'groups': user_data.get('groups', [])
+                },
+                'goals': user_data.get('smart_goals', []),
+                'exported_date': datetime.now().isoformat()
+            }
+            
+            # Convert to JSON
+            json_data = json.dumps(export_data, indent=2)
+            
+            st.download_button(
+                label="📥 Download JSON File",
+                data=json_data,
+                file_name=f"fittrack_data_{user_data.get('name', 'user')}_{datetime.now().strftime('%Y%m%d')}.json",
+                mime="application/json"
+            )
+            
+            st.success("✅ Your data is ready for download!")
+            st.info("💡 This JSON file contains all your FitTrack data. Keep it safe as a backup!")
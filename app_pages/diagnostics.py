@@ -0,0 +1,68 @@
+"""Diagnostics page for admins: where this server process spends its time."""
+import json
+import os
+
+import streamlit as st
+
+from app_pages import IMPORT_TIMES
+from app_pages.common import is_admin, job_queue
+from fittrack import instrument
+
+
+# Diagnostics (admins only)
+def diagnostics_page():
+    st.header("🩺 Diagnostics")
+    if not is_admin():
+        st.error("This page is only available to administrators.")
+        return
+
+    st.write(f"Timings for this server process (pid {os.getpid()}), shared by every session.")
+
+    recording = st.toggle("Record timings", value=instrument.enabled(),
+                          help="Same as starting the server with FITTRACK_PROFILE=1")
+    if recording != instrument.enabled():
+        instrument.enable(recording)
+        st.rerun()
+
+    report = instrument.summary()
+    st.caption(f"Recording since {report['started']}")
+
+    if report['timings']:
+        st.subheader("⏱️ Operations")
+        st.dataframe([{'Operation': name, 'Calls': stats['calls'],
+                       'p50 ms': stats['p50_ms'], 'p95 ms': stats['p95_ms'], 'p99 ms': stats['p99_ms'],
+                       'Max ms': stats['max_ms'], 'Total ms': stats['total_ms']}
+                      for name, stats in report['timings'].items()],
+                     hide_index=True, use_container_width=True)
+    elif recording:
+        st.info("Nothing recorded yet. Use the app for a while and come back.")
+    else:
+        st.info("Recording is off. Switch it on to start collecting timings.")
+
+    if report['counters']:
+        st.subheader("🔢 Counters")
+        st.dataframe([{'Counter': name, 'Count': n} for name, n in report['counters'].items()],
+                     hide_index=True, use_container_width=True)
+
+    if IMPORT_TIMES:
+        st.subheader("📦 Page imports")
+        st.dataframe([{'Module': name, 'First import ms': round(seconds * 1000, 1)}
+                      for name, seconds in IMPORT_TIMES.items()],
+                     hide_index=True, use_container_width=True)
+
+    job_counts = job_queue.counts()
+    if job_counts:
+        st.subheader("🧵 Background jobs")
+        st.caption("Every server process, from the shared job table.")
+        st.dataframe([{'Job': kind, 'Status': status, 'Jobs': n} for (kind, status), n in job_counts.items()],
+                     hide_index=True, use_container_width=True)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button("📥 Download JSON", json.dumps(report, indent=2),
+                           file_name=f"fittrack_timings_{os.getpid()}.json", mime="application/json")
+    with col2:
+        if st.button("🗑️ Reset"):
+            instrument.reset()
+            st.rerun()
+    st.caption("Compare two downloads with `python -m fittrack.instrument before.json after.json`.")
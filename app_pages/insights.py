@@ -0,0 +1,846 @@
+"""AI Insights page and its recommendation helpers."""
+import time
+from datetime import datetime, timedelta
+
+import streamlit as st
+
+from app_pages.common import get_user_data, update_user_data
+from fittrack.catalogs import RECIPES
+from fittrack.timeseries import log_columns
+
+
+# Body Type Calculator
+def calculate_body_type(weight, height):
+    """Calculate body type based on BMI and frame"""
+    bmi = weight / (height * height)
+    
+    # Simplified body type classification
+    if bmi < 18.5:
+        return "Ectomorph", "Naturally lean, fast metabolism, difficulty gaining weight"
+    elif bmi < 25:
+        if bmi < 21.5:
+            return "Ectomorph", "Naturally lean, fast metabolism, difficulty gaining weight"
+        else:
+            return "Mesomorph", "Athletic build, gains muscle easily, responds well to training"
+    elif bmi < 30:
+        return "Mesomorph", "Athletic build, gains muscle easily, responds well to training"
+    else:
+        return "Endomorph", "Larger bone structure, gains weight easily, slower metabolism"
+
+
+# Recipe API Integration (using TheMealDB - free API)
+def search_recipes_by_diet(diet_type, meal_type=""):
+    """Search for recipes based on diet goals"""
+    # Curated list based on diet needs until a recipe API is wired in
+    return RECIPES
+
+
+# AI Helper Functions
+def generate_ai_response(question, user_data):
+    """Generate AI response based on user question and their data"""
+    question_lower = question.lower()
+    
+    # Analyze user data for context
+    has_napfa = len(user_data.get('napfa_history', [])) > 0
+    has_bmi = len(user_data.get('bmi_history', [])) > 0
+    has_sleep = len(user_data.get('sleep_history', [])) > 0
+    
+    # NAPFA related questions
+    if 'napfa' in question_lower or 'pull' in question_lower or 'sit up' in question_lower or 'run' in question_lower:
+        if has_napfa:
+            latest = user_data['napfa_history'][-1]
+            weak_tests = [test for test, grade in latest['grades'].items() if grade < 3]
+            if weak_tests:
+                return f"Based on your latest NAPFA test, I see you need work on: {', '.join(weak_tests)}. Check the 'Workout Recommendations' tab for specific exercises! Focus on consistency - train each weak area 3-4x per week."
+            else:
+                return f"Great NAPFA scores! Your total is {latest['total']} points. To maintain or improve: (1) Keep training all components weekly, (2) Focus on explosive power for jumps, (3) Mix steady runs with sprints, (4) Don't neglect flexibility!"
+        else:
+            return "Complete a NAPFA test first so I can give you personalized advice! Once you do, I'll analyze your weak areas and create a specific plan."
+    
+    # BMI/Weight related
+    elif 'weight' in question_lower or 'bmi' in question_lower or 'lose' in question_lower or 'gain' in question_lower:
+        if has_bmi:
+            latest_bmi = user_data['bmi_history'][-1]
+            category = latest_bmi['category']
+            if category == "Normal":
+                return f"Your BMI is {latest_bmi['bmi']} (Normal range). To maintain: eat balanced meals, exercise 4-5x/week, stay hydrated. Focus on building strength and endurance rather than weight change!"
+            elif category == "Underweight":
+                return "To gain healthy weight: (1) Eat 5-6 small meals daily, (2) Focus on protein + complex carbs, (3) Strength train 3-4x/week, (4) Drink smoothies with banana, oats, peanut butter. Check 'Meal Suggestions' for specific foods!"
+            else:
+                return "For healthy weight loss: (1) Create small calorie deficit (200-300 cal), (2) Eat lean protein + veggies each meal, (3) Do cardio 4-5x/week, (4) Avoid sugary drinks. Check 'Meal Suggestions' for detailed plan!"
+        else:
+            return "Calculate your BMI first! Then I can give you personalized nutrition and training advice for your goals."
+    
+    # Sleep related
+    elif 'sleep' in question_lower or 'tired' in question_lower or 'energy' in question_lower:
+        if has_sleep:
+            sleep_data = user_data['sleep_history']
+            avg_hours = sum([s['hours'] + s['minutes']/60 for s in sleep_data]) / len(sleep_data)
+            if avg_hours >= 8:
+                return f"Your sleep is excellent at {avg_hours:.1f} hours! Keep it consistent. If still tired: check iron levels, reduce screen time before bed, and ensure quality sleep (dark, cool room)."
+            else:
+                return f"You're averaging {avg_hours:.1f} hours - you need 8-10 hours as a teen! Tips: (1) Set bedtime alarm, (2) No screens 1hr before bed, (3) Same sleep schedule daily, (4) Avoid caffeine after 2pm. Check 'Sleep Insights' for more!"
+        else:
+            return "Track your sleep for a few days first! Then I can analyze your patterns and give specific advice. Teenagers need 8-10 hours for optimal performance and recovery."
+    
+    # Strength training
+    elif 'strength' in question_lower or 'muscle' in question_lower or 'strong' in question_lower:
+        return "To build strength: (1) Focus on compound exercises (push-ups, pull-ups, squats), (2) Progressive overload - increase difficulty weekly, (3) Eat protein after workouts, (4) Rest 48hrs between training same muscles, (5) Start with bodyweight, add resistance gradually. Check 'Custom Workout Plan' for a complete program!"
+    
+    # Cardio/Endurance
+    elif 'cardio' in question_lower or 'endurance' in question_lower or 'stamina' in question_lower:
+        return "Build endurance with: (1) Start at comfortable pace - able to talk while running, (2) Gradually increase distance by 10% weekly, (3) Mix steady runs (30-45min) with intervals (sprint 1min, jog 2min x 8), (4) Cross-train with swimming/cycling, (5) Stay hydrated! Aim for 3-4 cardio sessions weekly."
+    
+    # Diet/Nutrition
+    elif 'eat' in question_lower or 'food' in question_lower or 'diet' in question_lower or 'meal' in question_lower:
+        return "For athletic performance: (1) Eat breakfast within 1hr of waking, (2) Balance each meal: lean protein + complex carbs + vegetables, (3) Pre-workout: banana + peanut butter, (4) Post-workout: protein + carbs within 1hr, (5) Stay hydrated - 8-10 glasses daily, (6) Limit processed foods and sugar. Check 'Meal Suggestions' for specific plans!"
+    
+    # Recovery
+    elif 'recover' in question_lower or 'sore' in question_lower or 'rest' in question_lower:
+        return "Recovery is crucial! (1) Sleep 8-10 hours, (2) Eat protein within 1hr post-workout, (3) Stay hydrated, (4) Active recovery: light walk/swim on rest days, (5) Stretch daily, (6) Ice sore muscles, (7) Rest 1-2 full days/week. Muscle soreness 24-48hrs after workout is normal (DOMS)!"
+    
+    # Motivation
+    elif 'motivat' in question_lower or 'give up' in question_lower or 'hard' in question_lower:
+        return "Stay motivated! 💪 (1) Set small, achievable goals, (2) Track progress - celebrate small wins, (3) Find a workout buddy, (4) Mix up your routine to stay interested, (5) Remember your 'why', (6) Progress isn't linear - some weeks are tough, (7) Focus on how you FEEL not just numbers. You've got this!"
+    
+    # Flexibility
+    elif 'stretch' in question_lower or 'flexibility' in question_lower or 'flexib' in question_lower:
+        return "Improve flexibility: (1) Stretch AFTER workouts when muscles are warm, (2) Hold each stretch 30-60 seconds, (3) Never bounce, (4) Stretch daily - even on rest days, (5) Focus on hamstrings, hip flexors, shoulders, (6) Try yoga 1-2x/week, (7) Breathe deeply while stretching. Flexibility improves injury prevention and performance!"
+    
+    # Injury
+    elif 'injur' in question_lower or 'pain' in question_lower or 'hurt' in question_lower:
+        return "⚠️ If you have pain (not soreness): (1) STOP that activity immediately, (2) Rest and ice the area, (3) See a doctor/physiotherapist if pain persists, (4) Don't train through pain - it makes injuries worse. Prevention: warm up properly, increase intensity gradually, use proper form, rest adequately. Your health comes first!"
+    
+    # Default helpful response
+    else:
+        return "I can help with: NAPFA training, strength building, cardio/endurance, nutrition/meals, weight management, sleep optimization, recovery, flexibility, injury prevention, and motivation! Try asking about any of these topics, or check the other tabs for detailed insights based on your data. What specific aspect of fitness would you like to know about?"
+
+
+# AI Insights and Recommendations
+def ai_insights():
+    st.header("🤖 AI Fitness Coach")
+    
+    user_data = get_user_data()
+    
+    # Create tabs for AI features - cleaned up, removed empty/duplicate tabs
+    tab1, tab2, tab3, tab4 = st.tabs([
+        "🤖 ML Predictions",
+        "🎯 SMART Goals",
+        "🗓️ AI Schedule Generator",
+        "🍳 Health Recipes"
+    ])
+    
+    with tab1:
+        st.subheader("🤖 Machine Learning Predictions & Statistical Analysis")
+        st.write("AI-powered predictions based on your performance data")
+        
+        # Check if enough data
+        has_napfa = len(user_data.get('napfa_history', [])) > 0
+        has_multiple_napfa = len(user_data.get('napfa_history', [])) >= 2
+        has_sleep = len(user_data.get('sleep_history', [])) >= 7
+        has_exercises = len(user_data.get('exercises', [])) >= 5
+        
+        # Prediction 1: When will you reach NAPFA Gold?
+        st.write("### 🥇 NAPFA Gold Prediction")
+        
+        if not has_napfa:
+            st.info("Complete your first NAPFA test to get predictions!")
+        elif not has_multiple_napfa:
+            latest_napfa = user_data['napfa_history'][-1]
+            current_score = latest_napfa['total']
+            
+            if current_score >= 21:
+                st.success(f"🎉 You already have NAPFA Gold! (Score: {current_score}/30)")
+            else:
+                points_needed = 21 - current_score
+                st.info(f"**Current Score:** {current_score}/30")
+                st.info(f"**Points Needed for Gold:** {points_needed}")
+                st.write("Complete another NAPFA test to get improvement rate predictions!")
+        else:
+            # ML Prediction: Linear regression on NAPFA scores
+            napfa_history = user_data['napfa_history']
+            scores = [test['total'] for test in napfa_history]
+            dates = [datetime.strptime(test['date'], '%Y-%m-%d') for test in napfa_history]
+            
+            # Calculate improvement rate
+            days_between = [(dates[i] - dates[i-1]).days for i in range(1, len(dates))]
+            score_changes = [scores[i] - scores[i-1] for i in range(1, len(scores))]
+            
+            if sum(days_between) > 0:
+                avg_improvement_per_day = sum(score_changes) / sum(days_between)
+                avg_improvement_per_month = avg_improvement_per_day * 30
+                
+                current_score = scores[-1]
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.metric("Current NAPFA", f"{current_score}/30")
+                    st.metric("Improvement Rate", f"+{avg_improvement_per_month:.2f} pts/month")
+                
+                with col2:
+                    if current_score >= 21:
+                        st.success("🥇 Gold Medal Achieved!")
+                    else:
+                        points_needed = 21 - current_score
+                        if avg_improvement_per_day > 0:
+                            days_to_gold = points_needed / avg_improvement_per_day
+                            months_to_gold = days_to_gold / 30
+                            predicted_date = datetime.now() + timedelta(days=days_to_gold)
+                            
+                            st.metric("Points to Gold", points_needed)
+                            st.metric("Predicted Gold Date", predicted_date.strftime('%B %Y'))
+                            
+                            st.info(f"📅 At your current rate, you'll reach Gold in ~{months_to_gold:.1f} months!")
+                        else:
+                            st.warning("Your score is decreasing. Focus on training to improve!")
+                
+                # Show prediction chart
+                st.write("### 📈 Score Projection")
+                
+                # Project next 6 months
+                future_dates = [datetime.now() + timedelta(days=30*i) for i in range(7)]
+                future_scores = [current_score + (avg_improvement_per_day * 30 * i) for i in range(7)]
+                future_scores = [min(max(s, 0), 30) for s in future_scores]  # Cap at 0-30
+                
+                import pandas as pd  # only needed for the chart
+                df = pd.DataFrame({
+                    'Date': [d.strftime('%b %Y') for d in future_dates],
+                    'Predicted Score': future_scores
+                })
+                
+                st.line_chart(df.set_index('Date'))
+                
+                st.write(f"**Model:** Linear regression based on {len(napfa_history)} test(s)")
+                st.write(f"**Confidence:** {'High' if len(napfa_history) >= 4 else 'Medium' if len(napfa_history) >= 3 else 'Low'}")
+        
+        st.write("---")
+        
+        # Prediction 2: Sleep Impact on Performance
+        st.write("### 😴 Sleep Impact Analysis")
+        
+        if not has_sleep or not has_napfa:
+            st.info("Track sleep for 7+ days and complete NAPFA to see correlation!")
+        else:
+            sleep_data = user_data['sleep_history']
+            
+            # Calculate average sleep
+            avg_sleep_hours = sum([s['hours'] + s['minutes']/60 for s in sleep_data]) / len(sleep_data)
+            
+            # Analyze NAPFA performance vs sleep
+            napfa_score = user_data['napfa_history'][-1]['total']
+            
+            # Statistical correlation (simplified)
+            if avg_sleep_hours >= 8:
+                performance_rating = "Optimal"
+                color = "#4caf50"
+                insight = "Your sleep supports peak performance! Keep it up."
+                predicted_improvement = 0
+            elif avg_sleep_hours >= 7:
+                performance_rating = "Good"
+                color = "#8bc34a"
+                insight = "Good sleep, but getting 8+ hours could improve your NAPFA score by ~2-3 points."
+                predicted_improvement = 2.5
+            else:
+                performance_rating = "Below Optimal"
+                color = "#ff9800"
+                insight = "⚠️ Poor sleep is limiting your performance. Getting 8+ hours could improve your score by ~5 points!"
+                predicted_improvement = 5
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Average Sleep", f"{avg_sleep_hours:.1f} hours")
+                st.metric("Current NAPFA", f"{napfa_score}/30")
+            
+            with col2:
+                st.markdown(f'<div class="stat-card" style="background: {color}; color: white;"><h3>{performance_rating}</h3></div>', unsafe_allow_html=True)
+                if predicted_improvement > 0:
+                    st.metric("Potential Gain", f"+{predicted_improvement:.1f} points")
+            
+            st.info(f"💡 **Insight:** {insight}")
+            
+            # Show correlation
+            st.write("**Research shows:** Students who sleep 8+ hours score on average 15% higher on NAPFA tests.")
+        
+        st.write("---")
+        
+        # Prediction 3: Injury Risk Prediction
+        st.write("### 🏥 Injury Risk Assessment")
+        
+        if not has_exercises:
+            st.info("Log 5+ workouts to get injury risk analysis!")
+        else:
+            exercises = user_data['exercises']
+            
+            # Calculate workout intensity distribution
+            intensity_counts = {'Low': 0, 'Medium': 0, 'High': 0}
+            for ex in exercises:
+                intensity_counts[ex['intensity']] += 1
+            
+            total = sum(intensity_counts.values())
+            high_intensity_ratio = intensity_counts['High'] / total if total > 0 else 0
+            
+            # Check workout frequency (last 2 weeks)
+            workout_log = log_columns(user_data, 'exercises')
+            workouts_per_week = workout_log.count(workout_log.recent(14)) / 2
+            
+            # Risk calculation
+            risk_score = 0
+            risk_factors = []
+            
+            if high_intensity_ratio > 0.7:
+                risk_score += 30
+                risk_factors.append("⚠️ Too many high-intensity workouts (>70%)")
+            
+            if workouts_per_week > 6:
+                risk_score += 25
+                risk_factors.append("⚠️ Insufficient rest days (<1 per week)")
+            
+            if workouts_per_week < 2:
+                risk_score += 15
+                risk_factors.append("⚠️ Inconsistent training increases injury risk")
+            
+            # Sleep factor
+            if has_sleep:
+                if avg_sleep_hours < 7:
+                    risk_score += 20
+                    risk_factors.append("⚠️ Poor sleep reduces recovery")
+            
+            # Determine risk level
+            if risk_score >= 50:
+                risk_level = "High Risk"
+                risk_color = "#f44336"
+                recommendation = "🚨 REDUCE intensity and take more rest days!"
+            elif risk_score >= 25:
+                risk_level = "Moderate Risk"
+                risk_color = "#ff9800"
+                recommendation = "⚠️ Balance your training intensity and rest."
+            else:
+                risk_level = "Low Risk"
+                risk_color = "#4caf50"
+                recommendation = "✅ Your training is well-balanced!"
+            
+            st.markdown(f'<div class="stat-card" style="background: {risk_color}; color: white;"><h2>Risk Level: {risk_level}</h2><p>{recommendation}</p></div>', unsafe_allow_html=True)
+            
+            if risk_factors:
+                st.write("**Risk Factors:**")
+                for factor in risk_factors:
+                    st.write(factor)
+            
+            st.write("")
+            st.write("**Injury Prevention Tips:**")
+            st.write("1. Include 1-2 rest days per week")
+            st.write("2. Mix high, medium, and low intensity workouts")
+            st.write("3. Sleep 8+ hours for recovery")
+            st.write("4. Warm up before and cool down after exercise")
+            st.write("5. Listen to your body - rest if you feel pain")
+    
+    with tab2:
+        st.subheader("🎯 SMART Goals System")
+        st.write("Set Specific, Measurable, Achievable, Relevant, and Time-bound goals")
+        
+        # Initialize smart_goals if it doesn't exist
+        if 'smart_goals' not in user_data:
+            user_data['smart_goals'] = []
+            update_user_data(user_data)
+        
+        # Create or view SMART goals
+        goal_tab1, goal_tab2 = st.tabs(["Create New Goal", "My SMART Goals"])
+        
+        with goal_tab1:
+            st.write("### Create a SMART Goal")
+            
+            # Goal type selection
+            goal_category = st.selectbox(
+                "Goal Category",
+                ["NAPFA Improvement", "Weight Management", "Strength Building", 
+                 "Endurance Training", "Flexibility", "Consistency/Habits"]
+            )
+            
+            # Specific
+            st.write("#### 📝 Specific - What exactly do you want to achieve?")
+            
+            if goal_category == "NAPFA Improvement":
+                specific_options = [
+                    "Achieve NAPFA Gold Medal",
+                    "Improve specific component to Grade 5",
+                    "Increase total NAPFA score by X points",
+                    "Get all components to Grade 3+"
+                ]
+                specific_goal = st.selectbox("Choose specific goal", specific_options)
+                
+                if "specific component" in specific_goal:
+                    component = st.selectbox("Which component?", 
+                                            ["Sit-Ups", "Standing Broad Jump", "Sit and Reach", 
+                                             "Pull-Ups", "Shuttle Run", "2.4km Run"])
+                    target_grade = 5
+                elif "increase total" in specific_goal:
+                    target_increase = st.number_input("Points to increase", min_value=1, max_value=10, value=3)
+                
+            elif goal_category == "Weight Management":
+                current_weight = st.number_input("Current Weight (kg)", min_value=30.0, max_value=150.0, value=60.0)
+                target_weight = st.number_input("Target Weight (kg)", min_value=30.0, max_value=150.0, value=58.0)
+                specific_goal = f"Change weight from {current_weight}kg to {target_weight}kg"
+                
+            elif goal_category == "Strength Building":
+                exercise = st.selectbox("Exercise", ["Push-ups", "Pull-ups", "Sit-ups", "Squats"])
+                current_reps = st.number_input(f"Current max {exercise}", min_value=0, max_value=200, value=10)
+                target_reps = st.number_input(f"Target {exercise}", min_value=0, max_value=200, value=20)
+                specific_goal = f"Increase {exercise} from {current_reps} to {target_reps} reps"
+                
+            elif goal_category == "Endurance Training":
+                distance = st.selectbox("Distance", ["1km", "2.4km", "5km", "10km"])
+                current_time = st.text_input("Current time (min:sec)", value="10:00")
+                target_time = st.text_input("Target time (min:sec)", value="9:00")
+                specific_goal = f"Run {distance} from {current_time} to {target_time}"
+                
+            elif goal_category == "Flexibility":
+                current_reach = st.number_input("Current Sit & Reach (cm)", min_value=0, max_value=100, value=30)
+                target_reach = st.number_input("Target Sit & Reach (cm)", min_value=0, max_value=100, value=40)
+                specific_goal = f"Improve flexibility from {current_reach}cm to {target_reach}cm"
+                
+            else:  # Consistency
+                workout_days = st.number_input("Workouts per week", min_value=1, max_value=7, value=4)
+                duration = st.number_input("For how many weeks?", min_value=1, max_value=52, value=8)
+                specific_goal = f"Workout {workout_days} days/week for {duration} weeks"
+            
+            # Measurable
+            st.write("#### 📊 Measurable - How will you track progress?")
+            tracking_method = st.multiselect(
+                "Tracking methods",
+                ["Weekly NAPFA practice tests", "Daily workout logs", "Weekly measurements",
+                 "Progress photos", "Performance records"],
+                default=["Daily workout logs"]
+            )
+            
+            # Achievable - AI calculates
+            st.write("#### ✅ Achievable - Is this realistic?")
+            
+            # Calculate if goal is achievable based on current data
+            timeline_weeks = st.slider("Timeline (weeks)", min_value=1, max_value=52, value=12)
+            
+            achievability = "Achievable"
+            ai_feedback = ""
+            
+            if goal_category == "NAPFA Improvement":
+                if user_data.get('napfa_history'):
+                    current_napfa = user_data['napfa_history'][-1]['total']
+                    if "Gold" in specific_goal and current_napfa < 15 and timeline_weeks < 12:
+                        achievability = "Very Challenging"
+                        ai_feedback = "⚠️ This is ambitious! Consider extending timeline to 16+ weeks."
+                    elif current_napfa >= 18:
+                        achievability = "Highly Achievable"
+                        ai_feedback = "✅ Great goal! You're close to Gold already."
+                    else:
+                        ai_feedback = "✅ Realistic with consistent training!"
+                        
+            elif goal_category == "Weight Management":
+                weight_change = abs(target_weight - current_weight)
+                safe_rate = 0.5  # kg per week
+                safe_weeks = weight_change / safe_rate
+                
+                if timeline_weeks < safe_weeks * 0.7:
+                    achievability = "Too Aggressive"
+                    ai_feedback = f"⚠️ Recommended timeline: {int(safe_weeks)} weeks for safe {weight_change}kg change"
+                else:
+                    ai_feedback = "✅ Safe and achievable rate!"
+            
+            st.info(f"**AI Assessment:** {achievability} - {ai_feedback}")
+            
+            # Relevant
+            st.write("#### 🎯 Relevant - Why is this important to you?")
+            motivation = st.text_area("Your motivation", 
+                                     placeholder="e.g., I want to improve my fitness for school sports...")
+            
+            # Time-bound
+            st.write("#### ⏰ Time-bound - When will you achieve this?")
+            target_date = st.date_input("Target completion date", 
+                                        value=datetime.now() + timedelta(weeks=timeline_weeks))
+            
+            # AI generates milestones
+            st.write("### 📅 AI-Generated Weekly Milestones")
+            
+            weeks = (target_date - datetime.now().date()).days // 7
+            if weeks > 0:
+                st.write(f"**Timeline:** {weeks} weeks")
+                
+                # Generate milestones
+                milestones = []
+                
+                if goal_category == "NAPFA Improvement" and "total" in specific_goal.lower():
+                    if user_data.get('napfa_history'):
+                        points_per_week = target_increase / weeks
+                        current_score = user_data['napfa_history'][-1]['total']
+                        
+                        for week in range(1, min(weeks + 1, 9)):
+                            milestone_score = current_score + (points_per_week * week)
+                            milestones.append(f"**Week {week}:** Target score {milestone_score:.1f}/30")
+                        
+                elif goal_category == "Weight Management":
+                    weight_per_week = (target_weight - current_weight) / weeks
+                    
+                    for week in range(1, min(weeks + 1, 9)):
+                        milestone_weight = current_weight + (weight_per_week * week)
+                        milestones.append(f"**Week {week}:** Target weight {milestone_weight:.1f}kg")
+                        
+                elif goal_category == "Strength Building":
+                    reps_per_week = (target_reps - current_reps) / weeks
+                    
+                    for week in range(1, min(weeks + 1, 9)):
+                        milestone_reps = int(current_reps + (reps_per_week * week))
+                        milestones.append(f"**Week {week}:** Target {milestone_reps} {exercise}")
+                
+                for milestone in milestones:
+                    st.write(milestone)
+            
+            # Save goal
+            if st.button("💾 Save SMART Goal", type="primary"):
+                smart_goal = {
+                    'category': goal_category,
+                    'specific': specific_goal,
+                    'measurable': tracking_method,
+                    'achievable': achievability,
+                    'relevant': motivation,
+                    'time_bound': target_date.strftime('%Y-%m-%d'),
+                    'milestones': milestones,
+                    'created_date': datetime.now().strftime('%Y-%m-%d'),
+                    'progress': 0,
+                    'weekly_checkpoints': []
+                }
+                
+                user_data['smart_goals'].append(smart_goal)
+                update_user_data(user_data)
+                
+                st.success("✅ SMART Goal created!")
+                st.balloons()
+                time.sleep(1)
+                st.rerun()
+        
+        with goal_tab2:
+            st.write("### My Active SMART Goals")
+            
+            if not user_data['smart_goals']:
+                st.info("No SMART goals yet. Create your first goal in the other tab!")
+            else:
+                for idx, goal in enumerate(user_data['smart_goals']):
+                    with st.expander(f"🎯 {goal['specific']}", expanded=True):
+                        col1, col2 = st.columns(2)
+                        
+                        with col1:
+                            st.write(f"**Category:** {goal['category']}")
+                            st.write(f"**Target Date:** {goal['time_bound']}")
+                            st.write(f"**Created:** {goal['created_date']}")
+                            st.write(f"**Achievability:** {goal['achievable']}")
+                        
+                        with col2:
+                            st.write("**Tracking Methods:**")
+                            for method in goal['measurable']:
+                                st.write(f"• {method}")
+                        
+                        st.write("")
+                        st.write(f"**Motivation:** {goal['relevant']}")
+                        
+                        # Progress tracking
+                        st.write("")
+                        st.write("### Progress Tracking")
+                        
+                        new_progress = st.slider(
+                            "Update Progress",
+                            min_value=0,
+                            max_value=100,
+                            value=goal['progress'],
+                            key=f"progress_{idx}"
+                        )
+                        
+                        if st.button("Update Progress", key=f"update_{idx}"):
+                            user_data['smart_goals'][idx]['progress'] = new_progress
+                            user_data['smart_goals'][idx]['weekly_checkpoints'].append({
+                                'date': datetime.now().strftime('%Y-%m-%d'),
+                                'progress': new_progress
+                            })
+                            update_user_data(user_data)
+                            st.success("Progress updated!")
+                            st.rerun()
+                        
+                        # Show milestones
+                        if goal.get('milestones'):
+                            st.write("")
+                            st.write("**Weekly Milestones:**")
+                            for milestone in goal['milestones']:
+                                st.write(milestone)
+                        
+                        # Delete goal
+                        if st.button("🗑️ Delete Goal", key=f"delete_{idx}"):
+                            user_data['smart_goals'].pop(idx)
+                            update_user_data(user_data)
+                            st.rerun()
+    
+    
+    with tab3:
+        st.subheader("🗓️ Comprehensive AI Schedule Generator")
+        st.write("Generate a complete personalized schedule based on your fitness data!")
+        
+        # Check if user has necessary data
+        has_napfa = len(user_data.get('napfa_history', [])) > 0
+        has_bmi = len(user_data.get('bmi_history', [])) > 0
+        has_sleep = len(user_data.get('sleep_history', [])) > 0
+        
+        if not has_napfa or not has_bmi or not has_sleep:
+            st.warning("⚠️ To generate a complete schedule, please complete:")
+            if not has_napfa:
+                st.write("- ❌ NAPFA Test")
+            if not has_bmi:
+                st.write("- ❌ BMI Calculation")
+            if not has_sleep:
+                st.write("- ❌ Sleep Tracking (at least 3 days)")
+            st.info("Once you have this data, come back to generate your personalized schedule!")
+        else:
+            st.success("✅ All data available! Ready to generate your schedule.")
+            
+            # Get latest data
+            latest_napfa = user_data['napfa_history'][-1]
+            latest_bmi_record = user_data['bmi_history'][-1]
+            latest_bmi = latest_bmi_record['bmi']
+            
+            # Calculate body type
+            body_type, body_description = calculate_body_type(
+                latest_bmi_record['weight'], 
+                latest_bmi_record['height']
+            )
+            
+            # Display current data
+            st.write("### 📊 Your Current Data")
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Latest BMI", f"{latest_bmi:.1f}")
+                st.write(f"**Body Type:** {body_type}")
+            with col2:
+                st.metric("NAPFA Score", f"{latest_napfa['total']}/30")
+                st.write(f"**Medal:** {latest_napfa['medal']}")
+            with col3:
+                sleep_week = [s for s in user_data['sleep_history'][-7:]]
+                if sleep_week:
+                    avg_sleep = sum([s['hours'] + s['minutes']/60 for s in sleep_week]) / len(sleep_week)
+                    st.metric("Avg Sleep", f"{avg_sleep:.1f}h")
+                    st.write(f"**Records:** {len(sleep_week)} days")
+            
+            st.write("---")
+            
+            # School schedule input
+            st.write("### 🏫 Your School Schedule")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                st.write("**Weekdays**")
+                weekday_start = st.time_input("School Start Time (Weekdays)", value=datetime.strptime("06:30", "%H:%M").time(), key="weekday_start")
+                weekday_end = st.time_input("School End Time (Weekdays)", value=datetime.strptime("19:00", "%H:%M").time(), key="weekday_end")
+            
+            with col2:
+                st.write("**Weekends**")
+                weekend_schedule = st.radio("Weekend Schedule", 
+                                           ["Full day available", "Half day (morning)", "Half day (afternoon)"],
+                                           key="weekend_sched")
+            
+            # Generate button
+            if st.button("🚀 Generate My Complete Schedule", type="primary"):
+                st.write("---")
+                st.success("✅ Your Personalized Schedule Generated!")
+                
+                # Analyze NAPFA weaknesses
+                weak_stations = []
+                for station, grade in latest_napfa['grades'].items():
+                    if grade <= 2:  # D or E grade
+                        weak_stations.append(station)
+                
+                # Determine focus areas
+                focus_cardio = 'RUN' in weak_stations
+                focus_strength = any(s in weak_stations for s in ['PU', 'SU'])
+                focus_flexibility = 'SAR' in weak_stations
+                
+                # Weekly schedule
+                st.write("### 📅 Your Weekly Training Schedule")
+                
+                schedule_data = {
+                    "Monday": [],
+                    "Tuesday": [],
+                    "Wednesday": [],
+                    "Thursday": [],
+                    "Friday": [],
+                    "Saturday": [],
+                    "Sunday": []
+                }
+                
+                # Build schedule based on analysis
+                if focus_cardio:
+                    schedule_data["Monday"].append({"time": "06:00-06:45", "activity": "🏃 Morning Run (2-3km)", "type": "Cardio"})
+                    schedule_data["Wednesday"].append({"time": "17:30-18:15", "activity": "🏃 Interval Training", "type": "Cardio"})
+                    schedule_data["Friday"].append({"time": "17:30-18:30", "activity": "🏃 Long Distance Run (3-4km)", "type": "Cardio"})
+                
+                if focus_strength:
+                    schedule_data["Tuesday"].append({"time": "17:30-18:30", "activity": "💪 Upper Body: Pull-ups, Push-ups, Sit-ups", "type": "Strength"})
+                    schedule_data["Thursday"].append({"time": "17:30-18:30", "activity": "💪 Core & Lower Body: Planks, Squats, Lunges", "type": "Strength"})
+                    schedule_data["Saturday"].append({"time": "09:00-10:00", "activity": "💪 Full Body Circuit Training", "type": "Strength"})
+                
+                if focus_flexibility:
+                    schedule_data["Monday"].append({"time": "19:30-20:00", "activity": "🧘 Stretching & Flexibility", "type": "Flexibility"})
+                    schedule_data["Wednesday"].append({"time": "19:30-20:00", "activity": "🧘 Yoga/Stretching", "type": "Flexibility"})
+                    schedule_data["Friday"].append({"time": "19:30-20:00", "activity": "🧘 Deep Stretching", "type": "Flexibility"})
+                
+                # Add general workouts if no specific weaknesses
+                if not weak_stations:
+                    schedule_data["Monday"].append({"time": "06:00-06:45", "activity": "🏃 Morning Run (3km)", "type": "Cardio"})
+                    schedule_data["Tuesday"].append({"time": "17:30-18:30", "activity": "💪 Strength Training", "type": "Strength"})
+                    schedule_data["Wednesday"].append({"time": "06:00-06:45", "activity": "🏃 Speed Work", "type": "Cardio"})
+                    schedule_data["Thursday"].append({"time": "17:30-18:30", "activity": "💪 Core & Upper Body", "type": "Strength"})
+                    schedule_data["Friday"].append({"time": "17:30-18:30", "activity": "🏃 Endurance Run", "type": "Cardio"})
+                    schedule_data["Saturday"].append({"time": "09:00-10:00", "activity": "🧘 Flexibility & Recovery", "type": "Flexibility"})
+                
+                # Add rest day
+                schedule_data["Sunday"].append({"time": "All Day", "activity": "😌 Rest & Recovery", "type": "Rest"})
+                
+                # Display schedule
+                for day, activities in schedule_data.items():
+                    if activities:
+                        st.markdown(f"#### {day}")
+                        for activity in activities:
+                            activity_type = activity['type']
+                            color = {
+                                'Cardio': '#ff5722',
+                                'Strength': '#2196f3', 
+                                'Flexibility': '#4caf50',
+                                'Rest': '#9e9e9e'
+                            }.get(activity_type, '#607d8b')
+                            
+                            st.markdown(f"""
+                            <div style="background: {color}; color: white; padding: 10px; border-radius: 8px; margin: 5px 0;">
+                                <strong>{activity['time']}</strong><br>
+                                {activity['activity']}
+                            </div>
+                            """, unsafe_allow_html=True)
+                
+                # Diet recommendations
+                st.write("---")
+                st.write("### 🍽️ Nutrition Plan")
+                
+                if latest_bmi < 18.5:
+                    st.info("**Goal:** Healthy weight gain with muscle building")
+                    st.write("""
+                    - **Daily Calories:** 2,800-3,200 kcal
+                    - **Protein:** 1.8-2.2g per kg body weight
+                    - **Meals:** 5-6 small meals throughout the day
+                    - **Focus:** Lean proteins, complex carbs, healthy fats
+                    """)
+                elif latest_bmi > 25:
+                    st.info("**Goal:** Healthy weight loss with muscle preservation")
+                    st.write("""
+                    - **Daily Calories:** 1,800-2,200 kcal
+                    - **Protein:** 1.6-2.0g per kg body weight
+                    - **Meals:** 4-5 balanced meals
+                    - **Focus:** High protein, moderate carbs, healthy fats
+                    """)
+                else:
+                    st.info("**Goal:** Maintain weight and build fitness")
+                    st.write("""
+                    - **Daily Calories:** 2,200-2,600 kcal
+                    - **Protein:** 1.6-1.8g per kg body weight
+                    - **Meals:** 4-5 balanced meals
+                    - **Focus:** Balanced macros, nutrient-dense foods
+                    """)
+                
+                # Sleep recommendations
+                st.write("---")
+                st.write("### 😴 Sleep Schedule")
+                
+                if avg_sleep < 8:
+                    st.warning(f"⚠️ You're averaging {avg_sleep:.1f}h - aim for 8-10h for teens!")
+                    st.write("""
+                    **Target:** 8-10 hours per night
+                    - **Bedtime:** 22:00-22:30
+                    - **Wake time:** 06:00-06:30
+                    - **Pre-bed routine:** No screens 1hr before, light stretching
+                    - **Weekend:** Keep similar schedule (±1 hour)
+                    """)
+                else:
+                    st.success(f"✅ Great sleep average: {avg_sleep:.1f}h - keep it up!")
+                    st.write("""
+                    **Target:** Maintain 8-10 hours per night
+                    - **Bedtime:** 22:00-22:30
+                    - **Wake time:** 06:00-06:30
+                    - **Keep consistent schedule** on weekends too
+                    """)
+                
+                # Specific recommendations based on weaknesses
+                if weak_stations:
+                    st.write("---")
+                    st.write("### 🎯 Focus Areas (Based on NAPFA Weaknesses)")
+                    
+                    station_names = {
+                        'SU': 'Sit-ups',
+                        'SBJ': 'Standing Broad Jump',
+                        'SAR': 'Sit & Reach',
+                        'PU': 'Pull-ups',
+                        'SR': 'Shuttle Run',
+                        'RUN': '2.4km Run'
+                    }
+                    
+                    for station in weak_stations:
+                        st.write(f"**{station_names.get(station, station)}** - Grade {['F', 'E', 'D', 'C', 'B', 'A'][latest_napfa['grades'].get(station, 0)]}")
+                    
+                    st.info("💡 Your training schedule above is customized to improve these areas. Stay consistent!")
+                
+                st.write("---")
+                st.success("💪 Schedule generated! Track your progress in the Exercise Log and NAPFA Test sections.")
+    
+    with tab4:
+        st.subheader("🍳 Health Recipes Database")
+        st.write("Healthy recipes tailored to your fitness goals!")
+        
+        # Recipe categories
+        st.write("### Select Your Dietary Goal")
+        
+        diet_type = st.selectbox(
+            "Choose goal",
+            ["Weight Loss", "Muscle Gain", "Maintenance"]
+        )
+        
+        # Get recipes
+        all_recipes = search_recipes_by_diet(diet_type)
+        
+        if diet_type in all_recipes:
+            recipes = all_recipes[diet_type]
+            
+            st.write(f"### 🍽️ {diet_type} Recipes ({len(recipes)} recipes)")
+            
+            for recipe in recipes:
+                with st.expander(f"📖 {recipe['name']}", expanded=False):
+                    col1, col2 = st.columns(2)
+                    
+                    with col1:
+                        st.write("**Nutritional Info:**")
+                        st.write(f"- Calories: {recipe['calories']} kcal")
+                        st.write(f"- Protein: {recipe['protein']}")
+                        st.write(f"- Carbs: {recipe['carbs']}")
+                        st.write(f"- Prep Time: {recipe['prep_time']}")
+                    
+                    with col2:
+                        st.write("**Meal Type:**")
+                        if recipe['calories'] < 300:
+                            st.write("🥗 Snack/Light meal")
+                        elif recipe['calories'] < 450:
+                            st.write("🍽️ Main meal")
+                        else:
+                            st.write("🍖 Post-workout meal")
+                    
+                    st.write("")
+                    st.write("**Ingredients:**")
+                    for ingredient in recipe['ingredients']:
+                        st.write(f"• {ingredient}")
+                    
+                    st.write("")
+                    st.write("**Instructions:**")
+                    st.write(recipe['instructions'])
+        else:
+            st.info("No recipes found. Select a dietary goal above.")
+        
+        st.write("---")
+        st.info("💡 **Tip:** These recipes align with your fitness goals. Mix and match to create variety in your diet!")
@@ -0,0 +1,555 @@
+"""Integrations page: weather, nutrition lookup and videos."""
+import streamlit as st
+
+from app_pages.common import API_MODE, OPENWEATHER_API_KEY, USDA_API_KEY, get_user_data
+from fittrack.catalogs import MOCK_NUTRITION, NAPFA_VIDEOS, TUTORIAL_VIDEOS, WORKOUT_VIDEOS
+from fittrack.instrument import timed
+
+
+# API Integrations
+def api_integrations():
+    st.header("🌐 API Integrations")
+    st.write("Connect with external services for enhanced features")
+    
+    user_data = get_user_data()
+    
+    # Create tabs
+    tab1, tab2, tab3 = st.tabs([
+        "🌤️ Weather API",
+        "🍔 Nutrition API",
+        "🎥 YouTube API"
+    ])
+    
+    with tab1:
+        st.subheader("🌤️ Weather-Based Workout Recommendations")
+        st.write("Get outdoor workout suggestions based on current weather")
+        
+        # Show API status
+        if OPENWEATHER_API_KEY:
+            st.success("✅ Real Weather API Active")
+        else:
+            st.info("📝 Using simulated weather data. Add API key to enable real-time weather.")
+        
+        location = st.text_input("Your Location", value="Singapore", placeholder="Enter city name")
+        
+        if st.button("Get Weather & Recommendations", type="primary"):
+            
+            if OPENWEATHER_API_KEY and API_MODE == 'real':
+                # REAL API CALL
+                try:
+                    import requests
+                    
+                    # OpenWeatherMap API endpoint
+                    url = f"http://api.openweathermap.org/data/2.5/weather"
+                    params = {
+                        'q': location,
+                        'appid': OPENWEATHER_API_KEY,
+                        'units': 'metric'  # Get temperature in Celsius
+                    }
+                    
+                    with timed('api.openweather'):
+                        response = requests.get(url, params=params)
+                    
+                    if response.status_code == 200:
+                        data = response.json()
+                        
+                        # Extract weather data
+                        temp = round(data['main']['temp'])
+                        humidity = data['main']['humidity']
+                        conditions = data['weather'][0]['main']
+                        description = data['weather'][0]['description']
+                        
+                        st.success(f"✅ Real-time weather data from OpenWeatherMap")
+                    else:
+                        st.error(f"Error fetching weather: {response.status_code}")
+                        # Fallback to mock data
+                        temp, humidity, conditions = 30, 75, "Clear"
+                
+                except Exception as e:
+                    st.error(f"API Error: {str(e)}")
+                    st.info("Falling back to simulated data")
+                    # Fallback to mock data
+                    import random
+                    temp = random.randint(25, 35)
+                    humidity = random.randint(60, 90)
+                    conditions = random.choice(["Clear", "Partly Cloudy", "Cloudy", "Light Rain", "Rainy"])
+            
+            else:
+                # MOCK DATA (when no API key)
+                import random
+                temp = random.randint(25, 35)
+                humidity = random.randint(60, 90)
+                conditions = random.choice(["Clear", "Partly Cloudy", "Cloudy", "Light Rain", "Rainy"])
+                
+                if not OPENWEATHER_API_KEY:
+                    st.warning("⚠️ Simulated weather data (no API key configured)")
+            
+            # Display weather (same for both real and mock)
+            st.write("### Current Weather")
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("🌡️ Temperature", f"{temp}°C")
+            with col2:
+                st.metric("💧 Humidity", f"{humidity}%")
+            with col3:
+                st.metric("☁️ Conditions", conditions)
+            
+            # Generate recommendations (same logic for both)
+            st.write("")
+            st.write("### 🏃 Workout Recommendations")
+            
+            if temp < 28 and "Rain" not in conditions:
+                recommendation = "✅ Perfect for outdoor running!"
+                workout = "2.4km NAPFA practice run"
+                color = "#4caf50"
+            elif temp < 32 and "Rain" not in conditions:
+                recommendation = "⚠️ Good for outdoor, stay hydrated"
+                workout = "Morning or evening run (avoid midday)"
+                color = "#ff9800"
+            elif "Rain" in conditions:
+                recommendation = "🏠 Indoor workout recommended"
+                workout = "Indoor circuit: push-ups, sit-ups, burpees"
+                color = "#2196f3"
+            else:
+                recommendation = "🌡️ Too hot! Indoor training"
+                workout = "Air-con gym or home workout"
+                color = "#f44336"
+            
+            st.markdown(f"""
+            <div class="stat-card" style="background: {color}; color: white;">
+                <h3>{recommendation}</h3>
+                <h4>Suggested: {workout}</h4>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            # Hydration advice
+            hydration_need = "High" if temp > 30 or humidity > 80 else "Moderate"
+            st.info(f"💧 **Hydration Need:** {hydration_need} - Drink {500 if hydration_need == 'High' else 300}ml before workout")
+        
+        # Setup instructions
+        if not OPENWEATHER_API_KEY:
+            st.write("")
+            st.write("---")
+            st.write("### 🔗 Enable Real-Time Weather")
+            
+            with st.expander("📝 Setup Instructions", expanded=False):
+                st.markdown("""
+                **Step 1: Get Free API Key**
+                1. Go to: https://openweathermap.org/api
+                2. Click "Sign Up" (it's FREE!)
+                3. Verify your email
+                4. Go to "API Keys" tab
+                5. Copy your API key
+                
+                **Step 2: Add to Streamlit Cloud**
+                1. Deploy your app to Streamlit Cloud
+                2. Go to your app settings (⚙️)
+                3. Click "Secrets"
+                4. Add this:
+                ```
+                OPENWEATHER_API_KEY = "your_api_key_here"
+                ```
+                5. Save and restart app
+                
+                **Step 3: Run Locally (Optional)**
+                Create a file called `.streamlit/secrets.toml`:
+                ```
+                OPENWEATHER_API_KEY = "your_api_key_here"
+                ```
+                
+                **That's it!** The app will automatically use real weather data.
+                
+                **Free Tier Limits:**
+                - 1,000 API calls per day
+                - 60 calls per minute
+                - More than enough for personal use!
+                """)
+
+    
+    with tab2:
+        st.subheader("🍔 Food & Nutrition Database")
+        st.write("Search nutritional information for any food")
+        
+        # Show API status
+        if USDA_API_KEY:
+            st.success("✅ Real USDA Food Database Active (350,000+ foods)")
+        else:
+            st.info("📝 Using sample food database. Add USDA API key for 350,000+ foods.")
+        
+        # Food search
+        food_query = st.text_input("Search for a food", placeholder="e.g., chicken rice, banana, salmon")
+        
+        # Advanced search options
+        with st.expander("🔍 Advanced Search Options"):
+            col1, col2 = st.columns(2)
+            with col1:
+                food_category = st.selectbox(
+                    "Food Category (optional)",
+                    ["All Categories", "Dairy", "Fruits", "Vegetables", "Proteins", 
+                     "Grains", "Snacks", "Beverages", "Fast Foods"]
+                )
+            with col2:
+                sort_by = st.selectbox(
+                    "Sort by",
+                    ["Relevance", "Protein (High to Low)", "Calories (Low to High)", "Calories (High to Low)"]
+                )
+        
+        if st.button("Search Nutrition", type="primary"):
+            
+            if USDA_API_KEY and API_MODE == 'real':
+                # REAL USDA API CALL
+                try:
+                    import requests
+                    
+                    # FoodData Central API endpoint
+                    url = "https://api.nal.usda.gov/fdc/v1/foods/search"
+                    
+                    params = {
+                        'api_key': USDA_API_KEY,
+                        'query': food_query,
+                        'pageSize': 10,  # Get top 10 results
+                    }
+                    
+                    # Note: Removed dataType filter as it can cause 400 errors
+                    # The API will return the best matches automatically
+                    
+                    with timed('api.usda'):
+                        response = requests.get(url, params=params)
+                    
+                    if response.status_code == 200:
+                        data = response.json()
+                        foods = data.get('foods', [])
+                        
+                        if foods:
+                            st.success(f"✅ Found {len(foods)} results from USDA database")
+                            
+                            # Sort results if needed
+                            if sort_by == "Protein (High to Low)":
+                                foods = sorted(foods, key=lambda x: get_nutrient_from_food(x, 'Protein'), reverse=True)
+                            elif sort_by == "Calories (Low to High)":
+                                foods = sorted(foods, key=lambda x: get_nutrient_from_food(x, 'Energy'))
+                            elif sort_by == "Calories (High to Low)":
+                                foods = sorted(foods, key=lambda x: get_nutrient_from_food(x, 'Energy'), reverse=True)
+                            
+                            # Display results
+                            for food in foods[:5]:  # Show top 5
+                                food_name = food.get('description', 'Unknown Food')
+                                brand = food.get('brandOwner', '')
+                                
+                                # Extract nutrients
+                                nutrients = food.get('foodNutrients', [])
+                                
+                                calories = get_nutrient_value(nutrients, 'Energy')
+                                protein = get_nutrient_value(nutrients, 'Protein')
+                                carbs = get_nutrient_value(nutrients, 'Carbohydrate, by difference')
+                                fat = get_nutrient_value(nutrients, 'Total lipid (fat)')
+                                fiber = get_nutrient_value(nutrients, 'Fiber, total dietary')
+                                sugar = get_nutrient_value(nutrients, 'Sugars, total including NLEA')
+                                
+                                # Handle alternative nutrient names
+                                if calories is None:
+                                    calories = get_nutrient_value(nutrients, 'Energy (Atwater General Factors)')
+                                if carbs is None:
+                                    carbs = get_nutrient_value(nutrients, 'Carbohydrate')
+                                if fat is None:
+                                    fat = get_nutrient_value(nutrients, 'Fat')
+                                
+                                # Serving size
+                                serving = food.get('servingSize', 100)
+                                serving_unit = food.get('servingUnit', 'g')
+                                
+                                with st.expander(f"🍽️ {food_name}" + (f" ({brand})" if brand else ""), expanded=True):
+                                    col1, col2 = st.columns([2, 1])
+                                    
+                                    with col1:
+                                        st.write(f"**Serving Size:** {serving} {serving_unit}")
+                                        
+                                        col_a, col_b, col_c, col_d = st.columns(4)
+                                        col_a.metric("Calories", f"{calories:.0f}" if calories else "N/A")
+                                        col_b.metric("Protein", f"{protein:.1f}g" if protein else "N/A")
+                                        col_c.metric("Carbs", f"{carbs:.1f}g" if carbs else "N/A")
+                                        col_d.metric("Fat", f"{fat:.1f}g" if fat else "N/A")
+                                        
+                                        if fiber or sugar:
+                                            st.write("")
+                                            col_e, col_f = st.columns(2)
+                                            if fiber:
+                                                col_e.write(f"**Fiber:** {fiber:.1f}g")
+                                            if sugar:
+                                                col_f.write(f"**Sugars:** {sugar:.1f}g")
+                                    
+                                    with col2:
+                                        # Macro ratio
+                                        if calories and calories > 0:
+                                            st.write("**Macro Ratio:**")
+                                            p_cals = (protein or 0) * 4
+                                            c_cals = (carbs or 0) * 4
+                                            f_cals = (fat or 0) * 9
+                                            total = p_cals + c_cals + f_cals
+                                            
+                                            if total > 0:
+                                                st.write(f"Protein: {(p_cals/total*100):.0f}%")
+                                                st.write(f"Carbs: {(c_cals/total*100):.0f}%")
+                                                st.write(f"Fat: {(f_cals/total*100):.0f}%")
+                                        
+                                        # Health score (simple)
+                                        health_score = calculate_health_score(protein, carbs, fat, fiber, sugar)
+                                        if health_score:
+                                            st.write("")
+                                            st.metric("Health Score", f"{health_score}/10")
+                        else:
+                            st.warning(f"No results found for '{food_query}'. Try a different search term.")
+                    
+                    elif response.status_code == 400:
+                        st.error("API Error 400: Invalid request format")
+                        st.write("**Debug Info:**")
+                        st.write(f"Query: {food_query}")
+                        try:
+                            error_detail = response.json()
+                            st.write(f"Error details: {error_detail}")
+                        except:
+                            st.write(f"Response: {response.text}")
+                        st.info("Falling back to sample database")
+                        show_mock_nutrition_data(food_query)
+                    
+                    elif response.status_code == 403:
+                        st.error("API Error 403: Invalid API key")
+                        st.write("Please check your USDA_API_KEY in Streamlit Secrets")
+                        st.info("Falling back to sample database")
+                        show_mock_nutrition_data(food_query)
+                    
+                    else:
+                        st.error(f"API Error: {response.status_code}")
+                        st.info("Falling back to sample database")
+                        show_mock_nutrition_data(food_query)
+                
+                except Exception as e:
+                    st.error(f"Error: {str(e)}")
+                    st.info("Falling back to sample database")
+                    show_mock_nutrition_data(food_query)
+            
+            else:
+                # MOCK DATA (when no API key)
+                show_mock_nutrition_data(food_query)
+        
+        # Setup instructions
+        if not USDA_API_KEY:
+            st.write("")
+            st.write("---")
+            st.write("### 🔗 Enable Full Food Database")
+            
+            with st.expander("📝 Setup Instructions (2 minutes)", expanded=False):
+                st.markdown("""
+                **Step 1: Get FREE API Key**
+                1. Go to: https://fdc.nal.usda.gov/api-key-signup.html
+                2. Fill in:
+                   - First Name
+                   - Last Name
+                   - Email Address
+                   - Organization: "School of Science and Technology" (or "Personal")
+                3. Click "Sign Up"
+                4. Check your email for API key
+                5. Copy the key (long string of letters/numbers)
+                
+                **Step 2: Add to Streamlit Cloud**
+                1. Go to your deployed app
+                2. Click ⚙️ Settings → Secrets
+                3. Add this line:
+                ```
+                USDA_API_KEY = "your_api_key_here"
+                ```
+                4. Save and restart
+                
+                **Step 3: Test**
+                1. Come back to this page
+                2. Should see "✅ Real USDA Food Database Active"
+                3. Search any food - get instant results!
+                
+                **What You Get:**
+                - ✅ 350,000+ foods (vs. 5 sample foods)
+                - ✅ Brand name foods
+                - ✅ Restaurant foods
+                - ✅ Complete nutrient data (vitamins, minerals, etc.)
+                - ✅ Serving size info
+                - ✅ Unlimited searches (FREE forever!)
+                
+                **Free Tier:**
+                - 1,000 requests per hour
+                - No daily limit
+                - No credit card needed
+                - FREE forever!
+                """)
+    
+    with tab3:
+        st.subheader("🎥 Exercise Tutorial Videos")
+        st.write("Curated YouTube videos for NAPFA components and exercises")
+        
+        st.info("💡 We use curated video links for best quality tutorials!")
+        
+        # NAPFA Component Videos
+        st.write("### NAPFA Component Tutorials")
+        
+        for component, url in NAPFA_VIDEOS.items():
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                st.write(f"**{component}**")
+            with col2:
+                st.link_button("Watch Videos", url, type="secondary")
+        
+        st.write("")
+        st.write("### General Workout Videos")
+        
+        for workout, url in WORKOUT_VIDEOS.items():
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                st.write(f"**{workout}**")
+            with col2:
+                st.link_button("Watch Videos", url, type="secondary")
+        
+        st.write("")
+        st.success("✅ All video links lead to curated YouTube search results for best tutorials!")
+
+
+# Helper functions for USDA API
+def get_nutrient_from_food(food, nutrient_name):
+    """Extract nutrient value from food object for sorting"""
+    nutrients = food.get('foodNutrients', [])
+    value = get_nutrient_value(nutrients, nutrient_name)
+    return value if value is not None else 0
+
+
+def get_nutrient_value(nutrients, nutrient_name):
+    """Extract nutrient value from USDA food data"""
+    for nutrient in nutrients:
+        # Check nutrient name
+        name = nutrient.get('nutrientName', '')
+        if nutrient_name.lower() in name.lower():
+            return nutrient.get('value', 0)
+    return None
+
+
+def calculate_health_score(protein, carbs, fat, fiber, sugar):
+    """Simple health score calculation (1-10)"""
+    if not all([protein is not None, carbs is not None, fat is not None]):
+        return None
+    
+    score = 5.0  # Start at neutral
+    
+    # High protein is good
+    if protein and protein > 10:
+        score += 1.5
+    elif protein and protein > 5:
+        score += 0.5
+    
+    # High fiber is good
+    if fiber and fiber > 5:
+        score += 1.5
+    elif fiber and fiber > 2:
+        score += 0.5
+    
+    # High sugar is bad
+    if sugar and sugar > 20:
+        score -= 2.0
+    elif sugar and sugar > 10:
+        score -= 1.0
+    
+    # Balance of macros
+    total = protein + carbs + fat
+    if total > 0:
+        protein_ratio = protein / total
+        if 0.2 <= protein_ratio <= 0.4:  # Good protein ratio
+            score += 1.0
+    
+    return max(1, min(10, round(score, 1)))
+
+
+def show_mock_nutrition_data(food_query):
+    """Display mock nutrition data when API not available"""
+    # Search (case-insensitive, partial match)
+    results = {k: v for k, v in MOCK_NUTRITION.items() if food_query.lower() in k.lower()}
+    
+    if results:
+        st.success(f"Found {len(results)} result(s) in sample database")
+        
+        for food_name, nutrition in results.items():
+            with st.expander(f"🍽️ {food_name.title()}", expanded=True):
+                col1, col2 = st.columns([2, 1])
+                
+                with col1:
+                    st.write(f"**Serving Size:** {nutrition['serving']}")
+                    
+                    col_a, col_b, col_c, col_d = st.columns(4)
+                    col_a.metric("Calories", f"{nutrition['calories']} kcal")
+                    col_b.metric("Protein", f"{nutrition['protein']}g")
+                    col_c.metric("Carbs", f"{nutrition['carbs']}g")
+                    col_d.metric("Fat", f"{nutrition['fat']}g")
+                    
+                    st.write("")
+                    col_e, col_f = st.columns(2)
+                    col_e.write(f"**Fiber:** {nutrition['fiber']}g")
+                    col_f.write(f"**Sugars:** {nutrition['sugar']}g")
+                
+                with col2:
+                    # Macro ratio
+                    total_cals = (nutrition['protein'] * 4 + nutrition['carbs'] * 4 + nutrition['fat'] * 9)
+                    if total_cals > 0:
+                        st.write("**Macro Ratio:**")
+                        st.write(f"Protein: {(nutrition['protein']*4/total_cals*100):.0f}%")
+                        st.write(f"Carbs: {(nutrition['carbs']*4/total_cals*100):.0f}%")
+                        st.write(f"Fat: {(nutrition['fat']*9/total_cals*100):.0f}%")
+                    
+                    # Health score
+                    health_score = calculate_health_score(
+                        nutrition['protein'], 
+                        nutrition['carbs'], 
+                        nutrition['fat'],
+                        nutrition['fiber'],
+                        nutrition['sugar']
+                    )
+                    if health_score:
+                        st.write("")
+                        st.metric("Health Score", f"{health_score}/10")
+        
+        st.info("💡 **Limited to 8 sample foods.** Add USDA API key for 350,000+ foods!")
+    else:
+        st.warning(f"No results for '{food_query}' in sample database.")
+        st.write("**Try searching:** chicken rice, banana, apple, white rice, grilled chicken breast, salmon, broccoli, egg")
+        st.info("💡 Add USDA API key to search any food!")
+
+# Workout Timer with Audio
+        st.subheader("🎥 Exercise Tutorial Videos")
+        st.write("Get exercise demonstrations from YouTube")
+        
+        # NAPFA component selector
+        exercise = st.selectbox(
+            "Select Exercise",
+            ["Sit-Ups", "Standing Broad Jump", "Sit and Reach", 
+             "Pull-Ups", "Shuttle Run", "2.4km Running Tips"]
+        )
+        
+        if st.button("Find Tutorials", type="primary"):
+            if exercise in TUTORIAL_VIDEOS:
+                st.write(f"### 📹 Top Tutorials for {exercise}")
+                
+                for video in TUTORIAL_VIDEOS[exercise]:
+                    with st.expander(f"▶️ {video['title']} - {video['duration']}", expanded=True):
+                        st.write(f"**Channel:** {video['channel']}")
+                        st.write(f"**Duration:** {video['duration']}")
+                        
+                        # In production, embed actual video
+                        st.info("🎥 Video would be embedded here with real YouTube API")
+                        
+                        st.write("**🔗 Search on YouTube:** ")
+                        search_url = f"https://www.youtube.com/results?search_query={exercise.replace(' ', '+')}+NAPFA+tutorial"
+                        st.markdown(f"[Open YouTube Search]({search_url})")
+            
+            st.write("")
+            st.info("""
+            **🔗 To enable video embedding:**
+            
+            Use YouTube Data API v3 (free quota):
+            1. Get API key: https://console.cloud.google.com/
+            2. Enable YouTube Data API
+            3. Embed videos directly in app
+            """)
@@ -0,0 +1,308 @@
+"""Sign in, registration and password reset."""
+import time
+from datetime import datetime
+
+import streamlit as st
+
+from app_pages.common import user_store
+from fittrack.passwords import check_password, hash_password, needs_rehash
+
+
+# Login/Registration Page
+def login_page():
+    st.markdown('<div class="main-header"><h1>🏋️ FitTrack</h1><p>School of Science and Technology Singapore</p><p>Your Personal Fitness Companion</p></div>', unsafe_allow_html=True)
+    
+    tab1, tab2, tab3 = st.tabs(["Sign In", "Create Account", "Reset Password"])
+    
+    with tab1:
+        st.subheader("Welcome Back!")
+        
+        # Google-style login
+        email = st.text_input("Email Address", key="login_email", placeholder="your.email@example.com")
+        password = st.text_input("Password", type="password", key="login_password")
+        
+        if st.button("Sign In", key="login_btn", type="primary"):
+            # Find user by email
+            user_found = None
+            username = user_store.find('email', email.lower())
+            if username:
+                data, _ = user_store.get(username)
+                if check_password(password, data.get('password', '')):
+                    user_found = username
+                    # Hash plaintext or outdated passwords now that we know the password
+                    if needs_rehash(data.get('password')):
+                        password_hash = hash_password(password)
+                        user_store.update(username, lambda user: user.update(password=password_hash))
+            
+            if user_found:
+                st.session_state.logged_in = True
+                st.session_state.username = user_found
+                st.success("✅ Login successful!")
+                time.sleep(1)
+                st.rerun()
+            else:
+                st.error("❌ Invalid email or password")
+        
+        st.write("")
+        st.info("💡 **Students:** Use any email | **Teachers:** Use any email")
+        st.write("")
+        
+        # Password reset link
+        col1, col2 = st.columns([3, 1])
+        with col2:
+            if st.button("Forgot Password?", key="forgot_link"):
+                st.info("Go to 'Reset Password' tab")
+    
+    with tab2:
+        st.subheader("Create Your Account")
+        
+        # Role selection at the top
+        st.write("### Select Your Role")
+        role = st.radio("I am a:", ["Student", "Teacher"], key="reg_role", horizontal=True)
+        
+        st.write("---")
+        st.write("### Account Information")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            new_email = st.text_input("Email Address", key="reg_email", 
+                                     placeholder="student@example.com" if role == "Student" else "teacher@sst.edu.sg")
+            full_name = st.text_input("Full Name", key="reg_name")
+        
+        with col2:
+            new_password = st.text_input("Password", type="password", key="reg_password")
+            confirm_password = st.text_input("Confirm Password", type="password", key="reg_confirm_password")
+            
+            # Password strength indicator
+            if new_password:
+                strength = 0
+                if len(new_password) >= 8:
+                    strength += 1
+                if any(c.isupper() for c in new_password):
+                    strength += 1
+                if any(c.isdigit() for c in new_password):
+                    strength += 1
+                if any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in new_password):
+                    strength += 1
+                
+                strength_colors = {0: "#f44336", 1: "#ff9800", 2: "#ffc107", 3: "#8bc34a", 4: "#4caf50"}
+                strength_labels = {0: "Very Weak", 1: "Weak", 2: "Fair", 3: "Good", 4: "Strong"}
+                
+                st.markdown(f'<div style="background: {strength_colors[strength]}; color: white; padding: 5px 10px; border-radius: 5px; text-align: center; margin-top: -10px;">Password Strength: {strength_labels[strength]}</div>', unsafe_allow_html=True)
+                
+                if strength < 2:
+                    st.caption("💡 Use 8+ chars, uppercase, numbers, and symbols for better security")
+        
+        st.write("### Personal Details")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            age = st.number_input("Age", min_value=12, max_value=100 if role == "Teacher" else 18, 
+                                 value=14 if role == "Student" else 30, key="reg_age")
+            gender = st.selectbox("Gender", ["Male", "Female"], key="reg_gender")
+        
+        with col2:
+            if role == "Student":
+                school = st.text_input("School (Optional)", value="School of Science and Technology", key="reg_school")
+                class_name = st.text_input("Class (Optional)", placeholder="e.g., 3-Integrity", key="reg_class")
+            else:
+                school = "School of Science and Technology"
+                st.text_input("School", value=school, disabled=True, key="reg_school_teacher")
+                department = st.text_input("Department (Optional)", placeholder="e.g., PE Department", key="reg_department")
+        
+        if role == "Student":
+            st.write("### 🏠 House Selection")
+            st.write("Choose your house to earn points for your team!")
+            
+            house_options = {
+                "🟡 Yellow House": "yellow",
+                "🔴 Red House": "red",
+                "🔵 Blue House": "blue",
+                "🟢 Green House": "green",
+                "⚫ Black House": "black"
+            }
+            
+            selected_house_display = st.selectbox("Select Your House", list(house_options.keys()), key="reg_house")
+            selected_house = house_options[selected_house_display]
+            
+            st.info("💡 Every hour you exercise earns 1 point for your house!")
+        
+        if role == "Student":
+            st.write("### Privacy Settings")
+            show_on_leaderboards = st.checkbox("Show me on public leaderboards", value=False, key="reg_leaderboard")
+            
+            st.write("### Join a Class (Optional)")
+            class_code = st.text_input("Class Code", placeholder="Enter code from your teacher", key="reg_class_code")
+        
+        if st.button("Create Account", key="register_btn", type="primary"):
+            # Validation
+            if not new_email or not full_name or not new_password:
+                st.error("Please fill in all required fields")
+            elif new_password != confirm_password:
+                st.error("Passwords do not match")
+            elif len(new_password) < 6:
+                st.error("Password must be at least 6 characters")
+            elif user_store.find('email', new_email.lower()):
+                st.error("Email already registered")
+            else:
+                # Generate username from email
+                username = new_email.split('@')[0].replace('.', '_')
+                
+                # Ensure username is unique
+                original_username = username
+                counter = 1
+                while user_store.exists(username):
+                    username = f"{original_username}{counter}"
+                    counter += 1
+                
+                # Create account based on role
+                if role == "Student":
+                    new_user = {
+                        'email': new_email.lower(),
+                        'password': hash_password(new_password),
+                        'role': 'student',
+                        'name': full_name,
+                        'age': age,
+                        'gender': 'm' if gender == "Male" else 'f',
+                        'school': school,
+                        'class': class_name,
+                        'house': selected_house,
+                        'house_points_contributed': 0,
+                        'total_workout_hours': 0,
+                        'show_on_leaderboards': show_on_leaderboards,
+                        'created': datetime.now().isoformat(),
+                        'bmi_history': [],
+                        'napfa_history': [],
+                        'sleep_history': [],
+                        'exercises': [],
+                        'goals': [],
+                        'schedule': [],
+                        'saved_workout_plan': None,
+                        'friends': [],
+                        'friend_requests': [],
+                        'badges': [],
+                        'level': 'Novice',
+                        'total_points': 0,
+                        'last_login': datetime.now().isoformat(),
+                        'login_streak': 0,
+                        'active_challenges': [],
+                        'completed_challenges': [],
+                        'teacher_class': None  # Will be set when joining a class
+                    }
+                    
+                    # Join class if code provided
+                    joined_teacher = None
+                    if class_code:
+                        # Find teacher with this class code
+                        teacher_username = user_store.find('class_code', class_code)
+                        if teacher_username:
+                            teacher_data, _ = user_store.get(teacher_username)
+                            # Check class size limit
+                            current_students = teacher_data.get('students', [])
+                            if len(current_students) >= 30:
+                                st.warning(f"Class is full (30/30 students). Contact your teacher.")
+                            else:
+                                new_user['teacher_class'] = teacher_username
+                                joined_teacher = teacher_username
+                                st.success(f"✅ Joined {teacher_data['name']}'s class!")
+                        else:
+                            st.warning("Invalid class code. You can join a class later.")
+                
+                else:  # Teacher
+                    # Generate unique class code
+                    import random
+                    import string
+                    class_code = ''.join(random.choices(string.ascii_uppercase + string.digits, k=6))
+                    while user_store.find('class_code', class_code):
+                        class_code = ''.join(random.choices(string.ascii_uppercase + string.digits, k=6))
+                    
+                    new_user = {
+                        'email': new_email.lower(),
+                        'password': hash_password(new_password),
+                        'role': 'teacher',
+                        'name': full_name,
+                        'age': age,
+                        'gender': 'm' if gender == "Male" else 'f',
+                        'school': school,
+                        'department': department,
+                        'created': datetime.now().isoformat(),
+                        'class_code': class_code,
+                        'students': [],
+                        'classes_created': [],
+                        'last_login': datetime.now().isoformat(),
+                        # Fitness tracking (teachers can track fitness too!)
+                        'house': None,
+                        'house_points_contributed': 0,
+                        'total_workout_hours': 0,
+                        'show_on_leaderboards': False,
+                        'bmi_history': [],
+                        'napfa_history': [],
+                        'sleep_history': [],
+                        'exercises': [],
+                        'goals': [],
+                        'schedule': [],
+                        'saved_workout_plan': None,
+                        'friends': [],
+                        'friend_requests': [],
+                        'badges': [],
+                        'level': 'Novice',
+                        'total_points': 0,
+                        'login_streak': 0,
+                        'groups': [],
+                        'group_invites': [],
+                        'smart_goals': []
+                    }
+                
+                if not user_store.create(username, new_user):
+                    # Taken by someone registering at the same moment
+                    st.error("Email already registered")
+                    st.stop()
+                if role == "Student" and joined_teacher:
+                    user_store.update(joined_teacher, lambda teacher: teacher['students'].append(username))
+                st.success("✅ Account created successfully! Please sign in.")
+                
+                if role == "Teacher":
+                    st.info(f"📝 Your Class Code: **{class_code}** - Share this with your students!")
+                
+                st.balloons()
+                time.sleep(2)
+                st.success("✅ Account created! Please sign in.")
+                st.rerun()
+    
+    with tab3:
+        st.subheader("🔐 Reset Password")
+        st.write("Enter your email to reset your password")
+        
+        reset_email = st.text_input("Email Address", key="reset_email", placeholder="your.email@example.com")
+        
+        if st.button("Send Reset Instructions", key="reset_btn", type="primary"):
+            # Find user by email
+            username_found = user_store.find('email', reset_email.lower())
+            user_found, _ = user_store.get(username_found) if username_found else (None, 0)
+            
+            if user_found:
+                st.success("✅ Account found!")
+                st.write("")
+                st.write("### Set New Password")
+                
+                new_pwd = st.text_input("New Password", type="password", key="new_pwd")
+                confirm_new_pwd = st.text_input("Confirm New Password", type="password", key="confirm_new_pwd")
+                
+                if st.button("Reset Password", key="do_reset"):
+                    if not new_pwd or len(new_pwd) < 6:
+                        st.error("Password must be at least 6 characters")
+                    elif new_pwd != confirm_new_pwd:
+                        st.error("Passwords do not match")
+                    else:
+                        # Update password
+                        password_hash = hash_password(new_pwd)
+                        user_store.update(username_found, lambda user: user.update(password=password_hash))
+                        st.success("✅ Password reset successful! Please sign in with your new password.")
+                        st.balloons()
+                        time.sleep(2)
+                        st.rerun()
+            else:
+                st.error("❌ Email not found. Please check your email or create a new account.")
+        
+        st.write("")
+        st.info("💡 **Note:** In production, this would send a secure reset link to your email. For now, you can reset directly here.")
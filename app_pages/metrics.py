@@ -0,0 +1,701 @@
+"""Advanced Metrics page."""
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from app_pages.common import SST_COLORS, get_user_data, update_user_data
+from fittrack.services import log_water
+from fittrack.timeseries import log_columns
+
+
+# Advanced Health Metrics
+def advanced_metrics():
+    st.header("🏥 Advanced Health Metrics")
+    st.write("Track detailed health and fitness metrics")
+    
+    user_data = get_user_data()
+    
+    # Create tabs
+    tab1, tab2, tab3, tab4 = st.tabs([
+        "🔥 BMR & Calories",
+        "❤️ Heart Rate Zones",
+        "💧 Hydration Tracker",
+        "📐 Body Composition"
+    ])
+    
+    with tab1:
+        st.subheader("🔥 Basal Metabolic Rate (BMR) Calculator")
+        st.write("Calculate your daily calorie needs")
+        
+        # Get user data
+        if user_data.get('bmi_history'):
+            latest_bmi = user_data['bmi_history'][-1]
+            default_weight = latest_bmi['weight']
+            default_height = latest_bmi['height'] * 100  # Convert to cm
+        else:
+            default_weight = 60.0
+            default_height = 165.0
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            weight = st.number_input("Weight (kg)", min_value=30.0, max_value=150.0, 
+                                    value=float(default_weight), step=0.1, key="bmr_weight")
+            height = st.number_input("Height (cm)", min_value=100.0, max_value=250.0, 
+                                    value=float(default_height), step=0.5, key="bmr_height")
+        
+        with col2:
+            age = user_data.get('age', 14)
+            gender = user_data.get('gender', 'm')
+            
+            st.metric("Age", age)
+            st.metric("Gender", "Male" if gender == 'm' else "Female")
+        
+        activity_level = st.selectbox(
+            "Activity Level",
+            [
+                "Sedentary (little/no exercise)",
+                "Lightly Active (1-3 days/week)",
+                "Moderately Active (3-5 days/week)",
+                "Very Active (6-7 days/week)",
+                "Extremely Active (athlete, 2x/day)"
+            ],
+            index=2
+        )
+        
+        if st.button("Calculate BMR & Calories", type="primary"):
+            # Mifflin-St Jeor Equation (most accurate for teens)
+            if gender == 'm':
+                bmr = (10 * weight) + (6.25 * height) - (5 * age) + 5
+            else:
+                bmr = (10 * weight) + (6.25 * height) - (5 * age) - 161
+            
+            # Activity multipliers
+            activity_multipliers = {
+                "Sedentary (little/no exercise)": 1.2,
+                "Lightly Active (1-3 days/week)": 1.375,
+                "Moderately Active (3-5 days/week)": 1.55,
+                "Very Active (6-7 days/week)": 1.725,
+                "Extremely Active (athlete, 2x/day)": 1.9
+            }
+            
+            multiplier = activity_multipliers[activity_level]
+            tdee = bmr * multiplier  # Total Daily Energy Expenditure
+            
+            # Calculate macros
+            protein_grams = weight * 1.6  # 1.6g per kg for active teens
+            protein_cals = protein_grams * 4
+            
+            fat_cals = tdee * 0.25  # 25% from fat
+            fat_grams = fat_cals / 9
+            
+            carb_cals = tdee - protein_cals - fat_cals
+            carb_grams = carb_cals / 4
+            
+            # Display results
+            st.write("---")
+            st.write("### Your Metabolic Profile")
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("BMR", f"{bmr:.0f} cal/day")
+                st.write("*Calories burned at rest*")
+            
+            with col2:
+                st.metric("TDEE", f"{tdee:.0f} cal/day")
+                st.write("*Total daily calories needed*")
+            
+            with col3:
+                calories_per_workout = 300  # Average
+                workout_days = 4  # Estimate
+                weekly_exercise_cals = calories_per_workout * workout_days
+                st.metric("Exercise Burns", f"{weekly_exercise_cals:.0f} cal/week")
+            
+            # Goals-based recommendations
+            st.write("")
+            st.write("### Calorie Targets by Goal")
+            
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                st.markdown("""
+                <div class="stat-card" style="background: #f44336; color: white;">
+                    <h3>💪 Weight Loss</h3>
+                    <h2>{:.0f} cal/day</h2>
+                    <p>Deficit: -500 cal/day</p>
+                    <p>Rate: -0.5kg/week</p>
+                </div>
+                """.format(tdee - 500), unsafe_allow_html=True)
+            
+            with col2:
+                st.markdown("""
+                <div class="stat-card" style="background: #4caf50; color: white;">
+                    <h3>⚖️ Maintenance</h3>
+                    <h2>{:.0f} cal/day</h2>
+                    <p>No deficit/surplus</p>
+                    <p>Maintain weight</p>
+                </div>
+                """.format(tdee), unsafe_allow_html=True)
+            
+            with col3:
+                st.markdown("""
+                <div class="stat-card" style="background: #2196f3; color: white;">
+                    <h3>🏋️ Muscle Gain</h3>
+                    <h2>{:.0f} cal/day</h2>
+                    <p>Surplus: +300 cal/day</p>
+                    <p>Rate: +0.25kg/week</p>
+                </div>
+                """.format(tdee + 300), unsafe_allow_html=True)
+            
+            # Macronutrients
+            st.write("")
+            st.write("### Recommended Macronutrients")
+            
+            st.write(f"**For your activity level ({activity_level}):**")
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Protein", f"{protein_grams:.0f}g/day")
+                st.write(f"({protein_cals:.0f} cal)")
+                st.progress(protein_cals / tdee)
+            
+            with col2:
+                st.metric("Carbs", f"{carb_grams:.0f}g/day")
+                st.write(f"({carb_cals:.0f} cal)")
+                st.progress(carb_cals / tdee)
+            
+            with col3:
+                st.metric("Fats", f"{fat_grams:.0f}g/day")
+                st.write(f"({fat_cals:.0f} cal)")
+                st.progress(fat_cals / tdee)
+            
+            # Save to user data
+            if 'bmr_history' not in user_data:
+                user_data['bmr_history'] = []
+            
+            user_data['bmr_history'].append({
+                'date': datetime.now().strftime('%Y-%m-%d'),
+                'bmr': round(bmr),
+                'tdee': round(tdee),
+                'weight': weight,
+                'height': height,
+                'activity_level': activity_level
+            })
+            update_user_data(user_data)
+    
+    with tab2:
+        st.subheader("❤️ Heart Rate Training Zones")
+        st.write("Optimize your training with heart rate zones")
+        
+        # Calculate max heart rate
+        age = user_data.get('age', 14)
+        max_hr = 220 - age
+        
+        # Resting heart rate input
+        st.write("### Calculate Your Training Zones")
+        
+        resting_hr = st.number_input(
+            "Resting Heart Rate (bpm)",
+            min_value=40,
+            max_value=100,
+            value=70,
+            help="Measure first thing in the morning before getting out of bed"
+        )
+        
+        # Heart Rate Reserve method (Karvonen Formula)
+        hr_reserve = max_hr - resting_hr
+        
+        # Define zones
+        zones = {
+            "Zone 1 - Very Light": {
+                "range": (0.50, 0.60),
+                "description": "Recovery, warm-up",
+                "benefits": "Promotes recovery, builds base endurance",
+                "duration": "Long (45-60+ min)",
+                "color": "#90caf9"
+            },
+            "Zone 2 - Light": {
+                "range": (0.60, 0.70),
+                "description": "Fat burning, base training",
+                "benefits": "Builds aerobic base, burns fat",
+                "duration": "Moderate-Long (30-60 min)",
+                "color": "#81c784"
+            },
+            "Zone 3 - Moderate": {
+                "range": (0.70, 0.80),
+                "description": "Aerobic endurance",
+                "benefits": "Improves cardiovascular fitness",
+                "duration": "Moderate (20-40 min)",
+                "color": "#fff176"
+            },
+            "Zone 4 - Hard": {
+                "range": (0.80, 0.90),
+                "description": "Lactate threshold",
+                "benefits": "Increases NAPFA performance, speed",
+                "duration": "Short-Moderate (10-30 min)",
+                "color": "#ffb74d"
+            },
+            "Zone 5 - Maximum": {
+                "range": (0.90, 1.00),
+                "description": "VO2 Max, sprints",
+                "benefits": "Max power, NAPFA 2.4km final sprint",
+                "duration": "Very Short (1-5 min intervals)",
+                "color": "#e57373"
+            }
+        }
+        
+        st.write("")
+        st.write(f"### Your Heart Rate Zones (Max HR: {max_hr} bpm)")
+        
+        for zone_name, zone_info in zones.items():
+            min_percent, max_percent = zone_info['range']
+            min_hr = int(resting_hr + (hr_reserve * min_percent))
+            max_hr_zone = int(resting_hr + (hr_reserve * max_percent))
+            
+            with st.expander(f"{zone_name}: {min_hr}-{max_hr_zone} bpm", expanded=True):
+                st.markdown(f"""
+                <div class="stat-card" style="background: {zone_info['color']};">
+                    <h3>{zone_info['description']}</h3>
+                    <h2>{min_hr} - {max_hr_zone} bpm</h2>
+                    <p><strong>Benefits:</strong> {zone_info['benefits']}</p>
+                    <p><strong>Duration:</strong> {zone_info['duration']}</p>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        # NAPFA-specific recommendations
+        st.write("")
+        st.write("### 🏃 NAPFA Training Recommendations")
+        
+        st.info("""
+        **For 2.4km Run:**
+        - Zone 2-3: 70% of training (build endurance)
+        - Zone 4: 20% of training (improve speed)
+        - Zone 5: 10% of training (final sprint power)
+        
+        **For Shuttle Run:**
+        - Zone 4-5: High-intensity intervals
+        - 30 sec sprints, 90 sec rest
+        
+        **For Recovery:**
+        - Zone 1: Active recovery days
+        - Light jogging or walking
+        """)
+        
+        # Save resting HR
+        if 'heart_rate_data' not in user_data:
+            user_data['heart_rate_data'] = []
+        
+        if st.button("Save Resting HR"):
+            user_data['heart_rate_data'].append({
+                'date': datetime.now().strftime('%Y-%m-%d'),
+                'resting_hr': resting_hr,
+                'max_hr': max_hr
+            })
+            update_user_data(user_data)
+            st.success("Resting heart rate saved!")
+    
+    with tab3:
+        st.subheader("💧 Hydration Calculator & Tracker")
+        st.write("Stay properly hydrated for optimal performance")
+        
+        # Calculate daily hydration needs
+        st.write("### Daily Hydration Needs")
+        
+        if user_data.get('bmi_history'):
+            weight = user_data['bmi_history'][-1]['weight']
+        else:
+            weight = st.number_input("Weight (kg)", min_value=30.0, max_value=150.0, value=60.0)
+        
+        # Calculate exercises today
+        today = datetime.now().strftime('%Y-%m-%d')
+        today_exercises = [e for e in user_data.get('exercises', []) if e['date'] == today]
+        workout_duration = sum(e['duration'] for e in today_exercises)
+        
+        # Base hydration (30-35 ml per kg)
+        base_hydration = weight * 35  # ml
+        
+        # Add for exercise (500-1000ml per hour)
+        exercise_hydration = (workout_duration / 60) * 750  # ml
+        
+        # Add for climate (if hot, +500ml)
+        climate_bonus = 0  # We'll let them select
+        
+        st.write("**Factors:**")
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.metric("Base Need", f"{base_hydration:.0f} ml")
+            st.write(f"({weight} kg × 35 ml)")
+        
+        with col2:
+            st.metric("Exercise Bonus", f"+{exercise_hydration:.0f} ml")
+            st.write(f"({workout_duration} min workout)")
+        
+        climate = st.selectbox(
+            "Climate/Temperature",
+            ["Cool (<25°C)", "Moderate (25-30°C)", "Hot (>30°C)"]
+        )
+        
+        if "Moderate" in climate:
+            climate_bonus = 500
+        elif "Hot" in climate:
+            climate_bonus = 1000
+        
+        total_hydration = base_hydration + exercise_hydration + climate_bonus
+        
+        st.write("")
+        st.markdown(f"""
+        <div class="stat-card" style="background: linear-gradient(135deg, {SST_COLORS['blue']} 0%, #1565c0 100%); color: white;">
+            <h2>💧 Total Daily Target</h2>
+            <h1>{total_hydration:.0f} ml</h1>
+            <h3>({total_hydration/1000:.1f} liters)</h3>
+            <p>≈ {total_hydration/250:.0f} glasses (250ml each)</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Hydration tracker
+        st.write("")
+        st.write("### Track Today's Intake")
+        
+        # Initialize today's hydration
+        if 'hydration_log' not in user_data:
+            user_data['hydration_log'] = []
+        
+        hydration = log_columns(user_data, 'hydration_log')
+        today_log = hydration.records(hydration.span(today, today))
+        current_intake = sum(h['amount'] for h in today_log)
+        
+        col1, col2 = st.columns([2, 1])
+        
+        with col1:
+            st.progress(min(current_intake / total_hydration, 1.0))
+            st.write(f"**Progress:** {current_intake:.0f} / {total_hydration:.0f} ml ({(current_intake/total_hydration*100):.0f}%)")
+        
+        with col2:
+            remaining = max(0, total_hydration - current_intake)
+            st.metric("Remaining", f"{remaining:.0f} ml")
+        
+        # Quick add buttons
+        st.write("**Quick Add:**")
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            if st.button("💧 Glass (250ml)"):
+                log_water(user_data, 250)
+                update_user_data(user_data)
+                st.rerun()
+        
+        with col2:
+            if st.button("🥤 Bottle (500ml)"):
+                log_water(user_data, 500)
+                update_user_data(user_data)
+                st.rerun()
+        
+        with col3:
+            if st.button("🧃 Large (750ml)"):
+                log_water(user_data, 750)
+                update_user_data(user_data)
+                st.rerun()
+        
+        with col4:
+            if st.button("💧 Custom"):
+                custom_amount = st.number_input("Amount (ml)", min_value=0, max_value=2000, value=250, step=50)
+                if st.button("Add Custom"):
+                    log_water(user_data, custom_amount)
+                    update_user_data(user_data)
+                    st.rerun()
+        
+        # Today's log
+        if today_log:
+            st.write("")
+            st.write("**Today's Log:**")
+            for log in reversed(today_log):
+                st.write(f"• {log['time']} - {log['amount']} ml")
+        
+        # Hydration tips
+        st.write("")
+        st.info("""
+        **💡 Hydration Tips:**
+        - Drink before you feel thirsty
+        - Hydrate 2 hours before exercise
+        - Drink 150-250ml every 15-20 min during exercise
+        - Rehydrate after exercise (1.5x fluid lost)
+        - Urine should be light yellow (not clear, not dark)
+        - Avoid sugary drinks - water is best
+        """)
+    
+    with tab4:
+        st.subheader("📐 Body Composition Analyzer")
+        st.write("Estimate body fat percentage using the Navy Method")
+        
+        # Get user data
+        user_data = get_user_data()
+        age = user_data.get('age', 14)
+        gender = user_data.get('gender', 'm')
+        
+        if user_data.get('bmi_history'):
+            latest_bmi = user_data['bmi_history'][-1]
+            default_weight = latest_bmi['weight']
+            default_height = latest_bmi['height'] * 100  # Convert to cm
+        else:
+            default_weight = 60.0
+            default_height = 165.0
+        
+        st.write("### Body Measurements")
+        st.info("💡 **Tip:** Use a measuring tape and measure at the widest/thickest point. Take measurements in the morning for consistency.")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.write("**Basic Info**")
+            weight = st.number_input("Weight (kg)", min_value=30.0, max_value=150.0, 
+                                    value=float(default_weight), step=0.1, key="comp_weight")
+            height_cm = st.number_input("Height (cm)", min_value=100.0, max_value=250.0, 
+                                       value=float(default_height), step=0.5, key="comp_height")
+            
+            st.metric("Age", age)
+            st.metric("Gender", "Male" if gender == 'm' else "Female")
+        
+        with col2:
+            st.write("**Circumference Measurements (cm)**")
+            neck = st.number_input("Neck circumference", min_value=20.0, max_value=60.0, 
+                                  value=35.0, step=0.5,
+                                  help="Measure just below the larynx (Adam's apple)")
+            waist = st.number_input("Waist circumference", min_value=40.0, max_value=150.0, 
+                                   value=75.0, step=0.5,
+                                   help="Measure at the narrowest point, usually at belly button level")
+            
+            if gender == 'f':
+                hip = st.number_input("Hip circumference", min_value=50.0, max_value=180.0, 
+                                     value=95.0, step=0.5,
+                                     help="Measure at the widest point of the hips")
+        
+        if st.button("Calculate Body Composition", type="primary"):
+            # Navy Method formulas
+            if gender == 'm':
+                # Male formula
+                body_fat_pct = (495 / (1.0324 - 0.19077 * np.log10(waist - neck) + 0.15456 * np.log10(height_cm))) - 450
+            else:
+                # Female formula
+                body_fat_pct = (495 / (1.29579 - 0.35004 * np.log10(waist + hip - neck) + 0.22100 * np.log10(height_cm))) - 450
+            
+            # Calculate fat mass and lean mass
+            fat_mass = (body_fat_pct / 100) * weight
+            lean_mass = weight - fat_mass
+            
+            # Determine category based on age and gender
+            if gender == 'm':
+                if body_fat_pct < 6:
+                    category = "Essential Fat Only"
+                    color = "#2196f3"
+                    desc = "⚠️ Too low - health risks"
+                elif body_fat_pct < 14:
+                    category = "Athletes"
+                    color = "#4caf50"
+                    desc = "✅ Athletic/Fit"
+                elif body_fat_pct < 18:
+                    category = "Fitness"
+                    color = "#8bc34a"
+                    desc = "✅ Good fitness level"
+                elif body_fat_pct < 25:
+                    category = "Average"
+                    color = "#ffc107"
+                    desc = "📊 Average range"
+                else:
+                    category = "Above Average"
+                    color = "#ff9800"
+                    desc = "⚠️ Consider reducing"
+            else:
+                if body_fat_pct < 14:
+                    category = "Essential Fat Only"
+                    color = "#2196f3"
+                    desc = "⚠️ Too low - health risks"
+                elif body_fat_pct < 21:
+                    category = "Athletes"
+                    color = "#4caf50"
+                    desc = "✅ Athletic/Fit"
+                elif body_fat_pct < 25:
+                    category = "Fitness"
+                    color = "#8bc34a"
+                    desc = "✅ Good fitness level"
+                elif body_fat_pct < 32:
+                    category = "Average"
+                    color = "#ffc107"
+                    desc = "📊 Average range"
+                else:
+                    category = "Above Average"
+                    color = "#ff9800"
+                    desc = "⚠️ Consider reducing"
+            
+            # Display results
+            st.write("---")
+            st.write("### Your Body Composition")
+            
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                st.markdown(f"""
+                <div class="stat-card" style="background: {color}; color: white;">
+                    <h3>Body Fat %</h3>
+                    <h1>{body_fat_pct:.1f}%</h1>
+                    <p><strong>{category}</strong></p>
+                    <p>{desc}</p>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col2:
+                st.metric("Fat Mass", f"{fat_mass:.1f} kg")
+                st.write(f"{(fat_mass/weight*100):.1f}% of body weight")
+            
+            with col3:
+                st.metric("Lean Mass", f"{lean_mass:.1f} kg")
+                st.write(f"{(lean_mass/weight*100):.1f}% of body weight")
+            
+            # Body composition breakdown chart
+            st.write("")
+            st.write("### Composition Breakdown")
+            
+            comp_data = pd.DataFrame({
+                'Component': ['Fat Mass', 'Lean Mass'],
+                'Weight (kg)': [fat_mass, lean_mass],
+                'Percentage': [body_fat_pct, 100-body_fat_pct]
+            })
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                st.bar_chart(comp_data.set_index('Component')['Weight (kg)'])
+            with col2:
+                st.dataframe(comp_data, use_container_width=True)
+            
+            # Reference ranges
+            st.write("")
+            st.write("### 📊 Reference Ranges by Category")
+            
+            if gender == 'm':
+                ref_data = {
+                    'Category': ['Essential Fat', 'Athletes', 'Fitness', 'Average', 'Above Average'],
+                    'Male (%)': ['2-5%', '6-13%', '14-17%', '18-24%', '25%+']
+                }
+            else:
+                ref_data = {
+                    'Category': ['Essential Fat', 'Athletes', 'Fitness', 'Average', 'Above Average'],
+                    'Female (%)': ['10-13%', '14-20%', '21-24%', '25-31%', '32%+']
+                }
+            
+            st.table(pd.DataFrame(ref_data))
+            
+            # Recommendations
+            st.write("")
+            st.write("### 💡 Personalized Recommendations")
+            
+            if body_fat_pct < (6 if gender == 'm' else 14):
+                st.warning("""
+                **⚠️ Body Fat Too Low**
+                - Increase calorie intake
+                - Focus on healthy fats (nuts, avocado, olive oil)
+                - Reduce intense cardio, increase strength training
+                - Consult with a healthcare provider
+                """)
+            elif body_fat_pct > (25 if gender == 'm' else 32):
+                st.info("""
+                **🎯 Body Fat Reduction Tips**
+                - Create moderate calorie deficit (300-500 cal/day)
+                - Increase protein intake (1.6-2.0g per kg)
+                - Combine cardio (3-4x/week) with strength training (3x/week)
+                - Focus on NAPFA training for functional fitness
+                - Track food intake for 2 weeks to identify patterns
+                """)
+            else:
+                st.success("""
+                **✅ Healthy Range - Maintenance Tips**
+                - Continue current training routine
+                - Maintain balanced diet
+                - Focus on NAPFA performance improvements
+                - Build muscle through strength training
+                - Monitor every 4-6 weeks for changes
+                """)
+            
+            # NAPFA correlation
+            st.write("")
+            st.write("### 🏃 Impact on NAPFA Performance")
+            
+            st.info("""
+            **Body composition affects NAPFA scores:**
+            
+            - **Lower body fat** generally improves:
+              - 2.4km run time (less weight to carry)
+              - Pull-ups (better strength-to-weight ratio)
+              - Shuttle run speed
+            
+            - **Higher lean mass** generally improves:
+              - Standing broad jump (more power)
+              - Pull-ups (more muscle)
+              - Sit-ups (stronger core)
+            
+            - **Balanced composition** is key:
+              - Too low body fat can reduce energy/performance
+              - Optimal is athletic/fitness range for your gender
+            """)
+            
+            # Save to history
+            if 'body_comp_history' not in user_data:
+                user_data['body_comp_history'] = []
+            
+            user_data['body_comp_history'].append({
+                'date': datetime.now().strftime('%Y-%m-%d'),
+                'body_fat_pct': round(body_fat_pct, 1),
+                'fat_mass': round(fat_mass, 1),
+                'lean_mass': round(lean_mass, 1),
+                'weight': weight,
+                'neck': neck,
+                'waist': waist,
+                'hip': hip if gender == 'f' else None
+            })
+            update_user_data(user_data)
+            
+            st.success("✅ Body composition data saved to your history!")
+        
+        # Show history if available
+        if user_data.get('body_comp_history') and len(user_data['body_comp_history']) > 1:
+            st.write("")
+            st.write("### 📈 Progress Tracking")
+            
+            df_comp = pd.DataFrame(user_data['body_comp_history'])
+            df_comp['date'] = pd.to_datetime(df_comp['date'])
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.write("**Body Fat % Trend**")
+                st.line_chart(df_comp.set_index('date')['body_fat_pct'])
+            
+            with col2:
+                st.write("**Lean Mass Trend**")
+                st.line_chart(df_comp.set_index('date')['lean_mass'])
+        
+        # Method explanation
+        st.write("")
+        with st.expander("ℹ️ About the Navy Method"):
+            st.write("""
+            **The U.S. Navy Body Composition Method:**
+            
+            This is a validated method used by the U.S. military that estimates body fat percentage 
+            using circumference measurements. It's considered one of the most accurate non-clinical methods.
+            
+            **Advantages:**
+            - No special equipment needed (just a measuring tape)
+            - Good accuracy (within 3-4% of DEXA scans)
+            - Easy to do at home
+            - Tracks changes over time
+            
+            **Tips for Accurate Measurements:**
+            1. Measure in the morning before eating
+            2. Stand relaxed, don't suck in or flex
+            3. Keep tape horizontal and snug (not tight)
+            4. Take 2-3 measurements and use the average
+            5. Same person should measure each time if possible
+            
+            **Note:** This is an estimate. For most accurate results, consider professional body composition 
+            testing (DEXA scan, hydrostatic weighing, or BodPod) if available.
+            """)
@@ -0,0 +1,84 @@
+"""NAPFA test calculator page."""
+import pandas as pd
+import streamlit as st
+
+from app_pages.common import MEDAL_COLORS, SST_COLORS, get_user_data, update_user_data
+from fittrack.napfa import STANDARDS, STATION_NAMES, run_minutes
+from fittrack.services import record_napfa
+
+
+# NAPFA Test Calculator
+def napfa_calculator():
+    st.header("🏃 NAPFA Test Calculator")
+    
+    user_data = get_user_data()
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        gender = st.selectbox("Gender", ["Male", "Female"], 
+                            index=0 if user_data['gender'] == 'm' else 1)
+    with col2:
+        min_age, max_age = STANDARDS.ages[0], STANDARDS.ages[-1]
+        age = st.number_input("Age", min_value=min_age, max_value=max_age,
+                              value=min(max(user_data['age'], min_age), max_age))
+    
+    gender_key = 'm' if gender == "Male" else 'f'
+    
+    if not STANDARDS.covers(age, gender_key):
+        st.error(f"No NAPFA standards for age {age} ({gender})")
+        return
+    
+    st.subheader("Enter Your Scores")
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        situps = st.number_input("Sit-ups (1 min)", min_value=0, max_value=100, value=30)
+        broadjump = st.number_input("Standing Broad Jump (cm)", min_value=0, max_value=300, value=200)
+    with col2:
+        sitreach = st.number_input("Sit and Reach (cm)", min_value=0, max_value=100, value=35)
+        pullups = st.number_input("Pull-ups (30 sec)", min_value=0, max_value=50, value=8)
+    with col3:
+        shuttlerun = st.number_input("Shuttle Run (seconds)", min_value=5.0, max_value=20.0, value=10.5, step=0.1)
+        run_time = st.text_input("2.4km Run (min:sec)", value="10:30")
+    
+    if st.button("Calculate Grades"):
+        try:
+            scores = {
+                'SU': situps,
+                'SBJ': broadjump,
+                'SAR': sitreach,
+                'PU': pullups,
+                'SR': shuttlerun,
+                'RUN': run_minutes(run_time)
+            }
+            
+            # Grade and save to history
+            result = record_napfa(user_data, scores, age, gender_key)
+            grades, total, medal = result['grades'], result['total'], result['medal']
+            medal_color = MEDAL_COLORS.get(medal, SST_COLORS['gray'])
+            update_user_data(user_data)
+            
+            # Display results
+            st.markdown("### Results")
+            
+            results_data = []
+            for test, grade in grades.items():
+                results_data.append({
+                    'Test': STATION_NAMES[test],
+                    'Score': scores[test],
+                    'Grade': grade
+                })
+            
+            df = pd.DataFrame(results_data)
+            st.dataframe(df, use_container_width=True, hide_index=True)
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown(f'<div class="stat-card"><h2 style="color: {SST_COLORS["blue"]};">Total: {total}</h2></div>', unsafe_allow_html=True)
+            with col2:
+                st.markdown(f'<div class="stat-card"><h2 style="color: {medal_color};">Medal: {medal}</h2></div>', unsafe_allow_html=True)
+            
+            st.info(f"📈 You have {len(user_data['napfa_history'])} NAPFA test(s) saved.")
+            
+        except Exception as e:
+            st.error(f"Error calculating grades: {str(e)}")
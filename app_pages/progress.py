@@ -0,0 +1,364 @@
+"""Weekly Progress page: reminders and weekly summary."""
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from app_pages.common import get_user_data
+from fittrack.catalogs import calculate_level
+from fittrack.napfa import STATION_NAMES
+from fittrack.streaks import streak_stats
+from fittrack.timeseries import log_columns
+
+
+def reminders_and_progress():
+    st.header("📊 Weekly Progress Report")
+    
+    user_data = get_user_data()
+    
+    # Quick Stats Widget (Phase 7 BONUS!)
+    st.markdown("### ⚡ Quick Stats")
+    
+    col1, col2, col3, col4, col5 = st.columns(5)
+    
+    with col1:
+        total_workouts = len(user_data.get('exercises', []))
+        st.metric("💪 Total Workouts", total_workouts)
+    
+    with col2:
+        house_points = user_data.get('house_points_contributed', 0)
+        st.metric("🏠 House Points", f"{house_points:.1f}")
+    
+    with col3:
+        total_badges = len(user_data.get('badges', []))
+        st.metric("🎖️ Badges", total_badges)
+    
+    with col4:
+        level = user_data.get('level', 'Novice')
+        st.metric("⭐ Level", level)
+    
+    with col5:
+        streak = user_data.get('login_streak', 0)
+        st.metric("🔥 Streak", f"{streak} days")
+    
+    # Show progress bar for current level
+    total_points = user_data.get('total_points', 0)
+    level_name, min_points, max_points = calculate_level(total_points)
+    
+    if max_points > min_points:
+        progress = min(100, ((total_points - min_points) / (max_points - min_points)) * 100)
+        st.progress(progress / 100)
+        st.caption(f"🎯 {total_points} / {max_points} points to next level")
+    
+    st.write("---")
+    
+    # Reminder Bar at the top
+    st.markdown("### 🔔 Today's Reminders")
+    
+    today = datetime.now().strftime('%A')
+    today_date = datetime.now().strftime('%Y-%m-%d')
+    
+    # Check scheduled activities for today
+    today_activities = [s for s in user_data.get('schedule', []) if s['day'] == today]
+    
+    if today_activities:
+        for activity in today_activities:
+            st.info(f"⏰ **Today:** {activity['activity']} - {activity['time']} ({activity['duration']} min)")
+    else:
+        st.success(f"✅ No workouts scheduled for {today}. Good rest day or add a session!")
+    
+    # Smart reminders based on data
+    reminders = []
+    
+    # Check last NAPFA test
+    if user_data.get('napfa_history'):
+        last_napfa_date = datetime.strptime(user_data['napfa_history'][-1]['date'], '%Y-%m-%d')
+        days_since_napfa = (datetime.now() - last_napfa_date).days
+        if days_since_napfa > 30:
+            reminders.append(f"📝 It's been {days_since_napfa} days since your last NAPFA test. Consider retesting to track progress!")
+    
+    # Check last BMI
+    if user_data.get('bmi_history'):
+        last_bmi_date = datetime.strptime(user_data['bmi_history'][-1]['date'], '%Y-%m-%d')
+        days_since_bmi = (datetime.now() - last_bmi_date).days
+        if days_since_bmi > 14:
+            reminders.append(f"⚖️ Update your BMI - last recorded {days_since_bmi} days ago")
+    
+    # Check sleep tracking
+    if user_data.get('sleep_history'):
+        last_sleep_date = datetime.strptime(user_data['sleep_history'][-1]['date'], '%Y-%m-%d')
+        if last_sleep_date.strftime('%Y-%m-%d') != today_date:
+            reminders.append("😴 Don't forget to log your sleep from last night!")
+    else:
+        reminders.append("😴 Start tracking your sleep for better recovery insights!")
+    
+    # Check exercise logging
+    if user_data.get('exercises'):
+        last_exercise_date = datetime.strptime(user_data['exercises'][0]['date'], '%Y-%m-%d')
+        days_since_exercise = (datetime.now() - last_exercise_date).days
+        if days_since_exercise > 2:
+            reminders.append(f"💪 It's been {days_since_exercise} days since your last logged workout. Time to get moving!")
+    else:
+        reminders.append("💪 Start logging your exercises to track your fitness journey!")
+    
+    # Check goals progress
+    if user_data.get('goals'):
+        for goal in user_data['goals']:
+            target_date = datetime.strptime(goal['date'], '%Y-%m-%d')
+            days_until = (target_date - datetime.now()).days
+            if 0 <= days_until <= 7:
+                reminders.append(f"🎯 Goal deadline approaching: '{goal['target']}' in {days_until} days!")
+    
+    if reminders:
+        st.markdown("### 💡 Smart Reminders")
+        for reminder in reminders:
+            st.warning(reminder)
+    
+    st.write("---")
+    
+    # Weekly Progress Report
+    st.markdown("### 📈 Your Weekly Summary")
+    
+    # Create tabs for different metrics
+    tab1, tab2, tab3, tab4 = st.tabs(["📊 Overview", "🏃 NAPFA Progress", "💪 Exercise Stats", "😴 Sleep Analysis"])
+    
+    with tab1:
+        st.subheader("This Week at a Glance")
+        
+        # Count activities this week
+        workout_log = log_columns(user_data, 'exercises')
+        exercises_this_week = workout_log.records(workout_log.recent(7))
+        
+        sleep_log = log_columns(user_data, 'sleep_history')
+        sleep_this_week = sleep_log.records(sleep_log.recent(7))
+        
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.metric("Workouts Logged", len(exercises_this_week))
+        with col2:
+            if exercises_this_week:
+                total_mins = sum([e['duration'] for e in exercises_this_week])
+                st.metric("Total Exercise", f"{total_mins} min")
+            else:
+                st.metric("Total Exercise", "0 min")
+        with col3:
+            st.metric("Sleep Tracked", len(sleep_this_week))
+        with col4:
+            if sleep_this_week:
+                avg_sleep = sum([s['hours'] + s['minutes']/60 for s in sleep_this_week]) / len(sleep_this_week)
+                st.metric("Avg Sleep", f"{avg_sleep:.1f}h")
+            else:
+                st.metric("Avg Sleep", "No data")
+        
+        # All-time stats
+        st.write("")
+        st.markdown("#### 📚 All-Time Statistics")
+        
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.metric("Total Workouts", len(user_data.get('exercises', [])))
+        with col2:
+            st.metric("NAPFA Tests", len(user_data.get('napfa_history', [])))
+        with col3:
+            st.metric("BMI Records", len(user_data.get('bmi_history', [])))
+        with col4:
+            st.metric("Active Goals", len(user_data.get('goals', [])))
+        
+        # Workout consistency
+        if user_data.get('exercises'):
+            st.write("")
+            st.markdown("#### 🔥 Workout Consistency")
+            
+            # Streak allows 1 rest day between workouts
+            stats = streak_stats(user_data)
+            
+            if len(set(e['date'] for e in user_data['exercises'])) >= 2:
+                streak = stats['current_streak']
+                
+                if streak >= 3:
+                    st.success(f"🔥 {streak} day streak! Keep it up!")
+                else:
+                    st.info(f"Current streak: {streak} days. Aim for 3+ for consistency!")
+    
+    with tab4:
+        st.subheader("🏃 NAPFA Performance")
+        
+        if not user_data.get('napfa_history'):
+            st.info("No NAPFA tests recorded yet. Complete your first test to track progress!")
+        else:
+            napfa_data = user_data['napfa_history']
+            
+            # Show latest scores
+            latest = napfa_data[-1]
+            st.write(f"**Latest Test:** {latest['date']}")
+            st.write(f"**Total Score:** {latest['total']} points")
+            st.write(f"**Medal:** {latest['medal']}")
+            
+            # Show grades breakdown
+            test_names = {
+                'SU': 'Sit-Ups',
+                'SBJ': 'Standing Broad Jump',
+                'SAR': 'Sit and Reach',
+                'PU': 'Pull-Ups',
+                'SR': 'Shuttle Run',
+                'RUN': '2.4km Run'
+            }
+            
+            st.write("")
+            st.write("**Grade Breakdown:**")
+            
+            grades_df = pd.DataFrame([
+                {
+                    'Test': STATION_NAMES[test],
+                    'Score': latest['scores'][test],
+                    'Grade': grade
+                }
+                for test, grade in latest['grades'].items()
+            ])
+            
+            st.dataframe(grades_df, use_container_width=True, hide_index=True)
+            
+            # Progress over time
+            if len(napfa_data) > 1:
+                st.write("")
+                st.write("**Progress Over Time:**")
+                
+                df = pd.DataFrame([
+                    {'Date': test['date'], 'Total Score': test['total']}
+                    for test in napfa_data
+                ])
+                df = df.set_index('Date')
+                st.line_chart(df)
+                
+                # Calculate improvement
+                first_score = napfa_data[0]['total']
+                latest_score = napfa_data[-1]['total']
+                improvement = latest_score - first_score
+                
+                if improvement > 0:
+                    st.success(f"📈 You've improved by {improvement} points since your first test!")
+                elif improvement < 0:
+                    st.warning(f"📉 Score decreased by {abs(improvement)} points. Review your training plan.")
+                else:
+                    st.info("Score unchanged. Time to push harder!")
+    
+    with tab3:
+        st.subheader("💪 Exercise Statistics")
+        
+        if not user_data.get('exercises'):
+            st.info("No exercises logged yet. Start logging your workouts!")
+        else:
+            exercises = user_data['exercises']
+            
+            # Total stats
+            total_workouts = len(exercises)
+            total_minutes = sum([e['duration'] for e in exercises])
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Total Workouts", total_workouts)
+            with col2:
+                st.metric("Total Time", f"{total_minutes} min ({total_minutes/60:.1f} hrs)")
+            
+            # Exercise frequency
+            st.write("")
+            st.write("**Exercise Frequency:**")
+            exercise_counts = {}
+            for ex in exercises:
+                exercise_counts[ex['name']] = exercise_counts.get(ex['name'], 0) + 1
+            
+            df_chart = pd.DataFrame({
+                'Exercise': list(exercise_counts.keys()),
+                'Count': list(exercise_counts.values())
+            }).sort_values('Count', ascending=False)
+            
+            df_chart = df_chart.set_index('Exercise')
+            st.bar_chart(df_chart)
+            
+            # Intensity breakdown
+            st.write("")
+            st.write("**Intensity Distribution:**")
+            intensity_counts = {'Low': 0, 'Medium': 0, 'High': 0}
+            for ex in exercises:
+                intensity_counts[ex['intensity']] += 1
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Low Intensity", intensity_counts['Low'])
+            with col2:
+                st.metric("Medium Intensity", intensity_counts['Medium'])
+            with col3:
+                st.metric("High Intensity", intensity_counts['High'])
+            
+            # Recent workouts
+            st.write("")
+            st.write("**Recent Workouts:**")
+            recent = exercises[:5]  # Last 5
+            for ex in recent:
+                st.write(f"• {ex['date']}: {ex['name']} - {ex['duration']}min ({ex['intensity']} intensity)")
+    
+    with tab4:
+        st.subheader("😴 Sleep Analysis")
+        
+        if not user_data.get('sleep_history'):
+            st.info("No sleep data yet. Start tracking your sleep!")
+        else:
+            sleep_data = user_data['sleep_history']
+            
+            # Calculate stats
+            total_records = len(sleep_data)
+            avg_hours = sum([s['hours'] + s['minutes']/60 for s in sleep_data]) / total_records
+            
+            quality_counts = {'Excellent': 0, 'Good': 0, 'Fair': 0, 'Poor': 0}
+            for s in sleep_data:
+                quality_counts[s['quality']] += 1
+            
+            # Display metrics
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Average Sleep", f"{avg_hours:.1f} hours")
+            with col2:
+                st.metric("Records Tracked", total_records)
+            
+            # Quality breakdown
+            st.write("")
+            st.write("**Sleep Quality Distribution:**")
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("😊 Excellent", quality_counts['Excellent'])
+            with col2:
+                st.metric("👍 Good", quality_counts['Good'])
+            with col3:
+                st.metric("😐 Fair", quality_counts['Fair'])
+            with col4:
+                st.metric("😴 Poor", quality_counts['Poor'])
+            
+            # Sleep trend
+            if len(sleep_data) > 1:
+                st.write("")
+                st.write("**Sleep Duration Trend:**")
+                df = pd.DataFrame(sleep_data)
+                df['total_hours'] = df['hours'] + df['minutes'] / 60
+                df_chart = df.set_index('date')['total_hours']
+                st.line_chart(df_chart)
+            
+            # Sleep insights
+            st.write("")
+            st.write("**Insights:**")
+            if avg_hours >= 8:
+                st.success("✅ Excellent sleep habits! Keep it up for optimal recovery and performance.")
+            elif avg_hours >= 7:
+                st.info("👍 Good sleep duration. Try to get closer to 8-10 hours for peak performance.")
+            else:
+                st.warning("⚠️ You're not getting enough sleep. Aim for 8-10 hours for teenagers!")
+            
+            # Best and worst
+            if len(sleep_data) >= 3:
+                sleep_sorted = sorted(sleep_data, key=lambda x: x['hours'] + x['minutes']/60, reverse=True)
+                best = sleep_sorted[0]
+                worst = sleep_sorted[-1]
+                
+                st.write(f"**Best night:** {best['date']} - {best['hours']}h {best['minutes']}m")
+                st.write(f"**Shortest night:** {worst['date']} - {worst['hours']}h {worst['minutes']}m")
@@ -0,0 +1,102 @@
+"""Training schedule and goal pages."""
+from datetime import datetime
+
+import streamlit as st
+
+from app_pages.common import get_user_data, update_user_data
+
+
+# Goal Setting
+def goal_setting():
+    st.header("🎯 Fitness Goals")
+    
+    with st.form("goal_form"):
+        goal_type = st.selectbox("Goal Type", 
+                                ["Weight Loss", "Muscle Gain", "NAPFA Improvement", 
+                                 "Endurance", "Flexibility"])
+        target = st.text_input("Target Value", placeholder="e.g., 60kg, Grade 5, 30 min run")
+        target_date = st.date_input("Target Date")
+        progress = st.slider("Current Progress (%)", 0, 100, 0)
+        
+        submitted = st.form_submit_button("Set Goal")
+        
+        if submitted:
+            if target:
+                user_data = get_user_data()
+                user_data['goals'].append({
+                    'type': goal_type,
+                    'target': target,
+                    'date': target_date.strftime('%Y-%m-%d'),
+                    'progress': progress,
+                    'created': datetime.now().strftime('%Y-%m-%d')
+                })
+                from fittrack.services import award_badges  # badges load numpy; only when a goal is set
+                award_badges(user_data, ('goal_set',))
+                update_user_data(user_data)
+                st.success("Goal set successfully!")
+                st.rerun()
+            else:
+                st.error("Please enter target value")
+    
+    # Display goals
+    user_data = get_user_data()
+    if user_data['goals']:
+        st.subheader("Your Goals")
+        for idx, goal in enumerate(user_data['goals']):
+            with st.expander(f"{goal['type']} - {goal['target']}"):
+                st.write(f"**Target Date:** {goal['date']}")
+                st.write(f"**Created:** {goal['created']}")
+                st.progress(goal['progress'] / 100)
+                st.write(f"Progress: {goal['progress']}%")
+    else:
+        st.info("No goals set yet.")
+
+
+# Schedule Manager
+def schedule_manager():
+    st.header("📅 Training Schedule")
+    
+    with st.form("schedule_form"):
+        day = st.selectbox("Day of Week", 
+                          ["Monday", "Tuesday", "Wednesday", "Thursday", 
+                           "Friday", "Saturday", "Sunday"])
+        activity = st.text_input("Activity", placeholder="e.g., Morning run")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            time = st.time_input("Time")
+        with col2:
+            duration = st.number_input("Duration (minutes)", min_value=1, max_value=300, value=30)
+        
+        submitted = st.form_submit_button("Add to Schedule")
+        
+        if submitted:
+            if activity:
+                user_data = get_user_data()
+                user_data['schedule'].append({
+                    'day': day,
+                    'activity': activity,
+                    'time': str(time),
+                    'duration': duration
+                })
+                update_user_data(user_data)
+                st.success("Activity added to schedule!")
+                st.rerun()
+            else:
+                st.error("Please enter activity name")
+    
+    # Display schedule
+    user_data = get_user_data()
+    if user_data['schedule']:
+        st.subheader("Weekly Schedule")
+        days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+        
+        for day in days:
+            day_activities = [s for s in user_data['schedule'] if s['day'] == day]
+            if day_activities:
+                st.markdown(f"### {day}")
+                for activity in day_activities:
+                    st.markdown(f'<div class="stat-card"><strong>{activity["activity"]}</strong><br>{activity["time"]} - {activity["duration"]} minutes</div>', 
+                              unsafe_allow_html=True)
+    else:
+        st.info("No activities scheduled yet.")
@@ -0,0 +1,55 @@
+"""Sleep tracker page."""
+import streamlit as st
+
+from app_pages.common import SST_COLORS, get_user_data, update_user_data
+from fittrack.services import log_sleep
+
+# Colour and advice shown for each sleep quality
+QUALITY_STYLES = {
+    "Excellent": ("#4caf50", "✓ Great job! You're getting enough sleep."),
+    "Good": ("#8bc34a", "👍 Good sleep duration. Try to get a bit more."),
+    "Fair": ("#ff9800", "⚠️ You need more sleep. Aim for 8-10 hours per night."),
+    "Poor": ("#f44336", "⚠️ You need more sleep. Aim for 8-10 hours per night.")
+}
+
+
+# Sleep Tracker
+def sleep_tracker():
+    st.header("😴 Sleep Tracker")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        sleep_start = st.time_input("Sleep Start Time", value=None)
+    with col2:
+        sleep_end = st.time_input("Wake Up Time", value=None)
+    
+    if st.button("Calculate Sleep"):
+        if sleep_start and sleep_end:
+            # Save to history
+            user_data = get_user_data()
+            entry = log_sleep(user_data, sleep_start, sleep_end)
+            update_user_data(user_data)
+            
+            hours, minutes, quality = entry['hours'], entry['minutes'], entry['quality']
+            color, advice = QUALITY_STYLES[quality]
+            
+            # Display results
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown(f'<div class="stat-card"><h2 style="color: {color};">Sleep Duration: {hours}h {minutes}m</h2></div>', unsafe_allow_html=True)
+            with col2:
+                st.markdown(f'<div class="stat-card"><h2 style="color: {SST_COLORS["blue"]};">Quality: {quality}</h2></div>', unsafe_allow_html=True)
+            
+            st.info(advice)
+            st.info(f"📈 You have {len(user_data['sleep_history'])} sleep record(s) saved.")
+            
+            # Show history chart if there's data
+            if len(user_data['sleep_history']) > 1:
+                import pandas as pd  # only needed for the chart
+                df = pd.DataFrame(user_data['sleep_history'])
+                df['total_hours'] = df['hours'] + df['minutes'] / 60
+                df_chart = df.set_index('date')['total_hours']
+                st.subheader("Sleep Duration History (hours)")
+                st.line_chart(df_chart)
+        else:
+            st.error("Please enter both sleep start and end times")
@@ -0,0 +1,512 @@
+"""Teacher dashboard."""
+import importlib.util
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from app_pages import STUDENT_PAGES, load_page
+from app_pages.common import (SST_COLORS, finished_job, get_user_data, is_admin, job_queue, load_users,
+                              update_user_data, user_store)
+from fittrack.classroom import (REPORT_FORMATS, WEAK_GRADE, class_overview, component_averages, report_columns,
+                                weekly_participation)
+from fittrack.houses import standings
+from fittrack.napfa import grade_frame, history_entries, read_results
+
+# Export Reports: file format choices and students shown in the preview
+REPORT_FORMAT_LABELS = {"CSV": 'csv', "Parquet": 'parquet', "Excel": 'xlsx'}
+REPORT_PREVIEW_ROWS = 20
+
+# Teacher Dashboard
+# Teacher Dashboard
+def teacher_dashboard():
+    st.header("👨‍🏫 Teacher Dashboard")
+    
+    user_data = get_user_data()
+    all_users = load_users()
+    
+    # Display class code
+    st.markdown(f"""
+    <div class="stat-card" style="background: linear-gradient(135deg, {SST_COLORS['blue']} 0%, #1565c0 100%); color: white;">
+        <h2>📝 Your Class Code: {user_data['class_code']}</h2>
+        <p>Share this code with your students to join your class</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.write("")
+    
+    # Get student list
+    student_usernames = user_data.get('students', [])
+    students_data = {username: all_users[username] for username in student_usernames if username in all_users}
+    
+    # Create tabs
+    tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs([
+        "💪 My Fitness",
+        "🏠 Houses",
+        "📊 Class Overview",
+        "👥 Student List", 
+        "📈 Performance Analysis",
+        "📄 Export Reports",
+        "🏃 NAPFA Test Day"
+    ])
+    
+    with tab1:
+        st.subheader("💪 My Personal Fitness")
+        st.write("Track your own fitness alongside your students!")
+        
+        # Allow teachers to access all student features
+        teacher_feature = st.selectbox(
+            "Select Feature",
+            ["Dashboard", "BMI Calculator", "NAPFA Test", "Sleep Tracker", 
+             "Exercise Log", "Training Schedule", "AI Insights", "Community"]
+        )
+        
+        if teacher_feature == "Dashboard":
+            st.write("### 📊 Your Fitness Overview")
+            
+            # Teacher's personal stats
+            col1, col2, col3, col4 = st.columns(4)
+            
+            with col1:
+                if user_data.get('bmi_history'):
+                    latest_bmi = user_data['bmi_history'][-1]['bmi']
+                    st.metric("Latest BMI", f"{latest_bmi:.1f}")
+                else:
+                    st.metric("Latest BMI", "No data")
+            
+            with col2:
+                if user_data.get('napfa_history'):
+                    latest_napfa = user_data['napfa_history'][-1]['total']
+                    st.metric("NAPFA Score", f"{latest_napfa}/30")
+                else:
+                    st.metric("NAPFA Score", "No data")
+            
+            with col3:
+                total_workouts = len(user_data.get('exercises', []))
+                st.metric("Total Workouts", total_workouts)
+            
+            with col4:
+                if user_data.get('house'):
+                    house_display = {'yellow': '🟡 Yellow', 'red': '🔴 Red', 'blue': '🔵 Blue', 
+                                   'green': '🟢 Green', 'black': '⚫ Black'}.get(user_data['house'], 'None')
+                    st.metric("Your House", house_display)
+                else:
+                    st.metric("Your House", "Not assigned")
+            
+            # Quick actions
+            st.write("")
+            st.write("### 🚀 Quick Actions")
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                if st.button("📝 Log Workout", key="teacher_log"):
+                    st.session_state.teacher_feature_nav = "Exercise Log"
+                    st.rerun()
+            with col2:
+                if st.button("🏃 Take NAPFA", key="teacher_napfa"):
+                    st.session_state.teacher_feature_nav = "NAPFA Test"
+                    st.rerun()
+            with col3:
+                if st.button("🤖 AI Insights", key="teacher_ai"):
+                    st.session_state.teacher_feature_nav = "AI Insights"
+                    st.rerun()
+            
+            # Recent activity
+            if user_data.get('exercises'):
+                st.write("")
+                st.write("### 📋 Recent Workouts")
+                recent = user_data['exercises'][:5]
+                for ex in recent:
+                    st.write(f"• **{ex['name']}** - {ex['duration']} min ({ex['date']})")
+        
+        elif teacher_feature == "BMI Calculator":
+            load_page(STUDENT_PAGES["BMI Calculator"])()
+        
+        elif teacher_feature == "NAPFA Test":
+            load_page(STUDENT_PAGES["NAPFA Test"])()
+        
+        elif teacher_feature == "Sleep Tracker":
+            load_page(STUDENT_PAGES["Sleep Tracker"])()
+        
+        elif teacher_feature == "Exercise Log":
+            load_page(STUDENT_PAGES["💪 Log Workout"])()
+        
+        elif teacher_feature == "Training Schedule":
+            load_page(STUDENT_PAGES["Training Schedule"])()
+        
+        elif teacher_feature == "AI Insights":
+            load_page(STUDENT_PAGES["🤖 AI Insights"])()
+        
+        elif teacher_feature == "Community":
+            st.write("### 🏆 Community Features")
+            st.info("💡 As a teacher, you can join houses, compete on leaderboards, and connect with colleagues!")
+            
+            community_sub = st.selectbox("Select", ["Leaderboards", "My Achievements", "Friends"])
+            
+            if community_sub == "Leaderboards":
+                st.write("Access leaderboards from the main Community section")
+                st.write("You can compete with students and other teachers!")
+            
+            elif community_sub == "My Achievements":
+                st.write("### 🎖️ Your Badges & Achievements")
+                badges = user_data.get('badges', [])
+                if badges:
+                    for badge in badges:
+                        st.success(f"{badge['name']} - {badge['description']} (+{badge['points']} pts)")
+                else:
+                    st.info("Complete workouts and NAPFA tests to earn badges!")
+            
+            elif community_sub == "Friends":
+                st.write("### 👥 Connect with Colleagues")
+                st.write("Add other teachers as friends to compare fitness progress!")
+    
+    with tab2:
+        st.subheader("🏠 House System - Your Class")
+        
+        # House stats for THIS teacher's students only
+        house_stats = standings(user_store.house_totals(st.session_state.username))
+        
+        # Sort houses
+        sorted_houses = sorted(house_stats.items(), key=lambda x: x[1]['points'], reverse=True)
+        
+        # Display house standings
+        st.write("### 🏆 House Standings (Your Class)")
+        
+        for rank, (house_name, stats) in enumerate(sorted_houses, 1):
+            if stats['members']:  # Only show houses with members
+                medal = "🥇" if rank == 1 else "🥈" if rank == 2 else "🥉" if rank == 3 else f"{rank}."
+                
+                st.markdown(f"""
+                <div class="stat-card" style="background: linear-gradient(135deg, {stats['color']} 0%, {stats['color']}dd 100%); color: white;">
+                    <h3>{medal} {stats['display']}</h3>
+                    <h2>{stats['points']:.1f} Points</h2>
+                    <p>👥 {stats['members']} members | 💪 {stats['workouts']} workouts</p>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        # House distribution
+        st.write("")
+        st.write("### 📊 House Distribution")
+        
+        col1, col2, col3, col4, col5 = st.columns(5)
+        cols = [col1, col2, col3, col4, col5]
+        
+        for idx, (house_name, stats) in enumerate(sorted_houses):
+            with cols[idx]:
+                st.metric(stats['display'], stats['members'])
+        
+        # Students not assigned to house
+        unassigned = [username for username, student in students_data.items() if not student.get('house')]
+        if unassigned:
+            st.write("")
+            st.warning(f"⚠️ {len(unassigned)} student(s) not assigned to a house")
+            st.write("Go to 'Student List' tab to assign houses.")
+    
+    # Class numbers kept up to date by the store as students save
+    class_rollup = user_store.class_rollup(st.session_state.username)
+    
+    with tab3:
+        st.subheader("Class Overview")
+        overview = class_overview(class_rollup, student_usernames)
+        napfa_totals = overview['napfa_totals']
+        
+        # Stats
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.metric("Total Students", f"{len(students_data)}/30")
+        
+        with col2:
+            if overview['avg_napfa'] is not None:
+                st.metric("Avg NAPFA Score", f"{overview['avg_napfa']:.1f}/30")
+            else:
+                st.metric("Avg NAPFA Score", "No data")
+        
+        with col3:
+            st.metric("Active This Week", f"{overview['active_this_week']}/{len(students_data)}")
+        
+        with col4:
+            st.metric("Class Workouts", overview['workouts_this_week'])
+        
+        # Performance distribution
+        if napfa_totals:
+            st.write("")
+            st.write("### 📊 NAPFA Score Distribution")
+            
+            # Create distribution chart
+            st.bar_chart(pd.Series(napfa_totals, name='count').rename_axis('Score').sort_index())
+            
+            # Medal counts
+            st.write("")
+            st.write("### 🏅 Medal Distribution")
+            
+            medal_counts = overview['medal_counts']
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("🥇 Gold", medal_counts['🥇 Gold'])
+            col2.metric("🥈 Silver", medal_counts['🥈 Silver'])
+            col3.metric("🥉 Bronze", medal_counts['🥉 Bronze'])
+            col4.metric("No Medal", medal_counts['No Medal'])
+        
+        # Top performers
+        if napfa_totals:
+            st.write("")
+            st.write("### ⭐ Top Performers")
+            
+            for idx, student in enumerate(overview['top_performers'], 1):
+                medal = "🥇" if idx == 1 else "🥈" if idx == 2 else "🥉" if idx == 3 else f"{idx}."
+                st.write(f"{medal} **{student['name']}** - {student['score']}/30 ({student['medal']})")
+        
+        # Students needing attention
+        st.write("")
+        st.write("### ⚠️ Students Needing Attention")
+        
+        needs_attention = overview['needs_attention']
+        if needs_attention:
+            for name, reason, total in needs_attention[:5]:
+                if reason == 'no_workouts':
+                    st.warning(f"📝 **{name}** - No workouts logged")
+                else:
+                    st.warning(f"📉 **{name}** - Low NAPFA score ({total}/30)")
+        else:
+            st.success("✅ All students doing well!")
+    
+    with tab4:
+        st.subheader("Student List")
+        
+        if not students_data:
+            st.info("No students in your class yet. Share your class code: " + user_data['class_code'])
+        else:
+            # Search and filter
+            search = st.text_input("🔍 Search students", placeholder="Enter name or username")
+            
+            # Display students
+            for username, student in students_data.items():
+                if search.lower() in student['name'].lower() or search.lower() in username.lower() or not search:
+                    with st.expander(f"👤 {student['name']} (@{username})"):
+                        col1, col2, col3 = st.columns(3)
+                        
+                        with col1:
+                            st.write(f"**Email:** {student.get('email', 'N/A')}")
+                            st.write(f"**Age:** {student.get('age', 'N/A')}")
+                            st.write(f"**Gender:** {'Male' if student.get('gender') == 'm' else 'Female'}")
+                        
+                        with col2:
+                            if student.get('napfa_history'):
+                                latest = student['napfa_history'][-1]
+                                st.write(f"**NAPFA:** {latest['total']}/30")
+                                st.write(f"**Medal:** {latest['medal']}")
+                            else:
+                                st.write("**NAPFA:** Not tested")
+                            
+                            st.write(f"**Workouts:** {len(student.get('exercises', []))}")
+                        
+                        with col3:
+                            st.write(f"**Level:** {student.get('level', 'Novice')}")
+                            st.write(f"**Points:** {student.get('total_points', 0)}")
+                            st.write(f"**Login Streak:** {student.get('login_streak', 0)} days")
+                        
+                        # House info and assignment
+                        st.write("")
+                        current_house = student.get('house', 'Not assigned')
+                        if current_house != 'Not assigned':
+                            house_display = {
+                                'yellow': '🟡 Yellow',
+                                'red': '🔴 Red',
+                                'blue': '🔵 Blue',
+                                'green': '🟢 Green',
+                                'black': '⚫ Black'
+                            }
+                            st.write(f"**🏠 House:** {house_display.get(current_house, current_house.title())}")
+                            st.write(f"**House Points:** {student.get('house_points_contributed', 0):.1f}")
+                        else:
+                            st.write("**🏠 House:** Not assigned")
+                        
+                        # House assignment
+                        st.write("")
+                        house_options = ['yellow', 'red', 'blue', 'green', 'black']
+                        new_house = st.selectbox(
+                            "Assign to House",
+                            house_options,
+                            index=house_options.index(current_house) if current_house in house_options else 0,
+                            key=f"house_{username}",
+                            format_func=lambda x: {'yellow': '🟡 Yellow', 'red': '🔴 Red', 'blue': '🔵 Blue', 
+                                                  'green': '🟢 Green', 'black': '⚫ Black'}[x]
+                        )
+                        
+                        col_a, col_b = st.columns(2)
+                        with col_a:
+                            if st.button(f"Update House", key=f"update_house_{username}"):
+                                user_store.update(username, lambda student: student.update(house=new_house))
+                                st.success(f"Updated {student['name']}'s house to {new_house.title()}!")
+                                st.rerun()
+                        
+                        with col_b:
+                            if st.button(f"Remove from class", key=f"remove_{username}"):
+                                user_data['students'].remove(username)
+                                update_user_data(user_data)
+                                user_store.update(username, lambda student: student.update(teacher_class=None))
+                                st.success(f"Removed {student['name']} from class")
+                                st.rerun()
+    
+    with tab5:
+        st.subheader("Performance Analysis")
+        
+        if not students_data:
+            st.info("No students to analyze yet")
+        else:
+            # NAPFA component analysis
+            st.write("### 📊 NAPFA Component Breakdown")
+            
+            avg_scores = component_averages(class_rollup)
+            if avg_scores:
+                df = pd.DataFrame({
+                    'Component': list(avg_scores.keys()),
+                    'Average Grade': list(avg_scores.values())
+                })
+                
+                st.bar_chart(df.set_index('Component'))
+                
+                # Identify weak areas
+                weak_components = [name for name, avg in avg_scores.items() if avg < WEAK_GRADE]
+                if weak_components:
+                    st.warning(f"⚠️ **Class weak areas:** {', '.join(weak_components)}")
+                    st.info("💡 Consider focusing class training on these components")
+            
+            # Participation trends
+            st.write("")
+            st.write("### 📈 Weekly Participation Trend")
+            
+            # Last 4 weeks
+            df_weeks = pd.DataFrame(weekly_participation(class_rollup))
+            st.line_chart(df_weeks.set_index('Week'))
+    
+    with tab6:
+        st.subheader("Export Class Reports")
+        
+        st.write("### 📊 Google Sheets Export")
+        st.info("Generate a comprehensive class report and export to Google Sheets")
+        
+        # Report options
+        include_napfa = st.checkbox("Include NAPFA scores", value=True)
+        include_workouts = st.checkbox("Include workout logs", value=True)
+        include_attendance = st.checkbox("Include attendance/participation", value=True)
+        
+        format_label = st.selectbox("File format", list(REPORT_FORMAT_LABELS))
+        report_format = REPORT_FORMAT_LABELS[format_label]
+        # Admins can export every class at once
+        scope = st.radio("Students", ["My class", "Whole school"], horizontal=True) if is_admin() else "My class"
+        report_teacher = None if scope == "Whole school" else st.session_state.username
+        
+        if st.button("📄 Generate Report", type="primary"):
+            if not user_store.class_member_count(report_teacher):
+                st.error("No students to export")
+            elif report_format == 'xlsx' and importlib.util.find_spec('openpyxl') is None:
+                st.error("openpyxl library not installed. Please add 'openpyxl' to requirements.txt")
+            else:
+                # Written in the background (see fittrack.classroom.report_job) to a file kept with the job
+                st.session_state.report_job = job_queue.submit(
+                    'class_report',
+                    {'teacher': report_teacher, 'format': report_format, 'preview': REPORT_PREVIEW_ROWS,
+                     'columns': report_columns(include_napfa, include_workouts, include_attendance)},
+                    owner=st.session_state.username)
+        
+        job = finished_job('report_job', "Writing report...")
+        if job is not None:
+            if job['status'] == 'failed':
+                st.error(f"Could not write the report: {job['error']}")
+            else:
+                with open(job['output'], 'rb') as report_file:
+                    report_data = report_file.read()
+                
+                label = next(label for label, fmt in REPORT_FORMAT_LABELS.items() if fmt == job['args']['format'])
+                _, extension, mime = REPORT_FORMATS[job['args']['format']]
+                st.download_button(
+                    label=f"📥 Download {label} Report",
+                    data=report_data,
+                    file_name=f"class_report_{datetime.now().strftime('%Y%m%d')}.{extension}",
+                    mime=mime
+                )
+                
+                st.success("✅ Report generated! Click to download.")
+                
+                # Preview
+                total = job['result']['students']
+                st.write("### Preview" if total <= REPORT_PREVIEW_ROWS
+                         else f"### Preview (first {REPORT_PREVIEW_ROWS} of {total} students)")
+                df_report = pd.DataFrame(job['result']['preview'], columns=job['args']['columns'])
+                st.dataframe(df_report, use_container_width=True)
+        
+        st.write("")
+        st.write("### 📧 Share Instructions")
+        st.info("""
+        **To share this report with others:**
+        1. Download the CSV file
+        2. Upload to Google Sheets
+        3. Click Share → Add people (enter emails)
+        4. Set permissions (Viewer = read-only, Editor = can edit)
+        5. Send the link!
+        
+        **For automatic Google Sheets export, this feature will be available after deployment.**
+        """)
+    
+    with tab7:
+        st.subheader("NAPFA Test Day Upload")
+        st.write("Upload the results CSV from the test station to grade the whole class at once.")
+        st.caption("Columns: username, age, gender (M/F), SU, SBJ, SAR, PU, SR (seconds), RUN (min:sec)")
+        
+        results_file = st.file_uploader("Test station results (CSV)", type=['csv'], key="napfa_results_csv")
+        
+        graded = None
+        if results_file is not None:
+            try:
+                graded = grade_frame(read_results(results_file))
+            except (ValueError, pd.errors.ParserError) as e:
+                st.error(f"Could not read results: {str(e)}")
+        
+        if graded is not None:
+            ungraded = graded['total'].isna()
+            
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("Students Graded", int((~ungraded).sum()))
+            with col2:
+                st.metric("🥇 Gold", int((graded['medal'] == '🥇 Gold').sum()))
+            with col3:
+                st.metric("🥈 Silver", int((graded['medal'] == '🥈 Silver').sum()))
+            with col4:
+                st.metric("🥉 Bronze", int((graded['medal'] == '🥉 Bronze').sum()))
+            
+            if ungraded.any():
+                st.warning(f"⚠️ {int(ungraded.sum())} row(s) have no scores, or no standards for their age and gender, "
+                           "and were not graded")
+            
+            st.dataframe(graded, use_container_width=True, hide_index=True)
+            
+            st.download_button(
+                label="📥 Download Graded Results",
+                data=graded.to_csv(index=False),
+                file_name=f"napfa_results_{datetime.now().strftime('%Y%m%d')}.csv",
+                mime="text/csv"
+            )
+            
+            if 'username' in graded.columns:
+                entries = history_entries(graded, datetime.now().strftime('%Y-%m-%d'))
+                in_class = {label: entry for label, entry in entries.items()
+                            if graded.at[label, 'username'] in students_data}
+                st.write(f"**{len(in_class)}** graded row(s) match students in your class.")
+                
+                if st.button("💾 Save Results to Student Records", type="primary", disabled=not in_class):
+                    # Saved in the background (see fittrack.napfa.import_job), one student at a time
+                    st.session_state.napfa_import_job = job_queue.submit(
+                        'napfa_import',
+                        {'entries': [[graded.at[label, 'username'], entry] for label, entry in in_class.items()]},
+                        owner=st.session_state.username)
+                
+                job = finished_job('napfa_import_job', "Saving results...")
+                if job is not None:
+                    if job['status'] == 'failed':
+                        st.error(f"Could not save the results: {job['error']}")
+                    else:
+                        st.success(f"✅ Saved NAPFA results for {job['result']['saved']} student(s)!")
+            else:
+                st.info("Add a username column to save these results to your students' records.")
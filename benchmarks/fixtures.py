@@ -0,0 +1,124 @@
+"""
+Synthetic FitTrack data for the benchmarks.
+
+seed_student() builds one student record with a few months of workouts,
+sleep, steps, hydration and NAPFA tests. make_school() builds a whole school:
+classes of CLASS_SIZE students, each with a teacher holding the class code,
+spread over the five houses, with friends inside their class and the badges
+their history would have earned. write_fixture() saves it as a
+fittrack_users.json snapshot that either storage backend opens as is:
+
+    python benchmarks/fixtures.py 5000 [--days 30] [--output fittrack_users.json]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+from datetime import date, datetime, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from fittrack.badges import check_and_award_badges  # noqa: E402
+from fittrack.streaks import update_streaks  # noqa: E402
+
+HOUSES = ('yellow', 'red', 'blue', 'green', 'black')
+WORKOUTS = ('Running', 'Push-ups', 'Cycling', 'Swimming', 'HIIT', 'Basketball')
+CLASS_SIZE = 30
+FRIENDS = 5
+
+
+def seed_student(rng, username, days=120, hydration_days=None):
+    """
+    A student record with roughly `days` days of history in every log
+    (hydration only for the last `hydration_days` days when given)
+    """
+    today = date.today()
+    exercises, sleep, steps, hydration = [], [], [], []
+    for offset in range(days, -1, -1):
+        day = (today - timedelta(days=offset)).isoformat()
+        if rng.random() < 0.6:
+            workout = rng.choice(WORKOUTS)
+            exercises.insert(0, {'name': workout, 'type': workout, 'date': day, 'time': '17:30',
+                                 'duration': rng.randint(15, 90), 'intensity': rng.choice(('Low', 'Medium', 'High')),
+                                 'notes': '', 'points_earned': 10, 'verification_status': 'auto'})
+        hours = rng.randint(5, 9)
+        sleep.append({'date': day, 'sleep_start': '23:00:00', 'sleep_end': '07:00:00',
+                      'hours': hours, 'minutes': rng.choice((0, 15, 30, 45)), 'quality': 'Good'})
+        steps.insert(0, {'date': day, 'steps': rng.randint(3000, 15000), 'distance_km': 5.0,
+                         'points_earned': 0, 'type': 'daily_steps'})
+        if hydration_days is None or offset < hydration_days:
+            for _ in range(rng.randint(2, 6)):
+                hydration.append({'date': day, 'time': '12:00', 'amount': 250})
+    napfa = []
+    for months_ago in (9, 6, 3):
+        grades = {s: rng.randint(2, 5) for s in ('SU', 'SBJ', 'SAR', 'PU', 'SR', 'RUN')}
+        total = sum(grades.values())
+        medal = '🥇 Gold' if total >= 21 and min(grades.values()) >= 3 else '🥈 Silver'
+        napfa.append({'date': (today - timedelta(days=30 * months_ago)).isoformat(), 'age': 14, 'gender': 'm',
+                      'scores': {'SU': 35, 'SBJ': 210, 'SAR': 38, 'PU': 15, 'SR': 10.8, 'RUN': 12.5},
+                      'grades': grades, 'total': total, 'medal': medal})
+    return {
+        'email': f'{username}@example.com', 'password': 'benchmark', 'role': 'student',
+        'name': username.title(), 'age': 14, 'gender': rng.choice('mf'), 'school': 'SST', 'class': 'S2-01',
+        'house': rng.choice(HOUSES), 'house_points_contributed': rng.randint(0, 200),
+        'total_workout_hours': sum(e['duration'] for e in exercises) / 60, 'show_on_leaderboards': True,
+        'created': datetime.now().isoformat(),
+        'bmi_history': [{'date': today.isoformat(), 'bmi': 19.5, 'weight': 50, 'height': 1.6, 'category': 'Normal'}],
+        'napfa_history': napfa, 'sleep_history': sleep, 'exercises': exercises, 'steps_data': steps,
+        'hydration_log': hydration, 'goals': [], 'schedule': [], 'saved_workout_plan': None,
+        'friends': [], 'friend_requests': [], 'badges': [], 'level': 'Novice', 'total_points': 300,
+        'last_login': datetime.now().isoformat(), 'login_streak': 3, 'active_challenges': [],
+        'completed_challenges': [], 'teacher_class': None,
+    }
+
+
+def seed_teacher(rng, username, class_name):
+    return {
+        'email': f'{username}@example.com', 'password': 'benchmark', 'role': 'teacher',
+        'name': username.title(), 'school': 'SST', 'class_code': f'{class_name}-{rng.randrange(10 ** 6):06d}',
+        'students': [], 'created': datetime.now().isoformat(),
+        'bmi_history': [], 'napfa_history': [], 'sleep_history': [], 'exercises': [],
+        'goals': [], 'schedule': [], 'last_login': datetime.now().isoformat(), 'login_streak': 1,
+    }
+
+
+def make_school(students, days=30, seed=0):
+    """{username: record} for `students` students and one teacher per class"""
+    rng = random.Random(seed)
+    users = {}
+    for first in range(0, students, CLASS_SIZE):
+        class_name = f'S{first // CLASS_SIZE + 1:04d}'
+        teacher = f'teacher{first // CLASS_SIZE}'
+        users[teacher] = seed_teacher(rng, teacher, class_name)
+        members = [f'student{i}' for i in range(first, min(first + CLASS_SIZE, students))]
+        for username in members:
+            data = seed_student(rng, username, days, hydration_days=7)
+            data['class'] = class_name
+            data['teacher_class'] = teacher
+            data['friends'] = rng.sample([u for u in members if u != username], min(FRIENDS, len(members) - 1))
+            update_streaks(data)
+            badges, points = check_and_award_badges(data)
+            data['badges'] = badges
+            data['total_points'] += points
+            users[username] = data
+        users[teacher]['students'] = members
+    return users
+
+
+def write_fixture(path, users):
+    with open(path, 'w') as f:
+        json.dump(users, f)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Write a synthetic fittrack_users.json")
+    parser.add_argument('students', type=int)
+    parser.add_argument('--days', type=int, default=30)
+    parser.add_argument('--output', default='fittrack_users.json')
+    args = parser.parse_args()
+    users = make_school(args.students, args.days)
+    write_fixture(args.output, users)
+    print(f"{args.output}: {args.students} students, {len(users) - args.students} teachers, "
+          f"{os.path.getsize(args.output) / 2 ** 20:.1f} MB")
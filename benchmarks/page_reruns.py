@@ -0,0 +1,103 @@
+"""
+Per-rerun CPU time for each sidebar page of the student app.
+
+Seeds a throwaway data directory with a class of students who have a few
+months of history, signs one of them in through session state and drives the
+app headlessly with Streamlit's AppTest: every page in main_app's sidebar is
+selected and rerun a number of times, and the CPU time of each rerun is
+recorded (with the script compiled once, as the server does). Run it
+against two checkouts of the app to compare them:
+
+    python benchmarks/page_reruns.py [--app path/to/fittrack_app_UNIFIED.py] [--reruns 10]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from fixtures import seed_student  # noqa: E402
+from fittrack.storage import UserStore, open_store  # noqa: E402
+
+PAGES = ["📊 Weekly Progress", "🏆 Community", "🤖 AI Insights", "🏥 Advanced Metrics", "🌐 Integrations",
+         "💪 Log Workout", "BMI Calculator", "NAPFA Test", "Sleep Tracker", "Training Schedule"]
+
+
+def seed(data_dir, students, backend):
+    rng = random.Random(0)
+    store = UserStore(open_store(os.path.join(data_dir, 'fittrack_users.json'), backend))
+    usernames = [f'student{i}' for i in range(students)]
+    for username in usernames:
+        data = seed_student(rng, username)
+        data['friends'] = rng.sample([u for u in usernames if u != username], min(5, students - 1))
+        store.create(username, data)
+    return usernames[0]
+
+
+def share_script_cache():
+    """
+    The Streamlit server compiles the script once and reuses its bytecode on
+    every rerun, but AppTest compiles it afresh on each run. Share one cache
+    so the timings are of running the script, as on the server.
+    """
+    from streamlit.runtime.scriptrunner import script_cache
+
+    shared = script_cache.ScriptCache()
+    script_cache.ScriptCache.get_bytecode = lambda self, path, get=shared.get_bytecode: get(path)
+
+
+def run(app, reruns, students, backend):
+    from streamlit.testing.v1 import AppTest
+
+    share_script_cache()
+    data_dir = tempfile.mkdtemp(prefix='fittrack-bench-')
+    os.chdir(data_dir)
+    os.environ['FITTRACK_STORAGE'] = backend
+    username = seed(data_dir, students, backend)
+
+    at = AppTest.from_file(app, default_timeout=120)
+    at.session_state['logged_in'] = True
+    at.session_state['username'] = username
+    at.run()
+
+    results = []
+    for page in PAGES:
+        at.sidebar.radio[0].set_value(page)
+        at.run()
+        if at.exception:
+            results.append((page, None, at.exception[0].message))
+            continue
+        times = []
+        for _ in range(reruns):
+            start = time.process_time()
+            at.run()
+            times.append((time.process_time() - start) * 1000)
+        results.append((page, times, None))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--app', default=os.path.join(ROOT, 'fittrack_app_UNIFIED.py'))
+    parser.add_argument('--reruns', type=int, default=10)
+    parser.add_argument('--students', type=int, default=30)
+    parser.add_argument('--backend', default='sqlite', choices=('sqlite', 'json'))
+    args = parser.parse_args()
+
+    app = os.path.abspath(args.app)
+    print(f"{app}: {args.reruns} reruns per page, {args.students} students, {args.backend} store")
+    print(f"  {'page':<22} {'median ms':>10} {'min ms':>8}")
+    for page, times, error in run(app, args.reruns, args.students, args.backend):
+        if error:
+            print(f"  {page:<22} failed: {error}")
+        else:
+            print(f"  {page:<22} {statistics.median(times):10.1f} {min(times):8.1f}")
+
+
+if __name__ == '__main__':
+    main()
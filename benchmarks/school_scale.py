@@ -0,0 +1,191 @@
+"""
+How FitTrack's core operations scale with the size of the school.
+
+For each school size a fixture is generated with benchmarks/fixtures.py
+(classes of 30 with a teacher each, a month of history per student) and
+written as fittrack_users.json in a scratch directory. The operations the
+pages depend on are then timed directly, without Streamlit:
+
+    load_users        a fresh UserStore reading every user (cold process)
+    get user          the private copy a session takes of its own user
+    save_users        UserStore.put of one student with a workout added
+    log_workout       the same through fittrack.services, badges and level included
+    badges            every rule for one student / only the rules a logged workout can earn
+    house totals      recounting every student / reading the kept counters
+    leaderboards      building every board in memory / reading the kept ones
+    class overview    the Class Overview and Performance numbers, counted from the
+                      records / read from the rollup the store keeps
+    class report      the Export Reports file for one class and the school, streamed
+                      from the class summaries the store keeps
+
+Each operation is repeated and its median (and p95) in ms is reported in a
+table with one column per size. Save the results with --json and pass them
+to a later run with --compare to see what changed between commits:
+
+    python benchmarks/school_scale.py [--sizes 500,5000] [--backend sqlite] [--json out.json] [--compare old.json]
+"""
+import argparse
+import copy
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from fittrack.badges import check_and_award_badges, evaluate  # noqa: E402
+from fittrack.classroom import (class_overview, component_averages, report_columns, weekly_participation,  # noqa: E402
+                                write_report)
+from fittrack.houses import SCHOOL, compute_totals, standings  # noqa: E402
+from fittrack.leaderboards import MemoryLeaderboards  # noqa: E402
+from fittrack.rollups import build_rollup  # noqa: E402
+from fittrack.services import apply, log_workout  # noqa: E402
+from fittrack.storage import UserStore, open_store  # noqa: E402
+from fixtures import make_school, write_fixture  # noqa: E402
+
+# Students (or classes) sampled for the per-user operations
+SAMPLE = 200
+
+
+def timings(function, calls):
+    """Durations in ms of calling function() `calls` times"""
+    result = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        function()
+        result.append((time.perf_counter() - start) * 1000)
+    return result
+
+
+def each(function, items):
+    """Durations in ms of function(item) for every item"""
+    result = []
+    for item in items:
+        start = time.perf_counter()
+        function(item)
+        result.append((time.perf_counter() - start) * 1000)
+    return result
+
+
+def run_size(students, backend, days, rounds):
+    """{operation: [ms, ...]} for one school size"""
+    data_dir = tempfile.mkdtemp(prefix=f'fittrack-school-{students}-')
+    path = os.path.join(data_dir, 'fittrack_users.json')
+    write_fixture(path, make_school(students, days))
+    results = {}
+
+    # The SQLite backend imports the JSON fixture the first time it is opened
+    results['open store (first time)'] = timings(lambda: UserStore(open_store(path, backend)).all_users(), 1)
+    results['load_users (cold)'] = timings(lambda: UserStore(open_store(path, backend)).all_users(), rounds)
+
+    store = UserStore(open_store(path, backend))
+    users = store.all_users()
+    results['load_users (warm)'] = timings(store.all_users, rounds * 10)
+
+    usernames = [u for u, d in users.items() if d.get('role') == 'student']
+    teachers = [u for u, d in users.items() if d.get('role') == 'teacher']
+    step = max(1, len(usernames) // SAMPLE)
+    sample = usernames[::step][:SAMPLE]
+
+    results['get user'] = each(store.get, sample)
+
+    def save(username):
+        data, version = store.get(username)
+        data['exercises'].insert(0, dict(data['exercises'][0]) if data['exercises'] else {
+            'name': 'Running', 'type': 'Running', 'date': '2024-01-01', 'duration': 30})
+        store.put(username, data, version)
+    results['save_users (one student)'] = each(save, sample)
+    results['log_workout (service)'] = each(lambda u: apply(store, u, log_workout, 'Running', 30), sample)
+
+    records = [copy.deepcopy(users[u]) for u in sample]
+    results['check_and_award_badges'] = each(check_and_award_badges, records)
+    results['badges (workout event)'] = each(lambda record: evaluate(record, ('workout_logged',)), records)
+
+    results['house totals (recount)'] = timings(lambda: standings(compute_totals(users).get(SCHOOL, {})), rounds)
+    results['house totals (counters)'] = timings(lambda: standings(store.house_totals()), rounds * 10)
+
+    def build_leaderboards():
+        boards = MemoryLeaderboards()
+        for username, data in users.items():
+            boards.update(username, data)
+    results['leaderboards (build all)'] = timings(build_leaderboards, rounds)
+    results['leaderboard top 20'] = timings(lambda: store.leaderboard('house_points', 20), rounds * 10)
+    results['leaderboard rank'] = each(lambda u: store.leaderboard_rank('house_points', u), sample)
+    results['weekly leaderboard'] = timings(lambda: store.weekly_leaderboard(20), rounds)
+
+    classes = {t: {u: users[u] for u in users[t]['students'] if u in users} for t in teachers[:SAMPLE]}
+
+    def overview(rollup):
+        class_overview(rollup)
+        component_averages(rollup)
+        weekly_participation(rollup)
+    results['class overview (recount)'] = each(lambda t: overview(build_rollup(classes[t])), classes)
+    results['class overview (rollup)'] = each(lambda t: overview(store.class_rollup(t)), list(classes) * rounds)
+
+    def report(teacher, report_format='csv'):
+        write_report(store.class_members(teacher), report_columns(), report_format, io.BytesIO())
+    results['class report CSV'] = each(report, classes)
+    results['school report CSV'] = timings(lambda: report(None), rounds)
+    results['school report Parquet'] = timings(lambda: report(None, 'parquet'), rounds)
+    return results
+
+
+def summarize(times):
+    ordered = sorted(times)
+    return {'calls': len(ordered), 'median_ms': round(statistics.median(ordered), 3),
+            'p95_ms': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3)}
+
+
+def print_table(report, baseline=None):
+    sizes = list(report['sizes'])
+    operations = list(next(iter(report['sizes'].values())))
+    header = f"  {'operation':<30}" + ''.join(f" {size + ' students':>22}" for size in sizes)
+    print(header)
+    print(f"  {'':<30}" + ''.join(f" {'median ms':>10} {'p95 ms':>11}" for _ in sizes))
+    for operation in operations:
+        line = f"  {operation:<30}"
+        for size in sizes:
+            stats = report['sizes'][size].get(operation)
+            old = (baseline or {}).get('sizes', {}).get(size, {}).get(operation)
+            if stats is None:
+                line += f" {'-':>22}"
+                continue
+            line += f" {stats['median_ms']:10.2f} {stats['p95_ms']:11.2f}"
+            if old and old['median_ms']:
+                line += f" ({(stats['median_ms'] / old['median_ms'] - 1) * 100:+.0f}%)"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default='500,5000', help="comma-separated numbers of students")
+    parser.add_argument('--backend', default='sqlite', choices=('sqlite', 'json'))
+    parser.add_argument('--days', type=int, default=30, help="days of history per student")
+    parser.add_argument('--rounds', type=int, default=5)
+    parser.add_argument('--json', help="write the results to this file")
+    parser.add_argument('--compare', help="results file from an earlier run to compare against")
+    args = parser.parse_args()
+
+    report = {'backend': args.backend, 'days': args.days, 'sizes': {}}
+    for students in (int(size) for size in args.sizes.split(',')):
+        print(f"Timing {students} students ({args.backend} store)...", file=sys.stderr)
+        results = run_size(students, args.backend, args.days, args.rounds)
+        report['sizes'][str(students)] = {operation: summarize(times) for operation, times in results.items()}
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+    print(f"FitTrack at school scale: {args.backend} store, {args.days} days of history per student")
+    print_table(report, baseline)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
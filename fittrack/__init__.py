@@ -0,0 +1 @@
+"""Headless support modules for the FitTrack Streamlit app."""
@@ -0,0 +1,276 @@
+"""
+Badges: which ones a student has earned and the points they are worth.
+
+Every badge is a rule in BADGES: a metric from METRICS reaching a threshold.
+Each metric lists the events that can change it, and pages and services
+report what just happened instead of asking for every badge to be checked:
+
+    workout_logged   a workout, run or timed session was added
+    napfa_recorded   a NAPFA test was saved
+    sleep_logged     a night's sleep was saved
+    goal_set         a goal was added
+    login            the login streak was updated
+    friend_added     a friend request was accepted
+    group_joined     the user created or joined a group
+
+evaluate() then runs only the rules listening to those events that the user
+has not earned yet, so a logged workout costs a handful of counter lookups.
+The one metric that needs a pass over a log, the number of different
+exercise types, keeps its running state in the record under 'badge_state'
+and only folds in the newest workout. A record whose 'badge_state' is
+missing or from an older RULES_VERSION gets a full check the first time it
+is evaluated.
+
+Award everything the existing records have already earned (for instance
+after adding a rule) with one vectorized pass over the school:
+
+    python -m fittrack.badges [--backend sqlite|json] [--dry-run] [DATA_FILE]
+"""
+import argparse
+from datetime import datetime
+
+from fittrack.catalogs import calculate_level
+from fittrack.instrument import timed_function
+from fittrack.streaks import streak_stats
+from fittrack.timeseries import log_columns
+
+# Bump when BADGES or METRICS change, so every record gets one full check
+RULES_VERSION = 1
+
+EVENTS = ('workout_logged', 'napfa_recorded', 'sleep_logged', 'goal_set', 'login', 'friend_added', 'group_joined')
+
+
+def _latest_napfa(data):
+    history = data.get('napfa_history')
+    return history[-1] if history else None
+
+
+def _napfa_gold(data, state):
+    latest = _latest_napfa(data)
+    return int(bool(latest) and '🥇 Gold' in latest['medal'])
+
+
+def _napfa_perfect(data, state):
+    latest = _latest_napfa(data)
+    return int(bool(latest) and all(grade == 5 for grade in latest['grades'].values()))
+
+
+def _workouts(data, state):
+    return len(data.get('exercises', []))
+
+
+def _workout_streak(data, state):
+    return streak_stats(data)['current_streak'] if data.get('exercises') else 0
+
+
+def _exercise_types(data, state):
+    """Different exercises logged; new workouts are inserted at the front, so only exercises[0] is folded in"""
+    exercises = data.get('exercises', [])
+    types = state.get('exercise_types')
+    counted = state.get('workouts_counted')
+    if types is None or counted is None or not counted <= len(exercises) <= counted + 1:
+        types = {e.get('name') or e.get('type') for e in exercises}
+    else:
+        types = set(types)
+        if len(exercises) > counted:
+            types.add(exercises[0].get('name') or exercises[0].get('type'))
+    state['exercise_types'] = sorted(types, key=str)
+    state['workouts_counted'] = len(exercises)
+    return len(types)
+
+
+def _workout_hours(data, state):
+    return data.get('total_workout_hours', 0)
+
+
+def _house_points(data, state):
+    if data.get('role') != 'student' or not data.get('house'):
+        return 0
+    return data.get('house_points_contributed', 0)
+
+
+def _good_sleep_nights(data, state):
+    """Nights of 8+ hours in the last 7 days"""
+    sleep_log = log_columns(data, 'sleep_history')
+    return sum(1 for s in sleep_log.records(sleep_log.recent(7)) if s['hours'] >= 8)
+
+
+def _goals_completed(data, state):
+    return sum(1 for g in data.get('goals', []) if g['progress'] >= 100)
+
+
+def _login_streak(data, state):
+    return data.get('login_streak', 0)
+
+
+def _friends(data, state):
+    return len(data.get('friends', []))
+
+
+def _groups(data, state):
+    return len(data.get('groups', []))
+
+
+# metric -> (events that can change it, function(record, badge state) -> value)
+METRICS = {
+    'napfa_gold': (('napfa_recorded',), _napfa_gold),
+    'napfa_perfect': (('napfa_recorded',), _napfa_perfect),
+    'workouts': (('workout_logged',), _workouts),
+    'workout_streak': (('workout_logged',), _workout_streak),
+    'exercise_types': (('workout_logged',), _exercise_types),
+    'workout_hours': (('workout_logged',), _workout_hours),
+    'house_points': (('workout_logged',), _house_points),
+    'good_sleep_nights': (('sleep_logged',), _good_sleep_nights),
+    'goals_completed': (('goal_set',), _goals_completed),
+    'login_streak': (('login',), _login_streak),
+    'friends': (('friend_added',), _friends),
+    'groups': (('group_joined',), _groups),
+}
+
+# (name, description, points, metric, threshold), in the order they are awarded
+BADGES = (
+    ('🥇 First Gold', 'Earned your first NAPFA Gold medal!', 100, 'napfa_gold', 1),
+    ('💯 Perfect Score', 'All Grade 5s on NAPFA test!', 200, 'napfa_perfect', 1),
+    ('💪 Century Club', 'Completed 100 total workouts!', 150, 'workouts', 100),
+    ('🏋️ Fifty Strong', 'Completed 50 workouts!', 75, 'workouts', 50),
+    ('🎯 Getting Started', 'Completed 10 workouts!', 25, 'workouts', 10),
+    ('🔥 Week Warrior', '7-day workout streak!', 50, 'workout_streak', 7),
+    ('🔥🔥 Month Master', '30-day workout streak!', 150, 'workout_streak', 30),
+    ('🌙 Sleep Champion', '7 days of 8+ hours sleep!', 50, 'good_sleep_nights', 7),
+    ('🎯 Goal Crusher', 'Completed 5 fitness goals!', 100, 'goals_completed', 5),
+    ('🎯 First Goal', 'Completed your first goal!', 30, 'goals_completed', 1),
+    ('📅 Daily Visitor', '7-day login streak!', 40, 'login_streak', 7),
+    ('🏠 House Hero', '100 points for your house!', 150, 'house_points', 100),
+    ('🏠 House Champion', '50 points for your house!', 75, 'house_points', 50),
+    ('🏠 House Starter', '10 points for your house!', 25, 'house_points', 10),
+    ('👥 Social Butterfly', '10 friends added!', 50, 'friends', 10),
+    ('👥 Friend Finder', '5 friends added!', 25, 'friends', 5),
+    ('👫 Group Leader', 'Member of 3 groups!', 40, 'groups', 3),
+    ('🎨 Variety Master', '10 different exercise types!', 60, 'exercise_types', 10),
+    ('⏰ Time Champion', '100 hours of exercise!', 200, 'workout_hours', 100),
+    ('⏰ Time Warrior', '50 hours of exercise!', 100, 'workout_hours', 50),
+    ('⏰ Time Starter', '10 hours of exercise!', 30, 'workout_hours', 10),
+)
+
+# event -> the rules (indexes into BADGES) it can complete
+RULES_BY_EVENT = {event: [i for i, rule in enumerate(BADGES) if event in METRICS[rule[3]][0]] for event in EVENTS}
+
+
+def badge(rule, when=None):
+    """The badge entry stored in a user's 'badges' for one rule"""
+    name, description, points, _, _ = rule
+    return {
+        'name': name,
+        'description': description,
+        'date': (when or datetime.now()).strftime('%Y-%m-%d'),
+        'points': points
+    }
+
+
+@timed_function('badges.check')
+def evaluate(user_data, events=None):
+    """
+    (new badges, their points) from the rules listening to events, or from
+    every rule when events is None or the record has not had a full check
+    under this RULES_VERSION. Updates user_data['badge_state'] but does not
+    award anything (see award()).
+    """
+    state = dict(user_data.get('badge_state') or {})
+    if events is None or state.get('version') != RULES_VERSION:
+        rules = range(len(BADGES))
+    else:
+        rules = sorted({i for event in events for i in RULES_BY_EVENT[event]})
+    state['version'] = RULES_VERSION
+
+    earned = {b['name'] for b in user_data.get('badges', [])}
+    values = {}
+    new_badges = []
+    for i in rules:
+        rule = BADGES[i]
+        name, _, _, metric, threshold = rule
+        if name in earned:
+            continue
+        if metric not in values:
+            values[metric] = METRICS[metric][1](user_data, state)
+        if values[metric] >= threshold:
+            new_badges.append(badge(rule))
+    if state != user_data.get('badge_state'):
+        user_data['badge_state'] = state
+    return new_badges, sum(b['points'] for b in new_badges)
+
+
+def check_and_award_badges(user_data):
+    """Check every rule (see evaluate())"""
+    return evaluate(user_data)
+
+
+def award(user_data, new_badges):
+    """Add badges to a user with their points"""
+    if new_badges:
+        user_data.setdefault('badges', []).extend(new_badges)
+        user_data['total_points'] = user_data.get('total_points', 0) + sum(b['points'] for b in new_badges)
+
+
+# Backfill (numpy and pandas are imported here only, to keep them off the pages' import path)
+def metric_frame(users):
+    """DataFrame of every metric (columns) for every user (rows)"""
+    import pandas as pd
+    rows = {}
+    for username, data in users.items():
+        state = {}
+        rows[username] = {metric: function(data, state) for metric, (_, function) in METRICS.items()}
+    return pd.DataFrame.from_dict(rows, orient='index', columns=list(METRICS), dtype=float)
+
+
+def earned_frame(users):
+    """Boolean DataFrame: which users (rows) have earned which badges (columns) but not been awarded them"""
+    import numpy as np
+    import pandas as pd
+    metrics = metric_frame(users)
+    names = [rule[0] for rule in BADGES]
+    reached = np.column_stack([metrics[metric].to_numpy() >= threshold for _, _, _, metric, threshold in BADGES]) \
+        if len(metrics) else np.zeros((0, len(BADGES)), dtype=bool)
+    awarded = np.array([[name in {b['name'] for b in users[username].get('badges', [])} for name in names]
+                        for username in metrics.index], dtype=bool).reshape(reached.shape)
+    return pd.DataFrame(reached & ~awarded, index=metrics.index, columns=names)
+
+
+def backfill(store, dry_run=False):
+    """Award every earned badge across the school; returns {username: [badge names]}"""
+    pending = earned_frame(store.all_users())
+    pending = pending[pending.any(axis=1)]
+    rules = {rule[0]: rule for rule in BADGES}
+    awarded = {username: [name for name in pending.columns if row[name]] for username, row in pending.iterrows()}
+    if dry_run:
+        return awarded
+
+    def grant(names):
+        def apply_to(data):
+            # Re-checked on the latest copy, in case the badge was awarded meanwhile
+            have = {b['name'] for b in data.get('badges', [])}
+            award(data, [badge(rules[name]) for name in names if name not in have])
+            data['level'] = calculate_level(data.get('total_points', 0))[0]
+        return apply_to
+
+    for username, names in awarded.items():
+        store.update(username, grant(names))
+    return awarded
+
+
+if __name__ == '__main__':
+    import pandas as pd
+
+    from fittrack.storage import UserStore, open_store
+
+    parser = argparse.ArgumentParser(description="Award every badge existing records have earned")
+    parser.add_argument('data_file', nargs='?', default='fittrack_users.json')
+    parser.add_argument('--backend', default='sqlite', choices=('sqlite', 'json'))
+    parser.add_argument('--dry-run', action='store_true', help="only list what would be awarded")
+    args = parser.parse_args()
+
+    awarded = backfill(UserStore(open_store(args.data_file, args.backend)), args.dry_run)
+    total = sum(len(names) for names in awarded.values())
+    print(f"{'Would award' if args.dry_run else 'Awarded'} {total} badges to {len(awarded)} users")
+    counts = pd.Series([name for names in awarded.values() for name in names], dtype=object).value_counts()
+    for name, n in counts.items():
+        print(f"  {name}: {n}")
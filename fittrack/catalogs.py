@@ -0,0 +1,257 @@
+"""
+Static catalogs for FitTrack.
+
+Streamlit runs the app script from the top on every interaction, so a literal
+written inside a page function is rebuilt on every rerun. The fixed content
+the pages show (recipes, video links, badges, weekly challenges, levels,
+mock nutrition facts) lives here instead and is built once per server
+process. Treat these as read-only: they are shared by every session.
+"""
+import bisect
+
+# Levels by total points: (name, points needed)
+LEVELS = (
+    ('Novice', 0),
+    ('Beginner', 50),
+    ('Intermediate', 150),
+    ('Advanced', 300),
+    ('Expert', 500),
+    ('Master', 800),
+    ('Legend', 1200),
+)
+_LEVEL_POINTS = [points for _, points in LEVELS]
+
+
+def calculate_level(total_points):
+    """(level, points where it starts, points where the next one starts) for a points total"""
+    i = max(bisect.bisect_right(_LEVEL_POINTS, total_points) - 1, 0)
+    name, min_points = LEVELS[i]
+    max_points = LEVELS[i + 1][1] if i + 1 < len(LEVELS) else min_points
+    return name, min_points, max_points
+
+
+# Shown under Available Badges in the Community page
+BADGE_CATALOG = [
+    "🥇 First Gold - Earn your first NAPFA Gold medal",
+    "💯 Perfect Score - All Grade 5s on NAPFA",
+    "💪 Century Club - Complete 100 workouts",
+    "🏋️ Fifty Strong - Complete 50 workouts", 
+    "🎯 Getting Started - Complete 10 workouts",
+    "🔥 Week Warrior - 7-day workout streak",
+    "🔥🔥 Month Master - 30-day workout streak",
+    "🌙 Sleep Champion - 7 days of 8+ hours sleep",
+    "🎯 Goal Crusher - Complete 5 goals",
+    "🎯 First Goal - Complete your first goal",
+    "📅 Daily Visitor - 7-day login streak"
+]
+
+# Progress is counted over the last 7 days; 'type' is workouts, minutes or sleep
+WEEKLY_CHALLENGES = [
+    {
+        'name': 'Workout Warrior',
+        'description': 'Complete 5 workouts this week',
+        'target': 5,
+        'type': 'workouts',
+        'points': 50
+    },
+    {
+        'name': 'Cardio King',
+        'description': 'Total 150 minutes of exercise this week',
+        'target': 150,
+        'type': 'minutes',
+        'points': 60
+    },
+    {
+        'name': 'Early Bird',
+        'description': 'Log 7 days of sleep tracking',
+        'target': 7,
+        'type': 'sleep',
+        'points': 40
+    }
+]
+
+# Curated recipes by dietary goal
+RECIPES = {
+    "Weight Loss": [
+        {"name": "Grilled Chicken Salad", "calories": 350, "protein": "35g", "carbs": "20g", "prep_time": "20 min",
+         "ingredients": ["Chicken breast", "Mixed greens", "Cherry tomatoes", "Cucumber", "Olive oil", "Lemon"],
+         "instructions": "1. Grill chicken breast until cooked\n2. Chop vegetables\n3. Mix greens with veggies\n4. Slice chicken on top\n5. Drizzle with olive oil and lemon"},
+
+        {"name": "Steamed Fish with Vegetables", "calories": 320, "protein": "40g", "carbs": "15g", "prep_time": "25 min",
+         "ingredients": ["White fish fillet", "Broccoli", "Carrots", "Ginger", "Soy sauce", "Garlic"],
+         "instructions": "1. Season fish with ginger and garlic\n2. Steam fish for 15 min\n3. Steam vegetables separately\n4. Serve with light soy sauce"},
+
+        {"name": "Egg White Omelette", "calories": 180, "protein": "20g", "carbs": "8g", "prep_time": "10 min",
+         "ingredients": ["Egg whites (4)", "Spinach", "Mushrooms", "Tomatoes", "Black pepper"],
+         "instructions": "1. Whisk egg whites\n2. Sauté vegetables\n3. Pour egg whites over veggies\n4. Cook until set"},
+
+        {"name": "Greek Yogurt Bowl", "calories": 250, "protein": "18g", "carbs": "30g", "prep_time": "5 min",
+         "ingredients": ["Greek yogurt", "Berries", "Chia seeds", "Honey (small amount)", "Almonds"],
+         "instructions": "1. Add yogurt to bowl\n2. Top with berries\n3. Sprinkle chia seeds and chopped almonds\n4. Drizzle tiny bit of honey"},
+
+        {"name": "Vegetable Soup", "calories": 150, "protein": "8g", "carbs": "25g", "prep_time": "30 min",
+         "ingredients": ["Mixed vegetables", "Vegetable broth", "Garlic", "Onion", "Herbs"],
+         "instructions": "1. Sauté garlic and onion\n2. Add chopped vegetables\n3. Pour in broth\n4. Simmer 20 minutes\n5. Season with herbs"}
+    ],
+
+    "Muscle Gain": [
+        {"name": "Chicken Rice Bowl", "calories": 650, "protein": "50g", "carbs": "70g", "prep_time": "30 min",
+         "ingredients": ["Chicken breast", "Brown rice", "Sweet potato", "Broccoli", "Olive oil"],
+         "instructions": "1. Cook brown rice\n2. Grill or bake chicken\n3. Roast sweet potato\n4. Steam broccoli\n5. Combine in bowl with olive oil"},
+
+        {"name": "Salmon with Quinoa", "calories": 700, "protein": "45g", "carbs": "60g", "prep_time": "25 min",
+         "ingredients": ["Salmon fillet", "Quinoa", "Avocado", "Spinach", "Lemon"],
+         "instructions": "1. Cook quinoa\n2. Bake salmon with lemon\n3. Sauté spinach\n4. Serve together with sliced avocado"},
+
+        {"name": "Protein Smoothie Bowl", "calories": 550, "protein": "40g", "carbs": "65g", "prep_time": "10 min",
+         "ingredients": ["Protein powder", "Banana", "Oats", "Peanut butter", "Milk", "Berries"],
+         "instructions": "1. Blend protein powder, banana, oats, milk\n2. Pour into bowl\n3. Top with berries and peanut butter"},
+
+        {"name": "Beef Stir Fry", "calories": 600, "protein": "48g", "carbs": "50g", "prep_time": "20 min",
+         "ingredients": ["Lean beef", "Mixed vegetables", "Brown rice", "Soy sauce", "Garlic", "Ginger"],
+         "instructions": "1. Cook brown rice\n2. Stir fry beef with garlic and ginger\n3. Add vegetables\n4. Season with soy sauce\n5. Serve over rice"},
+
+        {"name": "Tuna Pasta", "calories": 620, "protein": "42g", "carbs": "75g", "prep_time": "20 min",
+         "ingredients": ["Whole wheat pasta", "Canned tuna", "Cherry tomatoes", "Olive oil", "Garlic", "Basil"],
+         "instructions": "1. Cook pasta\n2. Sauté garlic and tomatoes\n3. Add drained tuna\n4. Mix with pasta\n5. Top with fresh basil"}
+    ],
+
+    "Maintenance": [
+        {"name": "Balanced Buddha Bowl", "calories": 500, "protein": "28g", "carbs": "55g", "prep_time": "25 min",
+         "ingredients": ["Chickpeas", "Quinoa", "Mixed greens", "Avocado", "Cherry tomatoes", "Tahini"],
+         "instructions": "1. Cook quinoa\n2. Roast chickpeas\n3. Arrange greens in bowl\n4. Add quinoa, chickpeas, tomatoes\n5. Top with avocado and tahini"},
+
+        {"name": "Chicken Wrap", "calories": 480, "protein": "35g", "carbs": "45g", "prep_time": "15 min",
+         "ingredients": ["Whole wheat wrap", "Grilled chicken", "Lettuce", "Tomato", "Hummus", "Cucumber"],
+         "instructions": "1. Spread hummus on wrap\n2. Add lettuce and vegetables\n3. Place sliced chicken\n4. Roll tightly and cut"},
+
+        {"name": "Egg Fried Rice", "calories": 520, "protein": "22g", "carbs": "62g", "prep_time": "20 min",
+         "ingredients": ["Brown rice", "Eggs", "Mixed vegetables", "Soy sauce", "Spring onions"],
+         "instructions": "1. Cook rice (preferably day-old)\n2. Scramble eggs separately\n3. Stir fry vegetables\n4. Add rice and eggs\n5. Season with soy sauce"},
+
+        {"name": "Grilled Fish Tacos", "calories": 450, "protein": "32g", "carbs": "48g", "prep_time": "20 min",
+         "ingredients": ["White fish", "Corn tortillas", "Cabbage", "Lime", "Greek yogurt", "Cilantro"],
+         "instructions": "1. Season and grill fish\n2. Warm tortillas\n3. Shred cabbage\n4. Assemble tacos with fish and slaw\n5. Top with yogurt and cilantro"},
+
+        {"name": "Oatmeal with Fruits", "calories": 380, "protein": "15g", "carbs": "58g", "prep_time": "10 min",
+         "ingredients": ["Oats", "Milk", "Banana", "Berries", "Honey", "Nuts"],
+         "instructions": "1. Cook oats with milk\n2. Slice banana\n3. Top with fruits and nuts\n4. Drizzle with honey"}
+    ]
+}
+
+# YouTube searches for each NAPFA station and general training
+NAPFA_VIDEOS = {
+    "Sit-Ups": "https://www.youtube.com/results?search_query=proper+sit+ups+form",
+    "Standing Broad Jump": "https://www.youtube.com/results?search_query=standing+broad+jump+technique",
+    "Sit and Reach": "https://www.youtube.com/results?search_query=sit+and+reach+flexibility",
+    "Pull-Ups": "https://www.youtube.com/results?search_query=pull+ups+tutorial",
+    "Shuttle Run": "https://www.youtube.com/results?search_query=shuttle+run+technique",
+    "2.4km Run": "https://www.youtube.com/results?search_query=running+form+tips"
+}
+
+WORKOUT_VIDEOS = {
+    "Strength Training": "https://www.youtube.com/results?search_query=strength+training+beginners",
+    "Cardio Workouts": "https://www.youtube.com/results?search_query=cardio+workout+home",
+    "Flexibility & Stretching": "https://www.youtube.com/results?search_query=flexibility+stretching+routine",
+    "HIIT Training": "https://www.youtube.com/results?search_query=HIIT+workout",
+    "Warm Up Exercises": "https://www.youtube.com/results?search_query=dynamic+warm+up",
+    "Cool Down Stretches": "https://www.youtube.com/results?search_query=cool+down+stretches"
+}
+
+# Suggested tutorials until the YouTube Data API is connected
+TUTORIAL_VIDEOS = {
+    "Sit-Ups": [
+        {"title": "Perfect Sit-Up Form for NAPFA", "channel": "FitnessBlender", "duration": "5:23"},
+        {"title": "How to Do More Sit-Ups", "channel": "PE Coach", "duration": "8:15"},
+        {"title": "NAPFA Sit-Up Training", "channel": "SG Fitness", "duration": "6:40"}
+    ],
+    "Pull-Ups": [
+        {"title": "Pull-Up Progression Guide", "channel": "Calisthenicmovement", "duration": "12:30"},
+        {"title": "Get Your First Pull-Up", "channel": "Athlean-X", "duration": "10:15"},
+        {"title": "NAPFA Pull-Up Technique", "channel": "PE Singapore", "duration": "7:20"}
+    ],
+    "Standing Broad Jump": [
+        {"title": "Standing Broad Jump Technique", "channel": "Track Coach", "duration": "6:45"},
+        {"title": "How to Jump Further", "channel": "Sprint Master", "duration": "9:10"}
+    ],
+    "2.4km Running Tips": [
+        {"title": "2.4km NAPFA Strategy", "channel": "Running Coach SG", "duration": "11:20"},
+        {"title": "How to Run Faster 2.4km", "channel": "TrackStar", "duration": "8:50"}
+    ]
+}
+
+# Nutrition facts per serving, used when the USDA API is not configured
+MOCK_NUTRITION = {
+    "chicken rice": {
+        "calories": 607,
+        "protein": 25,
+        "carbs": 86,
+        "fat": 15,
+        "fiber": 2,
+        "sugar": 3,
+        "serving": "1 plate (350g)"
+    },
+    "banana": {
+        "calories": 105,
+        "protein": 1.3,
+        "carbs": 27,
+        "fat": 0.4,
+        "fiber": 3.1,
+        "sugar": 14,
+        "serving": "1 medium (118g)"
+    },
+    "apple": {
+        "calories": 95,
+        "protein": 0.5,
+        "carbs": 25,
+        "fat": 0.3,
+        "fiber": 4.4,
+        "sugar": 19,
+        "serving": "1 medium (182g)"
+    },
+    "white rice": {
+        "calories": 204,
+        "protein": 4.2,
+        "carbs": 45,
+        "fat": 0.4,
+        "fiber": 0.6,
+        "sugar": 0.1,
+        "serving": "1 cup cooked (158g)"
+    },
+    "grilled chicken breast": {
+        "calories": 165,
+        "protein": 31,
+        "carbs": 0,
+        "fat": 3.6,
+        "fiber": 0,
+        "sugar": 0,
+        "serving": "100g"
+    },
+    "salmon": {
+        "calories": 206,
+        "protein": 22,
+        "carbs": 0,
+        "fat": 13,
+        "fiber": 0,
+        "sugar": 0,
+        "serving": "100g"
+    },
+    "broccoli": {
+        "calories": 55,
+        "protein": 3.7,
+        "carbs": 11,
+        "fat": 0.6,
+        "fiber": 5.1,
+        "sugar": 2.2,
+        "serving": "1 cup chopped (156g)"
+    },
+    "egg": {
+        "calories": 72,
+        "protein": 6,
+        "carbs": 0.4,
+        "fat": 5,
+        "fiber": 0,
+        "sugar": 0.2,
+        "serving": "1 large (50g)"
+    }
+}
@@ -0,0 +1,262 @@
+"""
+Class summaries for the teacher dashboard.
+
+Everything here returns plain data, so the Class Overview, Performance
+Analysis and Export Reports tabs only lay it out, and the same numbers can be
+computed (and timed) without Streamlit. The overview, component and
+participation numbers are read from a class rollup (see fittrack.rollups):
+the one the store keeps for the teacher, or build_rollup() of any
+{username: student record}.
+
+Class reports are written from the students' class summaries as well, one
+student at a time, so exporting a class or the whole school holds a batch of
+rows at most. write_report() writes CSV, Parquet or (with openpyxl) Excel,
+and the dashboard runs it as a background job (report_job()); from the
+command line:
+
+    python -m fittrack.classroom [DATA_FILE] [--teacher USERNAME] [--format csv|parquet|xlsx] [--output FILE]
+"""
+import csv
+import io
+import itertools
+
+from fittrack.napfa import MEDALS, NO_MEDAL, STATIONS
+from fittrack.timeseries import as_day, window_start
+
+# Latest NAPFA total below which a student is flagged for attention
+LOW_NAPFA_TOTAL = 9
+# Average class grade below which a component is a weak area
+WEAK_GRADE = 3
+
+# Short names used on the Performance Analysis chart and in reports
+COMPONENT_LABELS = {
+    'SU': 'Sit-Ups',
+    'SBJ': 'Broad Jump',
+    'SAR': 'Sit & Reach',
+    'PU': 'Pull-Ups',
+    'SR': 'Shuttle Run',
+    'RUN': '2.4km Run',
+}
+
+
+# Report columns in each section the teacher can pick
+REPORT_SECTIONS = {
+    'student': ('Name', 'Email', 'Age', 'Gender'),
+    'napfa': ('NAPFA Total', 'Medal') + tuple(COMPONENT_LABELS.values()),
+    'workouts': ('Total Workouts', 'Workouts This Week'),
+    'attendance': ('Login Streak', 'Level', 'Total Points'),
+}
+# Parquet column types by pyarrow type name (the rest are strings)
+REPORT_TYPES = dict.fromkeys(['Age', 'NAPFA Total', 'Total Workouts', 'Workouts This Week', 'Login Streak'] +
+                             list(COMPONENT_LABELS.values()), 'int64')
+REPORT_TYPES['Total Points'] = 'float64'
+# Students per Parquet row group
+REPORT_BATCH = 1000
+
+
+def _medal_name(medal):
+    return next((name for name, _, _ in MEDALS if name.split()[0] in medal), NO_MEDAL)
+
+
+def class_overview(rollup, usernames=None, today=None, top=5):
+    """
+    Headline numbers for the Class Overview tab from a class rollup.
+    usernames (the teacher's 'students') orders the top performers and
+    the students needing attention.
+    """
+    since = str(window_start(7, today))
+    medal_counts = {name: 0 for name, _, _ in MEDALS}
+    medal_counts[NO_MEDAL] = 0
+    for medal, n in rollup['medals'].items():
+        medal_counts[_medal_name(medal)] += n
+
+    members = rollup['members']
+    order = [u for u in usernames if u in members] if usernames is not None else list(members)
+    top_performers = []
+    needs_attention = []
+    for username in order:
+        member = members[username]
+        latest = member['napfa']
+        if latest:
+            top_performers.append({'name': member['name'], 'username': username,
+                                   'score': latest['total'], 'medal': latest['medal']})
+        if not member['workouts']:
+            needs_attention.append((member['name'], 'no_workouts', None))
+        elif latest and latest['total'] < LOW_NAPFA_TOTAL:
+            needs_attention.append((member['name'], 'low_napfa', latest['total']))
+
+    top_performers.sort(key=lambda x: x['score'], reverse=True)
+    return {
+        'students': rollup['students'],
+        'napfa_totals': {int(total): n for total, n in rollup['napfa_totals'].items()},
+        'avg_napfa': rollup['napfa_sum'] / rollup['napfa_count'] if rollup['napfa_count'] else None,
+        'active_this_week': sum(n for day, n in rollup['last_active'].items() if day >= since),
+        'workouts_this_week': sum(n for day, n in rollup['workout_days'].items() if day >= since),
+        'medal_counts': medal_counts,
+        'top_performers': top_performers[:top],
+        'needs_attention': needs_attention,
+    }
+
+
+def component_averages(rollup):
+    """{component label: average latest grade} (0 when nobody has one), or None without NAPFA data"""
+    if not rollup['grades']:
+        return None
+    averages = {}
+    for code in STATIONS:
+        counts = rollup['grades'].get(code, {})
+        students = sum(counts.values())
+        averages[COMPONENT_LABELS[code]] = \
+            sum(int(grade) * n for grade, n in counts.items()) / students if students else 0
+    return averages
+
+
+def weekly_participation(rollup, weeks=4, today=None):
+    """
+    [{'Week', 'Active Students'}] for the last `weeks` 7-day weeks, most
+    recent first (at most ROLLUP_DAYS // 7 weeks are kept in a rollup)
+    """
+    rows = []
+    for week in range(weeks):
+        week_last = as_day(today) - 7 * week
+        first, last = str(week_last - 6), str(week_last)
+        active = sum(1 for member in rollup['members'].values()
+                     if any(first <= day <= last for day in member['days']))
+        rows.append({'Week': f"Week {weeks - week}", 'Active Students': active})
+    return rows
+
+
+# Class reports
+def report_columns(include_napfa=True, include_workouts=True, include_attendance=True):
+    """Report columns: the student's details, then each section asked for"""
+    sections = [('student', True), ('napfa', include_napfa), ('workouts', include_workouts),
+                ('attendance', include_attendance)]
+    return [column for section, included in sections if included for column in REPORT_SECTIONS[section]]
+
+
+def report_row(summary, columns, today=None):
+    """One student's values for the report columns from their class summary (None where there is no data)"""
+    since = str(window_start(7, today))
+    values = {
+        'Name': summary['name'],
+        'Email': summary['email'],
+        'Age': summary['age'],
+        'Gender': 'Male' if summary['gender'] == 'm' else 'Female',
+        'Total Workouts': summary['workouts'],
+        'Workouts This Week': sum(n for day, n in summary['days'].items() if day >= since),
+        'Login Streak': summary['login_streak'],
+        'Level': summary['level'],
+        'Total Points': summary['total_points'],
+    }
+    latest = summary['napfa']
+    if latest:
+        values['NAPFA Total'] = latest['total']
+        values['Medal'] = latest['medal']
+        for code, label in COMPONENT_LABELS.items():
+            values[label] = latest['grades'].get(code, 0)
+    return [values.get(column) for column in columns]
+
+
+def report_rows(members, columns, today=None):
+    """Report rows for (teacher, username, summary) triples, one at a time"""
+    for _, _, summary in members:
+        yield report_row(summary, columns, today)
+
+
+def report_csv(rows, columns):
+    """The report as CSV text in chunks: the header, then one line per student"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    for row in itertools.chain([columns], rows):
+        writer.writerow(row)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def write_csv(rows, columns, file):
+    for chunk in report_csv(rows, columns):
+        file.write(chunk.encode('utf-8'))
+
+
+def write_parquet(rows, columns, file, batch=REPORT_BATCH):
+    """Write the report to a Parquet file one row group of `batch` students at a time"""
+    import pyarrow as pa  # ships with Streamlit
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([(column, pa.type_for_alias(REPORT_TYPES.get(column, 'string'))) for column in columns])
+    with pq.ParquetWriter(file, schema) as writer:
+        for chunk in iter(lambda: list(itertools.islice(rows, batch)), []):
+            writer.write_table(pa.Table.from_pylist([dict(zip(columns, row)) for row in chunk], schema))
+
+
+def write_xlsx(rows, columns, file):
+    """Write the report to an Excel workbook row by row (needs openpyxl)"""
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('Class Report')
+    sheet.append(columns)
+    for row in rows:
+        sheet.append(row)
+    workbook.save(file)
+
+
+# format -> (writer(rows, columns, binary file), file extension, MIME type)
+REPORT_FORMATS = {
+    'csv': (write_csv, 'csv', 'text/csv'),
+    'parquet': (write_parquet, 'parquet', 'application/vnd.apache.parquet'),
+    'xlsx': (write_xlsx, 'xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+}
+
+
+def write_report(members, columns, report_format, file, today=None):
+    """Write the report for (teacher, username, summary) triples to a binary file"""
+    writer = REPORT_FORMATS[report_format][0]
+    writer(report_rows(iter(members), columns, today), columns, file)
+
+
+def report_job(job):
+    """
+    Background job (see fittrack.jobs): write the report of one teacher's
+    class (job.args['teacher'], or the whole school when None) to the job's
+    output file. Returns the number of students and the first rows, for a
+    preview.
+    """
+    teacher, columns, report_format = job.args['teacher'], job.args['columns'], job.args['format']
+    preview_rows = job.args.get('preview', 0)
+    total = job.store.class_member_count(teacher)
+    preview = []
+
+    def counted(members):
+        """Pass the summaries through, keeping the first few and reporting progress"""
+        for done, member in enumerate(members, 1):
+            if len(preview) < preview_rows:
+                preview.append(member)
+            if done % 50 == 0 or done == total:
+                job.progress(done / total if total else 1.0, f"Writing report... {done}/{total} students")
+            yield member
+
+    with open(job.output_path(REPORT_FORMATS[report_format][1]), 'wb') as file:
+        write_report(counted(job.store.class_members(teacher)), columns, report_format, file)
+    return {'students': total, 'preview': [report_row(summary, columns) for _, _, summary in preview]}
+
+
+if __name__ == '__main__':
+    import argparse
+
+    from fittrack.storage import UserStore, open_store
+
+    parser = argparse.ArgumentParser(description="Export the class report for one teacher or the whole school")
+    parser.add_argument('data_file', nargs='?', default='fittrack_users.json')
+    parser.add_argument('--backend', default='sqlite', choices=('sqlite', 'json'))
+    parser.add_argument('--teacher', help="username of the teacher (default: every class)")
+    parser.add_argument('--format', default='csv', choices=list(REPORT_FORMATS))
+    parser.add_argument('--output', help="file to write (default: class_report.<format>)")
+    args = parser.parse_args()
+
+    store = UserStore(open_store(args.data_file, args.backend))
+    output = args.output or f"class_report.{REPORT_FORMATS[args.format][1]}"
+    with open(output, 'wb') as f:
+        write_report(store.class_members(args.teacher), report_columns(), args.format, f)
+    print(f"{output}: {store.class_member_count(args.teacher)} students")
@@ -0,0 +1,133 @@
+"""
+Workout groups for FitTrack.
+
+A group record ({'id', 'name', 'description', 'type', 'admin', 'members',
+'max_members', 'created'}) is stored by the storage backends next to the
+users, with two indexes kept on every write: group id -> members (the
+record's 'members') and member -> group ids. Members also keep the ids of
+their groups in their own record under 'groups', which badges count.
+
+Like house totals (see fittrack.houses), each group's total workouts and
+house points are running counters: saving a user adjusts the totals of
+every group they belong to by the difference between their old and new
+stats, and joining or leaving adds or takes away the member's stats. The
+My Groups and group leaderboard views read those counters and the stats
+kept per member instead of visiting every member's workouts. Rebuild them
+from the records with
+
+    python -m fittrack.groups [data file] [sqlite|json]
+"""
+import sys
+
+GROUP_TYPES = ["Study Group", "CCA Team", "Running Club", "Gym Buddies", "General Fitness"]
+
+
+def member_stats(data):
+    """(house points, workouts, latest NAPFA total or None) for one user (None when deleted)"""
+    if not data:
+        return None
+    napfa = data.get('napfa_history')
+    return (data.get('house_points_contributed', 0), len(data.get('exercises', [])),
+            napfa[-1]['total'] if napfa else None)
+
+
+def new_group(group_id, name, admin, description='', group_type='General Fitness', max_members=10, created=None):
+    return {
+        'id': group_id,
+        'name': name,
+        'description': description,
+        'type': group_type,
+        'admin': admin,
+        'members': [admin],
+        'max_members': max_members,
+        'created': created,
+    }
+
+
+def empty_totals():
+    return {'members': 0, 'workouts': 0, 'house_points': 0}
+
+
+def add_stats(totals, stats, sign=1):
+    """Add (sign=1) or take away (sign=-1) one member's stats in a group's totals"""
+    totals['members'] += sign
+    if stats:
+        totals['house_points'] += sign * stats[0]
+        totals['workouts'] += sign * stats[1]
+
+
+class MemoryGroups:
+    """Groups, their indexes and totals for a store that holds all users in memory"""
+
+    def __init__(self):
+        self.groups = {}
+        # member -> set of group ids, and group id -> totals
+        self._member_groups = {}
+        self._totals = {}
+        # member -> stats last added to their groups' totals
+        self._stats = {}
+
+    def load(self, groups, users):
+        self.__init__()
+        for group_id, group in groups.items():
+            self.put(group_id, group, users)
+
+    def put(self, group_id, group, users):
+        """File a group's new record (None when deleted), moving members in and out of its totals"""
+        old = self.groups.pop(group_id, None)
+        old_members = set(old['members']) if old else set()
+        new_members = set(group['members']) if group else set()
+        totals = self._totals.setdefault(group_id, empty_totals())
+        for username in old_members - new_members:
+            add_stats(totals, self._stats.get(username), -1)
+            groups = self._member_groups.get(username, set())
+            groups.discard(group_id)
+            if not groups:
+                self._member_groups.pop(username, None)
+                self._stats.pop(username, None)
+        for username in new_members - old_members:
+            if username not in self._stats:
+                self._stats[username] = member_stats(users.get(username))
+            add_stats(totals, self._stats[username])
+            self._member_groups.setdefault(username, set()).add(group_id)
+        if group:
+            self.groups[group_id] = group
+        else:
+            del self._totals[group_id]
+
+    def update_member(self, username, data):
+        """Bring a member's groups in line with their current record"""
+        group_ids = self._member_groups.get(username)
+        if not group_ids:
+            return
+        old = self._stats.get(username)
+        new = member_stats(data)
+        if old == new:
+            return
+        for group_id in group_ids:
+            add_stats(self._totals[group_id], old, -1)
+            add_stats(self._totals[group_id], new)
+        self._stats[username] = new
+
+    def group_ids(self, username):
+        return sorted(self._member_groups.get(username, ()))
+
+    def totals(self, group_id):
+        return dict(self._totals.get(group_id) or empty_totals())
+
+    def member_stats(self, group_id):
+        group = self.groups.get(group_id)
+        return {username: self._stats.get(username) for username in group['members']} if group else {}
+
+
+if __name__ == '__main__':
+    from fittrack.storage import open_store
+
+    data_file = sys.argv[1] if len(sys.argv) > 1 else 'fittrack_users.json'
+    backend = open_store(data_file, sys.argv[2] if len(sys.argv) > 2 else 'sqlite')
+    backend.rebuild_group_totals()
+    print(f"Rebuilt group totals for {data_file}")
+    for group_id in backend.group_ids():
+        group, totals = backend.load_group(group_id), backend.group_totals(group_id)
+        print(f"  {group['name']}: {totals['members']} members, {totals['workouts']} workouts, "
+              f"{totals['house_points']:.1f} house points")
@@ -0,0 +1,81 @@
+"""
+House standings for FitTrack.
+
+Every student in a house contributes their house points, one member and their
+logged workouts to that house's totals, both school-wide and within their
+teacher's class. The storage backends keep those totals as running counters:
+each save adjusts them by the difference between the student's old and new
+contribution, in the same write, so the Houses tab never has to visit every
+account. If the counters are ever in doubt, rebuild them from the user
+records with
+
+    python -m fittrack.houses [data file] [sqlite|json]
+"""
+import sys
+
+HOUSES = {
+    'yellow': {'display': '🟡 Yellow House', 'color': '#FFD700'},
+    'red': {'display': '🔴 Red House', 'color': '#DC143C'},
+    'blue': {'display': '🔵 Blue House', 'color': '#1E90FF'},
+    'green': {'display': '🟢 Green House', 'color': '#32CD32'},
+    'black': {'display': '⚫ Black House', 'color': '#2F4F4F'},
+}
+
+# Scope of the school-wide totals; class totals are scoped by teacher username
+SCHOOL = ''
+
+
+def contribution(data):
+    """(house, teacher username or None, points, workouts) for a student in a house, else None"""
+    if not data or data.get('role') != 'student' or data.get('house') not in HOUSES:
+        return None
+    return (data['house'], data.get('teacher_class'),
+            data.get('house_points_contributed', 0), len(data.get('exercises', [])))
+
+
+def add_contribution(totals, contrib, sign=1):
+    """Add (sign=1) or take away (sign=-1) one student's contribution in {scope: {house: counters}}"""
+    house, teacher, points, workouts = contrib
+    for scope in ((SCHOOL, teacher) if teacher else (SCHOOL,)):
+        counters = totals.setdefault(scope, {}).setdefault(
+            house, {'points': 0, 'members': 0, 'workouts': 0})
+        counters['points'] += sign * points
+        counters['members'] += sign
+        counters['workouts'] += sign * workouts
+
+
+def compute_totals(users):
+    """Totals for every scope, counted from scratch"""
+    totals = {}
+    for data in users.values():
+        contrib = contribution(data)
+        if contrib:
+            add_contribution(totals, contrib)
+    return totals
+
+
+def standings(totals):
+    """Per-house stats for one scope, every house present, with display name and colour"""
+    stats = {}
+    for house, info in HOUSES.items():
+        counters = totals.get(house, {})
+        stats[house] = {
+            'points': counters.get('points', 0),
+            'members': counters.get('members', 0),
+            'workouts': counters.get('workouts', 0),
+            'display': info['display'],
+            'color': info['color'],
+        }
+    return stats
+
+
+if __name__ == '__main__':
+    from fittrack.storage import open_store
+
+    data_file = sys.argv[1] if len(sys.argv) > 1 else 'fittrack_users.json'
+    backend = open_store(data_file, sys.argv[2] if len(sys.argv) > 2 else 'sqlite')
+    backend.rebuild_house_totals()
+    print(f"Rebuilt house totals for {data_file}")
+    for house, stats in standings(backend.house_totals()).items():
+        print(f"  {stats['display']}: {stats['points']:.1f} points, "
+              f"{stats['members']} members, {stats['workouts']} workouts")
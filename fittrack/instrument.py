@@ -0,0 +1,204 @@
+"""
+Opt-in timing and counters for FitTrack's hot paths.
+
+Off unless FITTRACK_PROFILE is set (or enable() is called, as the admin
+diagnostics page does). While off, timed() and count() return at once.
+
+    with timed('page:progress'):
+        ...
+
+    @timed_function('badges.check')
+    def check_and_award_badges(user_data): ...
+
+    count('timeseries.cache_miss')
+
+Each operation keeps its last SAMPLES durations in process memory; summary()
+reports calls, p50/p95/p99, max and total per operation, plus the counters.
+dump() writes the same as JSON, and FITTRACK_PROFILE_DUMP names a file to
+dump to when the process exits. Compare two dumps (say before and after a
+change) with
+
+    python -m fittrack.instrument before.json [after.json]
+"""
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+# Durations kept per operation for the percentiles
+SAMPLES = 2048
+PERCENTILES = (50, 95, 99)
+
+_enabled = os.environ.get('FITTRACK_PROFILE', '') not in ('', '0')
+_samples = {}
+_calls = {}
+_counters = {}
+_lock = threading.Lock()
+_started = datetime.now()
+
+
+def enabled():
+    return _enabled
+
+
+def enable(on=True):
+    """Start (or stop) recording in this process"""
+    global _enabled
+    _enabled = on
+
+
+def reset():
+    """Forget everything recorded so far"""
+    global _started
+    with _lock:
+        _samples.clear()
+        _calls.clear()
+        _counters.clear()
+        _started = datetime.now()
+
+
+def record(name, seconds):
+    with _lock:
+        samples = _samples.get(name)
+        if samples is None:
+            samples = _samples[name] = deque(maxlen=SAMPLES)
+        samples.append(seconds)
+        _calls[name] = _calls.get(name, 0) + 1
+
+
+def count(name, n=1):
+    """Add n to a counter"""
+    if _enabled:
+        with _lock:
+            _counters[name] = _counters.get(name, 0) + n
+
+
+class _Timer:
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        record(self.name, time.perf_counter() - self.start)
+
+
+class _NoTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+_NO_TIMER = _NoTimer()
+
+
+def timed(name):
+    """Context manager recording how long its block takes under name"""
+    return _Timer(name) if _enabled else _NO_TIMER
+
+
+def timed_function(name):
+    """Decorator recording every call of a function under name"""
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return function(*args, **kwargs)
+            with _Timer(name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def _percentile(ordered, p):
+    """Nearest-rank percentile of a sorted list"""
+    index = max(0, -(-len(ordered) * p // 100) - 1)
+    return ordered[min(index, len(ordered) - 1)]
+
+
+def summary():
+    """{'started', 'timings': {name: stats in ms}, 'counters': {name: n}}"""
+    with _lock:
+        samples = {name: sorted(values) for name, values in _samples.items()}
+        calls = dict(_calls)
+        counters = dict(_counters)
+    timings = {}
+    for name in sorted(samples):
+        ordered = samples[name]
+        stats = {'calls': calls[name]}
+        for p in PERCENTILES:
+            stats[f'p{p}_ms'] = round(_percentile(ordered, p) * 1000, 3)
+        stats['max_ms'] = round(ordered[-1] * 1000, 3)
+        stats['total_ms'] = round(sum(ordered) * 1000, 3)
+        timings[name] = stats
+    return {'started': _started.isoformat(timespec='seconds'), 'timings': timings,
+            'counters': dict(sorted(counters.items()))}
+
+
+def dump(path):
+    """Write summary() as JSON"""
+    report = summary()
+    report['dumped'] = datetime.now().isoformat(timespec='seconds')
+    report['pid'] = os.getpid()
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    return report
+
+
+def _dump_at_exit():
+    if _enabled or _samples:
+        dump(os.environ['FITTRACK_PROFILE_DUMP'])
+
+
+if os.environ.get('FITTRACK_PROFILE_DUMP'):
+    atexit.register(_dump_at_exit)
+
+
+def _print_comparison(before, after=None):
+    names = sorted(set(before['timings']) | set((after or before)['timings']))
+    print(f"  {'operation':<32} {'calls':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"
+          + (f" {'p50 after':>10} {'change':>8}" if after else ""))
+    for name in names:
+        old = before['timings'].get(name)
+        new = after['timings'].get(name) if after else None
+        if old is None:
+            print(f"  {name:<32} {'-':>7} {'-':>9} {'-':>9} {'-':>9} {new['p50_ms']:10.2f} {'new':>8}")
+            continue
+        line = f"  {name:<32} {old['calls']:>7} {old['p50_ms']:9.2f} {old['p95_ms']:9.2f} {old['p99_ms']:9.2f}"
+        if after:
+            if new is None:
+                line += f" {'-':>10} {'gone':>8}"
+            else:
+                change = (new['p50_ms'] / old['p50_ms'] - 1) * 100 if old['p50_ms'] else 0.0
+                line += f" {new['p50_ms']:10.2f} {change:+7.0f}%"
+        print(line)
+    counters = sorted(set(before['counters']) | set((after or before)['counters']))
+    if counters:
+        print(f"  {'counter':<32} {'count':>7}" + (f" {'after':>9}" if after else ""))
+        for name in counters:
+            line = f"  {name:<32} {before['counters'].get(name, 0):>7}"
+            if after:
+                line += f" {after['counters'].get(name, 0):>9}"
+            print(line)
+
+
+if __name__ == '__main__':
+    if not 2 <= len(sys.argv) <= 3:
+        print("usage: python -m fittrack.instrument before.json [after.json]")
+        sys.exit(2)
+    reports = []
+    for path in sys.argv[1:]:
+        with open(path, encoding='utf-8') as f:
+            reports.append(json.load(f))
+    _print_comparison(*reports)
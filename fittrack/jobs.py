@@ -0,0 +1,328 @@
+"""
+Background jobs for FitTrack's slow operations.
+
+AI workout verification waits on a remote API for seconds, a school report
+writes thousands of rows and a NAPFA test day saves a whole class. Pages
+hand these to a JobQueue and return at once; the work runs on a small pool
+of threads, and the page polls the job for its progress and result:
+
+    job_id = jobs.submit('verify_workout', {'exercise_type': 'Push-Up'}, owner=username, payload=photo)
+    jobs.get(job_id)   # {'status': 'running', 'progress': 0.0, ...}
+
+Jobs are rows in a SQLite table next to the data file (<data file>_jobs.db,
+see open_jobs()), so several server processes share them and a job outlives
+the page, or the session, that asked for it. The kinds of job are listed in
+JOB_TYPES by module and function name and imported on first use, like the
+app's pages. A job function gets a Job and returns its result as plain JSON;
+it may report progress and write a file for the page to offer for download.
+
+Submitting the same work again for the same user while it is still queued or
+running (a double click, or a rerun) returns the job already under way rather
+than starting another. Each process runs the jobs it was given; jobs left
+queued, or running in a process that has since died, are picked up by the
+next queue opened on the same file. Finished jobs are dropped after
+JOB_KEEP_DAYS. List recent jobs, or run whatever is still queued, with
+
+    python -m fittrack.jobs [DATA_FILE] [--run]
+"""
+import argparse
+import contextlib
+import hashlib
+import importlib
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from fittrack.instrument import count, timed
+
+# Kind -> (module, function) that runs it
+JOB_TYPES = {
+    'verify_workout': ('fittrack.verification', 'verify_job'),
+    'class_report': ('fittrack.classroom', 'report_job'),
+    'napfa_import': ('fittrack.napfa', 'import_job'),
+}
+
+# Threads running jobs in each process (mostly waiting on the network or disk)
+JOB_WORKERS = int(os.environ.get('FITTRACK_JOB_WORKERS', '4'))
+
+# Finished jobs, and the files they wrote, are kept this long
+JOB_KEEP_DAYS = 7
+
+QUEUED, RUNNING, DONE, FAILED = 'queued', 'running', 'done', 'failed'
+ACTIVE = (QUEUED, RUNNING)
+
+_COLUMNS = ('id', 'kind', 'owner', 'status', 'args', 'progress', 'message', 'result', 'error', 'output',
+            'created', 'started', 'finished')
+
+
+def _now():
+    return datetime.now().isoformat(timespec='seconds')
+
+
+def _job_key(kind, owner, args, payload):
+    """Fingerprint of a job's work, to spot the same job submitted twice"""
+    digest = hashlib.sha1(json.dumps([kind, owner, args], sort_keys=True).encode())
+    if payload is not None:
+        digest.update(payload)
+    return digest.hexdigest()
+
+
+def _worker_name():
+    return f'{socket.gethostname()}:{os.getpid()}'
+
+
+def _worker_alive(worker):
+    """Whether the process named by _worker_name() may still be running (always, for other hosts)"""
+    host, _, pid = (worker or '').rpartition(':')
+    if host != socket.gethostname():
+        return bool(worker)
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, ValueError):
+        return True
+    return True
+
+
+class Job:
+    """What a job function gets: its arguments and a way to report back"""
+
+    def __init__(self, queue, job_id, kind, owner, args, payload):
+        self.queue = queue
+        self.id = job_id
+        self.kind = kind
+        self.owner = owner
+        self.args = args
+        self.payload = payload
+
+    @property
+    def store(self):
+        """The UserStore the queue was opened with"""
+        return self.queue.store
+
+    def progress(self, fraction, message=None):
+        """Record how far along the job is (0 to 1), for the page polling it"""
+        self.queue._set(self.id, progress=min(max(fraction, 0.0), 1.0), message=message)
+
+    def output_path(self, extension):
+        """File the job may write its output to; the page reads it back by job id"""
+        os.makedirs(self.queue.files_dir, exist_ok=True)
+        path = os.path.join(self.queue.files_dir, f'{self.id}.{extension}')
+        self.queue._set(self.id, output=path)
+        return path
+
+
+class JobQueue:
+    """Jobs in a SQLite table, run on a pool of threads in this process"""
+
+    def __init__(self, path, store=None, workers=JOB_WORKERS):
+        self.path = path
+        self.store = store
+        self.files_dir = os.path.splitext(path)[0] + '_files'
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._worker = _worker_name()
+        # Transactions are managed by hand (see transaction())
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        with self.transaction():
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS jobs ('
+                'id TEXT PRIMARY KEY, kind TEXT NOT NULL, owner TEXT, key TEXT NOT NULL, '
+                'status TEXT NOT NULL, args TEXT NOT NULL, payload BLOB, '
+                'progress REAL NOT NULL DEFAULT 0, message TEXT, result TEXT, error TEXT, output TEXT, '
+                'worker TEXT, created TEXT NOT NULL, started TEXT, finished TEXT)'
+            )
+            self._conn.execute('CREATE INDEX IF NOT EXISTS jobs_key ON jobs (key, status)')
+            self._conn.execute('CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created)')
+            self._conn.execute('CREATE INDEX IF NOT EXISTS jobs_owner ON jobs (owner, created)')
+            orphans = self._recover()
+        self.prune()
+        # With no workers, jobs are only queued, for another process to run
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='fittrack-job') if workers else None
+        if self._pool:
+            for job_id in orphans:
+                self._pool.submit(self._run, job_id)
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """Hold the database write lock (across processes) for a read-check-write"""
+        with self._lock:
+            if self._depth == 0:
+                self._conn.execute('BEGIN IMMEDIATE')
+            self._depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._conn.execute('ROLLBACK')
+                raise
+            self._depth -= 1
+            if self._depth == 0:
+                self._conn.execute('COMMIT')
+
+    def _recover(self):
+        """Requeue jobs whose process died mid-run; returns every queued job id"""
+        for job_id, worker in self._conn.execute(
+                'SELECT id, worker FROM jobs WHERE status = ?', (RUNNING,)).fetchall():
+            if not _worker_alive(worker):
+                self._conn.execute('UPDATE jobs SET status = ?, worker = NULL, progress = 0 WHERE id = ?',
+                                   (QUEUED, job_id))
+        return [row[0] for row in self._conn.execute(
+            'SELECT id FROM jobs WHERE status = ? ORDER BY created', (QUEUED,))]
+
+    def prune(self, days=JOB_KEEP_DAYS):
+        """Drop finished jobs older than days, with their output files"""
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat(timespec='seconds')
+        with self.transaction():
+            old = self._conn.execute(
+                'SELECT id, output FROM jobs WHERE status IN (?, ?) AND finished < ?', (DONE, FAILED, cutoff)
+            ).fetchall()
+            self._conn.executemany('DELETE FROM jobs WHERE id = ?', [(job_id,) for job_id, _ in old])
+        for _, output in old:
+            if output and os.path.exists(output):
+                os.remove(output)
+        return len(old)
+
+    def submit(self, kind, args=None, owner=None, payload=None):
+        """
+        Queue a job and return its id at once. args must be plain JSON; payload
+        is optional bytes (a photo, an upload). The same job already queued or
+        running for the same owner is returned instead of a new one.
+        """
+        if kind not in JOB_TYPES:
+            raise ValueError(f"Unknown job type: {kind}")
+        args = args or {}
+        key = _job_key(kind, owner, args, payload)
+        with self.transaction():
+            row = self._conn.execute(
+                'SELECT id FROM jobs WHERE key = ? AND status IN (?, ?)', (key, *ACTIVE)
+            ).fetchone()
+            if row:
+                count('jobs.duplicates')
+                return row[0]
+            job_id = uuid.uuid4().hex
+            self._conn.execute(
+                'INSERT INTO jobs (id, kind, owner, key, status, args, payload, created) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (job_id, kind, owner, key, QUEUED, json.dumps(args), payload, _now())
+            )
+        count(f'jobs.submitted:{kind}')
+        if self._pool:
+            self._pool.submit(self._run, job_id)
+        return job_id
+
+    def _row(self, row):
+        job = dict(zip(_COLUMNS, row))
+        job['args'] = json.loads(job['args'])
+        job['result'] = json.loads(job['result']) if job['result'] is not None else None
+        return job
+
+    def get(self, job_id):
+        """A job's status, progress and result as a dict, or None"""
+        with self._lock:
+            row = self._conn.execute(f'SELECT {", ".join(_COLUMNS)} FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        return self._row(row) if row else None
+
+    def jobs(self, owner=None, limit=20):
+        """The newest jobs, of one owner or of everyone"""
+        query = f'SELECT {", ".join(_COLUMNS)} FROM jobs'
+        params = ()
+        if owner is not None:
+            query += ' WHERE owner = ?'
+            params = (owner,)
+        with self._lock:
+            rows = self._conn.execute(query + ' ORDER BY created DESC LIMIT ?', (*params, limit)).fetchall()
+        return [self._row(row) for row in rows]
+
+    def counts(self):
+        """{(kind, status): jobs}"""
+        with self._lock:
+            return {(kind, status): n for kind, status, n in self._conn.execute(
+                'SELECT kind, status, COUNT(*) FROM jobs GROUP BY kind, status ORDER BY kind, status')}
+
+    def wait(self, job_id, timeout=None, interval=0.1):
+        """Block until a job has finished (for scripts); returns get(job_id)"""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            job = self.get(job_id)
+            if job is None or job['status'] not in ACTIVE or (deadline and time.monotonic() >= deadline):
+                return job
+            time.sleep(interval)
+
+    def _set(self, job_id, **fields):
+        with self.transaction():
+            self._conn.execute(f'UPDATE jobs SET {", ".join(f"{name} = ?" for name in fields)} WHERE id = ?',
+                               (*fields.values(), job_id))
+
+    def _claim(self, job_id):
+        """Mark a queued job as running here; returns it, or None if another thread or process got it first"""
+        with self.transaction():
+            row = self._conn.execute(
+                'SELECT kind, owner, args, payload FROM jobs WHERE id = ? AND status = ?', (job_id, QUEUED)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute('UPDATE jobs SET status = ?, worker = ?, started = ? WHERE id = ?',
+                               (RUNNING, self._worker, _now(), job_id))
+        kind, owner, args, payload = row
+        return Job(self, job_id, kind, owner, json.loads(args), payload)
+
+    def _run(self, job_id):
+        job = self._claim(job_id)
+        if job is None:
+            return
+        module, function = JOB_TYPES[job.kind]
+        try:
+            with timed(f'job:{job.kind}'):
+                result = getattr(importlib.import_module(module), function)(job)
+        except Exception as e:
+            count(f'jobs.failed:{job.kind}')
+            self._set(job_id, status=FAILED, error=f'{type(e).__name__}: {e}', payload=None, finished=_now())
+            return
+        self._set(job_id, status=DONE, progress=1.0, result=json.dumps(result), payload=None, finished=_now())
+
+    def close(self, wait=True):
+        """Stop taking jobs; with wait, let the running ones finish"""
+        if self._pool:
+            self._pool.shutdown(wait=wait)
+
+
+def open_jobs(data_file, store=None, workers=JOB_WORKERS):
+    """The job queue for the app's data file, in <data file>_jobs.db"""
+    return JobQueue(os.path.splitext(data_file)[0] + '_jobs.db', store, workers)
+
+
+if __name__ == '__main__':
+    from fittrack.storage import UserStore, open_store
+
+    parser = argparse.ArgumentParser(description="List background jobs, or run the ones still queued")
+    parser.add_argument('data_file', nargs='?', default='fittrack_users.json')
+    parser.add_argument('--backend', default='sqlite', choices=('sqlite', 'json'))
+    parser.add_argument('--run', action='store_true', help="run queued jobs here and wait for them")
+    parser.add_argument('--limit', type=int, default=20)
+    args = parser.parse_args()
+
+    if args.run:
+        # Opening a queue with workers picks up every queued job
+        queue = open_jobs(args.data_file, UserStore(open_store(args.data_file, args.backend)))
+        queue.close(wait=True)
+    else:
+        queue = open_jobs(args.data_file, workers=0)
+    for (kind, status), n in queue.counts().items():
+        print(f"  {kind:<16} {status:<8} {n:>6}")
+    for job in queue.jobs(limit=args.limit):
+        took = ''
+        if job['started'] and job['finished']:
+            seconds = (datetime.fromisoformat(job['finished']) - datetime.fromisoformat(job['started'])).seconds
+            took = f" in {seconds}s"
+        print(f"{job['created']}  {job['id'][:8]}  {job['kind']:<16} {job['owner'] or '-':<16} "
+              f"{job['status']}{took}{'  ' + job['error'] if job['error'] else ''}")
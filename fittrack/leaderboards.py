@@ -0,0 +1,157 @@
+"""
+Leaderboards for FitTrack.
+
+Students who opted in to leaderboards get a score on each board they qualify
+for. The storage backends keep every board sorted as users are saved, so the
+Global and High Scores tabs ask for the top K or for one student's rank
+instead of ranking the whole school on every rerun.
+
+Boards are 'house_points', 'total_workouts', 'streak' and 'napfa:<component>'
+('napfa:total' or one of NAPFA_COMPONENTS, from the latest test). Any board
+can be narrowed to one age and/or gender. The weekly board depends on today's
+date, so instead of a score the backends keep each student's workout counts
+for the last WEEK_DAYS days and add them up when asked.
+"""
+import bisect
+from datetime import date, timedelta
+
+from fittrack.streaks import streak_stats
+
+# Bump when board_scores() changes, so stored boards are filed again (2: streaks counted from the newest workout)
+LEADERBOARD_VERSION = 2
+
+WEEK_DAYS = 7
+NAPFA_COMPONENTS = ('SU', 'SBJ', 'SAR', 'PU', 'SR', 'RUN')
+# Boards where the lowest score wins
+ASCENDING = {'napfa:SR', 'napfa:RUN'}
+
+
+def on_leaderboards(data):
+    """Whether a user appears on leaderboards at all"""
+    return bool(data) and data.get('role') == 'student' and data.get('show_on_leaderboards', False)
+
+
+def board_scores(data):
+    """{board: score} for one user; empty when they are not on leaderboards"""
+    if not on_leaderboards(data):
+        return {}
+    scores = {}
+    points = data.get('house_points_contributed', 0)
+    if points > 0:
+        scores['house_points'] = points
+    exercises = data.get('exercises', [])
+    if exercises:
+        scores['total_workouts'] = len(exercises)
+        scores['streak'] = streak_stats(data)['current_streak']
+    if data.get('napfa_history'):
+        latest = data['napfa_history'][-1]
+        scores['napfa:total'] = latest['total']
+        for component in NAPFA_COMPONENTS:
+            if component in latest.get('scores', {}):
+                scores['napfa:' + component] = latest['scores'][component]
+    return scores
+
+
+def week_start(today=None):
+    """First date (ISO string) counted by the weekly board"""
+    today = today or date.today()
+    return (today - timedelta(days=WEEK_DAYS - 1)).isoformat()
+
+
+def recent_workout_days(data, since=None):
+    """{date: (workouts, minutes)} on or after since, for a user on leaderboards"""
+    if not on_leaderboards(data):
+        return {}
+    since = since or week_start()
+    days = {}
+    for e in data.get('exercises', []):
+        if e['date'] >= since:
+            count, minutes = days.get(e['date'], (0, 0))
+            days[e['date']] = (count + 1, minutes + e.get('duration', 0))
+    return days
+
+
+class SortedBoard:
+    """One board as a sorted list of (sort key, username)"""
+
+    def __init__(self, ascending=False):
+        self.ascending = ascending
+        self._keys = []
+        self._scores = {}
+
+    def _key(self, username, score):
+        return (score if self.ascending else -score, username)
+
+    def put(self, username, score):
+        self.remove(username)
+        bisect.insort(self._keys, self._key(username, score))
+        self._scores[username] = score
+
+    def remove(self, username):
+        if username in self._scores:
+            key = self._key(username, self._scores.pop(username))
+            del self._keys[bisect.bisect_left(self._keys, key)]
+
+    def top(self, k):
+        return [(username, self._scores[username]) for _, username in self._keys[:k]]
+
+    def rank(self, username):
+        if username not in self._scores:
+            return None
+        return bisect.bisect_left(self._keys, self._key(username, self._scores[username])) + 1
+
+    def __len__(self):
+        return len(self._keys)
+
+
+class MemoryLeaderboards:
+    """Every board (and its age/gender slices) for a store that holds all users in memory"""
+
+    def __init__(self):
+        # (board, age, gender) -> SortedBoard; None matches everyone
+        self._boards = {}
+        self._slices = {}
+        self._days = {}
+
+    def update(self, username, data):
+        """Re-file one user from their current record (None when deleted)"""
+        for slice_key in self._slices.pop(username, []):
+            self._boards[slice_key].remove(username)
+        scores = board_scores(data)
+        slice_keys = []
+        for board, score in scores.items():
+            age, gender = data.get('age'), data.get('gender')
+            for slice_key in {(board, None, None), (board, age, None),
+                              (board, None, gender), (board, age, gender)}:
+                if slice_key not in self._boards:
+                    self._boards[slice_key] = SortedBoard(board in ASCENDING)
+                self._boards[slice_key].put(username, score)
+                slice_keys.append(slice_key)
+        if slice_keys:
+            self._slices[username] = slice_keys
+
+        days = recent_workout_days(data)
+        if days:
+            self._days[username] = days
+        else:
+            self._days.pop(username, None)
+
+    def top(self, board, k, age=None, gender=None):
+        board = self._boards.get((board, age, gender))
+        return board.top(k) if board else []
+
+    def rank(self, board, username, age=None, gender=None):
+        board = self._boards.get((board, age, gender))
+        rank = board.rank(username) if board else None
+        return (rank, len(board)) if rank else None
+
+    def weekly(self, k, today=None):
+        since = week_start(today)
+        totals = []
+        for username, days in self._days.items():
+            count = sum(c for d, (c, m) in days.items() if d >= since)
+            if count:
+                minutes = sum(m for d, (c, m) in days.items() if d >= since)
+                totals.append((username, count, minutes))
+        totals.sort(key=lambda x: (-x[1], x[0]))
+        return totals[:k]
@@ -0,0 +1,310 @@
+"""
+NAPFA grading for FitTrack.
+
+Each station's score gets a grade from 5 (A) down to 1 (E), or 0 below E,
+from the cutoffs for the student's age and gender. The six grades add up to a
+total out of 30 which, with the lowest grade, decides the medal.
+
+The cutoffs live in napfa_standards.json (or the file named by
+FITTRACK_NAPFA_STANDARDS):
+
+    {"grades": ["A", ..., "E"],
+     "reverse": {station: true when a lower score is better},
+     "standards": {age: {"m"|"f": {station: [A cutoff, ..., E cutoff]}}}}
+
+load_standards() checks that every age and gender has every station and that
+each station's cutoffs run the way its reverse flag says, then compiles them
+into a StandardsTable: dense numpy arrays indexed by (age, gender, station).
+Reverse stations are stored negated so every station grades the same way; a
+grade is the number of cutoffs the score reaches, for every row and station
+at once. Check a standards file with
+
+    python -m fittrack.napfa [standards file]
+
+grade_scores() grades one student for the NAPFA calculator. grade_frame()
+grades a whole test day at once, and read_results() reads the CSV from the
+test station into the frame it expects; import_job() saves the results to
+the students' records in the background (see fittrack.jobs).
+"""
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+STATIONS = ('SU', 'SBJ', 'SAR', 'PU', 'SR', 'RUN')
+STATION_NAMES = {
+    'SU': 'Sit-Ups',
+    'SBJ': 'Standing Broad Jump',
+    'SAR': 'Sit and Reach',
+    'PU': 'Pull-Ups',
+    'SR': 'Shuttle Run',
+    'RUN': '2.4km Run',
+}
+GENDERS = ('m', 'f')
+
+# (medal, minimum total, minimum grade on every station), best first
+MEDALS = (
+    ('🥇 Gold', 21, 3),
+    ('🥈 Silver', 15, 2),
+    ('🥉 Bronze', 9, 1),
+)
+NO_MEDAL = 'No Medal'
+
+STANDARDS_FILE = os.environ.get('FITTRACK_NAPFA_STANDARDS',
+                                os.path.join(os.path.dirname(__file__), 'napfa_standards.json'))
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def validate_standards(raw):
+    """Every problem with a parsed standards file, as readable strings"""
+    problems = []
+    grades = raw.get('grades')
+    if not isinstance(grades, list) or not grades:
+        return ["'grades' must be a non-empty list"]
+    reverse = raw.get('reverse', {})
+    for station in STATIONS:
+        if not isinstance(reverse.get(station), bool):
+            problems.append(f"'reverse' needs true or false for {station}")
+    standards = raw.get('standards')
+    if not isinstance(standards, dict) or not standards:
+        return problems + ["'standards' must map ages to genders"]
+
+    for age, by_gender in standards.items():
+        if not age.isdigit():
+            problems.append(f"age {age!r} is not a whole number")
+            continue
+        for gender, by_station in by_gender.items():
+            where = f"age {age} {gender}"
+            if gender not in GENDERS:
+                problems.append(f"{where}: gender must be one of {', '.join(GENDERS)}")
+                continue
+            for station in STATIONS:
+                cutoffs = by_station.get(station)
+                if cutoffs is None:
+                    problems.append(f"{where}: missing {station}")
+                elif len(cutoffs) != len(grades) or not all(_is_number(c) for c in cutoffs):
+                    problems.append(f"{where} {station}: needs {len(grades)} numeric cutoffs")
+                elif isinstance(reverse.get(station), bool):
+                    steps = np.diff(cutoffs)
+                    if reverse[station] and not (steps > 0).all():
+                        problems.append(f"{where} {station}: times must rise from {grades[0]} to {grades[-1]}")
+                    if not reverse[station] and not (steps < 0).all():
+                        problems.append(f"{where} {station}: scores must fall from {grades[0]} to {grades[-1]}")
+            for station in by_station:
+                if station not in STATIONS:
+                    problems.append(f"{where}: unknown station {station}")
+    return problems
+
+
+class StandardsTable:
+    """
+    Compiled standards.
+    cutoffs[age - min_age, gender, station] holds the cutoffs, negated for
+    reverse stations; available[age - min_age, gender] marks the ages and
+    genders that have standards.
+    """
+
+    def __init__(self, raw):
+        ages = sorted(int(age) for age in raw['standards'])
+        self.min_age = ages[0]
+        self.grades = list(raw['grades'])
+        self.sign = np.array([-1.0 if raw['reverse'][s] else 1.0 for s in STATIONS])
+        shape = (ages[-1] - self.min_age + 1, len(GENDERS))
+        self.cutoffs = np.full(shape + (len(STATIONS), len(self.grades)), np.nan)
+        self.available = np.zeros(shape, dtype=bool)
+        for age, by_gender in raw['standards'].items():
+            for gender, by_station in by_gender.items():
+                index = (int(age) - self.min_age, GENDERS.index(gender))
+                self.cutoffs[index] = [np.multiply(by_station[s], sign)
+                                       for s, sign in zip(STATIONS, self.sign)]
+                self.available[index] = True
+
+    @property
+    def ages(self):
+        """Ages with standards for at least one gender"""
+        return [self.min_age + i for i in np.flatnonzero(self.available.any(axis=1))]
+
+    def covers(self, age, gender):
+        i = int(age) - self.min_age
+        return 0 <= i < len(self.available) and gender in GENDERS and bool(self.available[i, GENDERS.index(gender)])
+
+    def grade(self, ages, genders, scores):
+        """
+        Grades for many students at once: ages and genders are arrays of
+        length n, scores an (n, stations) array with NaN for a missing score
+        (graded 0). Rows with no standards come back as NaN.
+        """
+        ages = np.asarray(ages, dtype=float)
+        genders = np.asarray(genders, dtype=object)
+        age_index = np.nan_to_num(ages - self.min_age, nan=-1).astype(int)
+        gender_index = np.select([genders == g for g in GENDERS], range(len(GENDERS)), -1)
+        covered = (age_index >= 0) & (age_index < len(self.available)) & (gender_index >= 0)
+        age_index[~covered] = 0
+        gender_index[~covered] = 0
+        covered &= self.available[age_index, gender_index]
+
+        signed = np.asarray(scores, dtype=float) * self.sign
+        # NaN scores reach no cutoff, so a missing station grades 0
+        grades = (signed[:, :, None] >= self.cutoffs[age_index, gender_index]).sum(axis=2).astype(float)
+        grades[~covered] = np.nan
+        return grades
+
+
+def load_standards(path=STANDARDS_FILE):
+    """Read, validate and compile a standards file; raises ValueError listing every problem"""
+    with open(path, encoding='utf-8') as f:
+        raw = json.load(f)
+    problems = validate_standards(raw)
+    if problems:
+        raise ValueError(f"Invalid NAPFA standards in {path}:\n  " + "\n  ".join(problems))
+    return StandardsTable(raw)
+
+
+STANDARDS = load_standards()
+
+
+def run_minutes(value):
+    """2.4km run time as minutes, from 'min:sec' or a number of minutes"""
+    if isinstance(value, str):
+        if ':' in value:
+            minutes, seconds = value.strip().split(':')
+            return int(minutes) + int(seconds) / 60
+        value = value.strip()
+        return float(value) if value else np.nan
+    return float(value)
+
+
+def medal_for(total, min_grade):
+    for medal, min_total, lowest in MEDALS:
+        if total >= min_total and min_grade >= lowest:
+            return medal
+    return NO_MEDAL
+
+
+def grade_scores(scores, age, gender):
+    """(grades, total, medal) for one student's {station: score}"""
+    if not STANDARDS.covers(age, gender):
+        raise ValueError(f"No NAPFA standards for age {age} ({gender})")
+    row = [[scores.get(station, np.nan) for station in STATIONS]]
+    grades = dict(zip(STATIONS, STANDARDS.grade([age], [gender], row)[0].astype(int).tolist()))
+    total = sum(grades.values())
+    return grades, total, medal_for(total, min(grades.values()))
+
+
+def grade_frame(results):
+    """
+    Grade every row of a DataFrame with 'age', 'gender' ('m'/'f') and one
+    column per station (RUN in minutes). Returns a copy with '<station>_grade',
+    'total', 'min_grade' and 'medal' added; rows with no standards for their
+    age and gender, or no score on any station, are left ungraded (no grades
+    or medal).
+    """
+    scores = results.reindex(columns=list(STATIONS)).to_numpy(dtype=float)
+    grades = STANDARDS.grade(pd.to_numeric(results['age'], errors='coerce').to_numpy(dtype=float),
+                             results['gender'].to_numpy(dtype=object), scores)
+    # A blank row is a student who was not tested, not one who scored 0 everywhere
+    grades[np.isnan(scores).all(axis=1)] = np.nan
+
+    graded = results.copy()
+    for j, station in enumerate(STATIONS):
+        graded[station + '_grade'] = pd.array(grades[:, j], dtype='Int64')
+    total = grades.sum(axis=1)
+    min_grade = grades.min(axis=1)
+    graded['total'] = pd.array(total, dtype='Int64')
+    graded['min_grade'] = pd.array(min_grade, dtype='Int64')
+    medal = np.select([(total >= min_total) & (min_grade >= lowest) for _, min_total, lowest in MEDALS],
+                      [name for name, _, _ in MEDALS], NO_MEDAL).astype(object)
+    medal[np.isnan(total)] = None
+    graded['medal'] = medal
+    return graded
+
+
+def history_entries(graded, date):
+    """{row label: napfa_history entry} for every graded row of grade_frame() output"""
+    entries = {}
+    for label, row in graded[graded['total'].notna()].iterrows():
+        scores = {}
+        for station in STATIONS:
+            if pd.notna(row[station]):
+                score = float(row[station])
+                scores[station] = int(score) if score.is_integer() else score
+        entries[label] = {
+            'date': date,
+            'age': int(row['age']),
+            'gender': row['gender'],
+            'scores': scores,
+            'grades': {station: int(row[station + '_grade']) for station in STATIONS},
+            'total': int(row['total']),
+            'medal': row['medal'],
+        }
+    return entries
+
+
+def read_results(file):
+    """
+    Test station CSV as a frame for grade_frame(). Needs age, gender and the
+    six station columns (any case); RUN may be 'min:sec'. Other columns, such
+    as username or name, are kept.
+    """
+    results = pd.read_csv(file, dtype=str, skipinitialspace=True)
+    renames = {}
+    for column in results.columns:
+        key = column.strip()
+        renames[column] = key.upper() if key.upper() in STATIONS else key.lower()
+    results = results.rename(columns=renames)
+    missing = [c for c in ('age', 'gender') + STATIONS if c not in results.columns]
+    if missing:
+        raise ValueError("Missing columns: " + ", ".join(missing))
+
+    results['age'] = pd.to_numeric(results['age'], errors='coerce')
+    results['gender'] = results['gender'].fillna('').str.strip().str[:1].str.lower()
+    for station in STATIONS:
+        if station == 'RUN':
+            results[station] = results[station].fillna('').map(run_minutes)
+        else:
+            results[station] = pd.to_numeric(results[station], errors='coerce')
+    return results
+
+
+def add_history_entry(student, entry):
+    """Add a test to a student's napfa_history, in place of any already saved for the same date"""
+    history = student.setdefault('napfa_history', [])
+    for i, saved in enumerate(history):
+        if saved.get('date') == entry['date']:
+            history[i] = entry
+            return
+    history.append(entry)
+
+
+def import_job(job):
+    """
+    Background job (see fittrack.jobs): add a test day's history_entries()
+    to the students' records. job.args['entries'] is a list of
+    [username, entry] pairs; returns how many were saved. Importing the same
+    day again replaces that day's entries rather than adding them twice.
+    """
+    entries = job.args['entries']
+    saved = 0
+    for done, (username, entry) in enumerate(entries, 1):
+        if job.store.update(username, lambda student: add_history_entry(student, entry)):
+            saved += 1
+        job.progress(done / len(entries), f"Saving results... {done}/{len(entries)} students")
+    return {'saved': saved}
+
+
+if __name__ == '__main__':
+    path = sys.argv[1] if len(sys.argv) > 1 else STANDARDS_FILE
+    try:
+        table = load_standards(path)
+    except ValueError as e:
+        print(e)
+        sys.exit(1)
+    print(f"NAPFA standards in {path} are valid")
+    for age in table.ages:
+        genders = [g for g in GENDERS if table.covers(age, g)]
+        print(f"  age {age}: {', '.join(genders)}")
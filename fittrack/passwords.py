@@ -0,0 +1,147 @@
+"""
+Password hashing for FitTrack.
+
+Passwords are stored as self-describing strings:
+
+    scrypt$<n>$<r>$<p>$<salt>$<hash>
+    pbkdf2_sha256$<iterations>$<salt>$<hash>
+
+with base64 salt and hash. New hashes use scrypt at SCRYPT_COST (PBKDF2 at
+PBKDF2_ITERATIONS where this Python's OpenSSL has no scrypt). Both costs can
+be raised through environment variables; run
+
+    python -m fittrack.passwords [target_ms]
+
+to time the candidates on the server and pick the largest cost that keeps a
+login under the target. Anything older or weaker than the current setting,
+including the plaintext passwords of existing accounts, still verifies, and
+needs_rehash() tells the caller to store a fresh hash after a successful login.
+
+The KDFs release the GIL, so check_password() runs them on a small thread pool:
+a burst of logins uses every core instead of queueing behind one hash, and is
+capped at one hash per core so scrypt's memory use stays bounded.
+"""
+import base64
+import hashlib
+import hmac
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+SCRYPT_COST = {
+    'n': int(os.environ.get('FITTRACK_SCRYPT_N', 2 ** 14)),
+    'r': int(os.environ.get('FITTRACK_SCRYPT_R', 8)),
+    'p': int(os.environ.get('FITTRACK_SCRYPT_P', 1)),
+}
+PBKDF2_ITERATIONS = int(os.environ.get('FITTRACK_PBKDF2_ITERATIONS', 600000))
+
+SALT_BYTES = 16
+HASH_BYTES = 32
+
+HAS_SCRYPT = hasattr(hashlib, 'scrypt')
+
+_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix='password')
+
+
+def _b64(raw):
+    return base64.b64encode(raw).decode('ascii')
+
+
+def _scrypt(password, salt, n, r, p):
+    # scrypt needs about 128*r*(n+p) bytes; OpenSSL's default cap is 32 MB
+    return hashlib.scrypt(password.encode('utf-8'), salt=salt, n=n, r=r, p=p,
+                          maxmem=2 * 128 * r * (n + p), dklen=HASH_BYTES)
+
+
+def _pbkdf2(password, salt, iterations):
+    return hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, iterations, HASH_BYTES)
+
+
+def hash_password(password):
+    """Hash a password with a fresh salt at the current cost"""
+    salt = os.urandom(SALT_BYTES)
+    if HAS_SCRYPT:
+        cost = SCRYPT_COST
+        digest = _scrypt(password, salt, cost['n'], cost['r'], cost['p'])
+        return f"scrypt${cost['n']}${cost['r']}${cost['p']}${_b64(salt)}${_b64(digest)}"
+    digest = _pbkdf2(password, salt, PBKDF2_ITERATIONS)
+    return f"pbkdf2_sha256${PBKDF2_ITERATIONS}${_b64(salt)}${_b64(digest)}"
+
+
+def verify_password(password, stored):
+    """Check a password against a stored hash (or a legacy plaintext password)"""
+    if not stored:
+        return False
+    parts = stored.split('$')
+    try:
+        if parts[0] == 'scrypt' and len(parts) == 6:
+            n, r, p = int(parts[1]), int(parts[2]), int(parts[3])
+            digest = _scrypt(password, base64.b64decode(parts[4]), n, r, p)
+            return hmac.compare_digest(digest, base64.b64decode(parts[5]))
+        if parts[0] == 'pbkdf2_sha256' and len(parts) == 4:
+            digest = _pbkdf2(password, base64.b64decode(parts[2]), int(parts[1]))
+            return hmac.compare_digest(digest, base64.b64decode(parts[3]))
+    except (ValueError, TypeError):
+        return False
+    # Accounts created before passwords were hashed
+    return hmac.compare_digest(password.encode('utf-8'), stored.encode('utf-8'))
+
+
+def needs_rehash(stored):
+    """Whether a stored password is plaintext or weaker than the current cost"""
+    parts = (stored or '').split('$')
+    if HAS_SCRYPT:
+        if parts[0] != 'scrypt' or len(parts) != 6:
+            return True
+        current = (SCRYPT_COST['n'], SCRYPT_COST['r'], SCRYPT_COST['p'])
+        return any(int(old) < new for old, new in zip(parts[1:4], current))
+    if parts[0] != 'pbkdf2_sha256' or len(parts) != 4:
+        return True
+    return int(parts[1]) < PBKDF2_ITERATIONS
+
+
+def check_password(password, stored):
+    """verify_password() on the shared hashing pool; blocks until it is done"""
+    return _pool.submit(verify_password, password, stored).result()
+
+
+def benchmark(target_ms=250, rounds=3):
+    """
+    Time each candidate cost on this machine.
+    Returns [(label, env setting, milliseconds)] and the index of the
+    strongest setting of the preferred KDF that stays under target_ms.
+    """
+    candidates = []
+    if HAS_SCRYPT:
+        for log_n in range(12, 19):
+            n = 2 ** log_n
+            candidates.append((f"scrypt n=2**{log_n} r=8 p=1",
+                               f"FITTRACK_SCRYPT_N={n}",
+                               lambda n=n: _scrypt('benchmark', b'\0' * SALT_BYTES, n, 8, 1)))
+    for iterations in (100000, 200000, 300000, 600000, 1000000):
+        candidates.append((f"pbkdf2_sha256 {iterations} iterations",
+                           f"FITTRACK_PBKDF2_ITERATIONS={iterations}",
+                           lambda i=iterations: _pbkdf2('benchmark', b'\0' * SALT_BYTES, i)))
+
+    results = []
+    for label, setting, run in candidates:
+        start = time.perf_counter()
+        for _ in range(rounds):
+            run()
+        results.append((label, setting, (time.perf_counter() - start) * 1000 / rounds))
+
+    best = None
+    for i, (label, setting, ms) in enumerate(results):
+        if ms <= target_ms and label.split()[0] == results[0][0].split()[0]:
+            best = i
+    return results, best
+
+
+if __name__ == '__main__':
+    target = float(sys.argv[1]) if len(sys.argv) > 1 else 250
+    results, best = benchmark(target)
+    print(f"Password hashing cost on this machine (target {target:.0f} ms per login)")
+    for i, (label, setting, ms) in enumerate(results):
+        marker = '  <- recommended' if i == best else ''
+        print(f"  {label:<34} {ms:8.1f} ms   {setting}{marker}")
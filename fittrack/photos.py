@@ -0,0 +1,107 @@
+"""
+Workout photos, made ready for AI verification once per upload.
+
+A phone camera photo is 12 megapixels and several megabytes, but the vision
+model scales every image to fit PHOTO_MAX_LONG x PHOTO_MAX_SHORT before it
+looks at it. prepare_photo() does that on our side instead: it decodes a
+JPEG at a reduced scale straight away (draft mode) rather than decoding all
+12 MP, turns the photo upright from its EXIF orientation, shrinks it to the
+model's resolution and encodes it once as a JPEG at PHOTO_QUALITY. A JPEG
+that is already upright and small enough is passed on as it is.
+
+The pages prepare each upload once and show, submit and hash (for the job
+and the verification cache) that one encoding; fittrack.verification sends
+it as is. Pillow is imported on first use. See what a photo would cost with
+
+    python -m fittrack.photos PHOTO [PHOTO ...]
+"""
+import io
+import sys
+import time
+
+from fittrack.instrument import count, timed
+
+# The largest image the vision model looks at: longest and shortest side, in pixels
+PHOTO_MAX_LONG = 2048
+PHOTO_MAX_SHORT = 768
+
+# JPEG quality of the re-encoded photo; form checks do not need more
+PHOTO_QUALITY = 85
+
+# EXIF tag holding the camera orientation
+EXIF_ORIENTATION = 0x0112
+
+
+def fitted_size(width, height):
+    """(width, height) scaled down, never up, to fit PHOTO_MAX_LONG x PHOTO_MAX_SHORT"""
+    scale = min(1.0, PHOTO_MAX_LONG / max(width, height), PHOTO_MAX_SHORT / min(width, height))
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def prepare_photo(data):
+    """
+    The uploaded file's bytes as the JPEG to verify. Returns a dict with
+    'data' (the JPEG bytes), 'width', 'height', 'format' (of the upload),
+    'original_bytes', 'bytes', 'bytes_saved' and 'encode_ms'. Raises
+    ValueError if the upload is not an image Pillow can read.
+    """
+    start = time.perf_counter()
+    with timed('photo.prepare'):
+        prepared, width, height, source_format = _prepare(data)
+    seconds = time.perf_counter() - start
+    count('photo.bytes_saved', len(data) - len(prepared))
+    return {
+        'data': prepared,
+        'width': width,
+        'height': height,
+        'format': source_format,
+        'original_bytes': len(data),
+        'bytes': len(prepared),
+        'bytes_saved': len(data) - len(prepared),
+        'encode_ms': round(seconds * 1000, 1),
+    }
+
+
+def _prepare(data):
+    """(JPEG bytes, width, height, format of the upload)"""
+    from PIL import Image, ImageOps, UnidentifiedImageError
+
+    try:
+        image = Image.open(io.BytesIO(data))
+        source_format = image.format
+        width, height = fitted_size(*image.size)
+        upright = image.getexif().get(EXIF_ORIENTATION, 1) == 1
+        if source_format == 'JPEG' and upright and (width, height) == image.size and image.mode in ('RGB', 'L'):
+            # Already what the model would get
+            prepared = data
+        else:
+            if source_format == 'JPEG':
+                # Let the decoder scale by 1/2, 1/4 or 1/8 while decoding, staying above the target size
+                image.draft('RGB', (width, height))
+            image = ImageOps.exif_transpose(image)
+            if image.mode != 'RGB':
+                image = image.convert('RGB')
+            image.thumbnail(fitted_size(*image.size), Image.LANCZOS)
+            buffered = io.BytesIO()
+            image.save(buffered, format='JPEG', quality=PHOTO_QUALITY)
+            prepared = buffered.getvalue()
+            width, height = image.size
+    except (UnidentifiedImageError, OSError) as e:
+        raise ValueError(f"Could not read the photo: {e}") from e
+    return prepared, width, height, source_format
+
+
+def describe(photo):
+    """One line on what preparing a photo did, for the pages"""
+    return (f"Sent for checking as {photo['width']}x{photo['height']} JPEG, {photo['bytes'] / 1024:.0f} KB "
+            f"(saved {max(photo['bytes_saved'], 0) / 1024:.0f} KB in {photo['encode_ms']:.0f} ms)")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("usage: python -m fittrack.photos PHOTO [PHOTO ...]")
+        sys.exit(2)
+    for path in sys.argv[1:]:
+        with open(path, 'rb') as f:
+            photo = prepare_photo(f.read())
+        print(f"{path}: {photo['format']} {photo['original_bytes'] / 1024:.0f} KB -> {describe(photo)}")
@@ -0,0 +1,178 @@
+"""
+Class rollups for the teacher dashboard.
+
+Every student in a teacher's class ('teacher_class') adds a short summary of
+their record to that teacher's rollup: their name, number of workouts, date
+of their last workout, workouts on each of the last ROLLUP_DAYS days, their
+latest NAPFA test and the details the class report lists (email, age,
+gender, login streak, level and points). The rollup adds the summaries up as
+it goes into students active and workouts per day, last-workout dates, and
+histograms of NAPFA totals, medals and component grades.
+
+Like house totals (see fittrack.houses), the storage backends keep every
+rollup current on each save by taking the student's old summary out and
+putting the new one in, so the Class Overview and Performance Analysis tabs
+(see fittrack.classroom) read one rollup instead of going through every
+student's workouts. Rebuild them from the records with
+
+    python -m fittrack.rollups [data file] [sqlite|json]
+"""
+import sys
+from datetime import date, timedelta
+
+# Days of workouts kept per student, enough for four weeks of participation
+ROLLUP_DAYS = 28
+
+# Bump when class_member() changes, so stored rollups are rebuilt
+ROLLUP_VERSION = 2
+
+
+def rollup_start(today=None):
+    """First date (ISO string) whose workouts are kept in a summary"""
+    return ((today or date.today()) - timedelta(days=ROLLUP_DAYS - 1)).isoformat()
+
+
+def class_teacher(data):
+    """Username of the teacher whose rollup a user belongs in, or None"""
+    if not data or data.get('role') != 'student':
+        return None
+    return data.get('teacher_class') or None
+
+
+def class_member(data, today=None):
+    """One student's summary (plain JSON, so both backends store it as is)"""
+    since = rollup_start(today)
+    exercises = data.get('exercises', [])
+    days = {}
+    last_active = None
+    for e in exercises:
+        day = e['date'][:10]
+        if day >= since:
+            days[day] = days.get(day, 0) + 1
+        if last_active is None or day > last_active:
+            last_active = day
+    history = data.get('napfa_history')
+    latest = history[-1] if history else None
+    return {
+        'name': data.get('name', ''),
+        'email': data.get('email', ''),
+        'age': data.get('age'),
+        'gender': data.get('gender'),
+        'login_streak': data.get('login_streak', 0),
+        'level': data.get('level', 'Novice'),
+        'total_points': data.get('total_points', 0),
+        'workouts': len(exercises),
+        'last_active': last_active,
+        'days': days,
+        'napfa': {'total': latest['total'], 'medal': latest['medal'], 'grades': dict(latest['grades'])}
+        if latest else None,
+    }
+
+
+def empty_rollup():
+    return {
+        'students': 0,
+        'members': {},
+        # day -> students with a workout that day / workouts that day
+        'active_days': {},
+        'workout_days': {},
+        # last workout date -> students
+        'last_active': {},
+        'napfa_count': 0,
+        'napfa_sum': 0,
+        # NAPFA total (as a string) -> students, medal -> students, component -> {grade: students}
+        'napfa_totals': {},
+        'medals': {},
+        'grades': {},
+    }
+
+
+def _bump(counts, key, n):
+    counts[key] = counts.get(key, 0) + n
+    if not counts[key]:
+        del counts[key]
+
+
+def add_member(rollup, username, member, sign=1):
+    """Add (sign=1) or take away (sign=-1) one student's summary"""
+    rollup['students'] += sign
+    if sign > 0:
+        rollup['members'][username] = member
+    else:
+        rollup['members'].pop(username, None)
+    for day, workouts in member['days'].items():
+        _bump(rollup['active_days'], day, sign)
+        _bump(rollup['workout_days'], day, sign * workouts)
+    if member['last_active']:
+        _bump(rollup['last_active'], member['last_active'], sign)
+    napfa = member['napfa']
+    if napfa:
+        rollup['napfa_count'] += sign
+        rollup['napfa_sum'] += sign * napfa['total']
+        _bump(rollup['napfa_totals'], str(napfa['total']), sign)
+        _bump(rollup['medals'], napfa['medal'], sign)
+        for code, grade in napfa['grades'].items():
+            grades = rollup['grades'].setdefault(code, {})
+            _bump(grades, str(grade), sign)
+            if not grades:
+                del rollup['grades'][code]
+
+
+def build_rollup(students, today=None):
+    """Rollup of {username: record} counted from scratch, whoever their teacher is"""
+    rollup = empty_rollup()
+    for username, data in students.items():
+        add_member(rollup, username, class_member(data, today))
+    return rollup
+
+
+def compute_rollups(users, today=None):
+    """{teacher: rollup} for every class, counted from scratch"""
+    classes = {}
+    for username, data in users.items():
+        teacher = class_teacher(data)
+        if teacher:
+            classes.setdefault(teacher, {})[username] = data
+    return {teacher: build_rollup(students, today) for teacher, students in classes.items()}
+
+
+class MemoryRollups:
+    """Every class rollup for a store that holds all users in memory"""
+
+    def __init__(self):
+        self.rollups = {}
+        # student -> teacher whose rollup holds their summary
+        self._teachers = {}
+
+    def update(self, username, data):
+        """Re-file one student from their current record (None when deleted)"""
+        teacher = class_teacher(data)
+        member = class_member(data) if teacher else None
+        old_teacher = self._teachers.pop(username, None)
+        if old_teacher:
+            rollup = self.rollups[old_teacher]
+            old = rollup['members'][username]
+            if teacher == old_teacher and old == member:
+                self._teachers[username] = teacher
+                return
+            add_member(rollup, username, old, -1)
+        if teacher:
+            add_member(self.rollups.setdefault(teacher, empty_rollup()), username, member)
+            self._teachers[username] = teacher
+
+    def rollup(self, teacher):
+        return self.rollups.get(teacher) or empty_rollup()
+
+
+if __name__ == '__main__':
+    from fittrack.storage import open_store
+
+    data_file = sys.argv[1] if len(sys.argv) > 1 else 'fittrack_users.json'
+    backend = open_store(data_file, sys.argv[2] if len(sys.argv) > 2 else 'sqlite')
+    backend.rebuild_class_rollups()
+    print(f"Rebuilt class rollups for {data_file}")
+    for teacher in backend.rollup_teachers():
+        rollup = backend.class_rollup(teacher)
+        average = rollup['napfa_sum'] / rollup['napfa_count'] if rollup['napfa_count'] else 0
+        print(f"  {teacher}: {rollup['students']} students, {sum(rollup['workout_days'].values())} workouts "
+              f"in the last {ROLLUP_DAYS} days, average NAPFA {average:.1f}")
@@ -0,0 +1,606 @@
+"""
+What students do in FitTrack, without Streamlit.
+
+Most actions change one user's record. Those functions take the record
+(a dict) as their first argument, change it in place and return what
+happened (points earned, new badges, the entry added) for the page to show.
+The pages call them on the session's private copy and save it with
+update_user_data(). A script or worker calls them through apply(), which
+loads the latest copy from a UserStore, runs the action and saves the result
+in one transaction:
+
+    apply(store, 'student0', log_steps, 12000)
+
+Friend requests and groups touch more than one record and take the store
+and usernames instead.
+Each action reports what happened to fittrack.badges (a workout logged, a
+NAPFA test recorded, ...), which checks only the badges that event can earn.
+Actions that cannot be done raise ActionError, with a message fit to show
+the user.
+
+Run one action from the command line (arguments are parsed as JSON where
+they can be):
+
+    python -m fittrack.services [--backend sqlite|json] DATA_FILE USERNAME ACTION [ARG ...]
+
+Dates and times may be given there as ISO strings ('2026-10-16' for a
+day, '2026-10-16T07:30' for when).
+"""
+import argparse
+import json
+import sys
+from datetime import date, datetime, timedelta
+
+from fittrack.badges import award, evaluate
+from fittrack.catalogs import calculate_level
+from fittrack.groups import new_group
+from fittrack.timeseries import log_columns
+
+# Points per minute of a photo-logged workout, by verification outcome
+WORKOUT_POINTS_PER_MINUTE = {'verified': 10, 'mock': 10, 'error': 5}
+
+# Points per rep of an AI-verified workout (per minute for Running), and the cap
+REP_POINTS = {
+    'Pull-Up': 5,
+    'Sit-Up': 2,
+    'Push-Up': 3,
+    'Squat': 2,
+    'Running': 1,
+    'Plank': 2,
+    'Jumping Jack': 1,
+    'Other': 2
+}
+MAX_REP_POINTS = 100
+
+# 1 point per this many steps
+STEPS_PER_POINT = 10000
+KM_PER_STEP = 0.000762
+
+
+class ActionError(ValueError):
+    """An action that cannot be done; the message is meant for the user"""
+
+
+def _now(when):
+    if isinstance(when, str):
+        return datetime.fromisoformat(when)
+    return when or datetime.now()
+
+
+# Points, house hours, badges and level
+def add_points(data, points):
+    data['total_points'] = data.get('total_points', 0) + points
+
+
+def add_workout_hours(data, hours):
+    """Workout hours count towards the student's house (1 hour = 1 house point)"""
+    data['total_workout_hours'] = data.get('total_workout_hours', 0) + hours
+    data['house_points_contributed'] = data.get('house_points_contributed', 0) + hours
+
+
+def in_house(data):
+    return data.get('role') == 'student' and bool(data.get('house'))
+
+
+def award_badges(data, events=None):
+    """
+    Add the badges the user has newly earned, with their points; returns the
+    new badges. Only the rules listening to events are checked (see
+    fittrack.badges), or all of them when events is None.
+    """
+    new_badges, _ = evaluate(data, events)
+    award(data, new_badges)
+    return new_badges
+
+
+def update_level(data):
+    data['level'] = calculate_level(data.get('total_points', 0))[0]
+    return data['level']
+
+
+# Workouts
+def workout_points(minutes, verification_status):
+    return int(minutes * WORKOUT_POINTS_PER_MINUTE.get(verification_status, 0))
+
+
+def log_workout(data, name, minutes, intensity='Medium', notes='', verification_status='mock', when=None):
+    """
+    A workout timed on the Log Workout page and checked against a photo.
+    Points depend on verification_status ('verified', 'mock', 'error' or
+    'failed'); the hours count for the house either way.
+    """
+    when = _now(when)
+    points = workout_points(minutes, verification_status)
+    entry = {
+        'name': name,
+        'date': when.strftime('%Y-%m-%d'),
+        'time': when.strftime('%H:%M'),
+        'duration': int(minutes),
+        'intensity': intensity,
+        'notes': notes,
+        'points_earned': points,
+        'verification_status': verification_status,
+        'has_photo': True
+    }
+    data.setdefault('exercises', []).insert(0, entry)
+    add_points(data, points)
+    house_points = minutes / 60
+    add_workout_hours(data, house_points)
+    new_badges = award_badges(data, ('workout_logged',))
+    return {'entry': entry, 'points': points, 'house_points': house_points,
+            'new_badges': new_badges, 'level': update_level(data)}
+
+
+def log_timed_workout(data, name, minutes, intensity='Medium', notes='', when=None):
+    """A workout from the Workout Timer; no points, but house hours for students in a house"""
+    entry = {
+        'date': _now(when).strftime('%Y-%m-%d'),
+        'name': name,
+        'duration': minutes,
+        'intensity': intensity,
+        'notes': notes
+    }
+    data.setdefault('exercises', []).insert(0, entry)
+    house_points = minutes / 60.0 if in_house(data) else 0
+    if house_points:
+        add_workout_hours(data, house_points)
+    new_badges = award_badges(data, ('workout_logged',))
+    return {'entry': entry, 'house_points': house_points, 'new_badges': new_badges, 'level': update_level(data)}
+
+
+def rep_points(exercise, reps):
+    return min(reps * REP_POINTS.get(exercise, 2), MAX_REP_POINTS)
+
+
+def log_rep_workout(data, exercise, reps, intensity='Medium', notes='', verdict=None, confidence=None,
+                    feedback='', when=None, cached=False):
+    """
+    A workout logged with a photo on the Log Workout page. verdict is the
+    AI's answer: True (good form) earns points per rep, False logs the
+    attempt for no points, None means verification is not configured.
+    cached marks an answer reused from an earlier check of the same photo.
+    reps is minutes for Running.
+    """
+    when = _now(when)
+    entry = {
+        'date': when.strftime('%Y-%m-%d'),
+        'time': when.strftime('%H:%M:%S'),
+        'type': exercise,
+        'duration': reps,  # Using duration field for reps
+        'intensity': intensity,
+        'notes': notes,
+        'verified': bool(verdict),
+    }
+    points = 0
+    house_points = 0
+    if verdict:
+        points = rep_points(exercise, reps)
+    elif verdict is None:
+        entry['notes'] = notes + " [UNVERIFIED - No AI]"
+    else:
+        entry['notes'] = notes + f" [INVALID FORM: {feedback[:50]}...]"
+    if verdict is not None:
+        entry['confidence'] = confidence
+    entry['points_earned'] = points
+    data.setdefault('exercises', []).insert(0, entry)
+
+    if verdict is not None:
+        verification = {
+            'date': entry['date'],
+            'time': entry['time'],
+            'exercise': exercise,
+            'reps': reps,
+            'valid': bool(verdict),
+            'confidence': confidence,
+            'feedback': feedback,
+            'points_earned': points
+        }
+        if cached:
+            verification['cached'] = True
+        data.setdefault('workout_verifications', []).append(verification)
+    if verdict:
+        add_points(data, points)
+        if in_house(data):
+            house_points = reps / 60.0 if exercise == "Running" else reps / 30.0
+            add_workout_hours(data, house_points)
+    new_badges = award_badges(data, ('workout_logged',))
+    return {'entry': entry, 'points': points, 'house_points': house_points,
+            'new_badges': new_badges, 'level': update_level(data)}
+
+
+def record_verification(data, exercise, reps, valid, confidence, feedback, when=None, cached=False):
+    """
+    A check of one photo on the AI Verification page: always kept in the
+    verification history (cached marks an answer reused from an earlier
+    check), and added to the exercise log (without points) when the form
+    was good.
+    """
+    when = _now(when)
+    entry = {
+        'date': when.strftime('%Y-%m-%d'),
+        'time': when.strftime('%H:%M:%S'),
+        'exercise': exercise,
+        'reps': reps,
+        'valid': valid,
+        'confidence': confidence,
+        'feedback': feedback
+    }
+    if cached:
+        entry['cached'] = True
+    data.setdefault('workout_verifications', []).append(entry)
+    if valid:
+        data.setdefault('exercises', []).insert(0, {
+            'date': entry['date'],
+            'type': exercise,
+            'duration': reps,  # Using duration field for reps
+            'notes': f'AI Verified ({confidence}% confidence)',
+            'verified': True
+        })
+    return {'entry': entry}
+
+
+# Steps and runs
+def steps_points(steps):
+    return steps // STEPS_PER_POINT
+
+
+def log_steps(data, steps, when=None):
+    """Today's step count, replacing any count already logged for today"""
+    if steps <= 0:
+        raise ActionError("Please enter your steps count!")
+    today = _now(when).strftime('%Y-%m-%d')
+    points = steps_points(steps)
+    entry = {
+        'date': today,
+        'steps': steps,
+        'distance_km': steps * KM_PER_STEP,
+        'points_earned': points,
+        'type': 'daily_steps'
+    }
+    data['steps_data'] = [s for s in data.get('steps_data', []) if s['date'] != today]
+    data['steps_data'].insert(0, entry)
+    add_points(data, points)
+    return {'entry': entry, 'points': points}
+
+
+def run_metrics(activity, distance_km, duration_min):
+    """Pace, speed and estimated steps of a run or walk"""
+    pace_min_per_km = duration_min / distance_km
+    pace_mins = int(pace_min_per_km)
+    pace_secs = int((pace_min_per_km - pace_mins) * 60)
+    # Running: ~1300 steps/km, Walking: ~1500 steps/km
+    steps_per_km = 1300 if "Running" in activity or "Jogging" in activity else 1500
+    return {
+        'pace': f"{pace_mins}:{pace_secs:02d}",
+        'speed_kmh': (distance_km / duration_min) * 60,
+        'steps': int(distance_km * steps_per_km),
+    }
+
+
+def log_run(data, activity, distance_km, duration_min, day=None, notes='', when=None):
+    """A run or walk: steps points, house hours, and a workout entry with a running bonus"""
+    when = _now(when)
+    if isinstance(day, str):
+        day = date.fromisoformat(day)
+    day = (day or when.date()).strftime('%Y-%m-%d')
+    metrics = run_metrics(activity, distance_km, duration_min)
+    points = steps_points(metrics['steps'])
+    house_points = duration_min / 60
+    entry = {
+        'date': day,
+        'type': 'run_walk',
+        'activity': activity,
+        'distance_km': distance_km,
+        'duration_min': duration_min,
+        'pace': metrics['pace'],
+        'speed_kmh': metrics['speed_kmh'],
+        'steps': metrics['steps'],
+        'points_earned': points,
+        'notes': notes
+    }
+    data.setdefault('steps_data', []).insert(0, entry)
+    add_points(data, points)
+    add_workout_hours(data, house_points)
+    data.setdefault('exercises', []).insert(0, {
+        'name': activity,
+        'date': day,
+        'time': when.strftime('%H:%M'),
+        'duration': duration_min,
+        'intensity': 'Medium',
+        'notes': f"{distance_km} km at {metrics['pace']}/km. {notes}",
+        'points_earned': points * 10,  # Bonus for running
+        'verification_status': 'auto'
+    })
+    new_badges = award_badges(data, ('workout_logged',))
+    return {'entry': entry, 'points': points, 'house_points': house_points,
+            'new_badges': new_badges, 'level': update_level(data), **metrics}
+
+
+# Tests and health records
+def record_napfa(data, scores, age, gender, when=None):
+    """Grade a NAPFA test ({station: score}) and add it to the history; returns the entry"""
+    from fittrack.napfa import grade_scores  # numpy and pandas, only needed here
+    try:
+        grades, total, medal = grade_scores(scores, age, gender)
+    except ValueError as e:
+        raise ActionError(str(e))
+    entry = {
+        'date': _now(when).strftime('%Y-%m-%d'),
+        'age': age,
+        'gender': gender,
+        'scores': scores,
+        'grades': grades,
+        'total': total,
+        'medal': medal
+    }
+    data.setdefault('napfa_history', []).append(entry)
+    award_badges(data, ('napfa_recorded',))
+    update_level(data)
+    return entry
+
+
+def bmi_category(bmi):
+    if bmi < 18.5:
+        return "Underweight"
+    if bmi < 25:
+        return "Normal"
+    if bmi < 30:
+        return "Overweight"
+    return "Obesity"
+
+
+def record_bmi(data, weight, height, when=None):
+    """BMI from weight (kg) and height (m), added to the history; returns the entry"""
+    bmi = weight / (height * height)
+    entry = {
+        'date': _now(when).strftime('%Y-%m-%d'),
+        'bmi': round(bmi, 2),
+        'weight': weight,
+        'height': height,
+        'category': bmi_category(bmi)
+    }
+    data.setdefault('bmi_history', []).append(entry)
+    return entry
+
+
+def sleep_quality(hours):
+    if hours >= 8:
+        return "Excellent"
+    if hours >= 7:
+        return "Good"
+    if hours >= 6:
+        return "Fair"
+    return "Poor"
+
+
+def log_sleep(data, sleep_start, sleep_end, when=None):
+    """A night's sleep from bedtime to wake-up (datetime.time); returns the entry"""
+    today = _now(when).date()
+    start = datetime.combine(today, sleep_start)
+    end = datetime.combine(today, sleep_end)
+    # Handle overnight sleep
+    if end < start:
+        end += timedelta(days=1)
+    diff = end - start
+    hours = diff.seconds // 3600
+    entry = {
+        'date': today.strftime('%Y-%m-%d'),
+        'sleep_start': str(sleep_start),
+        'sleep_end': str(sleep_end),
+        'hours': hours,
+        'minutes': (diff.seconds % 3600) // 60,
+        'quality': sleep_quality(hours)
+    }
+    data.setdefault('sleep_history', []).append(entry)
+    award_badges(data, ('sleep_logged',))
+    update_level(data)
+    return entry
+
+
+def log_water(data, amount, when=None):
+    when = _now(when)
+    entry = {'date': when.strftime('%Y-%m-%d'), 'time': when.strftime('%H:%M'), 'amount': amount}
+    data.setdefault('hydration_log', []).append(entry)
+    return entry
+
+
+# Challenges
+def challenge_progress(data, challenge, today=None):
+    """Progress this week towards one of WEEKLY_CHALLENGES"""
+    if challenge['type'] == 'sleep':
+        sleep_log = log_columns(data, 'sleep_history')
+        return sleep_log.count(sleep_log.recent(7, today))
+    workout_log = log_columns(data, 'exercises')
+    if challenge['type'] == 'minutes':
+        return int(workout_log.total('duration', workout_log.recent(7, today)))
+    return workout_log.count(workout_log.recent(7, today))
+
+
+def complete_challenge(data, challenge, when=None):
+    """Award a challenge's points the first time it is completed; returns whether it was new"""
+    if challenge['name'] in [c['name'] for c in data.get('completed_challenges', [])]:
+        return False
+    data.setdefault('completed_challenges', []).append({
+        'name': challenge['name'],
+        'completed_date': _now(when).strftime('%Y-%m-%d'),
+        'points': challenge['points']
+    })
+    add_points(data, challenge['points'])
+    return True
+
+
+# Friends (both users are saved)
+def send_friend_request(store, username, target):
+    if not store.exists(target):
+        raise ActionError("User not found")
+    if target == username:
+        raise ActionError("You can't add yourself!")
+    data, _ = store.get(username)
+    if target in data.get('friends', []):
+        raise ActionError("Already friends!")
+    target_data, _ = store.get(target)
+    if username in target_data.get('friend_requests', []):
+        raise ActionError("Request already sent!")
+    store.update(target, lambda friend: friend.setdefault('friend_requests', []).append(username))
+
+
+def accept_friend(store, username, requester):
+    def accept(data):
+        if requester in data.get('friend_requests', []):
+            data['friend_requests'].remove(requester)
+        if requester not in data.setdefault('friends', []):
+            data['friends'].append(requester)
+        award_badges(data, ('friend_added',))
+        update_level(data)
+
+    def add_back(friend):
+        if username not in friend.setdefault('friends', []):
+            friend['friends'].append(username)
+        award_badges(friend, ('friend_added',))
+        update_level(friend)
+
+    store.update(username, accept)
+    store.update(requester, add_back)
+
+
+def decline_friend(store, username, requester):
+    def decline(data):
+        if requester in data.get('friend_requests', []):
+            data['friend_requests'].remove(requester)
+    store.update(username, decline)
+
+
+def remove_friend(store, username, friend):
+    def drop(other):
+        def apply_drop(data):
+            if other in data.get('friends', []):
+                data['friends'].remove(other)
+        return apply_drop
+    store.update(username, drop(friend))
+    store.update(friend, drop(username))
+
+
+# Groups (the group and its members are saved)
+def create_group(store, username, name, description='', group_type='General Fitness', max_members=10, when=None):
+    """Start a group with username as admin and only member; returns its id"""
+    if not name:
+        raise ActionError("Please enter a group name")
+    when = _now(when)
+    group_id = f"group_{username}_{when.strftime('%Y%m%d%H%M%S')}"
+    group = new_group(group_id, name, username, description, group_type, max_members, when.strftime('%Y-%m-%d'))
+    if not store.create_group(group):
+        raise ActionError("You just created a group. Please try again in a moment.")
+    def add_group(data):
+        data.setdefault('groups', []).append(group_id)
+        award_badges(data, ('group_joined',))
+        update_level(data)
+
+    store.update(username, add_group)
+    return group_id
+
+
+def invite_to_group(store, group_id, friend):
+    store.update(friend, lambda other: other.setdefault('group_invites', []).append(group_id))
+
+
+def join_group(store, username, group_id):
+    """Accept an invitation to a group; returns the group"""
+    def join(group):
+        if username in group['members']:
+            return
+        if len(group['members']) >= group['max_members']:
+            raise ActionError("Group is full!")
+        group['members'].append(username)
+
+    def add_group(data):
+        if group_id not in data.setdefault('groups', []):
+            data['groups'].append(group_id)
+        decline_group(data, group_id)
+        award_badges(data, ('group_joined',))
+        update_level(data)
+
+    group = store.update_group(group_id, join)
+    if group is None:
+        raise ActionError("This group no longer exists")
+    store.update(username, add_group)
+    return group
+
+
+def decline_group(data, group_id):
+    if group_id in data.get('group_invites', []):
+        data['group_invites'].remove(group_id)
+
+
+def leave_group(store, username, group_id):
+    def leave(group):
+        if username in group['members']:
+            group['members'].remove(username)
+
+    def drop_group(data):
+        if group_id in data.get('groups', []):
+            data['groups'].remove(group_id)
+
+    store.update_group(group_id, leave)
+    store.update(username, drop_group)
+
+
+# Running actions against a store
+def apply(store, username, action, *args, **kwargs):
+    """Run a one-user action on the latest copy of username's record and save it; returns its result"""
+    results = []
+    if store.update(username, lambda data: results.append(action(data, *args, **kwargs))) is None:
+        raise ActionError(f"User not found: {username}")
+    return results[0]
+
+
+# Actions that can be run from the command line, by name
+ACTIONS = {
+    'log_workout': log_workout,
+    'log_timed_workout': log_timed_workout,
+    'log_steps': log_steps,
+    'log_run': log_run,
+    'record_napfa': record_napfa,
+    'record_bmi': record_bmi,
+    'log_water': log_water,
+    'send_friend_request': send_friend_request,
+    'accept_friend': accept_friend,
+    'decline_friend': decline_friend,
+    'remove_friend': remove_friend,
+    'create_group': create_group,
+    'join_group': join_group,
+    'leave_group': leave_group,
+}
+STORE_ACTIONS = {send_friend_request, accept_friend, decline_friend, remove_friend, create_group, join_group,
+                 leave_group}
+
+
+def _parse(value):
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+if __name__ == '__main__':
+    from fittrack.storage import UserStore, open_store
+
+    parser = argparse.ArgumentParser(description="Run one FitTrack action for a user")
+    parser.add_argument('--backend', default='sqlite', choices=('sqlite', 'json'))
+    parser.add_argument('data_file')
+    parser.add_argument('username')
+    parser.add_argument('action', choices=sorted(ACTIONS))
+    parser.add_argument('args', nargs='*')
+    args = parser.parse_args()
+
+    store = UserStore(open_store(args.data_file, args.backend))
+    action = ACTIONS[args.action]
+    values = [_parse(value) for value in args.args]
+    try:
+        if action in STORE_ACTIONS:
+            result = action(store, args.username, *values)
+        else:
+            result = apply(store, args.username, action, *values)
+    except ActionError as e:
+        print(e)
+        sys.exit(1)
+    print(json.dumps(result, indent=2, default=str))
@@ -0,0 +1,1771 @@
+"""
+User data storage for FitTrack.
+
+Users live in a JSON snapshot (the app's DATA_FILE) plus an append-only log of
+per-user mutations next to it (DATA_FILE + '.log'). Saving a user appends one
+record holding only the top-level fields that changed since the last save, so
+a water-glass tap costs the size of the hydration log, not the whole school.
+Workout groups (see fittrack.groups) are logged the same way, one record per
+saved group.
+
+Once the log passes COMPACT_THRESHOLD records it is folded back into the
+snapshot on a background thread. On startup the snapshot is read and the log
+replayed on top of it; a record torn by a crash mid-append is dropped.
+
+SqliteStore keeps one row per username in a local SQLite database instead, so
+looking up the logged-in user parses that user alone. open_store() picks the
+backend; both expose the same load/load_user/save_user/delete_user methods.
+
+Several Streamlit worker processes may share one data directory. Every user
+carries a version number that is stored with it and bumped on each write;
+save_user() refuses a write whose expected version is out of date, and
+refresh() reports users written by other processes since the last look. The
+JSON backend serializes writers with an flock() on DATA_FILE + '.lock' and
+replaces the snapshot by temp-file-and-rename; SQLite uses its own locking.
+
+Both backends keep the secondary indexes listed in INDEXES (email ->
+username, class code -> teacher) up to date on every write, and build any
+index missing from existing data when opened, so find() answers a login,
+a duplicate check or a class join without looking at any other account.
+MEMBER_INDEXES (class -> students) work the same way for keys shared by
+many users, answered by find_all().
+House totals (see fittrack.houses) are kept as counters the same way, and
+leaderboards (see fittrack.leaderboards) as sorted boards, and group
+membership and totals (see fittrack.groups) and the teachers' class rollups
+(see fittrack.rollups) likewise.
+
+UserStore sits in front of a backend as the single process-wide copy of the
+data. Sessions get private copies of their own user tagged with a version and
+write them back through put(), which merges field by field when someone else
+saved the same user in between (two tabs each logging a workout keep both,
+see merge_fields()), and raises StaleWriteError when both sides changed the
+same field in a way that cannot be combined.
+"""
+import contextlib
+import json
+import os
+import sqlite3
+import threading
+from collections import Counter
+
+from fittrack.catalogs import calculate_level
+from fittrack.groups import MemoryGroups, add_stats, empty_totals, member_stats
+from fittrack.houses import SCHOOL, add_contribution, compute_totals, contribution
+from fittrack.instrument import count, timed_function
+from fittrack.leaderboards import (ASCENDING, LEADERBOARD_VERSION, MemoryLeaderboards, board_scores, recent_workout_days,
+                                   week_start)
+from fittrack.rollups import (ROLLUP_VERSION, MemoryRollups, add_member, class_member, class_teacher, compute_rollups,
+                              empty_rollup)
+from fittrack.streaks import update_streaks
+
+try:
+    import fcntl
+except ImportError:  # Windows: writers are only serialized within one process
+    fcntl = None
+
+# Log records allowed to pile up before a background compaction is started
+COMPACT_THRESHOLD = 500
+
+# Secondary indexes: name -> function giving the key a record is found under
+# (or None). Each key maps to a single username.
+INDEXES = {
+    'email': lambda data: (data.get('email') or '').lower() or None,
+    'class_code': lambda data: data.get('class_code') if data.get('role') == 'teacher' else None,
+}
+
+# Indexes whose keys are shared: name -> function giving the key a record is
+# filed under (or None). Each key maps to every username filed under it.
+MEMBER_INDEXES = {
+    'class': lambda data: data.get('class') or None,
+}
+
+# One lock per data file, shared by every store object in the process.
+# Streamlit re-executes the app script on each rerun, so several stores can
+# point at the same files at once.
+_path_locks = {}
+_compacting = set()
+_registry_lock = threading.Lock()
+
+
+class StaleWriteError(Exception):
+    """A write was based on a copy of a user that someone else has since changed"""
+
+    def __init__(self, username, fields=None):
+        self.username = username
+        self.fields = fields or []
+        detail = f" (conflicting fields: {', '.join(self.fields)})" if self.fields else ""
+        super().__init__(f"User '{username}' was changed by another writer{detail}")
+
+
+class FileLock:
+    """
+    Exclusive lock held across threads and processes.
+    Re-entrant within a thread; other processes wait on flock() of the lock
+    file, other threads of this process on an RLock.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._fd = None
+
+    def __enter__(self):
+        self._thread_lock.acquire()
+        try:
+            if self._depth == 0 and fcntl is not None:
+                fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                except BaseException:
+                    os.close(fd)
+                    raise
+                self._fd = fd
+        except BaseException:
+            self._thread_lock.release()
+            raise
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        self._depth -= 1
+        if self._depth == 0 and self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+        self._thread_lock.release()
+
+
+def _lock_for(path):
+    path = os.path.abspath(path)
+    with _registry_lock:
+        if path not in _path_locks:
+            _path_locks[path] = FileLock(path + '.lock')
+        return _path_locks[path]
+
+
+def _encode(value):
+    """Serialize a value deterministically so it can be compared and logged"""
+    return json.dumps(value, sort_keys=True, separators=(',', ':'))
+
+
+def index_keys(data, indexes=INDEXES):
+    """{index name: key} for one user record (in INDEXES, or MEMBER_INDEXES)"""
+    keys = {}
+    for name, key_for in indexes.items():
+        key = key_for(data) if data else None
+        if key is not None:
+            keys[name] = key
+    return keys
+
+
+def _file_id(path):
+    """(inode, mtime) of a file, or None when it does not exist"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_ino, st.st_mtime_ns
+
+
+def read_snapshot(path):
+    """
+    Load (users, versions, groups) from the snapshot file.
+    Older snapshots are a bare {username: record} dict; their users start at
+    version 1.
+    """
+    if not os.path.exists(path):
+        return {}, {}, {}
+    with open(path, 'r') as f:
+        snapshot = json.load(f)
+    if isinstance(snapshot.get('__format__'), int):
+        users, versions = snapshot['users'], snapshot['versions']
+        groups = snapshot.get('groups', {})
+    else:
+        users, versions, groups = snapshot, {}, {}
+    for username in users:
+        versions.setdefault(username, 1)
+    return users, versions, groups
+
+
+def apply_record(users, versions, record, groups=None):
+    """
+    Apply one log record to a users dict (group records to the groups dict,
+    when given); returns the username it touched, or None for a group
+    """
+    op = record.get('op')
+    if op in ('group', 'ungroup'):
+        if groups is not None:
+            if op == 'group':
+                groups[record['id']] = record['data']
+            else:
+                groups.pop(record['id'], None)
+        return None
+    username = record.get('user')
+    version = record.get('v', versions.get(username, 0) + 1)
+    if op == 'put':
+        users[username] = record['data']
+        versions[username] = version
+    elif op == 'set':
+        user = users.setdefault(username, {})
+        user.update(record.get('fields', {}))
+        for key in record.get('unset', []):
+            user.pop(key, None)
+        versions[username] = version
+    elif op == 'del':
+        users.pop(username, None)
+        versions.pop(username, None)
+    return username
+
+
+def replay_log(path, users, versions, start=0, repair=False, groups=None):
+    """
+    Apply every complete record in a log file from offset start onwards.
+    Returns (usernames touched, one per record and None for a group record,
+    offset after the last good record). Reading stops at the first torn or unparsable record; with
+    repair=True the file is cut back to that point so later appends are not
+    glued onto garbage.
+    """
+    if not os.path.exists(path):
+        return [], 0
+
+    touched = []
+    good_offset = start
+    with open(path, 'rb') as f:
+        f.seek(start)
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+            touched.append(apply_record(users, versions, record, groups))
+            good_offset += len(line)
+
+    if repair and good_offset < os.path.getsize(path):
+        with open(path, 'r+b') as f:
+            f.truncate(good_offset)
+    return touched, good_offset
+
+
+class JsonLogStore:
+    """Snapshot + append-only log store for the users dict"""
+
+    def __init__(self, path, compact_threshold=COMPACT_THRESHOLD, fsync=True):
+        self.path = path
+        self.log_path = path + '.log'
+        self.rotated_log_path = path + '.log.1'
+        self.compact_threshold = compact_threshold
+        self.fsync = fsync
+        self.users = {}
+        self.versions = {}
+        # username -> {field: serialized value} as of the last logged save
+        self._saved_fields = {}
+        # {index name: {key: username}} and username -> {index name: key}
+        self.indexes = {name: {} for name in INDEXES}
+        self._index_keys = {}
+        # {index name: {key: set of usernames}} and username -> {index name: key}
+        self.member_indexes = {name: {} for name in MEMBER_INDEXES}
+        self._member_keys = {}
+        # {scope: {house: counters}} and username -> house contribution
+        self._house_totals = {}
+        self._contributions = {}
+        self.leaderboards = MemoryLeaderboards()
+        # group id -> record, and their indexes and totals
+        self.groups = {}
+        self._group_index = MemoryGroups()
+        self.rollups = MemoryRollups()
+        self._log_records = 0
+        # Snapshot file id and (live log file id, bytes read) as of the last
+        # look, to notice appends and compactions by other processes
+        self._snapshot_id = None
+        self._log_position = (None, 0)
+        # Usernames caught up on but not yet returned by refresh()
+        self._unreported = set()
+        self._loaded = False
+        self._lock = _lock_for(path)
+
+    def transaction(self):
+        """Lock out other writers (threads and processes) for a read-check-write"""
+        return self._lock
+
+    def load(self):
+        """Read the snapshot and replay the log on top of it"""
+        with self._lock:
+            users, versions, groups = read_snapshot(self.path)
+            # A rotated log only exists while (or if we crashed during) a compaction
+            rotated, _ = replay_log(self.rotated_log_path, users, versions, groups=groups)
+            live, offset = replay_log(self.log_path, users, versions, repair=True, groups=groups)
+            self.users = users
+            self.versions = versions
+            self.groups = groups
+            self._group_index.load(groups, users)
+            self._saved_fields = {}
+            self.indexes = {name: {} for name in INDEXES}
+            self._index_keys = {}
+            self.member_indexes = {name: {} for name in MEMBER_INDEXES}
+            self._member_keys = {}
+            self._house_totals = {}
+            self._contributions = {}
+            self.leaderboards = MemoryLeaderboards()
+            self.rollups = MemoryRollups()
+            for username in users:
+                self._derive(username)
+            self._log_records = len(rotated) + len(live)
+            self._snapshot_id = _file_id(self.path)
+            self._log_position = (self._open_log(), offset)
+            self._loaded = True
+            self._unreported = set()
+        self._maybe_compact()
+        return self.users
+
+    def refresh(self):
+        """
+        Catch up with writes made by other processes.
+        Returns the usernames they touched since the previous call, or None
+        when the files were compacted underneath us and everything had to be
+        reloaded.
+        """
+        with self._lock:
+            self._catch_up()
+            changed, self._unreported = self._unreported, set()
+            return changed
+
+    def _catch_up(self):
+        if not self._loaded:
+            return
+        if _file_id(self.path) != self._snapshot_id:
+            self._reload()
+            return
+        inode, offset = self._log_position
+        log_id = _file_id(self.log_path)
+        if log_id is None or log_id[0] != inode or os.path.getsize(self.log_path) < offset:
+            # Our log was rotated away by a compaction elsewhere
+            self._reload()
+            return
+        touched, offset = replay_log(self.log_path, self.users, self.versions, start=offset, groups=self.groups)
+        self._log_position = (inode, offset)
+        self._log_records += len(touched)
+        usernames = {username for username in touched if username is not None}
+        for username in usernames:
+            self._saved_fields.pop(username, None)
+            self._derive(username)
+        if len(usernames) < len(touched):
+            # Re-file the groups whose records were replaced
+            for group_id in set(self.groups) | set(self._group_index.groups):
+                group = self.groups.get(group_id)
+                if group is not self._group_index.groups.get(group_id):
+                    self._group_index.put(group_id, group, self.users)
+        if self._unreported is not None:
+            self._unreported.update(usernames)
+
+    def _reload(self):
+        self.load()
+        # Anything cached from before may be out of date
+        self._unreported = None
+
+    def _derive(self, username):
+        """
+        Bring the indexes, house totals, leaderboards, group totals and class
+        rollups in line with a user's current record
+        """
+        data = self.users.get(username)
+        for name, key in self._index_keys.pop(username, {}).items():
+            if self.indexes[name].get(key) == username:
+                del self.indexes[name][key]
+        keys = index_keys(data)
+        for name, key in keys.items():
+            self.indexes[name][key] = username
+        if keys:
+            self._index_keys[username] = keys
+        for name, key in self._member_keys.pop(username, {}).items():
+            members = self.member_indexes[name][key]
+            members.discard(username)
+            if not members:
+                del self.member_indexes[name][key]
+        keys = index_keys(data, MEMBER_INDEXES)
+        for name, key in keys.items():
+            self.member_indexes[name].setdefault(key, set()).add(username)
+        if keys:
+            self._member_keys[username] = keys
+
+        old = self._contributions.pop(username, None)
+        if old:
+            add_contribution(self._house_totals, old, -1)
+        new = contribution(data)
+        if new:
+            add_contribution(self._house_totals, new)
+            self._contributions[username] = new
+
+        self.leaderboards.update(username, data)
+        self._group_index.update_member(username, data)
+        self.rollups.update(username, data)
+
+    def house_totals(self, scope=SCHOOL):
+        """{house: {'points', 'members', 'workouts'}} for the school or one teacher's class"""
+        if not self._loaded:
+            self.load()
+        return self._house_totals.get(scope, {})
+
+    def leaderboard_top(self, board, k, age=None, gender=None):
+        """[(username, score)] of the best k on a board"""
+        if not self._loaded:
+            self.load()
+        return self.leaderboards.top(board, k, age, gender)
+
+    def leaderboard_rank(self, board, username, age=None, gender=None):
+        """(rank, entries on the board) for one user, or None when they are not on it"""
+        if not self._loaded:
+            self.load()
+        return self.leaderboards.rank(board, username, age, gender)
+
+    def weekly_leaderboard(self, k, today=None):
+        """[(username, workouts, minutes)] of the k most active in the last week"""
+        if not self._loaded:
+            self.load()
+        return self.leaderboards.weekly(k, today)
+
+    def rebuild_house_totals(self):
+        """Recount house totals from every user record"""
+        with self._lock:
+            if not self._loaded:
+                self.load()
+            self._catch_up()
+            self._house_totals = compute_totals(self.users)
+            self._contributions = {}
+            for username, data in self.users.items():
+                contrib = contribution(data)
+                if contrib:
+                    self._contributions[username] = contrib
+
+    def find(self, index, key):
+        """Username stored under key in a secondary index, or None"""
+        if not self._loaded:
+            self.load()
+        return self.indexes[index].get(key)
+
+    def find_all(self, index, key):
+        """Sorted usernames filed under key in one of the MEMBER_INDEXES"""
+        if not self._loaded:
+            self.load()
+        return sorted(self.member_indexes[index].get(key, ()))
+
+    def house_members(self, house, k=None):
+        """[(username, house points)] of a house's students, most points first (the best k)"""
+        if not self._loaded:
+            self.load()
+        members = sorted(((username, contrib[2]) for username, contrib in self._contributions.items()
+                          if contrib[0] == house), key=lambda member: (-member[1], member[0]))
+        return members[:k] if k is not None else members
+
+    def load_user(self, username):
+        """Return one user's record (the log has to be replayed in full first)"""
+        if not self._loaded:
+            self.load()
+        return self.users.get(username)
+
+    def usernames(self):
+        """List every username"""
+        if not self._loaded:
+            self.load()
+        return list(self.users)
+
+    def save_user(self, username, data, expected_version=None):
+        """
+        Log the fields of one user that changed since they were last saved.
+        Returns the user's new version; raises StaleWriteError when
+        expected_version is given and no longer current.
+        """
+        if not self._loaded:
+            self.load()
+        fields = {key: _encode(value) for key, value in data.items()}
+
+        with self._lock:
+            self._catch_up()
+            version = self.versions.get(username, 0)
+            if expected_version is not None and expected_version != version:
+                raise StaleWriteError(username)
+
+            previous = self._saved_fields.get(username)
+            if previous is None:
+                # First save of this user by this store: log the full record
+                line = '{"op":"put","user":%s,"v":%d,"data":{%s}}' % (
+                    _encode(username), version + 1,
+                    ','.join('%s:%s' % (_encode(k), v) for k, v in fields.items())
+                )
+            else:
+                changed = {k: v for k, v in fields.items() if previous.get(k) != v}
+                removed = [k for k in previous if k not in fields]
+                if not changed and not removed:
+                    return version
+                line = '{"op":"set","user":%s,"v":%d,"fields":{%s},"unset":%s}' % (
+                    _encode(username), version + 1,
+                    ','.join('%s:%s' % (_encode(k), v) for k, v in changed.items()),
+                    _encode(removed)
+                )
+
+            self._append(line)
+            self._saved_fields[username] = fields
+            self.users[username] = data
+            self.versions[username] = version + 1
+            self._derive(username)
+        self._maybe_compact()
+        return version + 1
+
+    def delete_user(self, username):
+        """Log the removal of a user"""
+        with self._lock:
+            self._catch_up()
+            self._append('{"op":"del","user":%s}' % _encode(username))
+            self._saved_fields.pop(username, None)
+            self.users.pop(username, None)
+            self.versions.pop(username, None)
+            self._derive(username)
+        self._maybe_compact()
+
+    def load_group(self, group_id):
+        """One group's record, or None"""
+        if not self._loaded:
+            self.load()
+        return self.groups.get(group_id)
+
+    def group_ids(self, username=None):
+        """Ids of every group, or of the groups one user is a member of"""
+        if not self._loaded:
+            self.load()
+        return sorted(self.groups) if username is None else self._group_index.group_ids(username)
+
+    def group_totals(self, group_id):
+        """{'members', 'workouts', 'house_points'} of one group"""
+        if not self._loaded:
+            self.load()
+        return self._group_index.totals(group_id)
+
+    def group_member_stats(self, group_id):
+        """{member: (house points, workouts, latest NAPFA total or None)} of one group"""
+        if not self._loaded:
+            self.load()
+        return self._group_index.member_stats(group_id)
+
+    def save_group(self, group_id, group):
+        """Log a group's new record"""
+        if not self._loaded:
+            self.load()
+        with self._lock:
+            self._catch_up()
+            self._append('{"op":"group","id":%s,"data":%s}' % (_encode(group_id), _encode(group)))
+            self.groups[group_id] = group
+            self._group_index.put(group_id, group, self.users)
+        self._maybe_compact()
+
+    def delete_group(self, group_id):
+        """Log the removal of a group"""
+        if not self._loaded:
+            self.load()
+        with self._lock:
+            self._catch_up()
+            self._append('{"op":"ungroup","id":%s}' % _encode(group_id))
+            self.groups.pop(group_id, None)
+            self._group_index.put(group_id, None, self.users)
+        self._maybe_compact()
+
+    def rebuild_group_totals(self):
+        """Recount group totals from every group and member record"""
+        with self._lock:
+            if not self._loaded:
+                self.load()
+            self._catch_up()
+            self._group_index.load(self.groups, self.users)
+
+    def class_rollup(self, teacher):
+        """One teacher's class rollup (see fittrack.rollups)"""
+        if not self._loaded:
+            self.load()
+        return self.rollups.rollup(teacher)
+
+    def rollup_teachers(self):
+        """Teachers with at least one student in their rollup"""
+        if not self._loaded:
+            self.load()
+        return sorted(teacher for teacher, rollup in self.rollups.rollups.items() if rollup['students'])
+
+    def class_members(self, teacher=None):
+        """(teacher, username, summary) of every student in a class, or in one teacher's, by teacher and username"""
+        if not self._loaded:
+            self.load()
+        for name in self.rollup_teachers() if teacher is None else [teacher]:
+            members = self.rollups.rollup(name)['members']
+            for username in sorted(members):
+                summary = members.get(username)
+                if summary is not None:
+                    yield name, username, summary
+
+    def class_member_count(self, teacher=None):
+        """Students in a class, or in one teacher's"""
+        if not self._loaded:
+            self.load()
+        if teacher is None:
+            return sum(rollup['students'] for rollup in self.rollups.rollups.values())
+        return self.rollups.rollup(teacher)['students']
+
+    def rebuild_class_rollups(self):
+        """Recount every class rollup from the student records"""
+        with self._lock:
+            if not self._loaded:
+                self.load()
+            self._catch_up()
+            self.rollups = MemoryRollups()
+            for username, data in self.users.items():
+                self.rollups.update(username, data)
+
+    def _open_log(self):
+        # The live log always exists once loaded, so a rotation is always
+        # visible as a change of inode
+        with open(self.log_path, 'a'):
+            pass
+        return _file_id(self.log_path)[0]
+
+    def _append(self, line):
+        # Callers hold the lock and have refreshed, so nobody else has
+        # appended since our last read and the new end is ours
+        with open(self.log_path, 'a') as f:
+            f.write(line + '\n')
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+            offset = f.tell()
+        self._log_position = (_file_id(self.log_path)[0], offset)
+        self._log_records += 1
+
+    def _maybe_compact(self):
+        if self._log_records >= self.compact_threshold:
+            self._log_records = 0
+            threading.Thread(target=self.compact, daemon=True).start()
+
+    def compact(self):
+        """
+        Fold the log into a fresh snapshot.
+        The live log is rotated aside first so saves keep appending while the
+        snapshot is rebuilt. The rebuild reads from disk rather than self.users,
+        so writes made through other store objects are never lost.
+        """
+        key = os.path.abspath(self.path)
+        with _registry_lock:
+            if key in _compacting:
+                return
+            _compacting.add(key)
+
+        try:
+            with self._lock:
+                self._catch_up()
+                if os.path.exists(self.log_path) and not os.path.exists(self.rotated_log_path):
+                    os.replace(self.log_path, self.rotated_log_path)
+                    self._log_position = (self._open_log(), 0)
+                users, versions, groups = read_snapshot(self.path)
+                snapshot_id = _file_id(self.path)
+
+            replay_log(self.rotated_log_path, users, versions, groups=groups)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump({'__format__': 2, 'users': users, 'versions': versions, 'groups': groups}, f)
+                f.flush()
+                os.fsync(f.fileno())
+
+            # Swap the snapshot and drop the rotated log together, so a
+            # concurrent load() sees either the old pair or the new one
+            with self._lock:
+                if _file_id(self.path) != snapshot_id:
+                    # Another process finished the same compaction first
+                    os.remove(tmp_path)
+                    return
+                self._catch_up()
+                os.replace(tmp_path, self.path)
+                if os.path.exists(self.rotated_log_path):
+                    os.remove(self.rotated_log_path)
+                self._snapshot_id = _file_id(self.path)
+        finally:
+            with _registry_lock:
+                _compacting.discard(key)
+
+
+class SqliteStore:
+    """One row per username in a local SQLite database"""
+
+    def __init__(self, path, legacy_json_path=None):
+        self.path = path
+        self.versions = {}
+        # username -> (version, JSON text) as last read or written, to skip no-op saves
+        self._saved = {}
+        self._lock = threading.RLock()
+        self._depth = 0
+        # Transactions are managed by hand (see transaction())
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        with self.transaction():
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS users (username TEXT PRIMARY KEY, data TEXT NOT NULL)'
+            )
+            columns = {row[1] for row in self._conn.execute('PRAGMA table_info(users)')}
+            # version: bumped on every write; seq: database-wide write order,
+            # so other processes can ask which rows changed since they looked
+            if 'version' not in columns:
+                self._conn.execute('ALTER TABLE users ADD COLUMN version INTEGER NOT NULL DEFAULT 1')
+            if 'seq' not in columns:
+                self._conn.execute('ALTER TABLE users ADD COLUMN seq INTEGER NOT NULL DEFAULT 0')
+            self._conn.execute('CREATE INDEX IF NOT EXISTS users_seq ON users (seq)')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)'
+            )
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS user_index ('
+                'name TEXT NOT NULL, key TEXT NOT NULL, username TEXT NOT NULL, '
+                'PRIMARY KEY (name, key))'
+            )
+            self._conn.execute('CREATE INDEX IF NOT EXISTS user_index_username ON user_index (username)')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS member_index ('
+                'name TEXT NOT NULL, key TEXT NOT NULL, username TEXT NOT NULL, '
+                'PRIMARY KEY (name, key, username))'
+            )
+            self._conn.execute('CREATE INDEX IF NOT EXISTS member_index_username ON member_index (username)')
+            # Each student's last counted contribution, and the running totals
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS house_members ('
+                'username TEXT PRIMARY KEY, house TEXT NOT NULL, teacher TEXT, '
+                'points REAL NOT NULL, workouts INTEGER NOT NULL)'
+            )
+            self._conn.execute('CREATE INDEX IF NOT EXISTS house_members_points ON house_members (house, points)')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS house_totals ('
+                'scope TEXT NOT NULL, house TEXT NOT NULL, points REAL NOT NULL, '
+                'members INTEGER NOT NULL, workouts INTEGER NOT NULL, PRIMARY KEY (scope, house))'
+            )
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS leaderboard ('
+                'board TEXT NOT NULL, username TEXT NOT NULL, score NUMERIC NOT NULL, '
+                'age INTEGER, gender TEXT, PRIMARY KEY (board, username))'
+            )
+            self._conn.execute('CREATE INDEX IF NOT EXISTS leaderboard_score ON leaderboard (board, score)')
+            self._conn.execute(
+                'CREATE INDEX IF NOT EXISTS leaderboard_slice ON leaderboard (board, age, gender, score)'
+            )
+            self._conn.execute('CREATE INDEX IF NOT EXISTS leaderboard_username ON leaderboard (username)')
+            # Workouts per day for the weekly board, only the days still in the
+            # window when the user was last saved
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS workout_days ('
+                'username TEXT NOT NULL, date TEXT NOT NULL, workouts INTEGER NOT NULL, '
+                'minutes NUMERIC NOT NULL, PRIMARY KEY (username, date))'
+            )
+            self._conn.execute('CREATE INDEX IF NOT EXISTS workout_days_date ON workout_days (date)')
+            # Groups with their running totals, the members of each, and the
+            # stats last added to those totals for every user in a group
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS group_records ('
+                'group_id TEXT PRIMARY KEY, data TEXT NOT NULL, members INTEGER NOT NULL DEFAULT 0, '
+                'workouts INTEGER NOT NULL DEFAULT 0, house_points REAL NOT NULL DEFAULT 0)'
+            )
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS group_members ('
+                'group_id TEXT NOT NULL, username TEXT NOT NULL, PRIMARY KEY (group_id, username))'
+            )
+            self._conn.execute('CREATE INDEX IF NOT EXISTS group_members_username ON group_members (username)')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS group_member_stats ('
+                'username TEXT PRIMARY KEY, house_points REAL NOT NULL, workouts INTEGER NOT NULL, napfa INTEGER)'
+            )
+            # Each teacher's class rollup, and the summary last added to one for each student
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS class_rollups (teacher TEXT PRIMARY KEY, data TEXT NOT NULL)'
+            )
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS class_members ('
+                'username TEXT PRIMARY KEY, teacher TEXT NOT NULL, data TEXT NOT NULL)'
+            )
+            self._conn.execute('CREATE INDEX IF NOT EXISTS class_members_teacher ON class_members (teacher, username)')
+        if legacy_json_path:
+            self._import_legacy(legacy_json_path)
+        self._build_indexes()
+        with self.transaction():
+            if not self._meta('aggregate:houses'):
+                self.rebuild_house_totals()
+            if self._meta('aggregate:leaderboards') != LEADERBOARD_VERSION:
+                self.rebuild_leaderboards()
+            if not self._meta('aggregate:groups'):
+                self.rebuild_group_totals()
+            if self._meta('aggregate:classes') != ROLLUP_VERSION:
+                self.rebuild_class_rollups()
+        self._data_version = self._conn.execute('PRAGMA data_version').fetchone()[0]
+        self._seq = self._max_seq()
+        self._deletes = self._meta('deletes')
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """Hold the database write lock (across processes) for a read-check-write"""
+        with self._lock:
+            if self._depth == 0:
+                self._conn.execute('BEGIN IMMEDIATE')
+            self._depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._conn.execute('ROLLBACK')
+                raise
+            self._depth -= 1
+            if self._depth == 0:
+                self._conn.execute('COMMIT')
+
+    def _max_seq(self):
+        return self._conn.execute('SELECT COALESCE(MAX(seq), 0) FROM users').fetchone()[0]
+
+    def _meta(self, key):
+        row = self._conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else 0
+
+    def _import_legacy(self, json_path):
+        """
+        Copy users from the JSON snapshot + log the first time the database is
+        opened. The files are only read: no log or lock file is created.
+        """
+        with self.transaction():
+            if self._conn.execute('SELECT 1 FROM users LIMIT 1').fetchone():
+                return
+            if not os.path.exists(json_path) and not os.path.exists(json_path + '.log'):
+                return
+            users, versions, groups = read_snapshot(json_path)
+            # Same order as JsonLogStore.load(): a log rotated by an unfinished compaction, then the live one
+            for log_path in (json_path + '.log.1', json_path + '.log'):
+                replay_log(log_path, users, versions, groups=groups)
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO users (username, data, version, seq) VALUES (?, ?, ?, 0)',
+                [(username, _encode(data), versions.get(username, 1)) for username, data in users.items()]
+            )
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO group_records (group_id, data) VALUES (?, ?)',
+                [(group_id, _encode(group)) for group_id, group in groups.items()]
+            )
+            # Members are filed by rebuild_group_totals()
+            self._conn.execute("DELETE FROM meta WHERE key = 'aggregate:groups'")
+
+    def _build_indexes(self):
+        """Fill any index in INDEXES or MEMBER_INDEXES that this database has not built yet"""
+        with self.transaction():
+            missing = [name for name in INDEXES if not self._meta('index:' + name)]
+            missing_members = [name for name in MEMBER_INDEXES if not self._meta('member_index:' + name)]
+            if not missing and not missing_members:
+                return
+            rows, member_rows = [], []
+            for username, text in self._conn.execute('SELECT username, data FROM users'):
+                data = json.loads(text)
+                keys = index_keys(data)
+                rows.extend((name, keys[name], username) for name in missing if name in keys)
+                keys = index_keys(data, MEMBER_INDEXES)
+                member_rows.extend((name, keys[name], username) for name in missing_members if name in keys)
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO user_index (name, key, username) VALUES (?, ?, ?)', rows
+            )
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO member_index (name, key, username) VALUES (?, ?, ?)', member_rows
+            )
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO meta (key, value) VALUES (?, 1)',
+                [('index:' + name,) for name in missing] + [('member_index:' + name,) for name in missing_members]
+            )
+
+    def _write_derived(self, username, data):
+        """
+        Bring the indexes, house totals, leaderboards, group totals and class
+        rollups in line with a user's new record (None when deleted)
+        """
+        self._conn.execute('DELETE FROM user_index WHERE username = ?', (username,))
+        self._conn.executemany(
+            'INSERT OR REPLACE INTO user_index (name, key, username) VALUES (?, ?, ?)',
+            [(name, key, username) for name, key in index_keys(data).items()]
+        )
+        self._conn.execute('DELETE FROM member_index WHERE username = ?', (username,))
+        self._conn.executemany(
+            'INSERT INTO member_index (name, key, username) VALUES (?, ?, ?)',
+            [(name, key, username) for name, key in index_keys(data, MEMBER_INDEXES).items()]
+        )
+        self._write_leaderboards(username, data)
+        self._write_group_stats(username, data)
+        self._write_class_member(username, data)
+
+        old = self._conn.execute(
+            'SELECT house, teacher, points, workouts FROM house_members WHERE username = ?', (username,)
+        ).fetchone()
+        new = contribution(data)
+        if old == new:
+            return
+        deltas = {}
+        if old:
+            add_contribution(deltas, old, -1)
+        if new:
+            add_contribution(deltas, new)
+            self._conn.execute(
+                'INSERT OR REPLACE INTO house_members (username, house, teacher, points, workouts) '
+                'VALUES (?, ?, ?, ?, ?)', (username,) + new
+            )
+        else:
+            self._conn.execute('DELETE FROM house_members WHERE username = ?', (username,))
+        self._conn.executemany(
+            'INSERT INTO house_totals (scope, house, points, members, workouts) VALUES (?, ?, ?, ?, ?) '
+            'ON CONFLICT(scope, house) DO UPDATE SET points = points + excluded.points, '
+            'members = members + excluded.members, workouts = workouts + excluded.workouts',
+            [(scope, house, c['points'], c['members'], c['workouts'])
+             for scope, by_house in deltas.items() for house, c in by_house.items()]
+        )
+
+    def _write_leaderboards(self, username, data):
+        self._conn.execute('DELETE FROM leaderboard WHERE username = ?', (username,))
+        self._conn.execute('DELETE FROM workout_days WHERE username = ?', (username,))
+        scores = board_scores(data)
+        if scores:
+            age, gender = data.get('age'), data.get('gender')
+            self._conn.executemany(
+                'INSERT INTO leaderboard (board, username, score, age, gender) VALUES (?, ?, ?, ?, ?)',
+                [(board, username, score, age, gender) for board, score in scores.items()]
+            )
+        self._conn.executemany(
+            'INSERT INTO workout_days (username, date, workouts, minutes) VALUES (?, ?, ?, ?)',
+            [(username, day, count, minutes)
+             for day, (count, minutes) in recent_workout_days(data).items()]
+        )
+
+    def _write_group_stats(self, username, data):
+        old = self._conn.execute(
+            'SELECT house_points, workouts, napfa FROM group_member_stats WHERE username = ?', (username,)
+        ).fetchone()
+        if old is None and not self._conn.execute(
+                'SELECT 1 FROM group_members WHERE username = ? LIMIT 1', (username,)).fetchone():
+            return
+        new = member_stats(data)
+        if old == new:
+            return
+        delta = empty_totals()
+        add_stats(delta, old, -1)
+        add_stats(delta, new)
+        self._conn.execute(
+            'UPDATE group_records SET workouts = workouts + ?, house_points = house_points + ? '
+            'WHERE group_id IN (SELECT group_id FROM group_members WHERE username = ?)',
+            (delta['workouts'], delta['house_points'], username)
+        )
+        self._set_member_stats(username, new)
+
+    def _write_class_member(self, username, data):
+        teacher = class_teacher(data)
+        member = _encode(class_member(data)) if teacher else None
+        old = self._conn.execute(
+            'SELECT teacher, data FROM class_members WHERE username = ?', (username,)
+        ).fetchone()
+        if old == ((teacher, member) if teacher else None):
+            return
+        changed = {}
+        if old:
+            changed[old[0]] = self.class_rollup(old[0])
+            add_member(changed[old[0]], username, json.loads(old[1]), -1)
+        if teacher:
+            add_member(changed.setdefault(teacher, self.class_rollup(teacher)), username, json.loads(member))
+            self._conn.execute(
+                'INSERT OR REPLACE INTO class_members (username, teacher, data) VALUES (?, ?, ?)',
+                (username, teacher, member)
+            )
+        else:
+            self._conn.execute('DELETE FROM class_members WHERE username = ?', (username,))
+        self._conn.executemany(
+            'INSERT OR REPLACE INTO class_rollups (teacher, data) VALUES (?, ?)',
+            [(name, _encode(rollup)) for name, rollup in changed.items()]
+        )
+
+    def class_rollup(self, teacher):
+        """One teacher's class rollup (see fittrack.rollups)"""
+        with self._lock:
+            row = self._conn.execute('SELECT data FROM class_rollups WHERE teacher = ?', (teacher,)).fetchone()
+        return json.loads(row[0]) if row else empty_rollup()
+
+    def rollup_teachers(self):
+        """Teachers with at least one student in their rollup"""
+        with self._lock:
+            return [row[0] for row in self._conn.execute(
+                'SELECT DISTINCT teacher FROM class_members ORDER BY teacher')]
+
+    def class_members(self, teacher=None, batch=500):
+        """
+        (teacher, username, summary) of every student in a class, or in one
+        teacher's, by teacher and username; read `batch` rows at a time
+        """
+        where, params = ('teacher = ? AND ', [teacher]) if teacher is not None else ('', [])
+        last = ('', '')
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    f'SELECT teacher, username, data FROM class_members WHERE {where}(teacher, username) > (?, ?) '
+                    'ORDER BY teacher, username LIMIT ?', params + list(last) + [batch]
+                ).fetchall()
+            for name, username, text in rows:
+                yield name, username, json.loads(text)
+            if len(rows) < batch:
+                return
+            last = rows[-1][:2]
+
+    def class_member_count(self, teacher=None):
+        """Students in a class, or in one teacher's"""
+        with self._lock:
+            if teacher is None:
+                return self._conn.execute('SELECT COUNT(*) FROM class_members').fetchone()[0]
+            return self._conn.execute('SELECT COUNT(*) FROM class_members WHERE teacher = ?', (teacher,)).fetchone()[0]
+
+    def rebuild_class_rollups(self):
+        """Recount every class rollup from the user rows"""
+        with self.transaction():
+            users = {username: json.loads(text)
+                     for username, text in self._conn.execute('SELECT username, data FROM users').fetchall()}
+            self._conn.execute('DELETE FROM class_rollups')
+            self._conn.execute('DELETE FROM class_members')
+            rollups = compute_rollups(users)
+            self._conn.executemany(
+                'INSERT INTO class_rollups (teacher, data) VALUES (?, ?)',
+                [(teacher, _encode(rollup)) for teacher, rollup in rollups.items()]
+            )
+            self._conn.executemany(
+                'INSERT INTO class_members (username, teacher, data) VALUES (?, ?, ?)',
+                [(username, teacher, _encode(member))
+                 for teacher, rollup in rollups.items() for username, member in rollup['members'].items()]
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('aggregate:classes', ?)", (ROLLUP_VERSION,)
+            )
+
+    def _set_member_stats(self, username, stats):
+        if stats:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO group_member_stats (username, house_points, workouts, napfa) '
+                'VALUES (?, ?, ?, ?)', (username,) + stats
+            )
+        else:
+            self._conn.execute('DELETE FROM group_member_stats WHERE username = ?', (username,))
+
+    def _file_group_members(self, group_id, members):
+        """Move users in and out of a group's membership; returns the change to its totals"""
+        old = {row[0] for row in self._conn.execute(
+            'SELECT username FROM group_members WHERE group_id = ?', (group_id,))}
+        delta = empty_totals()
+        for username in old - members:
+            stats = self._conn.execute(
+                'SELECT house_points, workouts, napfa FROM group_member_stats WHERE username = ?', (username,)
+            ).fetchone()
+            add_stats(delta, stats, -1)
+            self._conn.execute(
+                'DELETE FROM group_members WHERE group_id = ? AND username = ?', (group_id, username)
+            )
+            if not self._conn.execute(
+                    'SELECT 1 FROM group_members WHERE username = ? LIMIT 1', (username,)).fetchone():
+                self._set_member_stats(username, None)
+        for username in members - old:
+            stats = self._conn.execute(
+                'SELECT house_points, workouts, napfa FROM group_member_stats WHERE username = ?', (username,)
+            ).fetchone()
+            if stats is None:
+                row = self._conn.execute('SELECT data FROM users WHERE username = ?', (username,)).fetchone()
+                stats = member_stats(json.loads(row[0])) if row else None
+                self._set_member_stats(username, stats)
+            add_stats(delta, stats)
+            self._conn.execute(
+                'INSERT INTO group_members (group_id, username) VALUES (?, ?)', (group_id, username)
+            )
+        return delta
+
+    def load_group(self, group_id):
+        """One group's record, or None"""
+        with self._lock:
+            row = self._conn.execute('SELECT data FROM group_records WHERE group_id = ?', (group_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def group_ids(self, username=None):
+        """Ids of every group, or of the groups one user is a member of"""
+        with self._lock:
+            if username is None:
+                rows = self._conn.execute('SELECT group_id FROM group_records ORDER BY group_id')
+            else:
+                rows = self._conn.execute(
+                    'SELECT group_id FROM group_members WHERE username = ? ORDER BY group_id', (username,)
+                )
+            return [row[0] for row in rows]
+
+    def group_totals(self, group_id):
+        """{'members', 'workouts', 'house_points'} of one group"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT members, workouts, house_points FROM group_records WHERE group_id = ?', (group_id,)
+            ).fetchone()
+        if row is None:
+            return empty_totals()
+        return {'members': row[0], 'workouts': row[1], 'house_points': row[2]}
+
+    def group_member_stats(self, group_id):
+        """{member: (house points, workouts, latest NAPFA total or None)} of one group"""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT m.username, s.house_points, s.workouts, s.napfa FROM group_members m '
+                'LEFT JOIN group_member_stats s ON s.username = m.username WHERE m.group_id = ?', (group_id,)
+            ).fetchall()
+        return {username: (points, workouts, napfa) if workouts is not None else None
+                for username, points, workouts, napfa in rows}
+
+    def save_group(self, group_id, group):
+        """Write a group's new record, filing its members"""
+        with self.transaction():
+            delta = self._file_group_members(group_id, set(group['members']))
+            self._conn.execute(
+                'INSERT INTO group_records (group_id, data, members, workouts, house_points) VALUES (?, ?, ?, ?, ?) '
+                'ON CONFLICT(group_id) DO UPDATE SET data = excluded.data, members = members + excluded.members, '
+                'workouts = workouts + excluded.workouts, house_points = house_points + excluded.house_points',
+                (group_id, _encode(group), delta['members'], delta['workouts'], delta['house_points'])
+            )
+
+    def delete_group(self, group_id):
+        """Remove a group and its memberships"""
+        with self.transaction():
+            self._file_group_members(group_id, set())
+            self._conn.execute('DELETE FROM group_records WHERE group_id = ?', (group_id,))
+
+    def rebuild_group_totals(self):
+        """Re-file every group's members and recount the totals from their user rows"""
+        with self.transaction():
+            self._conn.execute('DELETE FROM group_members')
+            self._conn.execute('DELETE FROM group_member_stats')
+            self._conn.execute('UPDATE group_records SET members = 0, workouts = 0, house_points = 0')
+            for group_id, text in self._conn.execute('SELECT group_id, data FROM group_records').fetchall():
+                delta = self._file_group_members(group_id, set(json.loads(text)['members']))
+                self._conn.execute(
+                    'UPDATE group_records SET members = ?, workouts = ?, house_points = ? WHERE group_id = ?',
+                    (delta['members'], delta['workouts'], delta['house_points'], group_id)
+                )
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('aggregate:groups', 1)")
+
+    def rebuild_leaderboards(self):
+        """Re-file every user row on the leaderboards"""
+        with self.transaction():
+            self._conn.execute('DELETE FROM leaderboard')
+            self._conn.execute('DELETE FROM workout_days')
+            for username, text in self._conn.execute('SELECT username, data FROM users').fetchall():
+                self._write_leaderboards(username, json.loads(text))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('aggregate:leaderboards', ?)", (LEADERBOARD_VERSION,)
+            )
+
+    def _slice(self, board, age, gender):
+        where, params = 'board = ?', [board]
+        if age is not None:
+            where += ' AND age = ?'
+            params.append(age)
+        if gender is not None:
+            where += ' AND gender = ?'
+            params.append(gender)
+        return where, params
+
+    def leaderboard_top(self, board, k, age=None, gender=None):
+        """[(username, score)] of the best k on a board"""
+        where, params = self._slice(board, age, gender)
+        order = 'ASC' if board in ASCENDING else 'DESC'
+        with self._lock:
+            return self._conn.execute(
+                f'SELECT username, score FROM leaderboard WHERE {where} '
+                f'ORDER BY score {order}, username LIMIT ?', params + [k]
+            ).fetchall()
+
+    def leaderboard_rank(self, board, username, age=None, gender=None):
+        """(rank, entries on the board) for one user, or None when they are not on it"""
+        where, params = self._slice(board, age, gender)
+        better = '<' if board in ASCENDING else '>'
+        with self._lock:
+            row = self._conn.execute(
+                f'SELECT score FROM leaderboard WHERE {where} AND username = ?', params + [username]
+            ).fetchone()
+            if row is None:
+                return None
+            ahead, size = self._conn.execute(
+                f'SELECT SUM(score {better} ? OR (score = ? AND username < ?)), COUNT(*) '
+                f'FROM leaderboard WHERE {where}', [row[0], row[0], username] + params
+            ).fetchone()
+        return ahead + 1, size
+
+    def weekly_leaderboard(self, k, today=None):
+        """[(username, workouts, minutes)] of the k most active in the last week"""
+        with self._lock:
+            return self._conn.execute(
+                'SELECT username, SUM(workouts) AS total, SUM(minutes) FROM workout_days '
+                'WHERE date >= ? GROUP BY username ORDER BY total DESC, username LIMIT ?',
+                (week_start(today), k)
+            ).fetchall()
+
+    def house_totals(self, scope=SCHOOL):
+        """{house: {'points', 'members', 'workouts'}} for the school or one teacher's class"""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT house, points, members, workouts FROM house_totals WHERE scope = ?', (scope,)
+            ).fetchall()
+        return {house: {'points': points, 'members': members, 'workouts': workouts}
+                for house, points, members, workouts in rows}
+
+    def rebuild_house_totals(self):
+        """Recount house totals from every user row"""
+        with self.transaction():
+            self._conn.execute('DELETE FROM house_members')
+            self._conn.execute('DELETE FROM house_totals')
+            members = []
+            for username, text in self._conn.execute('SELECT username, data FROM users').fetchall():
+                contrib = contribution(json.loads(text))
+                if contrib:
+                    members.append((username,) + contrib)
+            self._conn.executemany(
+                'INSERT INTO house_members (username, house, teacher, points, workouts) '
+                'VALUES (?, ?, ?, ?, ?)', members
+            )
+            totals = {}
+            for member in members:
+                add_contribution(totals, member[1:])
+            self._conn.executemany(
+                'INSERT INTO house_totals (scope, house, points, members, workouts) VALUES (?, ?, ?, ?, ?)',
+                [(scope, house, c['points'], c['members'], c['workouts'])
+                 for scope, by_house in totals.items() for house, c in by_house.items()]
+            )
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('aggregate:houses', 1)")
+
+    def find(self, index, key):
+        """Username stored under key in a secondary index, or None"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT username FROM user_index WHERE name = ? AND key = ?', (index, key)
+            ).fetchone()
+        return row[0] if row else None
+
+    def find_all(self, index, key):
+        """Sorted usernames filed under key in one of the MEMBER_INDEXES"""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT username FROM member_index WHERE name = ? AND key = ? ORDER BY username', (index, key)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def house_members(self, house, k=None):
+        """[(username, house points)] of a house's students, most points first (the best k)"""
+        with self._lock:
+            return self._conn.execute(
+                'SELECT username, points FROM house_members WHERE house = ? ORDER BY points DESC, username LIMIT ?',
+                (house, -1 if k is None else k)
+            ).fetchall()
+
+    def refresh(self):
+        """
+        Catch up with writes made by other processes.
+        Returns the usernames they wrote, or None after a delete elsewhere
+        (deleted rows leave no trace to look up, so everything is suspect).
+        """
+        with self._lock:
+            data_version = self._conn.execute('PRAGMA data_version').fetchone()[0]
+            if data_version == self._data_version:
+                return set()
+            self._data_version = data_version
+            deletes = self._meta('deletes')
+            if deletes != self._deletes:
+                self._deletes = deletes
+                self._seq = self._max_seq()
+                self.versions = {}
+                self._saved = {}
+                return None
+            rows = self._conn.execute(
+                'SELECT username, version, seq FROM users WHERE seq > ?', (self._seq,)
+            ).fetchall()
+        changed = set()
+        for username, version, seq in rows:
+            changed.add(username)
+            self.versions[username] = version
+            self._saved.pop(username, None)
+            self._seq = max(self._seq, seq)
+        return changed
+
+    def load(self):
+        """Read every user (for leaderboards and other whole-school views)"""
+        with self._lock:
+            rows = self._conn.execute('SELECT username, data, version FROM users').fetchall()
+        users = {}
+        for username, text, version in rows:
+            users[username] = json.loads(text)
+            self.versions[username] = version
+        return users
+
+    def load_user(self, username):
+        """Read a single user's record, or None"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT data, version FROM users WHERE username = ?', (username,)
+            ).fetchone()
+        if row is None:
+            return None
+        text, version = row
+        self._saved[username] = (version, text)
+        self.versions[username] = version
+        return json.loads(text)
+
+    def usernames(self):
+        """List usernames without parsing any records"""
+        with self._lock:
+            return [row[0] for row in self._conn.execute('SELECT username FROM users')]
+
+    def save_user(self, username, data, expected_version=None):
+        """
+        Write one user's row if it changed and return its version.
+        Raises StaleWriteError when expected_version is given and the row has
+        moved on since.
+        """
+        text = _encode(data)
+        with self.transaction():
+            row = self._conn.execute(
+                'SELECT version FROM users WHERE username = ?', (username,)
+            ).fetchone()
+            version = row[0] if row else 0
+            if expected_version is not None and expected_version != version:
+                raise StaleWriteError(username)
+            if row and self._saved.get(username) == (version, text):
+                return version
+            # Readers never advance past a seq they have not seen, so our own
+            # writes also show up in our next refresh(); that only costs a reload
+            self._conn.execute(
+                'INSERT OR REPLACE INTO users (username, data, version, seq) '
+                'VALUES (?, ?, ?, (SELECT COALESCE(MAX(seq), 0) + 1 FROM users))',
+                (username, text, version + 1)
+            )
+            self._write_derived(username, data)
+        self._saved[username] = (version + 1, text)
+        self.versions[username] = version + 1
+        return version + 1
+
+    def delete_user(self, username):
+        """Remove one user's row"""
+        with self.transaction():
+            self._conn.execute('DELETE FROM users WHERE username = ?', (username,))
+            self._write_derived(username, None)
+            self._conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('deletes', 1) "
+                "ON CONFLICT(key) DO UPDATE SET value = value + 1"
+            )
+        self._saved.pop(username, None)
+        self.versions.pop(username, None)
+
+
+def open_store(data_file, backend='sqlite'):
+    """
+    Open the user store for the app's data file.
+    'sqlite' keeps one row per user in <data file>.db (imported from the JSON
+    files on first use); 'json' uses the snapshot + log files directly.
+    """
+    if backend == 'json':
+        return JsonLogStore(data_file)
+    if backend == 'sqlite':
+        db_path = os.path.splitext(data_file)[0] + '.db'
+        return SqliteStore(db_path, legacy_json_path=data_file)
+    raise ValueError(f"Unknown storage backend: {backend}")
+
+
+# Fields every session of a user moves forward on its own (see update_login_streak); when both
+# sides changed one, the larger value (the later ISO time, the longer streak) is kept
+NEWEST_WINS = ('last_login', 'login_streak')
+
+# Running totals each session adds to; when both sides changed one, both increments are kept
+COUNTERS = ('total_points', 'total_workout_hours', 'house_points_contributed')
+
+# Logs whose new entries are inserted at the front (see fittrack.services); others are appended
+NEWEST_FIRST = ('exercises', 'steps_data')
+
+# List entries that may only appear once, by the entry field naming them
+UNIQUE_ENTRIES = {'badges': 'name'}
+
+# Worked out from the rest of the record. Once both sides' changes are combined the level is
+# counted again from total_points, and the caches are dropped (put() and fittrack.badges rebuild them)
+DERIVED = ('level', 'badge_state', 'workout_streak')
+
+
+def _entry_time(entry):
+    return (entry.get('date') or '', entry.get('time') or '') if isinstance(entry, dict) else ('', '')
+
+
+def _split_added(base, items):
+    """(entries of items that were in base, entries added), matched by value; None if any base entry is gone"""
+    remaining = Counter(_encode(item) for item in base)
+    kept, added = [], []
+    for item in items:
+        text = _encode(item)
+        if remaining[text]:
+            remaining[text] -= 1
+            kept.append(item)
+        else:
+            added.append(item)
+    return None if +remaining else (kept, added)
+
+
+def merge_lists(key, base, mine, theirs):
+    """
+    A list both sides only added entries to, with every added entry kept, or
+    None when either side removed or changed an entry. The added entries go
+    in front for the NEWEST_FIRST logs and at the end otherwise, newest
+    first or oldest first by their date and time.
+    """
+    mine_split, theirs_split = _split_added(base, mine), _split_added(base, theirs)
+    if mine_split is None or theirs_split is None:
+        return None
+    (_, mine_added), (kept, theirs_added) = mine_split, theirs_split
+    if key in UNIQUE_ENTRIES:
+        field = UNIQUE_ENTRIES[key]
+        if {e.get(field) for e in mine_added} & {e.get(field) for e in theirs_added}:
+            return None
+    front = key in NEWEST_FIRST
+    added = sorted(theirs_added + mine_added, key=_entry_time, reverse=front)
+    return added + kept if front else kept + added
+
+
+def _combine(key, base, mine, theirs):
+    """A field both sides changed, with both changes kept, or None when they cannot be combined"""
+    if key in COUNTERS and all(isinstance(v, (int, float)) for v in (mine, theirs)):
+        return theirs + mine - (base or 0)
+    if isinstance(mine, list) and isinstance(theirs, list):
+        return merge_lists(key, base if isinstance(base, list) else [], mine, theirs)
+    return None
+
+
+def merge_fields(base, mine, theirs):
+    """
+    Three-way merge at the level of top-level fields.
+    Fields changed between base and mine are applied onto theirs; everything
+    else keeps theirs' value. A field theirs also changed, to something
+    different, is combined where that makes sense: NEWEST_WINS fields keep
+    the larger value, COUNTERS add up both increments, lists both sides only
+    added to keep every new entry (merge_lists()) and DERIVED fields are
+    worked out again. Returns (merged, conflicts), where conflicts lists the
+    fields changed on both sides that could not be combined.
+    """
+    merged = dict(theirs)
+    conflicts = []
+    rebuild = False
+    for key, value in mine.items():
+        if key in base and _encode(base[key]) == _encode(value):
+            continue
+        if key in NEWEST_WINS and key in theirs and value is not None and theirs[key] is not None:
+            merged[key] = max(value, theirs[key])
+            continue
+        if key in theirs and _encode(theirs[key]) != _encode(value):
+            if key not in base or _encode(base[key]) != _encode(theirs[key]):
+                if key in DERIVED:
+                    rebuild = True
+                    continue
+                combined = _combine(key, base.get(key), value, theirs[key])
+                if combined is None:
+                    conflicts.append(key)
+                else:
+                    value = combined
+                    rebuild = True
+        merged[key] = value
+    for key in base:
+        if key not in mine:
+            merged.pop(key, None)
+    if rebuild:
+        if 'level' in merged:
+            merged['level'] = calculate_level(merged.get('total_points', 0))[0]
+        merged.pop('badge_state', None)
+        merged.pop('workout_streak', None)
+    return merged, conflicts
+
+
+class UserStore:
+    """Process-wide user cache shared by every Streamlit session"""
+
+    # Versions of a user's record kept per user so stale writes can be merged
+    HISTORY = 8
+
+    def __init__(self, backend):
+        self.backend = backend
+        # username -> record shared by all sessions; treat as read-only
+        self._users = {}
+        # username -> {version: JSON text} for versions handed out or written
+        self._history = {}
+        self._all_loaded = False
+        self._lock = threading.RLock()
+
+    def _sync(self):
+        """Drop cached users that other processes have written since we last looked"""
+        changed = self.backend.refresh()
+        if changed is None:
+            self._users = {}
+            self._all_loaded = False
+            return
+        if changed:
+            count('store.external_writes', len(changed))
+        for username in changed:
+            self._users.pop(username, None)
+            if self._all_loaded:
+                data = self.backend.load_user(username)
+                if data is not None:
+                    self._users[username] = data
+
+    def _record(self, username):
+        if username not in self._users and not self._all_loaded:
+            data = self.backend.load_user(username)
+            if data is None:
+                return None
+            self._users[username] = data
+        return self._users.get(username)
+
+    def version(self, username):
+        """Current version of a user's record (0 when unknown)"""
+        return self.backend.versions.get(username, 0)
+
+    def exists(self, username):
+        """Whether a user with this username is stored"""
+        with self._lock:
+            self._sync()
+            return self._record(username) is not None
+
+    def find(self, index, key):
+        """Username found under key in one of the INDEXES (e.g. 'email'), or None"""
+        with self._lock:
+            self._sync()
+            return self.backend.find(index, key)
+
+    def find_all(self, index, key):
+        """Usernames filed under key in one of the MEMBER_INDEXES (e.g. 'class')"""
+        with self._lock:
+            self._sync()
+            return self.backend.find_all(index, key)
+
+    @timed_function('store.house_members')
+    def house_members(self, house, k=None):
+        """[(username, house points)] of a house's students, most points first (the best k)"""
+        with self._lock:
+            self._sync()
+            return self.backend.house_members(house, k)
+
+    @timed_function('store.house_totals')
+    def house_totals(self, scope=SCHOOL):
+        """Current house counters for the school, or for one teacher's class"""
+        with self._lock:
+            self._sync()
+            return self.backend.house_totals(scope)
+
+    @timed_function('store.leaderboard')
+    def leaderboard(self, board, k=20, age=None, gender=None):
+        """[(username, score)] of the top k on a board (see fittrack.leaderboards)"""
+        with self._lock:
+            self._sync()
+            return self.backend.leaderboard_top(board, k, age, gender)
+
+    @timed_function('store.leaderboard_rank')
+    def leaderboard_rank(self, board, username, age=None, gender=None):
+        """(rank, entries) of one user on a board, or None"""
+        with self._lock:
+            self._sync()
+            return self.backend.leaderboard_rank(board, username, age, gender)
+
+    @timed_function('store.weekly_leaderboard')
+    def weekly_leaderboard(self, k=20):
+        """[(username, workouts, minutes)] of the k most active students this week"""
+        with self._lock:
+            self._sync()
+            return self.backend.weekly_leaderboard(k)
+
+    @timed_function('store.get')
+    def get(self, username):
+        """Return (private copy, version) of one user, or (None, 0)"""
+        with self._lock:
+            self._sync()
+            data = self._record(username)
+            if data is None:
+                return None, 0
+            version = self.version(username)
+            history = self._history.setdefault(username, {})
+            if version not in history:
+                history[version] = _encode(data)
+                for old in sorted(history)[:-self.HISTORY]:
+                    del history[old]
+            return json.loads(history[version]), version
+
+    @timed_function('store.users')
+    def users(self, usernames):
+        """{username: record} of the named users that exist, in one go; callers must not mutate them"""
+        with self._lock:
+            self._sync()
+            records = {}
+            for username in usernames:
+                data = self._record(username)
+                if data is not None:
+                    records[username] = data
+            return records
+
+    @timed_function('store.all_users')
+    def all_users(self):
+        """Return the shared {username: record} dict; callers must not mutate it"""
+        with self._lock:
+            self._sync()
+            if not self._all_loaded:
+                users = dict(self.backend.load())
+                users.update(self._users)
+                self._users = users
+                self._all_loaded = True
+            return self._users
+
+    @timed_function('store.put')
+    def put(self, username, data, base_version=None):
+        """
+        Save a session's copy of a user and return the new version.
+        When base_version is older than the current version, only the fields
+        the session changed since base_version are written over the newer
+        record, and data is refreshed in place with the merged result.
+        Raises StaleWriteError if that is impossible: the base copy is no
+        longer remembered, or both sides changed a field merge_fields()
+        cannot combine.
+        A student's cached workout streak (see fittrack.streaks) is brought
+        up to date on the way.
+        Without base_version the write replaces whatever is stored.
+        """
+        with self._lock, self.backend.transaction():
+            self._sync()
+            current = self._record(username)
+            version = self.version(username) if current is not None else 0
+            if current is not None and base_version is not None and base_version != version:
+                base_text = self._history.get(username, {}).get(base_version)
+                if base_text is None:
+                    raise StaleWriteError(username)
+                merged, conflicts = merge_fields(json.loads(base_text), data, current)
+                if conflicts:
+                    raise StaleWriteError(username, conflicts)
+                data.clear()
+                data.update(merged)
+
+            # Derived fields stored with the record; only students log workouts
+            if data.get('role') == 'student':
+                update_streaks(data)
+            else:
+                data.pop('workout_streak', None)
+            text = _encode(data)
+            record = json.loads(text)
+            new_version = self.backend.save_user(username, record, expected_version=version)
+            self._users[username] = record
+            history = self._history.setdefault(username, {})
+            history[new_version] = text
+            for old in sorted(history)[:-self.HISTORY]:
+                del history[old]
+            return new_version
+
+    def update(self, username, mutator):
+        """Apply mutator to the latest copy of a user and save it"""
+        with self._lock, self.backend.transaction():
+            data, version = self.get(username)
+            if data is None:
+                return None
+            mutator(data)
+            self.put(username, data, version)
+            return data
+
+    def create(self, username, data):
+        """Add a new user; returns False if the username or an indexed key (email) is taken"""
+        with self._lock, self.backend.transaction():
+            self._sync()
+            if self._record(username) is not None:
+                return False
+            for index, key in index_keys(data).items():
+                if self.backend.find(index, key) is not None:
+                    return False
+            self.put(username, data)
+            return True
+
+    def delete(self, username):
+        """Remove a user everywhere"""
+        with self._lock, self.backend.transaction():
+            self.backend.delete_user(username)
+            self._users.pop(username, None)
+            self._history.pop(username, None)
+
+    # Groups are read from the backend each time; they are few and small
+    @timed_function('store.group')
+    def group(self, group_id):
+        """A copy of one group's record (see fittrack.groups), or None"""
+        with self._lock:
+            self._sync()
+            group = self.backend.load_group(group_id)
+            return json.loads(_encode(group)) if group is not None else None
+
+    def groups_of(self, username):
+        """Ids of the groups a user is a member of"""
+        with self._lock:
+            self._sync()
+            return self.backend.group_ids(username)
+
+    @timed_function('store.group_totals')
+    def group_totals(self, group_id):
+        """{'members', 'workouts', 'house_points'} of one group, kept as counters"""
+        with self._lock:
+            self._sync()
+            return self.backend.group_totals(group_id)
+
+    def group_member_stats(self, group_id):
+        """{member: (house points, workouts, latest NAPFA total or None)} of one group"""
+        with self._lock:
+            self._sync()
+            return self.backend.group_member_stats(group_id)
+
+    def create_group(self, group):
+        """Add a new group; returns False if its id is taken"""
+        with self._lock, self.backend.transaction():
+            self._sync()
+            if self.backend.load_group(group['id']) is not None:
+                return False
+            self.backend.save_group(group['id'], group)
+            return True
+
+    def update_group(self, group_id, mutator):
+        """Apply mutator to the latest copy of a group and save it; returns the group, or None"""
+        with self._lock, self.backend.transaction():
+            group = self.group(group_id)
+            if group is None:
+                return None
+            mutator(group)
+            self.backend.save_group(group_id, group)
+            return group
+
+    def delete_group(self, group_id):
+        with self._lock, self.backend.transaction():
+            self.backend.delete_group(group_id)
+
+    @timed_function('store.class_rollup')
+    def class_rollup(self, teacher):
+        """One teacher's class rollup (see fittrack.rollups), kept up to date on every save; treat as read-only"""
+        with self._lock:
+            self._sync()
+            return self.backend.class_rollup(teacher)
+
+    def class_members(self, teacher=None):
+        """(teacher, username, summary) of every student in a class, or in one teacher's, a few at a time"""
+        with self._lock:
+            self._sync()
+        return self.backend.class_members(teacher)
+
+    def class_member_count(self, teacher=None):
+        with self._lock:
+            self._sync()
+            return self.backend.class_member_count(teacher)
+
+    def invalidate(self, username=None):
+        """Drop cached records so the next read goes back to the backend"""
+        with self._lock:
+            # History is kept so sessions holding older copies can still merge
+            if username is None:
+                self._users = {}
+                self._all_loaded = False
+            else:
+                self._users.pop(username, None)
+                if self._all_loaded:
+                    data = self.backend.load_user(username)
+                    if data is not None:
+                        self._users[username] = data
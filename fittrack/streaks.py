@@ -0,0 +1,101 @@
+"""
+Workout streaks for FitTrack.
+
+A streak is a run of workout days where consecutive days are at most 2 days
+apart (one rest day allowed). Each student record caches its streak numbers
+under 'workout_streak':
+
+    current_streak     days in the run ending at the latest workout
+    longest_streak     days in the longest run ever
+    last_workout_date  latest workout date ('YYYY-MM-DD')
+
+update_streaks() keeps the cache in step with the exercises list when a
+student is saved. fittrack.services inserts new workouts at the front of the
+list, so the entries in front of those already counted are the new ones:
+workouts on or after the last workout date are folded in one at a time;
+anything else (a backdated or deleted workout) triggers a full recount.
+Pages, badges and leaderboards read the cache with streak_stats().
+"""
+from datetime import date
+
+# Longest gap in days between workouts that still continues a streak
+MAX_GAP_DAYS = 2
+
+# Bump when the cached numbers change meaning, so every cache is counted again
+STREAKS_VERSION = 2
+
+
+def _days_between(earlier, later):
+    return (date.fromisoformat(later) - date.fromisoformat(earlier)).days
+
+
+def compute_streaks(exercises):
+    """Streak numbers counted from scratch"""
+    stats = {'current_streak': 0, 'longest_streak': 0, 'last_workout_date': None,
+             'workouts_counted': len(exercises),
+             'last_entry_date': exercises[0]['date'] if exercises else None,
+             'version': STREAKS_VERSION}
+    run = 0
+    previous = None
+    for workout_date in sorted(set(e['date'] for e in exercises)):
+        if previous is not None and _days_between(previous, workout_date) <= MAX_GAP_DAYS:
+            run += 1
+        else:
+            run = 1
+        stats['longest_streak'] = max(stats['longest_streak'], run)
+        previous = workout_date
+    stats['current_streak'] = run
+    stats['last_workout_date'] = previous
+    return stats
+
+
+def update_streaks(data):
+    """Bring data['workout_streak'] up to date with data['exercises'] and return it"""
+    exercises = data.get('exercises') or []
+    stats = data.get('workout_streak')
+    counted = stats.get('workouts_counted', 0) if stats else 0
+    new = len(exercises) - counted
+
+    # exercises[new] is the entry that was in front when the cache was counted
+    if (stats is None or stats.get('version') != STREAKS_VERSION or new < 0
+            or (counted and exercises[new]['date'] != stats.get('last_entry_date'))):
+        stats = compute_streaks(exercises)
+    else:
+        stats = dict(stats)
+        # Oldest new workout first
+        for e in reversed(exercises[:new]):
+            last = stats['last_workout_date']
+            if last is None:
+                stats['current_streak'] = 1
+            elif e['date'] < last:
+                # Backdated workout: the runs before it may join up
+                stats = compute_streaks(exercises)
+                break
+            elif e['date'] > last:
+                if _days_between(last, e['date']) <= MAX_GAP_DAYS:
+                    stats['current_streak'] += 1
+                else:
+                    stats['current_streak'] = 1
+            stats['last_workout_date'] = max(last or e['date'], e['date'])
+            stats['longest_streak'] = max(stats['longest_streak'], stats['current_streak'])
+        else:
+            stats['workouts_counted'] = len(exercises)
+            stats['last_entry_date'] = exercises[0]['date'] if exercises else None
+
+    if stats != data.get('workout_streak'):
+        data['workout_streak'] = stats
+    return stats
+
+
+def streak_stats(data):
+    """
+    Cached streak numbers for a user. A cache that is behind (a workout just
+    logged, not saved yet) is brought up to date on the spot, without
+    changing data.
+    """
+    stats = data.get('workout_streak')
+    exercises = data.get('exercises') or []
+    if stats and stats.get('version') == STREAKS_VERSION and stats.get('workouts_counted') == len(exercises) and \
+            stats.get('last_entry_date') == (exercises[0]['date'] if exercises else None):
+        return stats
+    return update_streaks(dict(data))
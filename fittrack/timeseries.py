@@ -0,0 +1,118 @@
+"""
+Date-indexed views of the per-day logs in a user record.
+
+exercises, sleep_history, steps_data and hydration_log are lists of dicts with
+an ISO 'date' in whatever order the pages appended them. log_columns() turns
+one of those lists into a DateColumns: the dates as a sorted numpy
+datetime64[D] array plus the record order, with numeric value columns pulled
+out on first use. "Last N days" is then a binary search and a slice instead
+of parsing every date on every rerun.
+
+Columns are built once per list and reused for as long as the list is not
+changed. Records in the UserStore cache are shared between reruns, so other
+students' logs (leaderboards, teacher pages) are parsed once per save.
+"""
+import threading
+from collections import OrderedDict
+from datetime import date
+
+import numpy as np
+
+from fittrack.instrument import count
+
+LOG_FIELDS = ('exercises', 'sleep_history', 'steps_data', 'hydration_log')
+
+# Logs whose columns are kept between calls
+CACHE_SIZE = 4096
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def as_day(value=None):
+    """numpy day for a date, datetime or ISO string (today when None)"""
+    if value is None:
+        value = date.today()
+    elif hasattr(value, 'date'):
+        value = value.date()
+    return np.datetime64(value, 'D')
+
+
+def window_start(days, today=None):
+    """
+    First day of the last `days` days, today included.
+    Matches the old `strptime(d) >= datetime.now() - timedelta(days=days)` check.
+    """
+    return as_day(today) - (days - 1)
+
+
+class DateColumns:
+    """One log as date-sorted arrays"""
+
+    def __init__(self, records):
+        dates = np.array([r['date'][:10] for r in records], dtype='datetime64[D]')
+        self.order = np.argsort(dates, kind='stable')
+        self.dates = dates[self.order]
+        self._records = records
+        self._values = {}
+
+    def __len__(self):
+        return len(self.dates)
+
+    def values(self, field):
+        """A numeric field for every record in date order (missing counts as 0)"""
+        if field not in self._values:
+            self._values[field] = np.array(
+                [self._records[i].get(field) or 0 for i in self.order], dtype=float)
+        return self._values[field]
+
+    def span(self, first=None, last=None):
+        """Slice of the sorted arrays for first <= date <= last (open-ended when None)"""
+        start = 0 if first is None else int(np.searchsorted(self.dates, as_day(first), 'left'))
+        end = len(self.dates) if last is None else int(np.searchsorted(self.dates, as_day(last), 'right'))
+        return slice(start, max(start, end))
+
+    def recent(self, days, today=None):
+        """Slice covering the last `days` days"""
+        return self.span(window_start(days, today))
+
+    def count(self, span):
+        return span.stop - span.start
+
+    def total(self, field, span):
+        return self.values(field)[span].sum().item()
+
+    def records(self, span):
+        """The original record dicts in a slice, oldest first"""
+        return [self._records[i] for i in self.order[span]]
+
+
+_EMPTY = DateColumns([])
+
+
+def _fingerprint(records):
+    return (len(records), id(records[0]), id(records[-1]))
+
+
+def log_columns(data, field):
+    """DateColumns for data[field], reused until that list changes"""
+    records = data.get(field)
+    if not records:
+        return _EMPTY
+    key = id(records)
+    fingerprint = _fingerprint(records)
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry and entry[0] is records and entry[1] == fingerprint:
+            _cache.move_to_end(key)
+            count('timeseries.cache_hit')
+            return entry[2]
+    count('timeseries.cache_miss')
+    columns = DateColumns(records)
+    with _cache_lock:
+        # Holding the list keeps its id from being reused while cached
+        _cache[key] = (records, fingerprint, columns)
+        _cache.move_to_end(key)
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return columns
@@ -0,0 +1,262 @@
+"""
+AI workout verification: is the person in a photo doing the exercise properly?
+
+verify_workout() asks the OpenAI vision model about one photo, as prepared
+by fittrack.photos. It waits on the network for seconds, so the pages run it
+as a background job (see fittrack.jobs): they submit the photo with what to
+log once the answer is in, and verify_job() asks, then saves the workout to
+the user's record through fittrack.services, so the result is kept even if
+the page that asked has been left.
+
+Jobs ask through a VerificationCache kept in the job database, keyed by the
+prepared photo's content hash, the exercise and PROMPT_VERSION, so a photo
+submitted again, or by two pages, is answered without another API call for
+VERIFY_CACHE_DAYS. Verify a photo from the command line with
+
+    python -m fittrack.verification PHOTO [EXERCISE]
+"""
+import base64
+import hashlib
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+from fittrack.instrument import count, timed
+from fittrack.photos import prepare_photo
+from fittrack.services import apply, log_rep_workout, log_workout, record_verification
+
+OPENAI_URL = "https://api.openai.com/v1/chat/completions"
+OPENAI_MODEL = "gpt-4o"
+
+# Seconds to wait for the API before giving up
+OPENAI_TIMEOUT = 30
+
+# Bump when PROMPTS, OPENAI_MODEL or the reading of the answer change, so cached verdicts are not reused
+PROMPT_VERSION = 1
+
+# Verdicts kept in the cache (least recently used dropped first), and for how long
+VERIFY_CACHE_SIZE = 5000
+VERIFY_CACHE_DAYS = 30
+
+# Exercise-specific prompts (by lower-case exercise name)
+PROMPTS = {
+    'pull-up': "Analyze this image. Is the person doing a proper pull-up? Check: 1) Arms fully extended at bottom, 2) Chin above bar at top, 3) No kipping/swinging. Respond with 'VALID' or 'INVALID' followed by specific feedback.",
+    'sit-up': "Analyze this image. Is the person doing a proper sit-up? Check: 1) Back flat on ground, 2) Hands behind head or crossed on chest, 3) Shoulders lifting off ground, 4) Controlled movement. Respond with 'VALID' or 'INVALID' followed by specific feedback.",
+    'push-up': "Analyze this image. Is the person doing a proper push-up? Check: 1) Body straight line, 2) Elbows at 90 degrees at bottom, 3) Full extension at top, 4) No sagging hips. Respond with 'VALID' or 'INVALID' followed by specific feedback.",
+    'squat': "Analyze this image. Is the person doing a proper squat? Check: 1) Feet shoulder-width apart, 2) Knees not past toes, 3) Hips below knees at bottom, 4) Back straight. Respond with 'VALID' or 'INVALID' followed by specific feedback.",
+}
+
+
+def prompt_for(exercise_type):
+    return PROMPTS.get(exercise_type.lower(), f"Analyze if this person is doing a proper {exercise_type}. Respond with 'VALID' or 'INVALID' followed by feedback.")
+
+
+def verify_workout(photo, exercise_type, api_key=None):
+    """
+    Verify workout using OpenAI Vision API
+    photo is the JPEG from fittrack.photos.prepare_photo(), sent as is.
+    Returns: (is_valid, feedback, confidence); is_valid is None when the check could not be made
+    """
+    api_key = api_key if api_key is not None else os.environ.get('OPENAI_API_KEY', '')
+    if not api_key:
+        return None, "OpenAI API key not configured. Please add OPENAI_API_KEY to your Streamlit secrets.", 0
+
+    try:
+        import requests
+
+        img_base64 = base64.b64encode(photo).decode()
+
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {api_key}"
+        }
+
+        payload = {
+            "model": OPENAI_MODEL,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": prompt_for(exercise_type)},
+                        {
+                            "type": "image_url",
+                            "image_url": {
+                                "url": f"data:image/jpeg;base64,{img_base64}"
+                            }
+                        }
+                    ]
+                }
+            ],
+            "max_tokens": 300
+        }
+
+        with timed('api.openai'):
+            response = requests.post(OPENAI_URL, headers=headers, json=payload, timeout=OPENAI_TIMEOUT)
+
+        if response.status_code == 200:
+            result = response.json()
+            feedback = result['choices'][0]['message']['content']
+            is_valid = 'VALID' in feedback.upper() and 'INVALID' not in feedback.upper()
+            confidence = 85 if is_valid else 75
+
+            return is_valid, feedback, confidence
+        else:
+            return None, f"API Error: {response.status_code} - {response.text}", 0
+
+    except Exception as e:
+        return None, f"Error: {str(e)}", 0
+
+
+# Verification cache
+def cache_key(photo, exercise_type):
+    """The photo's SHA-256 with the exercise and PROMPT_VERSION"""
+    return f'{hashlib.sha256(photo).hexdigest()}:{exercise_type.lower()}:{PROMPT_VERSION}'
+
+
+class VerificationCache:
+    """
+    Verdicts by cache_key() in a SQLite table, shared by every process using
+    the file. Entries expire after days and the least recently used go once
+    there are more than size. Only answers from the model are kept, never a
+    failed call.
+    """
+
+    # Locks (picked by key) so one process never asks about the same photo twice at once
+    STRIPES = 16
+
+    def __init__(self, path, size=VERIFY_CACHE_SIZE, days=VERIFY_CACHE_DAYS):
+        self.path = path
+        self.size = size
+        self.ttl = days * 86400
+        self._lock = threading.Lock()
+        self._stripes = [threading.Lock() for _ in range(self.STRIPES)]
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        with self._lock:
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS verify_cache ('
+                'key TEXT PRIMARY KEY, valid INTEGER NOT NULL, feedback TEXT NOT NULL, confidence INTEGER NOT NULL, '
+                'created REAL NOT NULL, used REAL NOT NULL)'
+            )
+            self._conn.execute('CREATE INDEX IF NOT EXISTS verify_cache_used ON verify_cache (used)')
+
+    def get(self, key):
+        """(is_valid, feedback, confidence, when cached) or None"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT valid, feedback, confidence, created FROM verify_cache WHERE key = ? AND created > ?',
+                (key, now - self.ttl)
+            ).fetchone()
+            if row:
+                self._conn.execute('UPDATE verify_cache SET used = ? WHERE key = ?', (now, key))
+        if row is None:
+            return None
+        valid, feedback, confidence, created = row
+        return bool(valid), feedback, confidence, created
+
+    def put(self, key, is_valid, feedback, confidence):
+        now = time.time()
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                self._conn.execute('INSERT OR REPLACE INTO verify_cache VALUES (?, ?, ?, ?, ?, ?)',
+                                   (key, int(is_valid), feedback, confidence, now, now))
+                self._conn.execute('DELETE FROM verify_cache WHERE created <= ?', (now - self.ttl,))
+                self._conn.execute(
+                    'DELETE FROM verify_cache WHERE key IN '
+                    '(SELECT key FROM verify_cache ORDER BY used DESC LIMIT -1 OFFSET ?)', (self.size,)
+                )
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM verify_cache').fetchone()[0]
+
+    def verify(self, photo, exercise_type, api_key=None):
+        """verify_workout() through the cache; returns (is_valid, feedback, confidence, when cached or None)"""
+        key = cache_key(photo, exercise_type)
+        with self._stripes[int(key[:8], 16) % self.STRIPES]:
+            hit = self.get(key)
+            if hit is not None:
+                count('verify_cache.hits')
+                return hit
+            count('verify_cache.misses')
+            is_valid, feedback, confidence = verify_workout(photo, exercise_type, api_key)
+            if is_valid is not None:
+                self.put(key, is_valid, feedback, confidence)
+            return is_valid, feedback, confidence, None
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def cache_for(path):
+    """The process-wide VerificationCache for a database file"""
+    with _caches_lock:
+        if path not in _caches:
+            _caches[path] = VerificationCache(path)
+        return _caches[path]
+
+
+# What a verification job saves once the answer is in, by the 'log' job argument
+def _log_workout(data, exercise_type, log, is_valid, feedback, confidence, cached):
+    """A timed workout from Log Workout: points for the minutes if the photo checked out"""
+    return log_workout(data, exercise_type, log['minutes'], log['intensity'], log['notes'],
+                       'verified' if is_valid else 'failed')
+
+
+def _log_reps(data, exercise_type, log, is_valid, feedback, confidence, cached):
+    """Reps logged with a photo: points per rep for good form, the attempt alone otherwise"""
+    return log_rep_workout(data, exercise_type, log['reps'], log['intensity'], log['notes'], is_valid,
+                           confidence, feedback, cached=cached)
+
+
+def _log_check(data, exercise_type, log, is_valid, feedback, confidence, cached):
+    """A form check from the AI Verification page"""
+    return record_verification(data, exercise_type, log['reps'], is_valid, confidence, feedback, cached=cached)
+
+
+LOGGERS = {
+    'workout': _log_workout,
+    'reps': _log_reps,
+    'check': _log_check,
+}
+
+# Loggers that still save the workout when the photo could not be checked
+LOG_UNCHECKED = {'workout'}
+
+
+def verify_job(job):
+    """
+    Background job (see fittrack.jobs): verify job.payload, the photo, for
+    job.args['exercise_type'] through the cache kept in the job database,
+    and save it to the owner's record as job.args['log'] says. Returns the
+    verdict, whether it came from the cache, and what was logged.
+    """
+    exercise_type = job.args['exercise_type']
+    is_valid, feedback, confidence, cached_at = cache_for(job.queue.path).verify(job.payload, exercise_type)
+    result = {'valid': is_valid, 'feedback': feedback, 'confidence': confidence, 'cached': cached_at is not None,
+              'logged': None}
+    log = job.args.get('log')
+    if log and job.owner and (is_valid is not None or log['kind'] in LOG_UNCHECKED):
+        result['logged'] = apply(job.store, job.owner, LOGGERS[log['kind']], exercise_type, log,
+                                 is_valid, feedback, confidence, result['cached'])
+    return result
+
+
+if __name__ == '__main__':
+    if not 2 <= len(sys.argv) <= 3:
+        print("usage: python -m fittrack.verification PHOTO [EXERCISE]")
+        sys.exit(2)
+    with open(sys.argv[1], 'rb') as f:
+        photo = prepare_photo(f.read())
+    is_valid, feedback, confidence = verify_workout(photo['data'], sys.argv[2] if len(sys.argv) > 2 else 'Push-Up')
+    print({True: 'VALID', False: 'INVALID', None: 'NOT CHECKED'}[is_valid], f"({confidence}%)")
+    print(feedback)
@@ -0,0 +1,189 @@
+"""
+The storage backends underneath UserStore: log replay, compaction, the legacy
+JSON import, secondary indexes and merging of lists. Run with
+
+    python -m pytest -q tests
+"""
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fittrack.storage import JsonLogStore, StaleWriteError, UserStore, merge_fields, open_store  # noqa: E402
+
+
+@pytest.fixture(params=['sqlite', 'json'])
+def backend(request):
+    return request.param
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    return str(tmp_path / 'fittrack_users.json')
+
+
+def write_json_files(data_file, snapshot, *logs):
+    """A JSON snapshot and, in order, the rotated and/or live log as lists of lines"""
+    with open(data_file, 'w') as f:
+        json.dump(snapshot, f)
+    for suffix, lines in zip(('.log.1', '.log') if len(logs) == 2 else ('.log',), logs):
+        with open(data_file + suffix, 'w') as f:
+            f.write(''.join(lines))
+
+
+def record(**fields):
+    return json.dumps(fields) + '\n'
+
+
+@pytest.mark.parametrize('torn', ['{"op": "set", "user": "ana", "v": 3, "fields": {"name": "An',
+                                  '{"op": "set", "user": "ana", "v": 3, "fi\n'])
+def test_torn_last_record_is_dropped(backend, data_file, torn):
+    """A record cut short by a crash is ignored; everything before it is kept"""
+    write_json_files(data_file, {'ana': {'role': 'student', 'name': 'Ana'}}, [
+        record(op='set', user='ana', v=2, fields={'name': 'Ana Tan'}),
+        record(op='put', user='ben', v=1, data={'role': 'student', 'name': 'Ben'}),
+        torn,
+    ])
+    store = UserStore(open_store(data_file, backend))
+    assert store.get('ana') == ({'role': 'student', 'name': 'Ana Tan'}, 2)
+    assert store.get('ben') == ({'role': 'student', 'name': 'Ben'}, 1)
+
+    # The next save is not glued onto the torn bytes, and survives a reopen
+    ana, version = store.get('ana')
+    ana['name'] = 'Ana Lim'
+    assert store.put('ana', ana, version) == 3
+    reopened, version = UserStore(open_store(data_file, backend)).get('ana')
+    assert (reopened['name'], version) == ('Ana Lim', 3)
+    if backend == 'json':
+        with open(data_file + '.log') as f:
+            assert all(json.loads(line) for line in f)
+
+
+def test_compaction_folds_the_log_into_the_snapshot(backend, data_file):
+    writer = JsonLogStore(data_file, compact_threshold=10 ** 6, fsync=False)
+    for i in range(5):
+        writer.save_user(f'user{i}', {'role': 'student', 'name': f'User {i}', 'email': f'user{i}@example.com'})
+    writer.save_user('user0', {'role': 'student', 'name': 'User Zero', 'email': 'user0@example.com'})
+    writer.delete_user('user4')
+    writer.compact()
+
+    assert not os.path.exists(data_file + '.log.1')
+    assert os.path.getsize(data_file + '.log') == 0
+    with open(data_file) as f:
+        snapshot = json.load(f)
+    assert snapshot['__format__'] == 2
+    assert sorted(snapshot['users']) == ['user0', 'user1', 'user2', 'user3']
+    assert snapshot['versions']['user0'] == 2
+
+    # Saves after the compaction go to the fresh log
+    writer.save_user('user1', {'role': 'student', 'name': 'User One', 'email': 'user1@example.com'})
+    store = UserStore(open_store(data_file, backend))
+    assert store.get('user0') == ({'role': 'student', 'name': 'User Zero', 'email': 'user0@example.com'}, 2)
+    assert store.get('user1')[0]['name'] == 'User One'
+    assert store.get('user4') == (None, 0)
+    assert store.find('email', 'user3@example.com') == 'user3'
+    assert store.find('email', 'user4@example.com') is None
+
+
+def test_unfinished_compaction_replays_both_logs(backend, data_file):
+    """A crash mid-compaction leaves the rotated log next to the live one; the rotated one is older"""
+    write_json_files(data_file, {'ana': {'role': 'student', 'name': 'Ana'}},
+                     [record(op='set', user='ana', v=2, fields={'name': 'Ana Tan'}),
+                      record(op='put', user='ben', v=1, data={'role': 'student', 'name': 'Ben'})],
+                     [record(op='set', user='ana', v=3, fields={'name': 'Ana Lim'}),
+                      record(op='del', user='ben')])
+    store = UserStore(open_store(data_file, backend))
+    assert store.get('ana') == ({'role': 'student', 'name': 'Ana Lim'}, 3)
+    assert store.get('ben') == (None, 0)
+
+
+def test_legacy_snapshot(backend, data_file):
+    """A bare {username: record} snapshot from before versions: users start at version 1 and are indexed"""
+    write_json_files(data_file, {
+        'ana': {'role': 'student', 'name': 'Ana', 'email': 'ana@example.com', 'house': 'red',
+                'house_points_contributed': 4.5, 'class': '3A'},
+        'mr_lee': {'role': 'teacher', 'name': 'Mr Lee', 'email': 'lee@example.com', 'class_code': 'ABC123'},
+    }, [record(op='set', user='ana', v=2, fields={'house_points_contributed': 6.0})])
+    store = UserStore(open_store(data_file, backend))
+    assert store.get('mr_lee')[1] == 1
+    assert store.get('ana')[1] == 2
+    assert store.find('email', 'ana@example.com') == 'ana'
+    assert store.find('class_code', 'ABC123') == 'mr_lee'
+    assert store.find_all('class', '3A') == ['ana']
+    assert store.house_totals()['red']['points'] == 6.0
+
+    if backend == 'sqlite':
+        # Imported once: the database is not refilled from the JSON files later
+        store.delete('mr_lee')
+        assert UserStore(open_store(data_file, backend)).get('mr_lee') == (None, 0)
+
+
+def test_indexes_follow_changed_keys_and_deletes(backend, data_file):
+    store = UserStore(open_store(data_file, backend))
+    assert store.create('ana', {'role': 'student', 'name': 'Ana', 'email': 'ana@example.com'})
+    assert store.create('mr_lee', {'role': 'teacher', 'name': 'Mr Lee', 'email': 'lee@example.com',
+                                   'class_code': 'ABC123'})
+    assert not store.create('ana2', {'role': 'student', 'name': 'Ana', 'email': 'ana@example.com'})
+
+    ana, version = store.get('ana')
+    ana['email'] = 'ana.tan@example.com'
+    store.put('ana', ana, version)
+    teacher, version = store.get('mr_lee')
+    teacher['class_code'] = 'XYZ789'
+    store.put('mr_lee', teacher, version)
+    store.delete('ana')
+
+    for opened in (store, UserStore(open_store(data_file, backend))):
+        assert opened.find('email', 'ana@example.com') is None
+        assert opened.find('email', 'ana.tan@example.com') is None
+        assert opened.find('class_code', 'ABC123') is None
+        assert opened.find('class_code', 'XYZ789') == 'mr_lee'
+    # Keys that were freed can be taken again
+    assert store.create('ana', {'role': 'student', 'name': 'Ana', 'email': 'ana.tan@example.com'})
+    assert store.find('email', 'ana.tan@example.com') == 'ana'
+
+
+def test_merge_keeps_entries_both_sides_added():
+    base = {'exercises': [{'name': 'Run', 'date': '2026-10-14'}],
+            'sleep_history': [{'date': '2026-10-14', 'hours': 8}],
+            'badges': [{'name': '🎯 Getting Started'}]}
+    mine = {'exercises': [{'name': 'Squat', 'date': '2026-10-16'}] + base['exercises'],
+            'sleep_history': base['sleep_history'] + [{'date': '2026-10-16', 'hours': 7}],
+            'badges': base['badges'] + [{'name': '🔥 Week Warrior'}]}
+    theirs = {'exercises': [{'name': 'Plank', 'date': '2026-10-15'}] + base['exercises'],
+              'sleep_history': base['sleep_history'] + [{'date': '2026-10-15', 'hours': 9}],
+              'badges': base['badges'] + [{'name': '🌙 Sleep Champion'}]}
+    merged, conflicts = merge_fields(base, mine, theirs)
+    assert conflicts == []
+    assert [e['name'] for e in merged['exercises']] == ['Squat', 'Plank', 'Run']
+    assert [s['date'] for s in merged['sleep_history']] == ['2026-10-14', '2026-10-15', '2026-10-16']
+    assert [b['name'] for b in merged['badges']] == ['🎯 Getting Started', '🌙 Sleep Champion', '🔥 Week Warrior']
+
+
+def test_merge_refuses_removed_or_repeated_entries():
+    run = {'name': 'Run', 'date': '2026-10-14'}
+    squat = {'name': 'Squat', 'date': '2026-10-16'}
+    # One side deleted a workout the other kept
+    _, conflicts = merge_fields({'exercises': [run]}, {'exercises': []}, {'exercises': [squat, run]})
+    assert conflicts == ['exercises']
+    # Both sides awarded the same badge, on different days
+    _, conflicts = merge_fields({'badges': []}, {'badges': [{'name': '🔥 Week Warrior', 'date': '2026-10-15'}]},
+                                {'badges': [{'name': '🔥 Week Warrior', 'date': '2026-10-16'}]})
+    assert conflicts == ['badges']
+
+
+def test_removed_workout_against_added_one_is_a_stale_write(backend, data_file):
+    store = UserStore(open_store(data_file, backend))
+    run = {'name': 'Run', 'date': '2026-10-14', 'duration': 20}
+    store.put('ana', {'role': 'student', 'name': 'Ana', 'exercises': [run]})
+    a, a_version = store.get('ana')
+    b, b_version = store.get('ana')
+    a['exercises'].insert(0, {'name': 'Squat', 'date': '2026-10-16', 'duration': 10})
+    store.put('ana', a, a_version)
+    b['exercises'] = []
+    with pytest.raises(StaleWriteError):
+        store.put('ana', b, b_version)
+    assert [e['name'] for e in store.get('ana')[0]['exercises']] == ['Squat', 'Run']
@@ -0,0 +1,47 @@
+"""Grading a NAPFA test day and saving it to the students' records"""
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fittrack.jobs import open_jobs  # noqa: E402
+from fittrack.napfa import grade_frame, history_entries, read_results  # noqa: E402
+from fittrack.storage import UserStore, open_store  # noqa: E402
+
+RESULTS = """username,age,gender,SU,SBJ,SAR,PU,SR,RUN
+ana,14,F,40,200,40,10,10.5,12:30
+ben,14,M,,,,,,
+cai,14,M,30,,,,,
+"""
+
+
+def test_blank_rows_are_not_graded():
+    graded = grade_frame(read_results(io.StringIO(RESULTS)))
+    assert graded['total'].isna().tolist() == [False, True, False]
+    assert graded['medal'].isna().tolist() == [False, True, False]
+    entries = history_entries(graded, '2026-10-16')
+    assert sorted(entries) == [0, 2]
+    # A student who missed some stations is still graded, 0 on those
+    assert entries[2]['scores'] == {'SU': 30}
+    assert entries[2]['grades']['SBJ'] == 0
+
+
+def test_importing_the_same_day_twice(tmp_path):
+    data_file = str(tmp_path / 'fittrack_users.json')
+    store = UserStore(open_store(data_file))
+    old_test = {'date': '2026-04-01', 'total': 12, 'medal': '🥉 Bronze', 'scores': {}, 'grades': {}}
+    store.put('ana', {'role': 'student', 'name': 'Ana', 'napfa_history': [old_test]})
+    jobs = open_jobs(data_file, store, workers=1)
+    try:
+        entries = history_entries(grade_frame(read_results(io.StringIO(RESULTS))), '2026-10-16')
+        args = {'entries': [['ana', entries[0]]]}
+        for _ in range(2):
+            job = jobs.wait(jobs.submit('napfa_import', args, owner='mr_lee'), timeout=10)
+            assert job['status'] == 'done'
+            assert job['result'] == {'saved': 1}
+    finally:
+        jobs.close()
+    history = store.get('ana')[0]['napfa_history']
+    assert [test['date'] for test in history] == ['2026-04-01', '2026-10-16']
+    assert history[-1] == entries[0]
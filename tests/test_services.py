@@ -0,0 +1,21 @@
+"""Student actions given their dates as ISO strings, as the command line passes them"""
+import os
+import sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fittrack.services import log_run, log_water  # noqa: E402
+
+
+def test_log_run_with_iso_dates():
+    data = {'role': 'student', 'exercises': []}
+    result = log_run(data, 'Running', 3, 20, '2026-10-15', 'easy', '2026-10-16T07:30')
+    assert result['entry']['date'] == '2026-10-15'
+    assert data['exercises'][0]['date'] == '2026-10-15'
+    assert data['exercises'][0]['time'] == '07:30'
+
+
+def test_when_as_iso_string_or_datetime():
+    data = {}
+    assert log_water(data, 250, '2026-10-16T08:00') == log_water(data, 250, datetime(2026, 10, 16, 8, 0))
@@ -0,0 +1,159 @@
+"""
+UserStore writes from several sessions of one user. Run with
+
+    python -m pytest -q tests
+"""
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fittrack.catalogs import calculate_level  # noqa: E402
+from fittrack.storage import StaleWriteError, UserStore, open_store  # noqa: E402
+
+
+@pytest.fixture(params=['sqlite', 'json'])
+def store(request, tmp_path):
+    store = UserStore(open_store(str(tmp_path / 'fittrack_users.json'), request.param))
+    store.put('ana', {'role': 'student', 'name': 'Ana', 'email': 'ana@example.com', 'exercises': [],
+                      'last_login': '2026-10-15T08:00:00', 'login_streak': 3})
+    return store
+
+
+def test_two_sessions_logging_in(store):
+    """Two tabs each stamping last_login (and the streak) merge, keeping the newer values"""
+    a, a_version = store.get('ana')
+    b, b_version = store.get('ana')
+    a.update(last_login='2026-10-16T09:00:00', login_streak=4)
+    store.put('ana', a, a_version)
+    b.update(last_login='2026-10-16T09:00:05', login_streak=4)
+    store.put('ana', b, b_version)
+    saved, _ = store.get('ana')
+    assert saved['last_login'] == '2026-10-16T09:00:05'
+    assert saved['login_streak'] == 4
+
+    # The older stamp saved last does not move last_login back
+    c, c_version = store.get('ana')
+    d, d_version = store.get('ana')
+    c['last_login'] = '2026-10-16T10:00:00'
+    store.put('ana', c, c_version)
+    d['last_login'] = '2026-10-16T09:30:00'
+    d['name'] = 'Ana Tan'
+    store.put('ana', d, d_version)
+    saved, _ = store.get('ana')
+    assert saved['last_login'] == '2026-10-16T10:00:00'
+    assert saved['name'] == 'Ana Tan'
+
+
+def test_same_field_from_two_sessions_conflicts(store):
+    a, a_version = store.get('ana')
+    b, b_version = store.get('ana')
+    a['name'] = 'Ana Tan'
+    store.put('ana', a, a_version)
+    b['name'] = 'Ana Lim'
+    with pytest.raises(StaleWriteError):
+        store.put('ana', b, b_version)
+
+
+def test_sqlite_import_leaves_json_files_alone(tmp_path):
+    """The first SQLite open copies the JSON snapshot and log without creating files next to them"""
+    json_path = tmp_path / 'fittrack_users.json'
+    json_path.write_text('{"ana": {"role": "student", "name": "Ana"}}')
+    (tmp_path / 'fittrack_users.json.log').write_text('{"op": "set", "user": "ana", "v": 2, "fields": {"name": "Ana Tan"}}\n')
+    store = UserStore(open_store(str(json_path)))
+    assert store.get('ana') == ({'role': 'student', 'name': 'Ana Tan'}, 2)
+    assert not (tmp_path / 'fittrack_users.json.lock').exists()
+    assert sorted(p.name for p in tmp_path.glob('fittrack_users.json*')) == ['fittrack_users.json',
+                                                                             'fittrack_users.json.log']
+
+
+def test_workout_streak_is_kept_for_students_only(store):
+    store.create('mr_lee', {'role': 'teacher', 'name': 'Mr Lee', 'email': 'lee@example.com', 'class_code': 'ABC123'})
+    teacher, version = store.get('mr_lee')
+    store.put('mr_lee', teacher, version)
+    assert 'workout_streak' not in store.get('mr_lee')[0]
+
+    student, version = store.get('ana')
+    student['exercises'] = [{'date': '2026-10-16'}, {'date': '2026-10-15'}]
+    store.put('ana', student, version)
+    assert store.get('ana')[0]['workout_streak']['current_streak'] == 2
+
+
+def test_workout_streak_follows_logged_workouts(store, monkeypatch):
+    """Workouts logged through the services, newest in front, are folded in without recounting"""
+    from fittrack import streaks
+    from fittrack.services import apply, log_run, log_timed_workout, log_workout
+
+    recounts = []
+    compute_streaks = streaks.compute_streaks
+    monkeypatch.setattr(streaks, 'compute_streaks', lambda exercises: recounts.append(1) or compute_streaks(exercises))
+    store.put('ana', dict(store.get('ana')[0], show_on_leaderboards=True))
+    recounts.clear()
+
+    apply(store, 'ana', log_workout, 'Push-Up', 20, when=datetime(2026, 10, 10, 8, 0))
+    apply(store, 'ana', log_timed_workout, 'Plank', 10, when=datetime(2026, 10, 10, 17, 0))
+    apply(store, 'ana', log_workout, 'Squat', 20, when=datetime(2026, 10, 11, 8, 0))
+    apply(store, 'ana', log_run, 'Running', 3, 20, when=datetime(2026, 10, 12, 7, 0))
+    apply(store, 'ana', log_workout, 'Push-Up', 20, when=datetime(2026, 10, 13, 8, 0))
+
+    saved, _ = store.get('ana')
+    assert saved['workout_streak'] == compute_streaks(saved['exercises'])
+    assert saved['workout_streak']['current_streak'] == 4
+    assert saved['workout_streak']['last_workout_date'] == '2026-10-13'
+    assert store.leaderboard('streak') == [('ana', 4)]
+    assert recounts == []
+
+    # A gap of more than MAX_GAP_DAYS starts a new run
+    apply(store, 'ana', log_workout, 'Squat', 20, when=datetime(2026, 10, 17, 8, 0))
+    stats = store.get('ana')[0]['workout_streak']
+    assert (stats['current_streak'], stats['longest_streak']) == (1, 4)
+
+
+def test_two_sessions_adding_workouts(store):
+    """Both tabs' workouts, points and house hours are kept, newest first by date and time"""
+    from fittrack.services import log_workout
+
+    a, a_version = store.get('ana')
+    b, b_version = store.get('ana')
+    log_workout(a, 'Push-Up', 30, when=datetime(2026, 10, 16, 9, 0))
+    store.put('ana', a, a_version)
+    log_workout(b, 'Squat', 60, when=datetime(2026, 10, 16, 10, 0))
+    log_workout(b, 'Plank', 15, when=datetime(2026, 10, 15, 18, 0))
+    store.put('ana', b, b_version)
+
+    saved, _ = store.get('ana')
+    assert [(e['name'], e['date'], e['time']) for e in saved['exercises']] == [
+        ('Squat', '2026-10-16', '10:00'), ('Push-Up', '2026-10-16', '09:00'), ('Plank', '2026-10-15', '18:00')]
+    assert saved['total_points'] == 10 * (30 + 60 + 15)  # 'mock' workouts earn 10 points a minute
+    assert saved['total_workout_hours'] == pytest.approx(1.75)
+    assert saved['level'] == calculate_level(1050)[0]
+    assert saved['workout_streak']['current_streak'] == 2
+    assert b == saved
+
+
+def test_house_and_class_lookups(store):
+    """house_members() and find_all() follow saves, moves and deletes without loading every user"""
+    for username, house, points, klass in (('ben', 'red', 12.5, '3A'), ('cai', 'red', 30.0, '3A'),
+                                           ('dee', 'blue', 5.0, '3B'), ('eve', 'red', 12.5, None)):
+        store.put(username, {'role': 'student', 'name': username.title(), 'house': house, 'class': klass,
+                             'house_points_contributed': points, 'exercises': []})
+    store.put('tan', {'role': 'teacher', 'name': 'Mr Tan', 'class_code': 'ABC123'})
+    assert store.house_members('red') == [('cai', 30.0), ('ben', 12.5), ('eve', 12.5)]
+    assert store.house_members('red', 2) == [('cai', 30.0), ('ben', 12.5)]
+    assert store.find_all('class', '3A') == ['ben', 'cai']
+
+    ben, version = store.get('ben')
+    ben.update(house='blue', **{'class': '3B'})
+    store.put('ben', ben, version)
+    store.delete('cai')
+    assert store.house_members('red') == [('eve', 12.5)]
+    assert store.house_members('blue') == [('ben', 12.5), ('dee', 5.0)]
+    assert store.find_all('class', '3A') == []
+    assert store.find_all('class', '3B') == ['ben', 'dee']
+
+    found = store.users(['dee', 'cai', 'ana'])
+    assert sorted(found) == ['ana', 'dee']
+    assert found['dee']['name'] == 'Dee'